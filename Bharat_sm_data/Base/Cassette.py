@@ -0,0 +1,192 @@
+import base64
+import json
+import threading
+import zlib
+from collections import deque
+from datetime import timedelta
+from io import BytesIO
+from os import makedirs, path
+
+import brotli
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .Exceptions import CassetteMiss
+from .ResponseCache import ResponseCache
+
+
+class Cassette:
+    """
+        Records the requests made by a `CustomSession` along with their responses (status, headers and the body as it
+        came over the wire, i.e. still compressed) into a JSON lines file and serves them back later without network,
+        which makes parsing regression tests and benchmarks repeatable and offline.
+
+        Requests are matched by method, url, url params and payload; identical requests recorded more than once are
+        replayed in the recorded order, the last one is repeated once they are exhausted.
+
+        Usage:
+            client.cassette = Cassette('option_chain.jsonl', mode='record')  # hits the network and saves
+            client.cassette = Cassette('option_chain.jsonl', mode='replay')  # offline
+
+        Attributes:
+            file_path: path of the cassette file
+            mode: `record` (always hit the network and save), `replay` (never hit the network, raise `CassetteMiss`
+            for unknown requests) or `auto` (replay what is recorded, record the rest)
+
+        Methods:
+            play(method: str, url: str, params: dict = None, body=None) -> dict: Returns the recorded interaction.
+            record(method: str, url: str, params: dict, body, status: int, headers: dict, content: bytes,
+                   final_url: str = None) -> None: Saves an interaction.
+            build_response(interaction: dict) -> Response: Builds a `requests` response from an interaction.
+            decode_body(content: bytes, encoding: str) -> bytes: Decodes a body as per its Content-Encoding.
+    """
+
+    modes = ('record', 'replay', 'auto')
+
+    def __init__(self, file_path: str, mode: str = 'auto') -> None:
+        """
+            Opens the cassette, the recorded interactions are loaded unless the mode is `record`.
+
+            :param self: Represent the instance of the class
+            :param file_path: path of the cassette file
+            :param mode: (optional) `record`, `replay` or `auto`
+
+            :return: None
+        """
+
+        if mode not in self.modes:
+            raise ValueError(f'Invalid cassette mode {mode}; valid modes are : {self.modes}')
+        self.file_path = file_path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._interactions = {}
+        self._truncate = mode == 'record'
+        if mode != 'record' and path.exists(file_path):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions.setdefault(interaction['key'], deque()).append(interaction)
+
+    @staticmethod
+    def _key(method: str, url: str, params: dict = None, body=None) -> str:
+        """
+            Builds the key which matches a request to its recorded interaction.
+
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param params: (optional) url params of the request
+            :param body: (optional) JSON / form payload of the request
+
+            :return: Key of the request
+        """
+
+        if params:
+            params = {key: str(value) for key, value in params.items() if value is not None}
+        return ResponseCache.make_key(method, url, params, body)
+
+    def play(self, method: str, url: str, params: dict = None, body=None) -> dict:
+        """
+            Returns the recorded interaction of a request.
+
+            :param self: Represent the instance of the class
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param params: (optional) url params of the request
+            :param body: (optional) JSON / form payload of the request
+
+            :return: Interaction dict or None when it is not recorded (only in `auto` mode)
+        """
+
+        with self._lock:
+            recorded = self._interactions.get(self._key(method, url, params, body))
+            if recorded:
+                return recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self.mode == 'replay':
+            raise CassetteMiss(f'No recorded response for {method} {url} params={params} in {self.file_path}')
+        return None
+
+    def record(self, method: str, url: str, params: dict, body, status: int, headers: dict, content: bytes,
+               final_url: str = None) -> None:
+        """
+            Saves an interaction, it is appended to the cassette file right away.
+
+            :param self: Represent the instance of the class
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param params: url params of the request
+            :param body: JSON / form payload of the request
+            :param status: HTTP status code of the response
+            :param headers: headers of the response
+            :param content: body of the response as it came over the wire (encoded as per `Content-Encoding`)
+            :param final_url: (optional) url of the response after the redirects
+
+            :return: None
+        """
+
+        interaction = {
+            'key': self._key(method, url, params, body),
+            'request': {'method': method.upper(), 'url': url, 'params': params, 'body': body},
+            'response': {
+                'status': status,
+                'url': final_url or url,
+                'headers': dict(headers),
+                'body': base64.b64encode(content).decode('ascii'),
+            },
+        }
+        line = json.dumps(interaction, default=str)
+        with self._lock:
+            self._interactions.setdefault(interaction['key'], deque()).append(interaction)
+            makedirs(path.dirname(path.abspath(self.file_path)), exist_ok=True)
+            with open(self.file_path, 'w' if self._truncate else 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self._truncate = False
+
+    @staticmethod
+    def decode_body(content: bytes, encoding: str) -> bytes:
+        """
+            Decodes a body as per its Content-Encoding (gzip, deflate and br, also chained).
+
+            :param content: Body as it came over the wire
+            :param encoding: Value of the `Content-Encoding` header
+
+            :return: Decoded body
+        """
+
+        for coding in reversed([coding.strip().lower() for coding in (encoding or '').split(',') if coding.strip()]):
+            if coding in ('gzip', 'x-gzip'):
+                content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+            elif coding == 'deflate':
+                try:
+                    content = zlib.decompress(content)
+                except zlib.error:
+                    content = zlib.decompress(content, -zlib.MAX_WBITS)
+            elif coding == 'br':
+                content = brotli.decompress(content)
+            elif coding != 'identity':
+                raise ValueError(f'Unsupported Content-Encoding : {coding}')
+        return content
+
+    def build_response(self, interaction: dict) -> Response:
+        """
+            Builds a `requests` response out of a recorded interaction.
+
+            :param self: Represent the instance of the class
+            :param interaction: Interaction returned by `play`
+
+            :return: requests.Response object
+        """
+
+        recorded = interaction['response']
+        content = base64.b64decode(recorded['body'])
+        response = Response()
+        response.status_code = recorded['status']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = recorded['url']
+        response.raw = BytesIO(content)
+        response._content = self.decode_body(content, response.headers.get('Content-Encoding'))
+        response._content_consumed = True
+        response.elapsed = timedelta(0)
+        return response
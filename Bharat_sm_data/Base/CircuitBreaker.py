@@ -0,0 +1,293 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .Exceptions import CircuitOpenError
+
+
+class CircuitBreaker:
+    """
+        A thread-safe circuit breaker of one upstream host.
+
+        It starts closed; `failure_threshold` failed requests in a row open it, and while it is open every request
+        fails immediately with `CircuitOpenError` instead of going through the retries and timeouts of a degraded
+        host. Once `recovery_timeout` seconds passed it is half-open: `half_open_max_calls` probe requests are let
+        through, a successful probe closes it and a failed one opens it again for another `recovery_timeout`.
+
+        Attributes:
+            host: host name the breaker belongs to
+            failure_threshold: consecutive failures which open the circuit
+            recovery_timeout: seconds the circuit stays open before probing the host again
+            half_open_max_calls: probe requests let through at once while half-open
+
+        Methods:
+            state -> str: 'closed', 'open' or 'half_open'.
+            allow() -> None: Raises `CircuitOpenError` unless a request may be sent now.
+            record_success() -> None: Records a successful request.
+            record_failure() -> None: Records a failed request.
+            reset() -> None: Closes the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, host: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1) -> None:
+        """
+            Builds a closed breaker.
+
+            :param self: Represent the instance of the class
+            :param host: Host name the breaker belongs to
+            :param failure_threshold: (optional) consecutive failures which open the circuit
+            :param recovery_timeout: (optional) seconds the circuit stays open before probing the host again
+            :param half_open_max_calls: (optional) probe requests let through at once while half-open
+
+            :return: None
+        """
+
+        if failure_threshold < 1 or recovery_timeout < 0 or half_open_max_calls < 1:
+            raise ValueError(f'invalid circuit breaker settings; got failure_threshold={failure_threshold}, '
+                             f'recovery_timeout={recovery_timeout}, half_open_max_calls={half_open_max_calls}')
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        """
+            Current state of the circuit, an open circuit whose recovery timeout passed reads as half-open.
+
+            :param self: Represent the instance of the class
+
+            :return: 'closed', 'open' or 'half_open'
+        """
+
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> None:
+        """
+            Lets a request through unless the circuit is open, or half-open with all its probes already in flight.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = time.monotonic()
+            retry_after = self.recovery_timeout - (now - self._opened_at)
+            if retry_after <= 0:
+                # open for long enough, or the probes of the half-open circuit never reported back
+                self._state = self.HALF_OPEN
+                self._opened_at = now
+                self._probes = 0
+                retry_after = self.recovery_timeout
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+        raise CircuitOpenError(self.host, max(retry_after, 0.0))
+
+    def record_success(self) -> None:
+        """
+            Records a successful request, it closes a half-open circuit.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        """
+            Records a failed request, it opens the circuit once the threshold is reached and re-opens a half-open one.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def reset(self) -> None:
+        """
+            Closes the circuit and forgets the failures.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        self.record_success()
+
+
+class HostCircuitBreaker:
+    """
+        Keeps one `CircuitBreaker` per upstream host name, so a degraded `www.nseindia.com` does not stop the requests
+        to `charting.nseindia.com`. The settings of a host come from the longest configured host suffix, else from
+        `default_settings`.
+
+        A request fails when it raises (connection error, timeout) or is answered with one of `failure_statuses`
+        after its retries; any other answer is a success.
+
+        Attributes:
+            default_settings: dict of `CircuitBreaker` keyword arguments used for the hosts without own settings
+            failure_statuses: status codes counted as failures of the host
+
+        Methods:
+            configure(host: str, **settings) -> None: Sets the breaker settings of a host suffix.
+            breaker_for(url: str) -> CircuitBreaker: Returns the breaker of the url's host.
+            allow(url: str) -> None: Raises `CircuitOpenError` unless a request to the url may be sent now.
+            record(url: str, status: int = None) -> None: Records the outcome of a request, None for an exception.
+            states() -> dict: Returns the state of every host seen so far.
+            reset(host: str = None) -> None: Closes the circuit of a host (or of all of them).
+    """
+
+    default_settings = {'failure_threshold': 5, 'recovery_timeout': 30.0, 'half_open_max_calls': 1}
+    failure_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, settings: dict = None) -> None:
+        """
+            Builds the registry, the breakers are created on the first request to each host.
+
+            :param self: Represent the instance of the class
+            :param settings: (optional) dict of host suffix and its `CircuitBreaker` keyword arguments
+
+            :return: None
+        """
+
+        self._lock = threading.Lock()
+        self._settings = {}
+        self._breakers = {}
+        for host, host_settings in (settings or {}).items():
+            self.configure(host, **host_settings)
+
+    def configure(self, host: str, **settings) -> None:
+        """
+            Sets the breaker settings (`failure_threshold`, `recovery_timeout`, `half_open_max_calls`) of a host suffix,
+            the breakers of its hosts start over with them.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix, e.g. `nseindia.com`
+            :param settings: keyword arguments of `CircuitBreaker`
+
+            :return: None
+        """
+
+        host = host.lower().lstrip('.')
+        with self._lock:
+            self._settings[host] = dict(self.default_settings, **settings)
+            for name in [name for name in self._breakers if name == host or name.endswith('.' + host)]:
+                del self._breakers[name]
+
+    def _settings_for(self, host: str) -> dict:
+        """
+            Finds the settings of the longest configured host suffix, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param host: Host name
+
+            :return: Dict of `CircuitBreaker` keyword arguments
+        """
+
+        suffix = host
+        while suffix:
+            if suffix in self._settings:
+                return self._settings[suffix]
+            suffix = suffix.partition('.')[2]
+        return self.default_settings
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """
+            Returns the breaker of the url's host, it is created on the first request to the host.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: CircuitBreaker object
+        """
+
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(host, **self._settings_for(host))
+            return breaker
+
+    def allow(self, url: str) -> None:
+        """
+            Raises `CircuitOpenError` unless a request to the url may be sent now.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: None
+        """
+
+        self.breaker_for(url).allow()
+
+    def record(self, url: str, status: int = None) -> None:
+        """
+            Records the outcome of a request.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param status: (optional) status code of the response, None when the request raised
+
+            :return: None
+        """
+
+        breaker = self.breaker_for(url)
+        if status is None or status in self.failure_statuses:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def states(self) -> dict:
+        """
+            Returns the state of the circuit of every host seen so far.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict of host name and 'closed', 'open' or 'half_open'
+        """
+
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.host: breaker.state for breaker in breakers}
+
+    def reset(self, host: str = None) -> None:
+        """
+            Closes the circuit of a host name, or of every host.
+
+            :param self: Represent the instance of the class
+            :param host: (optional) Host name, default is every host
+
+            :return: None
+        """
+
+        with self._lock:
+            breakers = list(self._breakers.values()) if host is None else \
+                [self._breakers[host]] if host in self._breakers else []
+        for breaker in breakers:
+            breaker.reset()
@@ -0,0 +1,327 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
+
+from .Metrics import endpoint_template
+
+
+class AIMDLimit:
+    """
+        A thread-safe concurrency limit of one upstream host which adapts itself with AIMD (additive increase,
+        multiplicative decrease), the congestion control of TCP: every healthy response grows the limit by
+        `increase / limit` (about `increase` per round of requests) and a congestion signal (403, 429, 5xx or the
+        smoothed latency going above `latency_tolerance` times, and `latency_slack` seconds over, the best recent
+        latency) multiplies it by `backoff`. The latency baseline is kept per endpoint, so a slow endpoint (option
+        chain, filings) is compared with its own best latency and not with the fast quotes of the same host.
+        A burst of failures of the requests already in flight when the limit was cut counts as one signal.
+
+        The slots are taken with `acquire` / `async_acquire` (or `with limit:`) and given back with `release`; tasks
+        waiting for a slot poll it every few milliseconds, so one limit can be shared by threads and event loops.
+
+        Attributes:
+            host: host name the limit belongs to
+            limit: current number of requests allowed in flight
+            min_limit: lower bound of the limit
+            max_limit: upper bound of the limit
+            increase: slots added per round of healthy requests
+            backoff: factor the limit is multiplied by on congestion
+            latency_tolerance: smoothed latency over best recent latency ratio treated as congestion
+            latency_slack: seconds the smoothed latency must also be above the best one, so jitter of fast hosts is
+            not taken for congestion
+            max_endpoints: endpoints whose latency baseline is kept, the least recently seen ones are dropped
+
+        Methods:
+            acquire() -> None: Blocks the thread till a slot is free (`with limit:` / `async with limit:`).
+            async_acquire() -> None: Suspends the task till a slot is free.
+            release() -> None: Gives a slot back.
+            record(status: int = None, latency: float = None, started: float = None, endpoint: str = None) -> None:
+            Adapts the limit to the outcome of a request, None status for an exception.
+    """
+
+    congestion_statuses = (403, 429, 500, 502, 503, 504)
+
+    def __init__(self, host: str, initial_limit: float = 4, min_limit: float = 1, max_limit: float = 32,
+                 increase: float = 1, backoff: float = 0.5, latency_tolerance: float = 3.0,
+                 latency_slack: float = 0.05, latency_window: int = 50, max_endpoints: int = 64) -> None:
+        """
+            Builds the limit of a host.
+
+            :param self: Represent the instance of the class
+            :param host: Host name the limit belongs to
+            :param initial_limit: (optional) requests allowed in flight at first
+            :param min_limit: (optional) lower bound of the limit
+            :param max_limit: (optional) upper bound of the limit
+            :param increase: (optional) slots added per round of healthy requests
+            :param backoff: (optional) factor the limit is multiplied by on congestion, between 0 and 1
+            :param latency_tolerance: (optional) smoothed latency over best recent latency ratio treated as congestion
+            :param latency_slack: (optional) seconds the smoothed latency must also be above the best one
+            :param latency_window: (optional) number of recent latencies of an endpoint the best latency is taken from
+            :param max_endpoints: (optional) endpoints whose latency baseline is kept
+
+            :return: None
+        """
+
+        if not 1 <= min_limit <= initial_limit <= max_limit or not 0 < backoff < 1 or increase <= 0:
+            raise ValueError(f'invalid concurrency settings; got initial_limit={initial_limit}, min_limit={min_limit}, '
+                             f'max_limit={max_limit}, increase={increase}, backoff={backoff}')
+        self.host = host
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack
+        self.max_endpoints = max_endpoints
+        self._latency_window = latency_window
+        # endpoint -> [recent latencies, smoothed latency], least recently seen first
+        self._baselines = OrderedDict()
+        self._cut_at = 0.0
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """
+            Number of slots taken.
+
+            :param self: Represent the instance of the class
+
+            :return: Requests in flight
+        """
+
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        """
+            Takes a slot if one is free, must be called with the condition held.
+
+            :param self: Represent the instance of the class
+
+            :return: True if a slot was taken
+        """
+
+        if self._in_flight < max(int(self.limit), 1):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """
+            Blocks the calling thread till a slot is free and takes it.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def async_acquire(self) -> None:
+        """
+            Suspends the calling task till a slot is free and takes it.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        wait = 0.002
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+            await asyncio.sleep(wait)
+            wait = min(wait * 2, 0.05)
+
+    def release(self) -> None:
+        """
+            Gives a slot back.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> 'AIMDLimit':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    async def __aenter__(self) -> 'AIMDLimit':
+        await self.async_acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    def _baseline(self, endpoint: str) -> list:
+        """
+            Returns the latency baseline of an endpoint, must be called with the condition held.
+
+            :param self: Represent the instance of the class
+            :param endpoint: Endpoint template of the request
+
+            :return: List of the deque of recent latencies and the smoothed latency (None till the first one)
+        """
+
+        baseline = self._baselines.get(endpoint)
+        if baseline is None:
+            baseline = self._baselines[endpoint] = [deque(maxlen=self._latency_window), None]
+            while len(self._baselines) > self.max_endpoints:
+                self._baselines.popitem(last=False)
+        else:
+            self._baselines.move_to_end(endpoint)
+        return baseline
+
+    def record(self, status: int = None, latency: float = None, started: float = None, endpoint: str = None) -> None:
+        """
+            Adapts the limit to the outcome of a request.
+
+            :param self: Represent the instance of the class
+            :param status: (optional) status code of the response, None when the request raised
+            :param latency: (optional) seconds taken by the request
+            :param started: (optional) `time.monotonic()` when the request was sent, a congestion signal of a request
+            sent before the last cut is ignored
+            :param endpoint: (optional) endpoint template of the request, its latency is compared with the best recent
+            latency of the same endpoint; None shares one baseline
+
+            :return: None
+        """
+
+        with self._condition:
+            congested = status is None or status in self.congestion_statuses
+            if latency is not None and not congested:
+                baseline = self._baseline(endpoint)
+                latencies = baseline[0]
+                latencies.append(latency)
+                baseline[1] = latency if baseline[1] is None else 0.8 * baseline[1] + 0.2 * latency
+                best = min(latencies)
+                congested = baseline[1] > max(self.latency_tolerance * best, best + self.latency_slack)
+            if not congested:
+                grown = min(self.max_limit, self.limit + self.increase / self.limit)
+                if int(grown) > int(self.limit):
+                    self._condition.notify()
+                self.limit = grown
+            elif started is None or started >= self._cut_at:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._cut_at = time.monotonic()
+                # the latencies of the congested period must not look like the norm afterwards
+                for baseline in self._baselines.values():
+                    baseline[1] = None
+
+
+class HostConcurrencyLimiter:
+    """
+        Keeps one `AIMDLimit` per upstream host name, the settings of a host come from the longest configured host
+        suffix, else from `default_settings`. Every request of `CustomSession` reports its outcome here and the bulk
+        APIs (`fetch_many`, `async_fetch_many`) keep at most the current limit of requests in flight per host, so they
+        run at the highest throughput the host takes that day.
+
+        Attributes:
+            default_settings: dict of `AIMDLimit` keyword arguments used for the hosts without own settings
+
+        Methods:
+            configure(host: str, **settings) -> None: Sets the limit settings of a host suffix.
+            limit_for(url: str) -> AIMDLimit: Returns the limit of the url's host.
+            record(url: str, status: int = None, latency: float = None, started: float = None) -> None: Reports the
+            outcome of a request.
+            limits() -> dict: Returns the current limit of every host seen so far.
+    """
+
+    default_settings = {'initial_limit': 4, 'min_limit': 1, 'max_limit': 32}
+
+    def __init__(self, settings: dict = None) -> None:
+        """
+            Builds the registry, the limits are created on the first request to each host.
+
+            :param self: Represent the instance of the class
+            :param settings: (optional) dict of host suffix and its `AIMDLimit` keyword arguments; by default Screener,
+            which blocks aggressive clients, starts at 2 requests in flight and never goes above 4
+
+            :return: None
+        """
+
+        self._lock = threading.Lock()
+        self._settings = {}
+        self._limits = {}
+        settings = {'screener.in': {'initial_limit': 2, 'max_limit': 4}} if settings is None else settings
+        for host, host_settings in settings.items():
+            self.configure(host, **host_settings)
+
+    def configure(self, host: str, **settings) -> None:
+        """
+            Sets the limit settings (`initial_limit`, `min_limit`, `max_limit`, `increase`, `backoff`,
+            `latency_tolerance`, `latency_slack`, `max_endpoints`) of a host suffix, the limits of its hosts start over
+            with them.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix, e.g. `nseindia.com`
+            :param settings: keyword arguments of `AIMDLimit`
+
+            :return: None
+        """
+
+        host = host.lower().lstrip('.')
+        with self._lock:
+            self._settings[host] = dict(self.default_settings, **settings)
+            for name in [name for name in self._limits if name == host or name.endswith('.' + host)]:
+                del self._limits[name]
+
+    def limit_for(self, url: str) -> AIMDLimit:
+        """
+            Returns the limit of the url's host, it is created on the first request to the host.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: AIMDLimit object
+        """
+
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            limit = self._limits.get(host)
+            if limit is None:
+                suffix = host
+                while suffix and suffix not in self._settings:
+                    suffix = suffix.partition('.')[2]
+                limit = self._limits[host] = AIMDLimit(host, **self._settings.get(suffix, self.default_settings))
+            return limit
+
+    def record(self, url: str, status: int = None, latency: float = None, started: float = None) -> None:
+        """
+            Reports the outcome of a request to the limit of its host, keyed by its endpoint template for the latency.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param status: (optional) status code of the response, None when the request raised
+            :param latency: (optional) seconds taken by the request
+            :param started: (optional) `time.monotonic()` when the request was sent
+
+            :return: None
+        """
+
+        self.limit_for(url).record(status, latency, started, endpoint_template(url)[1])
+
+    def limits(self) -> dict:
+        """
+            Returns the current limit of every host seen so far.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict of host name and its limit of requests in flight
+        """
+
+        with self._lock:
+            limits = list(self._limits.values())
+        return {limit.host: round(limit.limit, 2) for limit in limits}
@@ -0,0 +1,286 @@
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+
+class Validated(namedtuple('Validated', ['etag', 'last_modified', 'data', 'content', 'headers', 'size', 'path'],
+                           defaults=(None,))):
+    """
+        A response kept by `ConditionalCache`, reused as it is when the server answers its revalidation with 304.
+
+        Attributes:
+            etag: value of the `ETag` response header or None
+            last_modified: value of the `Last-Modified` response header or None
+            data: parsed object stored with `store(data=...)`, handed out as it is (`CustomSession` keeps the body
+            instead)
+            content: body of the response (decompressed for a json api, as `requests` handed it out for a raw response)
+            headers: dict of the headers of the response when its body is kept
+            size: size of the body in bytes
+            path: path of the copy of a downloaded body kept on disk, None for the other kinds
+    """
+
+    __slots__ = ()
+
+    def request_headers(self) -> dict:
+        """
+            Headers which make the request conditional on the resource having changed since this response.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict with `If-None-Match` and / or `If-Modified-Since`
+        """
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """
+        Thread-safe in-memory LRU of the validators (`ETag` / `Last-Modified`) of GET responses, along with what the
+        caller reuses when a conditional GET is answered with 304 Not Modified: the body of a json api, so the unchanged
+        body is not downloaded again (it is parsed again for every caller, so no caller can alter what another one
+        gets), or the body and headers of a raw response. It is bounded by the total size of the bodies, the least
+        recently used entries are dropped first.
+
+        Unlike `ResponseCache` it never serves a response without asking the server, so it is safe for any endpoint;
+        only the responses carrying a validator (and no `Cache-Control: no-store`, nor `Vary` on `*`, cookies or
+        credentials) are kept. The key includes the headers of the request, and raw responses are only kept for the
+        `kept_content_types` (JSON / CSV apis), not for HTML pages or files.
+
+        The bodies of `CustomSession.download` are kept as files in a private temporary directory (removed along with
+        the cache) and bounded by `max_file_bytes`, so a large file is revalidated without being held in memory.
+
+        Attributes:
+            max_bytes: upper bound of the total size of the kept bodies
+            max_entries: maximum number of kept responses
+            max_file_bytes: upper bound of the total size of the downloaded bodies kept on disk
+
+        Methods:
+            make_key(url: str, params: dict = None, kind: str = 'json', headers: dict = None) -> str: Builds the key of
+            a GET request.
+            kept_content_type(content_type: str) -> bool: Tells whether the body of a raw response is worth keeping.
+            get(key: str) -> Validated: Returns the kept response of the key or None.
+            store(key: str, response_headers, data=None, content: bytes = None, size: int = None,
+            path: str = None) -> None: Keeps a 200 response with its validators, forgets the key when the response has
+            none.
+            new_file_path() -> str: Returns a fresh path to write the copy of a downloaded body to.
+            discard(key: str) -> None: Forgets the response of a key.
+            clear() -> None: Forgets every response.
+            size() -> int: Total size of the kept bodies in bytes.
+    """
+
+    # content types of the raw responses whose bodies are kept, matched as substrings
+    kept_content_types = ('json', 'csv')
+    # `Vary` values which make a response depend on the caller, such responses are never kept
+    _private_vary = ('*', 'cookie', 'authorization')
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 1024,
+                 max_file_bytes: int = 1024 * 1024 * 1024) -> None:
+        """
+            Builds an empty cache.
+
+            :param self: Represent the instance of the class
+            :param max_bytes: (optional) upper bound of the total size of the kept bodies, default is 64 MB
+            :param max_entries: (optional) maximum number of kept responses
+            :param max_file_bytes: (optional) upper bound of the total size of the downloaded bodies kept on disk,
+            default is 1 GB
+
+            :return: None
+        """
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_file_bytes = max_file_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._file_size = 0
+        self._directory = None
+        self._file_ids = itertools.count()
+
+    @staticmethod
+    def make_key(url: str, params: dict = None, kind: str = 'json', headers: dict = None) -> str:
+        """
+            Builds the key of a GET request from its url, url params and headers; a json api and a raw response of the
+            same url are kept apart as they keep different things.
+
+            :param url: Url of the request
+            :param params: (optional) url params of the request
+            :param kind: (optional) `json` for a json api, `response` for a raw response, `file` for a download
+            :param headers: (optional) headers of the request, the same url asked with other headers is kept apart
+
+            :return: Hex digest which identifies the request
+        """
+
+        headers = {str(name).lower(): value for name, value in (headers or {}).items()}
+        raw_key = json.dumps([kind, url, params or {}, headers], sort_keys=True, default=str)
+        return hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Validated:
+        """
+            Returns the kept response of the key and marks it as recently used.
+
+            :param self: Represent the instance of the class
+            :param key: Key built by `make_key`
+
+            :return: Validated response or None
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def kept_content_type(self, content_type: str) -> bool:
+        """
+            Tells whether the body of a raw response of the content type is worth keeping.
+
+            :param self: Represent the instance of the class
+            :param content_type: Value of the `Content-Type` response header
+
+            :return: True for the `kept_content_types`
+        """
+
+        content_type = (content_type or '').lower()
+        return any(kept in content_type for kept in self.kept_content_types)
+
+    def storable(self, response_headers) -> bool:
+        """
+            Tells whether a response carries a validator and may be kept: not marked `no-store` and not varying with
+            the caller (`Vary: *` / `Cookie` / `Authorization`).
+
+            :param self: Represent the instance of the class
+            :param response_headers: Headers of the response (case-insensitive mapping)
+
+            :return: True if `store` would keep the response
+        """
+
+        vary = response_headers.get('Vary', '').lower()
+        return bool(response_headers.get('ETag') or response_headers.get('Last-Modified')) \
+            and 'no-store' not in response_headers.get('Cache-Control', '').lower() \
+            and not any(private in vary for private in self._private_vary)
+
+    def new_file_path(self) -> str:
+        """
+            Returns a fresh path in the private directory of the cache, to write the copy of a downloaded body to
+            before handing it to `store`.
+
+            :param self: Represent the instance of the class
+
+            :return: Path of a file which doesn't exist yet
+        """
+
+        with self._lock:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix='bharat_sm_data_downloads_')
+                # the copies go away with the cache, or when the process exits
+                weakref.finalize(self, shutil.rmtree, self._directory, True)
+            return os.path.join(self._directory, f'{next(self._file_ids)}.body')
+
+    def store(self, key: str, response_headers, data=None, content: bytes = None, size: int = None,
+              path: str = None) -> None:
+        """
+            Keeps a 200 response along with its validators, a response without any validator (or marked `no-store`)
+            forgets what was kept for the key.
+
+            :param self: Represent the instance of the class
+            :param key: Key built by `make_key`
+            :param response_headers: Headers of the response (case-insensitive mapping)
+            :param data: (optional) parsed object of a json api
+            :param content: (optional) body of a raw response, its headers are kept along with it
+            :param size: (optional) size of the body in bytes, default is the length of `content`
+            :param path: (optional) copy of a downloaded body from `new_file_path`, the cache owns the file from now on
+            and removes it when the entry is dropped
+
+            :return: None
+        """
+
+        size = len(content or b'') if size is None else size
+        if not self.storable(response_headers) or size > (self.max_bytes if path is None else self.max_file_bytes):
+            self.discard(key)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+            return
+        headers = dict(response_headers) if content is not None else None
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = Validated(response_headers.get('ETag'), response_headers.get('Last-Modified'), data,
+                                           content, headers, size, path)
+            if path is None:
+                self._size += size
+            else:
+                self._file_size += size
+            while self._size > self.max_bytes or self._file_size > self.max_file_bytes \
+                    or len(self._entries) > self.max_entries:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        """
+            Drops the response of a key, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param key: Key built by `make_key`
+
+            :return: None
+        """
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry.path is None:
+            self._size -= entry.size
+            return
+        self._file_size -= entry.size
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+    def discard(self, key: str) -> None:
+        """
+            Forgets the response of a key.
+
+            :param self: Represent the instance of the class
+            :param key: Key built by `make_key`
+
+            :return: None
+        """
+
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        """
+            Forgets every response.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            for key in list(self._entries):
+                self._pop(key)
+
+    def size(self) -> int:
+        """
+            Total size of the kept bodies.
+
+            :param self: Represent the instance of the class
+
+            :return: Size in bytes
+        """
+
+        with self._lock:
+            return self._size
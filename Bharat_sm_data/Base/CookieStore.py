@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from os import makedirs, path
+
+from requests.cookies import create_cookie
+
+
+class CookieStore:
+    """
+        Persists the cookie jar of a session to a JSON file, with the expiry of every cookie, so a fresh process can
+        reuse the cookies set by the warm-up requests of an earlier one instead of warming up again.
+
+        Cookies without an expiry (session cookies) are trusted for `session_cookie_ttl` seconds after they were saved.
+        The file is replaced atomically, so one store can be shared by several processes.
+
+        Attributes:
+            file_path: path of the JSON file
+            session_cookie_ttl: seconds a saved cookie without expiry is considered fresh
+            min_ttl: cookies expiring within these many seconds are treated as already expired
+
+        Methods:
+            load(jar, domain: str = None) -> bool: Loads the saved cookies into the jar if all of them are fresh.
+            save(jar, domain: str = None) -> None: Saves the cookies of the jar.
+            clear() -> None: Deletes the saved cookies.
+    """
+
+    default_path = path.join(path.expanduser('~'), '.cache', 'bharat_sm_data', 'cookies.json')
+
+    def __init__(self, file_path: str = None, session_cookie_ttl: float = 30 * 60, min_ttl: float = 60) -> None:
+        """
+            Builds the store, nothing is read or written till `load` / `save` is called.
+
+            :param self: Represent the instance of the class
+            :param file_path: (optional) path of the JSON file, default is `~/.cache/bharat_sm_data/cookies.json`
+            :param session_cookie_ttl: (optional) seconds a saved cookie without expiry is considered fresh
+            :param min_ttl: (optional) cookies expiring within these many seconds are treated as already expired
+
+            :return: None
+        """
+
+        self.file_path = file_path or self.default_path
+        self.session_cookie_ttl = session_cookie_ttl
+        self.min_ttl = min_ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _matches(cookie_domain: str, domain: str) -> bool:
+        """
+            Tells whether a cookie of `cookie_domain` belongs to `domain` or to one of its sub domains.
+
+            :param cookie_domain: Domain attribute of the cookie
+            :param domain: Domain to match, e.g. `nseindia.com`
+
+            :return: True if the cookie belongs to the domain
+        """
+
+        cookie_domain = cookie_domain.lstrip('.').lower()
+        return cookie_domain == domain or cookie_domain.endswith(f'.{domain}')
+
+    def _read(self) -> dict:
+        """
+            Reads the saved cookies, a missing or corrupt file is treated as empty.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict with `saved_at` and `cookies` keys or None
+        """
+
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self, jar, domain: str = None) -> bool:
+        """
+            Loads the saved cookies into the jar. Nothing is loaded when there are no saved cookies or any one of them
+            has expired (or is about to), since a partial set would not pass the checks of the website anyway.
+
+            :param self: Represent the instance of the class
+            :param jar: `requests` cookie jar to load the cookies into
+            :param domain: (optional) only the cookies of this domain (and its sub domains) are considered
+
+            :return: True if fresh cookies were loaded, False if a warm-up is required
+        """
+
+        with self._lock:
+            saved = self._read()
+        if not saved or not saved.get('cookies'):
+            return False
+
+        fresh_till = time.time() + self.min_ttl
+        cookies = []
+        for entry in saved['cookies']:
+            if domain and not self._matches(entry['domain'], domain.lower()):
+                continue
+            expires = entry.get('expires')
+            if expires is None:
+                expires = saved.get('saved_at', 0) + self.session_cookie_ttl
+            if expires <= fresh_till:
+                return False
+            cookies.append(entry)
+        if not cookies:
+            return False
+
+        for entry in cookies:
+            jar.set_cookie(create_cookie(entry['name'], entry['value'], domain=entry['domain'], path=entry['path'],
+                                         secure=entry.get('secure', False), expires=entry.get('expires'),
+                                         rest=entry.get('rest') or {}))
+        return True
+
+    def save(self, jar, domain: str = None) -> None:
+        """
+            Saves the cookies of the jar, replacing the earlier saved ones.
+
+            :param self: Represent the instance of the class
+            :param jar: `requests` cookie jar, or a list of its cookies, to save
+            :param domain: (optional) only the cookies of this domain (and its sub domains) are saved
+
+            :return: None
+        """
+
+        cookies = [{
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path,
+            'secure': cookie.secure,
+            'expires': cookie.expires,
+            'rest': dict(getattr(cookie, '_rest', {}) or {}),
+        } for cookie in jar if not domain or self._matches(cookie.domain, domain.lower())]
+        if not cookies:
+            return
+
+        directory = path.dirname(path.abspath(self.file_path))
+        with self._lock:
+            makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.cookies-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'saved_at': time.time(), 'cookies': cookies}, f)
+                os.replace(tmp_path, self.file_path)
+            except BaseException:
+                if path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def clear(self) -> None:
+        """
+            Deletes the saved cookies.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            if path.exists(self.file_path):
+                os.remove(self.file_path)
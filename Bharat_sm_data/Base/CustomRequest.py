@@ -1,16 +1,184 @@
+import asyncio
 import json
+import os
+import threading
+import time
+import weakref
+from collections import namedtuple
+from http.cookiejar import http2time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import ContextVar, copy_context
+from functools import partial
+from types import MappingProxyType
+from urllib.parse import urlsplit
+
 import brotli
-from requests import Session, session
+from requests import Response, Session, session
 from requests.adapters import HTTPAdapter, Retry
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .CircuitBreaker import HostCircuitBreaker
+from .ConcurrencyLimiter import HostConcurrencyLimiter
+from .ConditionalCache import ConditionalCache, Validated
+from .Deadline import Deadline
+from .Exceptions import CircuitOpenError, DeadlineExceeded
+from .FastJson import loads as json_loads
+from .Metrics import MetricsRegistry
+from .Operation import Operation, RequestSpec
+from .Priority import Priority
+from .RateLimiter import HostRateLimiter
+from .ResponseCache import ResponseCache
+from .SessionRegistry import SessionRegistry, SessionState
+from .SingleFlight import SingleFlight
+from .Transport import RequestsTransport
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, only the async API needs it
+    aiohttp = None
+
+# set while the requests of a primer are being made, so they don't try to prime the session themselves
+_priming = ContextVar('bharat_sm_data_priming', default=False)
+
+
+class FetchResult(namedtuple('FetchResult', ['spec', 'data', 'error'])):
+    """
+        Outcome of one request of `CustomSession.fetch_many`.
+
+        Attributes:
+            spec: the request spec as it was passed
+            data: parsed JSON, decompressed bytes, the response or the bytes written (as per the `kind` asked for);
+            None on error
+            error: the exception raised by the request or None
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DownloadProgress(namedtuple('DownloadProgress', ['url', 'received', 'total', 'elapsed'])):
+    """
+        Progress of a `CustomSession.download`, handed to its `progress` callback after every chunk written.
+
+        Attributes:
+            url: url of the download
+            received: bytes of the (decompressed) body written so far
+            total: size of the body from `Content-Length`, None when unknown or the body is compressed on the wire
+            elapsed: seconds since the response headers arrived
+    """
+
+    __slots__ = ()
+
+    @property
+    def rate(self) -> float:
+        """
+            Throughput of the download so far in bytes per second.
+
+            :param self: Represent the instance of the class
+
+            :return: Bytes per second, 0 before any time has elapsed
+        """
+
+        return self.received / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _Tee:
+    """
+        Writes every chunk of a download to the destination and to the copies kept by the caches.
+    """
+
+    def __init__(self, sink, *copies) -> None:
+        self.sink = sink
+        self.copies = copies
+
+    def write(self, chunk: bytes) -> None:
+        self.sink.write(chunk)
+        for copy in self.copies:
+            copy.write(chunk)
+
+
+class _BoundedCopy:
+    """
+        In-memory copy of a download for the response cache, given up (and its memory released) as soon as the body
+        outgrows `limit` bytes, so a large file never ends up in memory.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.overflowed = False
+        self._buffer = bytearray()
+
+    def write(self, chunk: bytes) -> None:
+        if self.overflowed:
+            return
+        if len(self._buffer) + len(chunk) > self.limit:
+            self.overflowed = True
+            self._buffer = bytearray()
+            return
+        self._buffer += chunk
+
+    def getvalue(self) -> bytes:
+        return None if self.overflowed else bytes(self._buffer)
 
 
 class CustomSession:
     """
         A custom class for creating a session object with retries, timeouts, and headers.
 
+        Thread safety:
+            A client can be shared by any number of threads (e.g. one warmed up NSE client serving a 32 thread pool):
+            the default headers are read-only (assign a new dict to `headers` to replace them, use `merge_headers` to
+            send extra headers with one request), the cookie jar is read under a lock, priming runs once for all the
+            concurrent callers (a burst of 401 / 403 re-primes the host once, then every caller replays its request)
+            and the rate limiter, cache, metrics and single flight are thread-safe.
+            Configure the client (`timeout`, `cache`, `single_flight`, `cassette`, primers) before sharing it.
+
         Attributes:
             session : session object for making HTTP requests
-            headers: headers required for getting data from a website via API
+            headers: read-only default headers sent with every request, required for getting data from a website via API
+            cache: (optional) response cache (e.g. `ResponseCache`) consulted before hitting the network
+            conditional_cache: `ConditionalCache` of the validators (ETag / Last-Modified) of the GET responses, the
+            next request sends them as `If-None-Match` / `If-Modified-Since` and a 304 answer is served the kept parsed
+            object (json apis) or body (raw responses); shared by all the clients of the process by default, set it to
+            None to disable conditional requests
+            single_flight: (optional) `SingleFlight` group which coalesces concurrent identical requests
+            cassette: (optional) `Cassette` which records the requests / responses or serves them back offline
+            hedger: (optional) `Hedger` which sends a duplicate of a slow request to a latency critical json api (option
+            chain, charting history, live derivative prices) and takes the first response
+            metrics: `MetricsRegistry` which records latency, bytes, retries, status codes and cache hits of every
+            request per host and endpoint; it is shared by all the clients of the process by default, set it to None to
+            disable recording
+            rate_limiter: per host token bucket limiter applied to every request, it is shared by all the clients of
+            the process by default; set it to None to disable throttling. Requests waiting for a host are served by
+            `Priority` (interactive before bulk) and the time they wait is recorded as the `queue_wait` histogram
+            circuit_breaker: `HostCircuitBreaker` which fails the requests to a host with `CircuitOpenError` right away
+            while the host keeps failing; it is shared by all the clients of the process by default, set it to None to
+            always send the requests
+            concurrency_limiter: `HostConcurrencyLimiter` which adapts the requests kept in flight per host by the bulk
+            APIs (AIMD on 403 / 429 / 5xx and latency), shared by all the clients of the process by default; set it to
+            None to use the fixed `bulk_per_host`
+            transport: `Transport` which sends the sync requests, `RequestsTransport` (the `requests` session) by
+            default; assign a `PoolTransport` to a client polling hot endpoints to skip the `requests` overhead
+            async_connection_limit: maximum number of simultaneous connections used by the async API
+            bulk_per_host: maximum number of requests `fetch_many` / `async_fetch_many` keep in flight to one host when
+            `concurrency_limiter` is None
+            bulk_max_workers: maximum number of threads `fetch_many` runs the requests on
+            download_cache_max_bytes: largest body of a `download` stored into `self.cache`, a larger one is not
+            cached (its copy would have to be held in memory)
+            download_chunk_size: bytes read from the wire and written at a time by `download`, it bounds the memory
+            a download takes whatever the size of the file
+            timeout: (connect, read) timeout in seconds applied to every request, both are cut down to the time left
+            when the request is made inside a `Deadline` block
+            primers: dict of host suffix and the pages (or callables) which set the cookies required by its apis,
+            shared by the session family
+            session_family: host family whose warmed up session (connection pool, cookie jar and primers) the client
+            shares with the other clients of the family, None (the default) gives the client a session of its own
+            session_registry: `SessionRegistry` of the shared sessions, process-wide by default; set it to None to give
+            every client a session of its own
 
         Methods:
             __init__(self, headers: dict = None) -> None:
@@ -19,11 +187,80 @@ class CustomSession:
             get_session(self) -> Session:
                 Returns the session object.
 
-            hit_and_get_data(self, url: str, params: dict = None) -> dict:
+            add_primer(self, host: str, *steps, shared: bool = True) -> None:
+                Registers the pages / callables which prime the session for a host, they run lazily before the first
+                request to the host and again whenever it answers with 401 / 403; `shared=False` keeps them to the
+                client instead of its session family.
+
+            mark_primed(self, host: str) -> None:
+                Marks a host as primed, e.g. when its cookies were restored from elsewhere.
+
+            merge_headers(self, overlay: dict = None) -> dict:
+                Returns a new dict of the default headers overridden by the given ones, for a single request.
+
+            hit_and_get_data(self, url: str, params: dict = None, headers: dict = None, priority: int = None) -> dict:
                 Hits the API and gets the data based on the endpoint and parameters passed.
 
+            post_and_get_data(self, url: str, json_data: dict = None, headers: dict = None,
+                              priority: int = None) -> dict:
+                Hits the API with a POST request and gets the data based on the endpoint and payload passed.
+
+            hit_and_get_content(self, url: str, params: dict = None, priority: int = None,
+                                headers: dict = None) -> bytes:
+                Hits the url and returns the raw (decompressed) body, used for non JSON payloads like CSV and HTML.
+
+            hit_and_get_response(self, url: str, params: dict = None, headers: dict = None, priority: int = None,
+                                 **kwargs) -> Response:
+                Throttled GET request which returns the `requests` response as it is (HTML pages, files, etc.).
+
+            post_and_get_response(self, url: str, json_data: dict = None, data: dict = None, headers: dict = None,
+                                  priority: int = None, **kwargs) -> Response:
+                Throttled POST request which returns the `requests` response as it is.
+
+            async_hit_and_get_data(self, url: str, params: dict = None, headers: dict = None,
+                                   priority: int = None) -> dict:
+                Coroutine equivalent of `hit_and_get_data` running on the asyncio transport.
+
+            download(self, url: str, destination, params: dict = None, headers: dict = None, progress=None,
+                     chunk_size: int = None, priority: int = None, **kwargs) -> int:
+                Streams a large body (PDF, CSV master, archive) chunk by chunk to a file or to any object with a
+                `write` method, without holding it in memory.
+
+            fetch_many(self, specs: list, kind: str = 'json', per_host: int = None, max_workers: int = None,
+                       priority: int = None) -> list:
+                Runs many requests concurrently on a thread pool, bounded per host, and returns a `FetchResult` per
+                request in the order of the specs; `kind='file'` downloads the bodies to the `destination` of the specs.
+
+            async_post_and_get_data(self, url: str, json_data: dict = None, headers: dict = None,
+                                    priority: int = None) -> dict:
+                Coroutine equivalent of `post_and_get_data` running on the asyncio transport.
+
+            async_fetch_many(self, specs: list, per_host: int = None, priority: int = None) -> list:
+                Coroutine equivalent of `fetch_many` for JSON apis running on the asyncio transport.
+
+            aclose(self) -> None:
+                Closes the asyncio transport.
+
+            close(self) -> None:
+                Shuts down the threads the client started for hedged requests.
+
+            run(self, operation: Operation, priority: int = None) -> object:
+                Makes the request of an `Operation` built by a client and parses its payload.
+
+            run_many(self, operations: list, parse_executor=None, per_host: int = None, max_workers: int = None,
+                     priority: int = None) -> list:
+                Runs many operations with `fetch_many`, the payloads can be parsed on a process pool.
+
+            async_run(self, operation: Operation, priority: int = None) -> object:
+                Coroutine equivalent of `run`.
+
+            async_run_many(self, operations: list, parse_executor=None, per_host: int = None,
+                           priority: int = None) -> list:
+                Coroutine equivalent of `run_many`.
+
         Args:
             headers : (optional) headers required for getting data from a website via API
+            cache : (optional) response cache consulted before hitting the network
 
         Returns:
             dict : JSON parsed result of the output response data from the API
@@ -33,7 +270,29 @@ class CustomSession:
             Exception: If there is an error in connecting to the URL
     """
 
-    def __init__(self, headers: dict = None) -> None:
+    _max_retries = 3
+    _backoff_factor = 0.1
+    _retry_statuses = (500, 502, 503, 504, 400, 402)
+    _reprime_statuses = (401, 403)
+    _connect_timeout = 5
+    _read_timeout = 30
+    # connections kept per host, enough for a shared client serving a thread pool without discarding connections
+    _pool_maxsize = 32
+    rate_limiter = HostRateLimiter()
+    circuit_breaker = HostCircuitBreaker()
+    concurrency_limiter = HostConcurrencyLimiter()
+    conditional_cache = ConditionalCache()
+    metrics = MetricsRegistry()
+    session_registry = SessionRegistry()
+    session_family = None
+    transport = RequestsTransport()
+    bulk_per_host = 4
+    bulk_max_workers = 16
+    download_chunk_size = 64 * 1024
+    download_cache_max_bytes = 4 * 1024 * 1024
+    _bulk_kinds = ('json', 'content', 'response', 'file')
+
+    def __init__(self, headers: dict = None, cache=None) -> None:
         """
             It's a custom class that does the common functionalities creating a session object with Retries, timeouts,
             builds from the headers, etc.
@@ -41,22 +300,96 @@ class CustomSession:
             :param self: Represent the instance of the class
             :param headers: (optional) headers required for getting data from a website via api. This is required
              because most of the websites require headers since they validate few to identify it is genuinely used
+            :param cache: (optional) response cache (e.g. `ResponseCache`), it can also be set later via `self.cache`
 
             :return: None
         """
 
-        self.session = session()
-        if headers:
-            self.headers = headers
+        if self.session_family and self.session_registry is not None:
+            state = self.session_registry.get(self.session_family, self._new_session_state)
         else:
-            self.headers = {}
+            state = self._new_session_state()
+        self.session = state.session
+        self.primers = state.primers
+        self._own_primers = {}
+        self._primed = state.primed
+        self._prime_generations = state.prime_generations
+        self._priming_flight = state.priming_flight
+        self._cookie_lock = state.cookie_lock
+
+        self.headers = headers or {}
+        self.timeout = (self._connect_timeout, self._read_timeout)
+        self.cache = cache
+        self.single_flight = None
+        self.cassette = None
+        self.hedger = None
+        self._hedge_pools = None
+        self._hedge_lock = threading.Lock()
+
+        self.async_connection_limit = 200
+        self._async_session = None
+        self._async_loop = None
+
+    def _new_session_state(self) -> SessionState:
+        """
+            Builds a new `requests` session with the retry policy and connection pool of the class.
+
+            :param self: Represent the instance of the class
+
+            :return: SessionState of the new session
+        """
+
+        # 401 / 403 are never retried as they are, only the refreshed cookies of a re-prime can fix them
+        retries = Retry(total=self._max_retries,
+                        backoff_factor=self._backoff_factor,
+                        status_forcelist=[status for status in self._retry_statuses
+                                          if status not in self._reprime_statuses])
+
+        new_session = session()
+        new_session.mount('https://', HTTPAdapter(max_retries=retries, pool_maxsize=self._pool_maxsize))
+        return SessionState(new_session)
+
+    @property
+    def headers(self) -> MappingProxyType:
+        """
+            Default headers of every request; they are read-only so a client can be shared across threads.
+
+            :param self: Represent the instance of the class
+
+            :return: Read-only mapping of the headers
+        """
+
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: dict) -> None:
+        """
+            Replaces the default headers as a whole, requests already in flight keep the earlier ones.
+
+            :param self: Represent the instance of the class
+            :param headers: New default headers
 
-        retries = Retry(total=3,
-                        backoff_factor=0.1,
-                        status_forcelist=[500, 502, 503, 504, 400, 401, 402, 403])
+            :return: None
+        """
+
+        self._headers = MappingProxyType(dict(headers))
+
+    def merge_headers(self, overlay: dict = None) -> dict:
+        """
+            Returns a new dict of the default headers overridden by the given ones (names are matched case
+            insensitively), meant to be passed as the `headers` of a single request.
+
+            :param self: Represent the instance of the class
+            :param overlay: (optional) headers to add / override
+
+            :return: Dict of headers
+        """
 
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
-        self.session.timeout = 30  # timeout for 30 seconds
+        overlay = overlay or {}
+        names = {name.lower() for name in overlay}
+        headers = {name: value for name, value in self._headers.items() if name.lower() not in names}
+        headers.update(overlay)
+        return headers
 
     def get_session(self) -> Session:
         """
@@ -69,65 +402,1824 @@ class CustomSession:
 
         return self.session
 
-    def hit_and_get_data(self, url: str, params: dict = None) -> dict:
+    # ----------------------------------------------------------------------------------------------------------------
+    # Session priming
+
+    def add_primer(self, host: str, *steps, shared: bool = True) -> None:
         """
-            Hitting the api and gets the data based on the endpoint passed as well as the url params / params for the
-            get type of requests, all api used in this library are of get type so its supports only GET type requests
+            Registers the steps which prime the session (set the cookies, log in, etc.) for the apis of a host. They are
+            not run here but lazily, right before the first request to the host, and again whenever the host answers
+            a request with 401 / 403; so constructing a client costs no network round trip.
 
-            :param self: Represent the instance of the class.
-            :param url: Endpoint of the api; aka link of the api
-            :param params: (optional) parameters which is required to get exact data from the api aka url params
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix, e.g. `nseindia.com` covers every `*.nseindia.com` host
+            :param steps: Urls to GET, or callables without arguments, run in the given order; the steps already
+             registered are not added twice
+            :param shared: (optional) register the steps for every client of the session family, False keeps them to
+             this client (run after the shared ones), e.g. a page only its own apis need
 
-            :return: Dict object which is json parsed result of the output response data got from hitting above request
+            :return: None
+        """
+
+        host = host.lower().lstrip('.')
+        primer = self.primers.setdefault(host, []) if shared else self._own_primers.setdefault(host, [])
+        primer.extend(step for step in steps if step not in primer)
+
+    def _primer_steps(self, host: str) -> list:
+        """
+            Returns the primer steps of a host for this client: the ones shared by its session family followed by its
+            own.
+
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+
+            :return: List of steps
+        """
+
+        shared = self.primers.get(host, [])
+        own = self._own_primers.get(host)
+        return shared + [step for step in own if step not in shared] if own else list(shared)
+
+    def mark_primed(self, host: str) -> None:
+        """
+            Marks a host as primed so its primer is not run before the first request, e.g. when the cookies of the host
+            were restored from a cookie store.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix which was registered with `add_primer`
+
+            :return: None
+        """
+
+        host = host.lower().lstrip('.')
+        self._primed[host] = set(self._primer_steps(host))
+
+    def _primer_host(self, url: str) -> str:
+        """
+            Finds the longest registered host suffix matching the host of the url.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: The registered host suffix or None if the host has no primer
+        """
+
+        host = (urlsplit(url).hostname or '').lower()
+        while host:
+            if host in self.primers or host in self._own_primers:
+                return host
+            host = host.partition('.')[2]
+        return None
+
+    def _on_primed(self, host: str) -> None:
+        """
+            Called after the primer of a host ran, subclasses override it to persist the fresh cookies etc.
+
+            :param self: Represent the instance of the class
+            :param host: Host suffix which was primed
+
+            :return: None
+        """
+
+    def _pending_steps(self, host: str, stale: int = None) -> list:
+        """
+            Returns the primer steps of a host which have to run: the ones which never ran (e.g. registered by another
+            client of the session family after the host was primed), or all of them when the caller's request was
+            rejected by the generation of the primer which is still the current one (no other caller re-primed since).
+
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+            :param stale: (optional) generation of the primer the caller's request was rejected with
+
+            :return: List of steps, empty when the host is primed
+        """
+
+        if stale is None:
+            primed = self._primed.get(host, ())
+            return [step for step in self._primer_steps(host) if step not in primed]
+        if self._prime_generations.get(host, 0) == stale:
+            return self._primer_steps(host)
+        return []
+
+    def _primed_with(self, host: str, steps: list, full: bool) -> None:
+        """
+            Records the primer steps of a host which ran, a full run starts a new generation of the primer.
+
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+            :param steps: Steps which ran
+            :param full: True if every step ran, False if only the ones missing from the current generation
+
+            :return: None
+        """
+
+        if full:
+            self._primed[host] = set(steps)
+            self._prime_generations[host] = self._prime_generations.get(host, 0) + 1
+        else:
+            self._primed[host] = self._primed.get(host, set()) | set(steps)
+        self._on_primed(host)
+
+    def _prime(self, host: str, stale: int = None) -> None:
+        """
+            Runs the primer of a host, a failing step is reported and the remaining steps still run.
+
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+            :param stale: (optional) generation of the primer the caller's request was rejected with
+
+            :return: None
         """
 
+        # a caller arriving right after another one's run finished finds the host freshly primed
+        steps = self._pending_steps(host, stale)
+        if not steps:
+            return
+        full = stale is not None or not self._primed.get(host)
+        token = _priming.set(True)
         try:
-            if params:
-                response =  self.session.get(url, params=params, headers=self.headers)
-            else:
-                response =  self.session.get(url, headers=self.headers)
-            encoding = response.headers.get('Content-Encoding', '')
-            if encoding == 'br':
+            for step in steps:
                 try:
-                    data = brotli.decompress(response.content).decode("utf-8")
-                except brotli.error:
-                    data = response.content.decode("utf-8")
-            else:
-                data = response.text
-            return json.loads(data)
-        except json.JSONDecodeError:
-            return {}
-        except Exception as err:
-            print(f'Error in connecting to url : {url} Error : {err}')
-            return {}
+                    step() if callable(step) else self.hit_and_get_response(step)
+                except Exception as err:
+                    print(f'Error in priming the session with {step} Error : {err}')
+        finally:
+            _priming.reset(token)
+        self._primed_with(host, steps, full)
 
-    def post_and_get_data(self, url: str, json_data: dict = None, headers: dict = None) -> dict:
+    async def _async_prime(self, host: str, stale: int = None) -> None:
         """
-            Hitting the api with POST request and gets the data based on the endpoint passed
+            Coroutine equivalent of `_prime`, the urls are hit with the asyncio transport.
 
-            :param self: Represent the instance of the class.
-            :param url: Endpoint of the api; aka link of the api
-            :param json_data: (optional) JSON payload to send in POST request body
-            :param headers: (optional) Custom headers for this specific request
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+            :param stale: (optional) generation of the primer the caller's request was rejected with
 
-            :return: Dict object which is json parsed result of the output response data got from hitting above request
+            :return: None
         """
 
+        steps = self._pending_steps(host, stale)
+        if not steps:
+            return
+        full = stale is not None or not self._primed.get(host)
+        token = _priming.set(True)
         try:
-            request_headers = headers if headers else self.headers
-            response = self.session.post(url, json=json_data, headers=request_headers)
-            encoding = response.headers.get('Content-Encoding', '')
-            if encoding == 'br':
+            for step in steps:
                 try:
-                    data = brotli.decompress(response.content).decode("utf-8")
-                except brotli.error:
-                    data = response.content.decode("utf-8")
-            else:
-                data = response.text
-            return json.loads(data)
-        except json.JSONDecodeError:
-            return {}
-        except Exception as err:
-            print(f'Error in connecting to url : {url} Error : {err}')
-            return {}
+                    if callable(step):
+                        step()
+                        continue
+                    self._circuit_allow(step)
+                    await self._async_throttle(step)
+                    async with self._get_async_session().get(step, headers=self.headers,
+                                                             cookies=self._cookies_for(step),
+                                                             timeout=self._async_request_timeout()) as response:
+                        await response.read()
+                        self._store_cookies(step, response.cookies)
+                    self._record_outcome(step, response.status)
+                except Exception as err:
+                    print(f'Error in priming the session with {step} Error : {err}')
+        finally:
+            _priming.reset(token)
+        self._primed_with(host, steps, full)
+
+    def _priming_key(self, host: str):
+        """
+            Key the concurrent priming runs of a host are coalesced on, the clients with primer steps of their own don't
+            wait for a run which skips them.
+
+            :param self: Represent the instance of the class
+            :param host: Registered host suffix
+
+            :return: The host, or (host, own steps) when the client has its own steps
+        """
+
+        own = self._own_primers.get(host)
+        return (host, tuple(own)) if own else host
+
+    def _ensure_primed(self, url: str, stale: int = None) -> int:
+        """
+            Runs the primer of the url's host unless it already ran; concurrent callers share one run.
+
+            When the cookies expire mid-session every request in flight is rejected with 401 / 403 at once, so each
+            caller passes the generation its request was sent with: the first one re-primes the host, the others wait
+            for that run and then find a newer generation, so they only replay their requests.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request about to be made
+            :param stale: (optional) generation returned for a request which was then rejected with 401 / 403
+
+            :return: Generation of the host's primer (incremented by every run), None if the host has no primer
+        """
+
+        if _priming.get():
+            return None
+        host = self._primer_host(url)
+        if host is None:
+            return None
+        if self._pending_steps(host, stale):
+            self._priming_flight.do(self._priming_key(host), lambda: self._prime(host, stale))
+        return self._prime_generations.get(host, 0)
+
+    async def _async_ensure_primed(self, url: str, stale: int = None) -> int:
+        """
+            Coroutine equivalent of `_ensure_primed`.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request about to be made
+            :param stale: (optional) generation returned for a request which was then rejected with 401 / 403
+
+            :return: Generation of the host's primer (incremented by every run), None if the host has no primer
+        """
+
+        if _priming.get():
+            return None
+        host = self._primer_host(url)
+        if host is None:
+            return None
+        if self._pending_steps(host, stale):
+            await self._priming_flight.async_do(self._priming_key(host), lambda: self._async_prime(host, stale))
+        return self._prime_generations.get(host, 0)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Core - shared by the sync and async transports
+
+    @staticmethod
+    def _decode_body(content: bytes, encoding: str) -> bytes:
+        """
+            Decompresses brotli compressed bodies which were not already decoded by the transport.
+
+            :param content: Raw bytes of the response body
+            :param encoding: Value of the `Content-Encoding` response header
+
+            :return: Decompressed bytes of the body
+        """
+
+        if encoding == 'br':
+            try:
+                return brotli.decompress(content)
+            except brotli.error:
+                pass
+        return content
+
+    @staticmethod
+    def _parse_json(content: bytes) -> dict:
+        """
+            Decodes the decompressed body of a response into a python object, the bytes are parsed as they are (orjson
+            when installed) without a round trip through str.
+
+            :param content: Decompressed bytes of the response body
+
+            :return: JSON parsed result of the body
+        """
+
+        return json_loads(content)
+
+    def _cache_key(self, method: str, url: str, params: dict = None, json_data: dict = None) -> tuple:
+        """
+            Builds the cache key and TTL of a request.
+
+            :param self: Represent the instance of the class
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload of the request
+
+            :return: A tuple of key and TTL, both are None when there is no cache or the url is not cacheable
+        """
+
+        if self.cache is None:
+            return None, None
+        ttl = self.cache.ttl_for(url)
+        if not ttl:
+            return None, None
+        return self.cache.make_key(method, url, self._prepare_params(params), json_data), ttl
+
+    def _throttle(self, url: str) -> None:
+        """
+            Waits for the rate limiter of the url's host, if any, behind the more urgent requests (see `Priority`) and
+            records the time spent in its queue into the `queue_wait` histogram.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: None
+        """
+
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(url, Priority.current())
+            if self.metrics is not None:
+                self.metrics.observe(url, 'queue_wait', waited)
+
+    async def _async_throttle(self, url: str) -> None:
+        """
+            Coroutine equivalent of `_throttle`.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: None
+        """
+
+        if self.rate_limiter is not None:
+            waited = await self.rate_limiter.async_acquire(url, Priority.current())
+            if self.metrics is not None:
+                self.metrics.observe(url, 'queue_wait', waited)
+
+    def _circuit_allow(self, url: str) -> None:
+        """
+            Raises `CircuitOpenError` while the circuit breaker of the url's host is open.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: None
+        """
+
+        if self.circuit_breaker is None:
+            return
+        try:
+            self.circuit_breaker.allow(url)
+        except CircuitOpenError:
+            if self.metrics is not None:
+                self.metrics.inc(url, 'circuit_open')
+            raise
+
+    def _record_outcome(self, url: str, status: int = None, latency: float = None) -> None:
+        """
+            Records the outcome of a request in the circuit breaker and the concurrency limiter, a request cut short by
+            the `Deadline` is not held against the host.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param status: (optional) status code of the response, None when the request raised
+            :param latency: (optional) seconds taken by the request
+
+            :return: None
+        """
+
+        if status is None and Deadline.expired():
+            return
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url, status)
+        if self.concurrency_limiter is not None:
+            started = time.monotonic() - latency if latency is not None else None
+            self.concurrency_limiter.record(url, status, latency, started)
+
+    def _request_timeout(self, timeout=None) -> tuple:
+        """
+            Builds the (connect, read) timeout of a request, cut down to the time left for the current `Deadline`.
+
+            :param self: Represent the instance of the class
+            :param timeout: (optional) timeout asked by the caller, either seconds or a (connect, read) tuple; default
+            is `self.timeout`
+
+            :return: A tuple of connect and read timeout in seconds
+        """
+
+        if timeout is None:
+            timeout = self.timeout
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        remaining = Deadline.check()
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        return connect, read
+
+    def _async_request_timeout(self):
+        """
+            Builds the `aiohttp` timeout of a request, the whole request is bounded by the time left for the current
+            `Deadline`.
+
+            :param self: Represent the instance of the class
+
+            :return: aiohttp.ClientTimeout object
+        """
+
+        connect, read = self._request_timeout()
+        return aiohttp.ClientTimeout(total=Deadline.remaining(), connect=connect, sock_read=read)
+
+    def _cache_get(self, key: str, url: str) -> bytes:
+        """
+            Looks up the cache and records the hit / miss.
+
+            :param self: Represent the instance of the class
+            :param key: Cache key of the request, None when the request is not cacheable
+            :param url: Url of the request
+
+            :return: Cached body or None
+        """
+
+        if not key:
+            return None
+        content = self.cache.get(key)
+        if self.metrics is not None:
+            self.metrics.inc(url, 'cache.miss' if content is None else 'cache.hit')
+        return content
+
+    def _conditional(self, method: str, url: str, params: dict, headers, kind: str) -> tuple:
+        """
+            Looks up the validators of a GET request in `self.conditional_cache` and adds them to its headers, so the
+            server answers with an empty 304 when the resource didn't change.
+
+            :param self: Represent the instance of the class
+            :param method: HTTP method of the request, only GET requests are made conditional
+            :param url: Url of the request
+            :param params: url params of the request
+            :param headers: headers of the request
+            :param kind: `json` when the parsed object is reused, `response` when the raw response is, `file` when the
+            copy of a download kept on disk is
+
+            :return: A tuple of the key (None when the response must not be kept), the kept response (None when there
+            is nothing to revalidate) and the headers to send
+        """
+
+        cache = self.conditional_cache
+        # a recorded / replayed request is never made conditional, the cassette must hold real bodies
+        if cache is None or method != 'GET' or self.cassette is not None:
+            return None, None, headers
+        key = cache.make_key(url, self._prepare_params(params), kind, headers)
+        validated = cache.get(key)
+        if validated is None:
+            return key, None, headers
+        return key, validated, dict(headers, **validated.request_headers())
+
+    def _not_modified(self, url: str, validated: Validated, status: int) -> bool:
+        """
+            Tells whether a conditional request was answered with 304, so the kept response is to be reused, and
+            records the revalidation.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param validated: Kept response whose validators were sent, None when the request was not conditional
+            :param status: HTTP status code of the response
+
+            :return: True if the kept response is to be reused
+        """
+
+        if validated is None or status != 304:
+            return False
+        if self.metrics is not None:
+            self.metrics.inc(url, 'cache.revalidated')
+        return True
+
+    def _record(self, url: str, status: int, latency: float, ttfb: float = None, compressed: int = None,
+                decompressed: int = None, retries: int = 0) -> None:
+        """
+            Records the metrics of a finished request.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param status: HTTP status code of the response
+            :param latency: Seconds taken by the whole request, body included
+            :param ttfb: (optional) Seconds taken till the response headers arrived
+            :param compressed: (optional) Bytes received over the wire
+            :param decompressed: (optional) Bytes of the decoded body
+            :param retries: (optional) Number of retries made before this response
+
+            :return: None
+        """
+
+        metrics = self.metrics
+        if metrics is None:
+            return
+        metrics.inc(url, 'requests')
+        metrics.inc(url, f'status.{status}')
+        metrics.observe(url, 'latency', latency)
+        if ttfb is not None:
+            metrics.observe(url, 'ttfb', ttfb)
+        if compressed is not None:
+            metrics.inc(url, 'bytes.compressed', compressed)
+        if decompressed is not None:
+            metrics.inc(url, 'bytes.decompressed', decompressed)
+        if retries:
+            metrics.inc(url, 'retries', retries)
+
+    @staticmethod
+    def _prepare_params(params: dict = None) -> dict:
+        """
+            Converts url params the same way `requests` does (drops `None`, stringifies values) so both transports
+            build identical urls.
+
+            :param params: (optional) url params of the request
+
+            :return: url params with string values only
+        """
+
+        if not params:
+            return None
+        return {key: str(value) for key, value in params.items() if value is not None}
+
+    def cookie_snapshot(self) -> list:
+        """
+            Returns a consistent copy of the cookies of the session, safe to take while other threads are storing the
+            cookies of their responses.
+
+            :param self: Represent the instance of the class
+
+            :return: List of `http.cookiejar.Cookie`
+        """
+
+        jar = self.session.cookies
+        # `requests` stores the cookies of a response under the jar's own lock, iterating the jar is not locked
+        with jar._cookies_lock:
+            return list(jar)
+
+    def _cookies_for(self, url: str) -> dict:
+        """
+            Picks the cookies from the shared cookie jar which are valid for the host of the given url.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: Dict of cookie name and its value
+        """
+
+        host = urlsplit(url).hostname or ''
+        cookies = {}
+        for cookie in self.cookie_snapshot():
+            domain = cookie.domain.lstrip('.')
+            if not domain or host == domain or host.endswith(f'.{domain}'):
+                cookies[cookie.name] = cookie.value
+        return cookies
+
+    def _store_cookies(self, url: str, cookies) -> None:
+        """
+            Stores the cookies set by a response of the async or `PoolTransport` transport into the shared cookie jar of
+            the `requests` session, along with their expiry; a cookie set already expired is removed.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param cookies: `http.cookies.SimpleCookie` of the response
+
+            :return: None
+        """
+
+        host = urlsplit(url).hostname or ''
+        now = time.time()
+        with self._cookie_lock:
+            for name, morsel in cookies.items():
+                expires = None
+                if morsel['max-age']:
+                    try:
+                        expires = int(now) + int(morsel['max-age'])
+                    except ValueError:
+                        pass
+                elif morsel['expires']:
+                    expires = http2time(morsel['expires'])
+                domain, path = morsel['domain'] or host, morsel['path'] or '/'
+                if expires is not None and expires <= now:
+                    self.session.cookies.set(name, None, domain=domain, path=path)
+                else:
+                    self.session.cookies.set(name, morsel.value, domain=domain, path=path, expires=expires)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Sync transport
+
+    def _send(self, method: str, url: str, headers: dict = None, timeout=None, **kwargs) -> Response:
+        """
+            Sends a request with `self.transport`: primes the host if required, waits for the rate limiter, applies the
+            timeouts and re-primes the host once when it answers with 401 / 403.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+            :param timeout: (optional) timeout asked by the caller, default is `self.timeout`
+            :param kwargs: (optional) any other keyword argument of `requests.Session.request`
+
+            :return: requests.Response object
+        """
+
+        Deadline.check()
+        generation = self._ensure_primed(url)
+        response = self._request_once(method, url, headers=headers, timeout=timeout, **kwargs)
+        if generation is not None and response.status_code in self._reprime_statuses:
+            self._ensure_primed(url, stale=generation)
+            response = self._request_once(method, url, headers=headers, timeout=timeout, **kwargs)
+        return response
+
+    def _request_once(self, method: str, url: str, headers: dict = None, timeout=None, **kwargs) -> Response:
+        """
+            Checks the circuit breaker, waits for the rate limiter and sends one request (the `Retry` adapter may still
+            retry it) while recording its metrics and its outcome for the circuit breaker and concurrency limiter.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+            :param timeout: (optional) timeout asked by the caller, default is `self.timeout`
+            :param kwargs: (optional) any other keyword argument of `requests.Session.request`
+
+            :return: requests.Response object
+        """
+
+        cassette = self.cassette
+        body = kwargs.get('json', kwargs.get('data'))
+        if cassette is not None and cassette.mode != 'record':
+            interaction = cassette.play(method, url, kwargs.get('params'), body)
+            if interaction is not None:
+                return cassette.build_response(interaction)
+        recording = cassette is not None and cassette.mode != 'replay'
+        streamed = kwargs.get('stream') and not recording
+        if recording:
+            kwargs['stream'] = True  # to read the body as it comes over the wire
+
+        self._circuit_allow(url)
+        self._throttle(url)
+        started = time.perf_counter()
+        try:
+            response = self.transport.request(self, method, url, headers=headers,
+                                              timeout=self._request_timeout(timeout), **kwargs)
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.inc(url, 'errors')
+            self._record_outcome(url, latency=time.perf_counter() - started)
+            raise
+        latency = time.perf_counter() - started
+        self._record_outcome(url, response.status_code, latency)
+        if self.hedger is not None:
+            self.hedger.observe(url, latency)
+        if recording:
+            content = response.raw.read(decode_content=False)
+            response._content = cassette.decode_body(content, response.headers.get('Content-Encoding'))
+            response._content_consumed = True
+            cassette.record(method, url, kwargs.get('params'), body, response.status_code, response.headers, content,
+                            response.url)
+        if self.metrics is not None:
+            raw = response.raw
+            retries = getattr(raw, 'retries', None)
+            compressed = decompressed = None
+            if not streamed:
+                decompressed = len(response.content)
+                compressed = raw.tell() if hasattr(raw, 'tell') else decompressed
+            self._record(url, response.status_code, time.perf_counter() - started, response.elapsed.total_seconds(),
+                         compressed, decompressed, len(retries.history) if retries is not None else 0)
+        return response
+
+    def _fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                    headers: dict = None) -> dict:
+        """
+            Sends the request with `self.transport` (or serves it from the cache) and parses its json response; a GET
+            whose validators were kept is sent conditional and a 304 answer parses the kept body again, so every caller
+            gets an object of its own.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        key, ttl = self._cache_key(method, url, params, json_data)
+        content = self._cache_get(key, url)
+        if content is not None:
+            return self._parse_json(content)
+
+        validator_key, validated, headers = self._conditional(method, url, params, headers if headers else self.headers,
+                                                              'json')
+        response = self._send(method, url, params=params, json=json_data, headers=headers)
+        if self._not_modified(url, validated, response.status_code):
+            return self._parse_json(validated.content)
+        content = self._decode_body(response.content, response.headers.get('Content-Encoding', ''))
+        data = self._parse_json(content)
+        if key and response.ok:
+            self.cache.set(key, content, ttl)
+        if validator_key and response.status_code == 200:
+            self.conditional_cache.store(validator_key, response.headers, content=content)
+        return data
+
+    def _hedge_delay(self, url: str) -> float:
+        """
+            Returns the seconds after which a request to the url is hedged.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: Seconds to wait for the first response, None when the request is not hedged
+        """
+
+        # a recorded / replayed request is never duplicated
+        if self.hedger is None or self.cassette is not None or not self.hedger.hedges(url):
+            return None
+        return self.hedger.delay_for(url)
+
+    def _may_hedge(self, url: str) -> bool:
+        """
+            Tells whether a late request to the url gets its duplicate: the host's rate limiter must have a token free,
+            so the duplicate never queues behind (or delays) other requests, and the hedger must be within its budget.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: True if the duplicate is to be sent
+        """
+
+        if self.rate_limiter is not None and not self.rate_limiter.available(url):
+            return False
+        return self.hedger.try_hedge(url)
+
+    def _hedge_executors(self) -> tuple:
+        """
+            Returns the thread pools of the hedged requests, one for the first requests and one for their duplicates
+            so a burst of duplicates never delays the first requests (nor the other way round). They are started on
+            first use and shut down by `close` or once the client is garbage collected.
+
+            :param self: Represent the instance of the class
+
+            :return: Tuple of the ThreadPoolExecutor of the first requests and the one of the duplicates
+        """
+
+        with self._hedge_lock:
+            if self._hedge_pools is None:
+                self._hedge_pools = tuple(ThreadPoolExecutor(max_workers=self.bulk_max_workers,
+                                                             thread_name_prefix=f'bharat_sm_data_{name}')
+                                          for name in ('hedged', 'hedge'))
+                for pool in self._hedge_pools:
+                    weakref.finalize(self, pool.shutdown, wait=False)
+            return self._hedge_pools
+
+    def _hedged_fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                           headers: dict = None) -> dict:
+        """
+            `_fetch_json` hedged by `self.hedger`: when the request hasn't answered within the delay learned for its
+            endpoint, a duplicate is sent on another thread and the first successful response wins. The delay runs
+            from the moment the request is sent, not from when it was queued for a thread, so it is the upstream which
+            is measured. The slower one is left to finish in the background, its latency still teaches the hedger.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        delay = self._hedge_delay(url)
+        if delay is None:
+            return self._fetch_json(method, url, params, json_data, headers)
+
+        primaries, hedges = self._hedge_executors()
+        sent = threading.Event()
+
+        def send() -> dict:
+            sent.set()
+            return self._fetch_json(method, url, params, json_data, headers)
+
+        try:
+            primary = primaries.submit(copy_context().run, send)
+        except RuntimeError:
+            # the pools were shut down by `close` meanwhile, the request is not hedged
+            return self._fetch_json(method, url, params, json_data, headers)
+        sent.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge(url):
+            return primary.result()
+
+        try:
+            hedge = hedges.submit(copy_context().run, self._fetch_json, method, url, params, json_data, headers)
+        except RuntimeError:
+            return primary.result()
+        if self.metrics is not None:
+            self.metrics.inc(url, 'hedges')
+        done, pending = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = hedge if hedge in done and primary not in done else primary
+        if winner.exception() is not None and pending:
+            # the first one to answer failed, the other one still has its chance
+            winner = pending.pop()
+        if winner is hedge:
+            self.hedger.record_win(url)
+        return winner.result()
+
+    def _coalesced_fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                              headers: dict = None) -> dict:
+        """
+            `_fetch_json` through `self.single_flight` when it is set, so identical concurrent requests are coalesced.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        if self.single_flight is None:
+            return self._hedged_fetch_json(method, url, params, json_data, headers)
+        return self.single_flight.do(
+            ResponseCache.make_key(method, url, self._prepare_params(params), json_data),
+            lambda: self._hedged_fetch_json(method, url, params, json_data, headers),
+        )
+
+    def _request_and_get_data(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                              headers: dict = None) -> dict:
+        """
+            Fetches and parses the json response, identical concurrent requests are coalesced into one when
+            `self.single_flight` is set.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data, `{}` on any error except
+            `CircuitOpenError` which is raised so the caller can move on to other work
+        """
+
+        try:
+            return self._coalesced_fetch_json(method, url, params, json_data, headers)
+        except json.JSONDecodeError:
+            return {}
+        except CircuitOpenError:
+            raise
+        except Exception as err:
+            print(f'Error in connecting to url : {url} Error : {err}')
+            return {}
+
+    def hit_and_get_data(self, url: str, params: dict = None, headers: dict = None, priority: int = None) -> dict:
+        """
+            Hitting the api and gets the data based on the endpoint passed as well as the url params / params for the
+            get type of requests
+
+            :param self: Represent the instance of the class.
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) parameters which is required to get exact data from the api aka url params
+            :param headers: (optional) Custom headers for this specific request, see `merge_headers`
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Dict object which is json parsed result of the output response data got from hitting above request
+        """
+
+        with Priority(priority):
+            return self._request_and_get_data('GET', url, params=params, headers=headers)
+
+    def post_and_get_data(self, url: str, json_data: dict = None, headers: dict = None, priority: int = None) -> dict:
+        """
+            Hitting the api with POST request and gets the data based on the endpoint passed
+
+            :param self: Represent the instance of the class.
+            :param url: Endpoint of the api; aka link of the api
+            :param json_data: (optional) JSON payload to send in POST request body
+            :param headers: (optional) Custom headers for this specific request
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Dict object which is json parsed result of the output response data got from hitting above request
+        """
+
+        with Priority(priority):
+            return self._request_and_get_data('POST', url, json_data=json_data, headers=headers)
+
+    def hit_and_get_content(self, url: str, params: dict = None, priority: int = None, headers: dict = None) -> bytes:
+        """
+            Hitting the url with GET request and returns the raw body, this is meant for non JSON payloads like CSV
+            masters and HTML pages; the body is served from the cache when available.
+
+            :param self: Represent the instance of the class.
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+            :param headers: (optional) headers of this request, default is `self.headers`
+
+            :return: Decompressed bytes of the response body
+        """
+
+        key, ttl = self._cache_key('GET', url, params)
+        content = self._cache_get(key, url)
+        if content is not None:
+            return content
+
+        response = self.hit_and_get_response(url, params=params, headers=headers, priority=priority)
+        content = self._decode_body(response.content, response.headers.get('Content-Encoding', ''))
+        if key and response.ok:
+            self.cache.set(key, content, ttl)
+        return content
+
+    def hit_and_get_response(self, url: str, params: dict = None, headers: dict = None, priority: int = None,
+                             **kwargs) -> Response:
+        """
+            Throttled GET request which returns the response as it is; used for HTML pages, files and everything else
+            which is not a JSON api. Unless it is streamed the request is sent conditional when the validators of the
+            url were kept, and a 304 answer is turned into the kept 200 response.
+
+            :param self: Represent the instance of the class.
+            :param url: Link of the page / file
+            :param params: (optional) url params of the request
+            :param headers: (optional) headers of this request, default is `self.headers`; pass `{}` to send only the
+            session defaults
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+            :param kwargs: (optional) any other keyword argument of `requests.Session.get`
+
+            :return: requests.Response object
+        """
+
+        headers = self.headers if headers is None else headers
+        validator_key, validated = None, None
+        if not kwargs.get('stream'):
+            validator_key, validated, headers = self._conditional('GET', url, params, headers, 'response')
+        with Priority(priority):
+            response = self._send('GET', url, params=params, headers=headers, **kwargs)
+        if self._not_modified(url, validated, response.status_code):
+            return self._validated_response(response, validated)
+        # only the bodies worth revalidating are kept in memory, not HTML pages or files
+        if validator_key and response.status_code == 200 \
+                and self.conditional_cache.kept_content_type(response.headers.get('Content-Type')):
+            self.conditional_cache.store(validator_key, response.headers, content=response.content)
+        return response
+
+    @staticmethod
+    def _validated_response(response: Response, validated: Validated) -> Response:
+        """
+            Turns the 304 answer of a conditional request into the kept 200 response.
+
+            :param response: 304 response
+            :param validated: Kept response whose validators were sent
+
+            :return: requests.Response object with the kept status, headers and body
+        """
+
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(validated.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = validated.content
+        response._content_consumed = True
+        return response
+
+    def post_and_get_response(self, url: str, json_data: dict = None, data: dict = None, headers: dict = None,
+                              priority: int = None, **kwargs) -> Response:
+        """
+            Throttled POST request which returns the response as it is.
+
+            :param self: Represent the instance of the class.
+            :param url: Link of the page / api
+            :param json_data: (optional) JSON payload of the request
+            :param data: (optional) form payload of the request
+            :param headers: (optional) headers of this request, default is `self.headers`; pass `{}` to send only the
+            session defaults
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+            :param kwargs: (optional) any other keyword argument of `requests.Session.post`
+
+            :return: requests.Response object
+        """
+
+        with Priority(priority):
+            return self._send('POST', url, json=json_data, data=data,
+                              headers=self.headers if headers is None else headers, **kwargs)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Streaming downloads
+
+    def download(self, url: str, destination, params: dict = None, headers: dict = None, progress=None,
+                 chunk_size: int = None, priority: int = None, **kwargs) -> int:
+        """
+            Throttled GET request whose body is streamed to the destination chunk by chunk as it arrives, so the memory
+            taken stays bounded by the chunk size whatever the size of the file. The body is decompressed on the fly
+            (gzip / deflate / brotli). A path is written to `<path>.part` first and moved into place once complete, so
+            a failed download never leaves a truncated file behind.
+
+            The caches apply as they do to `hit_and_get_content`: a body held by `self.cache` is written out without a
+            request (and a downloaded body up to `download_cache_max_bytes` is stored into it), and when
+            `self.conditional_cache` kept a copy of the file the request is sent with `If-None-Match` /
+            `If-Modified-Since` and a 304 answer writes the kept copy to the destination.
+
+            Usage:
+                client.download(pdf_url, 'reports/2024.pdf', progress=lambda p: print(p.received, p.total, p.rate))
+
+            :param self: Represent the instance of the class.
+            :param url: Link of the file
+            :param destination: Path of the file to write (str / PathLike), or any object with a `write(bytes)` method
+            (an open file, a spooled temporary file, an incremental parser) which gets the chunks as they come
+            :param params: (optional) url params of the request
+            :param headers: (optional) headers of this request, default is `self.headers`
+            :param progress: (optional) callable taking a `DownloadProgress`, called after every chunk written
+            :param chunk_size: (optional) bytes read and written at a time, default is `self.download_chunk_size`
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+            :param kwargs: (optional) any other keyword argument of `requests.Session.get`
+
+            :return: Number of bytes written
+
+            Raises:
+                requests.HTTPError: when the server answers with an error status (unlike `hit_and_get_content`, which
+                returns the error page), nothing is written then
+        """
+
+        with Priority(priority):
+            return self._download('GET', url, destination, params=params,
+                                  headers=self.headers if headers is None else headers, progress=progress,
+                                  chunk_size=chunk_size, **kwargs)
+
+    def _download(self, method: str, url: str, destination, params: dict = None, headers: dict = None,
+                  progress=None, chunk_size: int = None, **kwargs) -> int:
+        """
+            Writes the body of a request to the destination from the caches or a streamed response, see `download`.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request, only GET requests are cached
+            :param url: Url of the request
+            :param destination: Path of the file to write or object with a `write(bytes)` method
+            :param params: (optional) url params of the request
+            :param headers: (optional) headers of the request
+            :param progress: (optional) callable taking a `DownloadProgress`
+            :param chunk_size: (optional) bytes read and written at a time, default is `self.download_chunk_size`
+            :param kwargs: (optional) any other keyword argument of `requests.Session.request`
+
+            :return: Number of bytes written
+        """
+
+        chunk_size = chunk_size or self.download_chunk_size
+        cacheable = method == 'GET' and not kwargs.get('json') and not kwargs.get('data')
+        key, ttl = self._cache_key(method, url, params) if cacheable else (None, None)
+        content = self._cache_get(key, url)
+        if content is not None:
+            chunks = (content[start:start + chunk_size] for start in range(0, len(content), chunk_size))
+            return self._write_to(destination,
+                                  lambda sink: self._write_chunks(url, chunks, sink, len(content), progress))
+
+        validator_key, validated, conditional_headers = self._conditional(method, url, params, headers, 'file') \
+            if cacheable else (None, None, headers)
+        kept = None
+        if validated is not None:
+            try:
+                # opened before the request, so the copy stays readable even if the entry is replaced or evicted
+                # (and its file removed) while the request is in flight
+                kept = open(validated.path, 'rb')
+            except OSError:
+                # already gone since the lookup, the request is sent unconditional
+                validated, conditional_headers = None, headers
+        try:
+            response = self._send(method, url, params=params, headers=conditional_headers, stream=True, **kwargs)
+            try:
+                if self._not_modified(url, validated, response.status_code):
+                    return self._write_to(destination, lambda sink: self._write_chunks(
+                        url, iter(partial(kept.read, chunk_size), b''), sink, validated.size, progress))
+                response.raise_for_status()
+                return self._write_response(url, response, destination, key, ttl, validator_key, progress,
+                                            chunk_size)
+            finally:
+                response.close()
+        finally:
+            if kept is not None:
+                kept.close()
+
+    def _write_response(self, url: str, response: Response, destination, key: str, ttl: float, validator_key: str,
+                        progress=None, chunk_size: int = None) -> int:
+        """
+            Writes a streamed 200 response to the destination and tees it into the caches: a copy on disk for
+            `self.conditional_cache` and, while the body stays under `download_cache_max_bytes`, one in memory for
+            `self.cache`.
+
+            :param self: Represent the instance of the class.
+            :param url: Url of the request
+            :param response: Streamed response
+            :param destination: Path of the file to write or object with a `write(bytes)` method
+            :param key: Key of the response cache, None when the body is not cached
+            :param ttl: TTL of the response cache entry
+            :param validator_key: Key of the conditional cache, None when the copy is not kept
+            :param progress: (optional) callable taking a `DownloadProgress`, called after every chunk written
+            :param chunk_size: (optional) bytes read and written at a time
+
+            :return: Number of bytes written
+        """
+
+        copies = []
+        bounded = None
+        if key:
+            limit = min(self.download_cache_max_bytes, self.cache.max_bytes)
+            length = response.headers.get('Content-Length')
+            if not (length and length.isdigit() and int(length) > limit):
+                bounded = _BoundedCopy(limit)
+                copies.append(bounded)
+        copy_path = None
+        if validator_key is not None and response.status_code == 200 \
+                and self.conditional_cache.storable(response.headers):
+            copy_path = self.conditional_cache.new_file_path()
+            copies.append(open(copy_path, 'wb'))
+        try:
+            written = self._write_to(destination, lambda sink: self._write_body(
+                url, response, _Tee(sink, *copies) if copies else sink, progress, chunk_size))
+        except BaseException:
+            if copy_path is not None:
+                copies[-1].close()
+                os.remove(copy_path)
+            raise
+        if copy_path is not None:
+            copies[-1].close()
+            self.conditional_cache.store(validator_key, response.headers, size=written, path=copy_path)
+        if bounded is not None and not bounded.overflowed:
+            self.cache.set(key, bounded.getvalue(), ttl)
+        return written
+
+    @staticmethod
+    def _write_to(destination, write) -> int:
+        """
+            Runs a writer on the destination: an object with a `write` method is written as it is, a path is written to
+            `<path>.part` which is moved into place once the writer is done, or removed if it fails.
+
+            :param destination: Path of the file to write or object with a `write(bytes)` method
+            :param write: Callable taking the object to write to and returning the number of bytes written
+
+            :return: Number of bytes written
+        """
+
+        if hasattr(destination, 'write'):
+            return write(destination)
+        partial_path = f'{os.fspath(destination)}.part'
+        try:
+            with open(partial_path, 'wb') as file:
+                written = write(file)
+            os.replace(partial_path, destination)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        return written
+
+    @staticmethod
+    def _write_chunks(url: str, chunks, sink, total: int = None, progress=None) -> int:
+        """
+            Writes the chunks to the sink and reports the progress after every chunk.
+
+            :param url: Url of the download
+            :param chunks: Iterable of bytes
+            :param sink: Object with a `write(bytes)` method
+            :param total: (optional) size of the body, None when unknown
+            :param progress: (optional) callable taking a `DownloadProgress`
+
+            :return: Number of bytes written
+        """
+
+        started = time.perf_counter()
+        written = 0
+        for chunk in chunks:
+            sink.write(chunk)
+            written += len(chunk)
+            if progress is not None:
+                progress(DownloadProgress(url, written, total, time.perf_counter() - started))
+        return written
+
+    def _write_body(self, url: str, response: Response, sink, progress=None, chunk_size: int = None) -> int:
+        """
+            Writes the body of a streamed response to the sink chunk by chunk and records its bytes.
+
+            :param self: Represent the instance of the class.
+            :param url: Url of the request
+            :param response: Streamed response
+            :param sink: Object with a `write(bytes)` method
+            :param progress: (optional) callable taking a `DownloadProgress`
+            :param chunk_size: (optional) bytes read and written at a time, default is `self.download_chunk_size`
+
+            :return: Number of bytes written
+        """
+
+        # a recorded / replayed response already holds its body, its bytes were recorded with the request
+        streamed = not response._content_consumed
+        length = response.headers.get('Content-Length')
+        encoding = response.headers.get('Content-Encoding', 'identity').lower()
+        total = int(length) if length and length.isdigit() and encoding == 'identity' else None
+        written = self._write_chunks(url, response.iter_content(chunk_size or self.download_chunk_size), sink, total,
+                                     progress)
+        if streamed and self.metrics is not None:
+            raw = response.raw
+            self.metrics.inc(url, 'bytes.compressed', raw.tell() if hasattr(raw, 'tell') else written)
+            self.metrics.inc(url, 'bytes.decompressed', written)
+        return written
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Bulk requests
+
+    @staticmethod
+    def _bulk_spec(spec) -> dict:
+        """
+            Normalises a request spec of `fetch_many` / `async_fetch_many`.
+
+            :param spec: Url string, `RequestSpec` or dict with `url` and optionally `method`, `params`, `json_data`,
+            `data`, `headers`, `priority` and any other keyword argument of `requests.Session.request` (used with
+            `kind='response'`); `kind='file'` takes the `destination` and optionally the `progress` of `download`
+
+            :return: Dict with at least `method` and `url`
+        """
+
+        if isinstance(spec, RequestSpec):
+            return spec.to_dict()
+        spec = {'url': spec} if isinstance(spec, str) else dict(spec)
+        if not spec.get('url'):
+            raise ValueError(f'Request spec without url : {spec}')
+        spec['method'] = spec.get('method', 'POST' if 'json_data' in spec or 'data' in spec else 'GET').upper()
+        return spec
+
+    def _bulk_fetch(self, spec: dict, kind: str):
+        """
+            Makes one request of `fetch_many`; unlike `hit_and_get_data` errors are raised, not turned into `{}`.
+
+            :param self: Represent the instance of the class.
+            :param spec: Normalised request spec
+            :param kind: `json`, `content`, `response` or `file`
+
+            :return: Parsed JSON, decompressed bytes, the response or the number of bytes written
+        """
+
+        spec = dict(spec)
+        method, url = spec.pop('method'), spec.pop('url')
+        params, json_data, headers = spec.pop('params', None), spec.pop('json_data', None), spec.pop('headers', None)
+        if kind == 'json' and not spec.get('data'):
+            return self._coalesced_fetch_json(method, url, params, json_data, headers)
+        if kind == 'file':
+            return self._download(method, url, spec.pop('destination'), params=params, json=json_data,
+                                  headers=self.headers if headers is None else headers, **spec)
+
+        response = self._send(method, url, params=params, json=json_data,
+                              headers=self.headers if headers is None else headers, **spec)
+        if kind == 'response':
+            return response
+        content = self._decode_body(response.content, response.headers.get('Content-Encoding', ''))
+        return self._parse_json(content) if kind == 'json' else content
+
+    @staticmethod
+    def _result_data(result: FetchResult, default=None):
+        """
+            Returns the data of a `fetch_many` result, a failed request is reported the way `hit_and_get_data` reports
+            it and gets the default instead; `CircuitOpenError` is raised as `hit_and_get_data` does.
+
+            :param result: `FetchResult` of the request
+            :param default: (optional) value returned for a failed request, `{}` when not passed
+
+            :return: Data of the request or the default
+        """
+
+        if result.ok:
+            return result.data
+        if isinstance(result.error, CircuitOpenError):
+            raise result.error
+        if not isinstance(result.error, json.JSONDecodeError):
+            url = result.spec if isinstance(result.spec, str) else \
+                result.spec.url if isinstance(result.spec, RequestSpec) else result.spec.get('url')
+            print(f'Error in connecting to url : {url} Error : {result.error}')
+        return {} if default is None else default
+
+    def fetch_many(self, specs: list, kind: str = 'json', per_host: int = None, max_workers: int = None,
+                   priority: int = None) -> list:
+        """
+            Runs many requests concurrently on a thread pool and waits for all of them. The requests in flight to one
+            host are bounded by the adaptive limit of `self.concurrency_limiter` (or by `per_host` when it is passed)
+            and every request still goes through the priming, rate limiter, cache and single flight of the client; an
+            enclosing `Deadline` applies to all of them.
+
+            Usage:
+                results = client.fetch_many([{'url': quote_url, 'params': {'symbol': ticker}} for ticker in tickers])
+                data = [result.data if result.ok else {} for result in results]
+
+            :param self: Represent the instance of the class.
+            :param specs: List of url strings, `RequestSpec` or dicts with `url` and optionally `method`, `params`,
+            `json_data`, `data`, `headers`, `priority` (and other `requests` keyword arguments for `kind='response'`,
+            `destination` and `progress` for `kind='file'`)
+            :param kind: (optional) `json` for parsed JSON (default), `content` for the decompressed body, `response`
+            for the `requests` response as it is or `file` to stream the body to the `destination` of the spec (see
+            `download`), the data is then the number of bytes written
+            :param per_host: (optional) fixed maximum of requests in flight to one host, default is the adaptive limit
+            of the host (`self.bulk_per_host` when `self.concurrency_limiter` is None)
+            :param max_workers: (optional) size of the thread pool, default is `self.bulk_max_workers`
+            :param priority: (optional) `Priority` of the requests whose spec has none, e.g. `Priority.BULK` for a
+            backfill; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: List of `FetchResult` (spec, data, error) in the order of the specs, a failed request has its
+            exception in `error` and does not affect the others
+        """
+
+        if kind not in self._bulk_kinds:
+            raise ValueError(f'Invalid kind {kind}; valid kinds are : {self._bulk_kinds}')
+        specs = list(specs)
+        if not specs:
+            return []
+
+        limiter = self.concurrency_limiter if per_host is None else None
+        per_host = per_host or self.bulk_per_host
+        slots = {}
+        slots_lock = threading.Lock()
+
+        def fetch(spec):
+            try:
+                normalised = self._bulk_spec(spec)
+                host = (urlsplit(normalised['url']).hostname or '').lower()
+                with slots_lock:
+                    slot = slots.get(host)
+                    if slot is None:
+                        slot = slots[host] = limiter.limit_for(normalised['url']) if limiter is not None else \
+                            threading.BoundedSemaphore(per_host)
+                with slot, Priority(normalised.pop('priority', None)):
+                    return FetchResult(spec, self._bulk_fetch(normalised, kind), None)
+            except Exception as err:
+                return FetchResult(spec, None, err)
+
+        workers = min(max_workers or self.bulk_max_workers, len(specs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bharat_sm_data') as pool:
+            # every request runs in a copy of the caller's context so an enclosing `Deadline` / `Priority` applies to it
+            with Priority(priority):
+                futures = [pool.submit(copy_context().run, fetch, spec) for spec in specs]
+            return [future.result() for future in futures]
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Async transport
+
+    def _get_async_session(self):
+        """
+            Returns the `aiohttp` session bound to the running event loop, it is (re)created lazily so a client can be
+            used from more than one event loop over its lifetime.
+
+            :param self: Represent the instance of the class
+
+            :return: aiohttp.ClientSession object
+        """
+
+        if aiohttp is None:
+            raise ImportError('The async API requires aiohttp; install it with '
+                              '`pip install Bharat_sm_data_avinash[async]`')
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            # cookies are kept in the `requests` jar so that both transports share the same warmed up session
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.async_connection_limit),
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+            self._async_loop = loop
+        return self._async_session
+
+    async def _async_fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                                headers: dict = None) -> dict:
+        """
+            Coroutine equivalent of `_fetch_json`, retries with the same policy as the sync transport.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        key, ttl = self._cache_key(method, url, params, json_data)
+        content = self._cache_get(key, url)
+        if content is not None:
+            return self._parse_json(content)
+
+        async_session = self._get_async_session()
+        params = self._prepare_params(params)
+        if self.cassette is not None and self.cassette.mode != 'record':
+            interaction = self.cassette.play(method, url, params, json_data)
+            if interaction is not None:
+                response = self.cassette.build_response(interaction)
+                return self._parse_json(self._decode_body(response.content, ''))
+
+        validator_key, validated, headers = self._conditional(method, url, params, headers if headers else self.headers,
+                                                              'json')
+        generation = await self._async_ensure_primed(url)
+        reprimed = False
+        started = time.perf_counter()
+        for attempt in range(self._max_retries + 1):
+            Deadline.check()
+            # every attempt is a request of its own for the circuit breaker and the concurrency limiter, as with
+            # `_request_once`, so a retry doesn't go out once the circuit opened
+            self._circuit_allow(url)
+            await self._async_throttle(url)
+            attempt_started = time.perf_counter()
+            try:
+                async with async_session.request(method, url, params=params, json=json_data, headers=headers,
+                                                 cookies=self._cookies_for(url),
+                                                 timeout=self._async_request_timeout()) as response:
+                    ttfb = time.perf_counter() - attempt_started
+                    content = await response.read()
+                    self._store_cookies(url, response.cookies)
+                    retry = response.status in self._retry_statuses
+                    reprime = generation is not None and not reprimed and response.status in self._reprime_statuses
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                self._record_outcome(url, latency=time.perf_counter() - attempt_started)
+                if self.metrics is not None and (Deadline.expired() or attempt == self._max_retries):
+                    self.metrics.inc(url, 'errors')
+                if Deadline.expired():
+                    raise DeadlineExceeded('Deadline exceeded while waiting for the response') from err
+                if attempt == self._max_retries:
+                    raise
+                retry, reprime = True, False
+            else:
+                self._record_outcome(url, response.status, time.perf_counter() - attempt_started)
+            if reprime and attempt < self._max_retries:
+                reprimed = True
+                await self._async_ensure_primed(url, stale=generation)
+                continue
+            if retry and attempt < self._max_retries:
+                await asyncio.sleep(self._backoff_factor * (2 ** attempt))
+                continue
+            compressed = response.content_length if response.content_length is not None else len(content)
+            if self.cassette is not None and self.cassette.mode != 'replay':
+                # aiohttp hands out the decoded body only, so it is recorded as it is
+                recorded_headers = {name: value for name, value in response.headers.items()
+                                    if name.lower() != 'content-encoding'}
+                self.cassette.record(method, url, params, json_data, response.status, recorded_headers, content,
+                                     str(response.url))
+            content = self._decode_body(content, response.headers.get('Content-Encoding', ''))
+            self._record(url, response.status, time.perf_counter() - started, ttfb, compressed, len(content), attempt)
+            if self.hedger is not None:
+                self.hedger.observe(url, time.perf_counter() - attempt_started)
+            if self._not_modified(url, validated, response.status):
+                return self._parse_json(validated.content)
+            data = self._parse_json(content)
+            if key and 200 <= response.status < 400:
+                self.cache.set(key, content, ttl)
+            if validator_key and response.status == 200:
+                self.conditional_cache.store(validator_key, response.headers, content=content)
+            return data
+
+    async def _async_hedged_fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                                       headers: dict = None) -> dict:
+        """
+            Coroutine equivalent of `_hedged_fetch_json`, the duplicate is another task and the slower one is cancelled.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        delay = self._hedge_delay(url)
+        if delay is None:
+            return await self._async_fetch_json(method, url, params, json_data, headers)
+
+        primary = asyncio.ensure_future(self._async_fetch_json(method, url, params, json_data, headers))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._may_hedge(url):
+                return await primary
+
+            if self.metrics is not None:
+                self.metrics.inc(url, 'hedges')
+            hedge = asyncio.ensure_future(self._async_fetch_json(method, url, params, json_data, headers))
+            done, pending = await asyncio.wait({primary, hedge}, return_when=asyncio.FIRST_COMPLETED)
+            winner = hedge if hedge in done and primary not in done else primary
+            if winner.exception() is not None and pending:
+                # the first one to answer failed, the other one still has its chance
+                winner = pending.pop()
+                await asyncio.wait({winner})
+            if winner is hedge:
+                self.hedger.record_win(url)
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # the loser's error is not raised
+
+    async def _async_coalesced_fetch_json(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                                          headers: dict = None) -> dict:
+        """
+            Coroutine equivalent of `_coalesced_fetch_json`.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data
+        """
+
+        if self.single_flight is None:
+            return await self._async_hedged_fetch_json(method, url, params, json_data, headers)
+        return await self.single_flight.async_do(
+            ResponseCache.make_key(method, url, self._prepare_params(params), json_data),
+            lambda: self._async_hedged_fetch_json(method, url, params, json_data, headers),
+        )
+
+    async def _async_request_and_get_data(self, method: str, url: str, params: dict = None, json_data: dict = None,
+                                          headers: dict = None) -> dict:
+        """
+            Coroutine equivalent of `_request_and_get_data`.
+
+            :param self: Represent the instance of the class.
+            :param method: HTTP method of the request (GET / POST)
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) url params of the request
+            :param json_data: (optional) JSON payload to send in request body
+            :param headers: (optional) Custom headers for this specific request
+
+            :return: Dict object which is json parsed result of the output response data, `{}` on any error except
+            `CircuitOpenError`
+        """
+
+        self._get_async_session()  # fails loudly when aiohttp is not installed
+        try:
+            return await self._async_coalesced_fetch_json(method, url, params, json_data, headers)
+        except json.JSONDecodeError:
+            return {}
+        except CircuitOpenError:
+            raise
+        except Exception as err:
+            print(f'Error in connecting to url : {url} Error : {err}')
+            return {}
+
+    async def async_hit_and_get_data(self, url: str, params: dict = None, headers: dict = None,
+                                     priority: int = None) -> dict:
+        """
+            Coroutine equivalent of `hit_and_get_data`, many of these can be kept in flight at once from one event loop.
+
+            :param self: Represent the instance of the class.
+            :param url: Endpoint of the api; aka link of the api
+            :param params: (optional) parameters which is required to get exact data from the api aka url params
+            :param headers: (optional) Custom headers for this specific request, see `merge_headers`
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Dict object which is json parsed result of the output response data got from hitting above request
+        """
+
+        with Priority(priority):
+            return await self._async_request_and_get_data('GET', url, params=params, headers=headers)
+
+    async def async_post_and_get_data(self, url: str, json_data: dict = None, headers: dict = None,
+                                      priority: int = None) -> dict:
+        """
+            Coroutine equivalent of `post_and_get_data`.
+
+            :param self: Represent the instance of the class.
+            :param url: Endpoint of the api; aka link of the api
+            :param json_data: (optional) JSON payload to send in POST request body
+            :param headers: (optional) Custom headers for this specific request
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Dict object which is json parsed result of the output response data got from hitting above request
+        """
+
+        with Priority(priority):
+            return await self._async_request_and_get_data('POST', url, json_data=json_data, headers=headers)
+
+    async def async_fetch_many(self, specs: list, per_host: int = None, priority: int = None) -> list:
+        """
+            Coroutine equivalent of `fetch_many` for JSON apis: runs the requests concurrently on the event loop, the
+            requests in flight to one host are bounded by its adaptive limit (or by `per_host` when it is passed).
+
+            :param self: Represent the instance of the class.
+            :param specs: List of url strings, `RequestSpec` or dicts with `url` and optionally `method`, `params`,
+            `json_data`, `headers` and `priority`
+            :param per_host: (optional) fixed maximum of requests in flight to one host, default is the adaptive limit
+            of the host (`self.bulk_per_host` when `self.concurrency_limiter` is None)
+            :param priority: (optional) `Priority` of the requests whose spec has none; default is the priority of the
+            enclosing `with Priority(...)` block
+
+            :return: List of `FetchResult` (spec, data, error) in the order of the specs
+        """
+
+        self._get_async_session()  # fails loudly when aiohttp is not installed
+        limiter = self.concurrency_limiter if per_host is None else None
+        per_host = per_host or self.bulk_per_host
+        slots = {}
+
+        async def fetch(spec):
+            try:
+                normalised = self._bulk_spec(spec)
+                host = (urlsplit(normalised['url']).hostname or '').lower()
+                slot = slots.get(host)
+                if slot is None:
+                    slot = slots[host] = limiter.limit_for(normalised['url']) if limiter is not None else \
+                        asyncio.Semaphore(per_host)
+                async with slot:
+                    with Priority(normalised.get('priority')):
+                        data = await self._async_coalesced_fetch_json(normalised['method'], normalised['url'],
+                                                                      normalised.get('params'),
+                                                                      normalised.get('json_data'),
+                                                                      normalised.get('headers'))
+                return FetchResult(spec, data, None)
+            except Exception as err:
+                return FetchResult(spec, None, err)
+
+        with Priority(priority):
+            # the tasks copy the context, and so the priority, as they are created
+            return list(await asyncio.gather(*[fetch(spec) for spec in specs]))
+
+    async def aclose(self) -> None:
+        """
+            Closes the connections opened by the async transport, the sync session is left untouched.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_loop = None
+
+    def close(self) -> None:
+        """
+            Shuts down the thread pools of the hedged requests, the requests in flight are left to finish. The sync
+            session is shared by the clients of the same family and stays open.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._hedge_lock:
+            pools, self._hedge_pools = self._hedge_pools, None
+        for pool in pools or ():
+            pool.shutdown(wait=False)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Sans-IO operations
+
+    def _fetch_payload(self, spec: RequestSpec):
+        """
+            Fetches the payload of a request spec with the semantics of the public methods: a json api answers `{}` on
+            error like `hit_and_get_data`, a body is fetched like `hit_and_get_content` and its errors are raised.
+
+            :param self: Represent the instance of the class.
+            :param spec: `RequestSpec` of the request
+
+            :return: Parsed JSON or decompressed bytes, as per `spec.kind`
+        """
+
+        if spec.kind == 'json' and spec.data is None:
+            return self._request_and_get_data(spec.method, spec.url, spec.params, spec.json_data, spec.headers)
+        if spec.kind == 'content' and spec.method == 'GET' and spec.data is None:
+            return self.hit_and_get_content(spec.url, spec.params, headers=spec.headers)
+        return self._bulk_fetch(self._bulk_spec(spec), spec.kind)
+
+    def _fetch_operations(self, operations: list, **kwargs) -> list:
+        """
+            Fetches the payloads of many operations with `fetch_many`, one batch per kind of payload.
+
+            :param self: Represent the instance of the class.
+            :param operations: List of `Operation`
+            :param kwargs: (optional) `per_host`, `max_workers` and `priority` of `fetch_many`
+
+            :return: List of `FetchResult` of the payloads in the order of the operations
+        """
+
+        results = [None] * len(operations)
+        by_kind = {}
+        for index, operation in enumerate(operations):
+            by_kind.setdefault(operation.spec.kind, []).append(index)
+        for kind, indexes in by_kind.items():
+            fetched = self.fetch_many([operations[index].spec for index in indexes], kind=kind, **kwargs)
+            for index, result in zip(indexes, fetched):
+                results[index] = result
+        return results
+
+    @staticmethod
+    def _parsed(operation: Operation, result: FetchResult, future=None) -> FetchResult:
+        """
+            Returns the result of an operation, its parse error is kept in `error` like a request error.
+
+            :param operation: `Operation` which was run
+            :param result: `FetchResult` of its payload
+            :param future: (optional) future of the parse when it ran on an executor
+
+            :return: `FetchResult` with the operation as spec and the parsed result as data
+        """
+
+        if not result.ok:
+            return FetchResult(operation, None, result.error)
+        try:
+            return FetchResult(operation, operation.result(result.data) if future is None else future.result(), None)
+        except Exception as err:
+            return FetchResult(operation, None, err)
+
+    def run(self, operation: Operation, priority: int = None):
+        """
+            Runs an `Operation` (built by an `*_operation` method of a client) on the sync transport: its request is
+            made and its payload is parsed, it is what the matching public method does.
+
+            :param self: Represent the instance of the class.
+            :param operation: `Operation` to run
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Result of the operation, e.g. a DataFrame
+        """
+
+        with Priority(priority):
+            return operation.result(self._fetch_payload(operation.spec))
+
+    def run_many(self, operations: list, parse_executor=None, per_host: int = None, max_workers: int = None,
+                 priority: int = None) -> list:
+        """
+            Runs many operations: the requests are made concurrently by `fetch_many` and the payloads are parsed as they
+            are all in, on `parse_executor` when it is passed (e.g. a `ProcessPoolExecutor`, which keeps the parsing of
+            big payloads off the threads doing the I/O) or else on the calling thread.
+
+            Usage:
+                with ProcessPoolExecutor() as parsers:
+                    results = nse.run_many([nse.get_option_chain_operation(ticker, expiry) for ticker in tickers],
+                                           parse_executor=parsers)
+
+            :param self: Represent the instance of the class.
+            :param operations: List of `Operation`
+            :param parse_executor: (optional) `concurrent.futures.Executor` the parsers are submitted to
+            :param per_host: (optional) fixed maximum of requests in flight to one host, see `fetch_many`
+            :param max_workers: (optional) size of the thread pool of the requests, see `fetch_many`
+            :param priority: (optional) `Priority` of the requests; default is the priority of the enclosing
+            `with Priority(...)` block
+
+            :return: List of `FetchResult` (operation, result, error) in the order of the operations, a failed request
+            or parse has its exception in `error` and does not affect the others
+        """
+
+        operations = list(operations)
+        fetched = self._fetch_operations(operations, per_host=per_host, max_workers=max_workers, priority=priority)
+        futures = [parse_executor.submit(operation.parse, result.data)
+                   if parse_executor is not None and result.ok and operation.parse is not None else None
+                   for operation, result in zip(operations, fetched)]
+        return [self._parsed(operation, result, future)
+                for operation, result, future in zip(operations, fetched, futures)]
+
+    async def async_run(self, operation: Operation, priority: int = None):
+        """
+            Coroutine equivalent of `run`: a json api is requested on the asyncio transport, the other payloads are
+            fetched on a worker thread.
+
+            :param self: Represent the instance of the class.
+            :param operation: `Operation` to run
+            :param priority: (optional) `Priority` of the request while it waits for the rate limit of its host, lower
+            is served first; default is the priority of the enclosing `with Priority(...)` block
+
+            :return: Result of the operation, e.g. a DataFrame
+        """
+
+        spec = operation.spec
+        with Priority(priority):
+            if spec.kind == 'json' and spec.data is None:
+                payload = await self._async_request_and_get_data(spec.method, spec.url, spec.params, spec.json_data,
+                                                                 spec.headers)
+            else:
+                payload = await asyncio.get_running_loop().run_in_executor(None, copy_context().run,
+                                                                           self._fetch_payload, spec)
+        return operation.result(payload)
+
+    async def async_run_many(self, operations: list, parse_executor=None, per_host: int = None,
+                             priority: int = None) -> list:
+        """
+            Coroutine equivalent of `run_many`: the json apis are requested by `async_fetch_many`, the other payloads
+            by `fetch_many` on a worker thread, and the payloads are parsed on `parse_executor` when it is passed.
+
+            :param self: Represent the instance of the class.
+            :param operations: List of `Operation`
+            :param parse_executor: (optional) `concurrent.futures.Executor` the parsers are submitted to
+            :param per_host: (optional) fixed maximum of requests in flight to one host, see `async_fetch_many`
+            :param priority: (optional) `Priority` of the requests; default is the priority of the enclosing
+            `with Priority(...)` block
+
+            :return: List of `FetchResult` (operation, result, error) in the order of the operations
+        """
+
+        operations = list(operations)
+        loop = asyncio.get_running_loop()
+        on_loop = [index for index, operation in enumerate(operations)
+                   if operation.spec.kind == 'json' and operation.spec.data is None]
+        on_thread = [index for index, operation in enumerate(operations)
+                     if operation.spec.kind != 'json' or operation.spec.data is not None]
+        with Priority(priority):
+            fetched_on_loop, fetched_on_thread = await asyncio.gather(
+                self.async_fetch_many([operations[index].spec for index in on_loop], per_host=per_host),
+                loop.run_in_executor(None, copy_context().run, lambda: self._fetch_operations(
+                    [operations[index] for index in on_thread], per_host=per_host)),
+            )
+        fetched = [None] * len(operations)
+        for indexes, results in ((on_loop, fetched_on_loop), (on_thread, fetched_on_thread)):
+            for index, result in zip(indexes, results):
+                fetched[index] = result
+
+        async def parse(operation, result):
+            if parse_executor is None or not result.ok or operation.parse is None:
+                return self._parsed(operation, result)
+            try:
+                return FetchResult(operation, await loop.run_in_executor(parse_executor, operation.parse, result.data),
+                                   None)
+            except Exception as err:
+                return FetchResult(operation, None, err)
 
+        return list(await asyncio.gather(*[parse(operation, result) for operation, result in zip(operations, fetched)]))
@@ -0,0 +1,94 @@
+import time
+from contextvars import ContextVar
+
+from .Exceptions import DeadlineExceeded
+
+# monotonic timestamp by which the running public method must be done, None when there is no deadline
+_expires_at = ContextVar('bharat_sm_data_deadline', default=None)
+
+
+class Deadline:
+    """
+        An end-to-end latency budget shared by every request made inside the `with` block. The connect / read timeouts
+        of those requests are cut down to the time left, and once it is over they fail fast with `DeadlineExceeded`
+        instead of touching the network.
+
+        The deadline is kept in a context variable, so it follows the code into the coroutines and tasks started
+        within the block. Nested deadlines can only shorten the budget, never extend it.
+
+        Usage:
+            with Deadline(10):
+                df = nse.get_trade_info(tickers)
+
+        Attributes:
+            seconds: budget of the block in seconds, None means no deadline of its own
+            expires_at: monotonic timestamp by which the block must be done (set on enter)
+
+        Methods:
+            remaining() -> float: Seconds left for the current deadline, None when there is none.
+            expired() -> bool: Tells whether the current deadline is over.
+            check() -> float: Raises `DeadlineExceeded` when the current deadline is over, else returns `remaining()`.
+    """
+
+    def __init__(self, seconds: float = None) -> None:
+        """
+            Builds the deadline, the clock starts when the `with` block is entered.
+
+            :param self: Represent the instance of the class
+            :param seconds: (optional) budget in seconds, None keeps the outer deadline (if any) as it is
+
+            :return: None
+        """
+
+        self.seconds = seconds
+        self.expires_at = None
+        self._token = None
+
+    def __enter__(self) -> 'Deadline':
+        expires_at = None if self.seconds is None else time.monotonic() + self.seconds
+        outer = _expires_at.get()
+        if outer is not None and (expires_at is None or outer < expires_at):
+            expires_at = outer
+        self.expires_at = expires_at
+        self._token = _expires_at.set(expires_at)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _expires_at.reset(self._token)
+        self._token = None
+
+    @staticmethod
+    def remaining() -> float:
+        """
+            Seconds left for the deadline of the current context.
+
+            :return: Seconds left (0 once it is over) or None when there is no deadline
+        """
+
+        expires_at = _expires_at.get()
+        if expires_at is None:
+            return None
+        return max(0.0, expires_at - time.monotonic())
+
+    @staticmethod
+    def expired() -> bool:
+        """
+            Tells whether the deadline of the current context is over.
+
+            :return: True if there is a deadline and no time is left
+        """
+
+        return Deadline.remaining() == 0.0
+
+    @staticmethod
+    def check() -> float:
+        """
+            Fails fast when the deadline of the current context is over.
+
+            :return: Seconds left or None when there is no deadline
+        """
+
+        remaining = Deadline.remaining()
+        if remaining == 0.0:
+            raise DeadlineExceeded('Deadline exceeded before the request could be sent')
+        return remaining
@@ -0,0 +1,22 @@
+class DeadlineExceeded(TimeoutError):
+    """
+        Raised when a request can not be sent (or finished) within the deadline set by `Deadline`.
+    """
+
+
+class CassetteMiss(LookupError):
+    """
+        Raised in replay mode when the cassette has no recorded response for a request.
+    """
+
+
+class CircuitOpenError(ConnectionError):
+    """
+        Raised without sending the request while the circuit breaker of the host is open, i.e. the host failed too many
+        requests in a row; `retry_after` is the number of seconds till the host is probed again.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f'Circuit breaker of {host} is open, retry after {retry_after:.1f}s')
+        self.host = host
+        self.retry_after = retry_after
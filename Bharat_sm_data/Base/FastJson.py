@@ -0,0 +1,52 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, the stdlib decoder is used without it
+    orjson = None
+
+backend = 'orjson' if orjson is not None else 'json'
+
+
+def loads_stdlib(content: bytes):
+    """
+        Parses a JSON body with the stdlib decoder. The bytes are decoded up front, which is quicker than letting `json`
+        decode bytes input, in the encoding `json.detect_encoding` finds from the first bytes (UTF-8, with or without a
+        BOM, UTF-16 or UTF-32 as allowed by the JSON RFCs).
+
+        :param content: Decompressed bytes of the response body
+
+        :return: JSON parsed result of the body
+
+        :raises json.JSONDecodeError: If the body is not a valid JSON, also when the bytes are not text of the detected
+        encoding
+    """
+
+    encoding = json.detect_encoding(content)
+    try:
+        text = content.decode(encoding, 'surrogatepass')
+    except UnicodeDecodeError as err:
+        raise json.JSONDecodeError(f'Body is not valid {encoding} ({err.reason})',
+                                   content.decode(encoding, 'replace'), err.start) from err
+    return json.loads(text)
+
+
+def loads(content: bytes):
+    """
+        Parses a JSON body with the fastest available decoder; orjson parses the bytes directly without building an
+        intermediate str. Payloads orjson refuses (e.g. NaN / Infinity literals, UTF-16 bodies) are handed to the stdlib
+        decoder so both backends accept the same input.
+
+        :param content: Decompressed bytes of the response body
+
+        :return: JSON parsed result of the body
+
+        :raises json.JSONDecodeError: If the body is not a valid JSON
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return loads_stdlib(content)
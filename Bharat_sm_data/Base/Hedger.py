@@ -0,0 +1,169 @@
+import threading
+from collections import deque
+
+from .Metrics import endpoint_template
+
+
+class Hedger:
+    """
+        Decides when a latency critical request is hedged: if it hasn't answered within the `percentile` of the recent
+        latencies of its endpoint, a duplicate request is sent and the first response wins.
+
+        Only the urls containing one of `endpoints` are hedged. The delay of an endpoint is learned from its last
+        `window` latencies and hedging starts once `min_samples` of them were seen. The extra load is capped by a
+        budget: every hedged endpoint request earns `max_extra_load` of a hedge (up to `burst` saved) and every hedge
+        spends one, so hedges never add more than `max_extra_load` (10% by default) to the requests sent.
+
+        One instance can be shared by several clients and threads.
+
+        Attributes:
+            endpoints: url path fragments of the hedged endpoints
+            percentile: percentile (0 - 100) of the recent latencies after which the duplicate is sent
+            min_samples: latencies an endpoint needs before it is hedged
+            min_delay: lower bound of the delay in seconds, so fast endpoints are not hedged on noise
+            max_extra_load: maximum ratio of hedges to the requests of the hedged endpoints
+            burst: maximum number of hedges saved up by the budget
+
+        Methods:
+            hedges(url: str) -> bool: Tells whether the url belongs to a hedged endpoint.
+            delay_for(url: str) -> float: Returns the seconds after which the url is hedged, None till it is learned.
+            observe(url: str, latency: float) -> None: Records the latency of a request.
+            try_hedge(url: str) -> bool: Spends a hedge from the budget if one is left.
+            record_win(url: str) -> None: Records that the duplicate answered first.
+            stats() -> dict: Returns the counts of requests, hedges and hedge wins.
+    """
+
+    default_endpoints = (
+        '/api/option-chain-v3',
+        '/v1/charts/symbolHistoricalData',
+        '/cache/live_derivative_prices/',
+    )
+
+    def __init__(self, endpoints: tuple = None, percentile: float = 95, min_samples: int = 20, window: int = 200,
+                 min_delay: float = 0.05, max_extra_load: float = 0.1, burst: float = 5) -> None:
+        """
+            Builds a hedger with an empty latency history.
+
+            :param self: Represent the instance of the class
+            :param endpoints: (optional) url path fragments of the hedged endpoints, `default_endpoints` when not passed
+            :param percentile: (optional) percentile of the recent latencies after which the duplicate is sent
+            :param min_samples: (optional) latencies an endpoint needs before it is hedged
+            :param window: (optional) number of recent latencies kept per endpoint
+            :param min_delay: (optional) lower bound of the delay in seconds
+            :param max_extra_load: (optional) maximum ratio of hedges to the requests of the hedged endpoints
+            :param burst: (optional) maximum number of hedges saved up by the budget
+
+            :return: None
+        """
+
+        if not 0 < percentile < 100 or max_extra_load < 0 or burst < 1:
+            raise ValueError(f'invalid hedging settings; got percentile={percentile}, '
+                             f'max_extra_load={max_extra_load}, burst={burst}')
+        self.endpoints = tuple(self.default_endpoints if endpoints is None else endpoints)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._budget = 0.0
+        self._counts = {'requests': 0, 'hedges': 0, 'hedge_wins': 0, 'over_budget': 0}
+
+    def hedges(self, url: str) -> bool:
+        """
+            Tells whether the url belongs to one of the hedged endpoints.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: True if the url is hedged
+        """
+
+        return any(fragment in url for fragment in self.endpoints)
+
+    def delay_for(self, url: str) -> float:
+        """
+            Returns the seconds after which a request to the url is hedged and earns the budget its share of a hedge.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: Seconds to wait for the first response, None while the endpoint has too few latencies
+        """
+
+        key = endpoint_template(url)
+        with self._lock:
+            self._counts['requests'] += 1
+            self._budget = min(self.burst, self._budget + self.max_extra_load)
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        rank = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[rank])
+
+    def observe(self, url: str, latency: float) -> None:
+        """
+            Records the latency of a request, the urls which are not hedged are ignored.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param latency: Seconds taken by the request
+
+            :return: None
+        """
+
+        if not self.hedges(url):
+            return
+        key = endpoint_template(url)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def try_hedge(self, url: str) -> bool:
+        """
+            Spends a hedge from the budget.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: True if the duplicate request may be sent
+        """
+
+        with self._lock:
+            if self._budget < 1:
+                self._counts['over_budget'] += 1
+                return False
+            self._budget -= 1
+            self._counts['hedges'] += 1
+            return True
+
+    def record_win(self, url: str) -> None:
+        """
+            Records that the duplicate request answered before the first one.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: None
+        """
+
+        with self._lock:
+            self._counts['hedge_wins'] += 1
+
+    def stats(self) -> dict:
+        """
+            Returns the counts of hedged endpoint requests, hedges sent, hedges which answered first and hedges skipped
+            for lack of budget.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict of counts
+        """
+
+        with self._lock:
+            return dict(self._counts)
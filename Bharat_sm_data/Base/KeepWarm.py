@@ -0,0 +1,366 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time
+from urllib.parse import urlsplit
+
+from .Exceptions import CircuitOpenError
+from .Priority import Priority
+from .ResponseCache import IST
+
+# resolver of the process before any `DnsCache` was installed
+_system_getaddrinfo = socket.getaddrinfo
+# installed caches, the last one resolves; guarded by `_install_lock`
+_installed = []
+_install_lock = threading.Lock()
+
+
+class DnsCache:
+    """
+        Thread-safe cache of the DNS answers (`socket.getaddrinfo`) of the process, so a request after an idle gap
+        doesn't wait for the resolver. Installing it patches `socket.getaddrinfo` for the whole process, so every
+        resolution goes through it: the `requests` / `PoolTransport` connections as well as the `aiohttp` resolver
+        threads. Installs nest: the cache installed last resolves and uninstalling it hands the process back to the
+        cache installed before it, or to the system resolver once none is left. An answer is reused for `ttl`
+        seconds; when the resolver fails afterwards the last answer is served for up to `stale_ttl` more seconds
+        rather than failing the request.
+
+        `resolve` refreshes the answer of a host ahead of time, `KeepWarm` calls it on every round so the latency
+        critical requests always find a fresh answer.
+
+        Usage:
+            dns_cache = DnsCache()
+            dns_cache.install()
+            dns_cache.resolve('www.nseindia.com')
+
+        Attributes:
+            ttl: seconds an answer is reused for
+            stale_ttl: seconds an expired answer is still served while the resolver fails
+
+        Methods:
+            getaddrinfo(host, port, family=0, type=0, proto=0, flags=0) -> list: `socket.getaddrinfo` served from the
+            cache.
+            resolve(host: str, port: int = 443) -> list: Resolves a host now and keeps its answer.
+            install() -> None: Makes the cache the resolver of the process.
+            uninstall() -> None: Gives the process its resolver back.
+            clear() -> None: Forgets every answer.
+    """
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 3600) -> None:
+        """
+            Builds an empty cache, it is used by the process once installed.
+
+            :param self: Represent the instance of the class
+            :param ttl: (optional) seconds an answer is reused for
+            :param stale_ttl: (optional) seconds an expired answer is still served while the resolver fails
+
+            :return: None
+        """
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._answers = {}
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0) -> list:
+        """
+            `socket.getaddrinfo` served from the cache while the answer is fresh.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or address
+            :param port: Port number or service name
+            :param family: (optional) address family
+            :param type: (optional) socket type
+            :param proto: (optional) protocol
+            :param flags: (optional) `AI_*` flags
+
+            :return: List of (family, type, proto, canonname, sockaddr) tuples
+
+            Raises:
+                socket.gaierror: when the resolver fails and there is no answer to fall back on
+        """
+
+        key = (host, port, family, type, proto, flags)
+        with self._lock:
+            answer = self._answers.get(key)
+        if answer is not None and time.monotonic() - answer[0] < self.ttl:
+            return list(answer[1])
+        return self._lookup(key, answer)
+
+    def _lookup(self, key: tuple, answer: tuple = None) -> list:
+        """
+            Asks the resolver of the process and keeps its answer, the last answer is served when it fails.
+
+            :param self: Represent the instance of the class
+            :param key: (host, port, family, type, proto, flags) of the lookup
+            :param answer: (optional) kept (resolved at, addresses) of the key
+
+            :return: List of (family, type, proto, canonname, sockaddr) tuples
+        """
+
+        try:
+            addresses = _system_getaddrinfo(*key)
+        except socket.gaierror:
+            if answer is not None and time.monotonic() - answer[0] < self.ttl + self.stale_ttl:
+                return list(answer[1])
+            raise
+        with self._lock:
+            self._answers[key] = (time.monotonic(), tuple(addresses))
+        return addresses
+
+    def resolve(self, host: str, port: int = 443) -> list:
+        """
+            Resolves a host now, whatever the age of its answer, and keeps the answer for the lookups the connections
+            make (TCP on any address family).
+
+            :param self: Represent the instance of the class
+            :param host: Host name
+            :param port: (optional) port the connections are made to
+
+            :return: List of (family, type, proto, canonname, sockaddr) tuples
+        """
+
+        key = (host, port, socket.AF_UNSPEC, socket.SOCK_STREAM, 0, 0)
+        with self._lock:
+            answer = self._answers.get(key)
+        return self._lookup(key, answer)
+
+    def install(self) -> None:
+        """
+            Makes the cache the resolver of the process (patches `socket.getaddrinfo`), every `install` is to be
+            matched by an `uninstall`.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with _install_lock:
+            _installed.append(self)
+            socket.getaddrinfo = self.getaddrinfo
+
+    def uninstall(self) -> None:
+        """
+            Undoes one `install` of the cache, the process resolves with the cache installed before it or with the
+            system resolver once no cache is installed.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with _install_lock:
+            for index in range(len(_installed) - 1, -1, -1):
+                if _installed[index] is self:
+                    del _installed[index]
+                    break
+            socket.getaddrinfo = _installed[-1].getaddrinfo if _installed else _system_getaddrinfo
+
+    def clear(self) -> None:
+        """
+            Forgets every answer.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            self._answers.clear()
+
+
+class KeepWarm:
+    """
+        Keeps the connections of a client warm during the configured windows (by default from a little before the NSE
+        session opens until it closes, IST weekdays): every `interval` seconds it refreshes the DNS answers of the hosts
+        (when a `dns_cache` is given) and sends `connections` concurrent cheap requests (HEAD) to each of them, so that
+        many connections stay open and idle in the pool of the client's transport. The first latency critical call of
+        the session (the 09:15 snapshot) then starts on an open TLS connection instead of paying DNS, TCP and TLS
+        handshakes.
+
+        The pings are sent like any request of the client (`_request_once` on its sync transport, `requests` session or
+        `PoolTransport`) with `Priority.BULK`, so they respect the rate limiter, step aside for real requests and feed
+        the circuit breaker and concurrency limiter; a host whose circuit is open is not pinged. The async transport
+        keeps its own connections and is not warmed, it still benefits from a `dns_cache`. The pings are counted in the
+        metrics as `keep_warm.pings` / `keep_warm.errors`.
+
+        Usage:
+            warm = KeepWarm(nse)  # pings the primer pages of the client, www and charting.nseindia.com for NSE
+            warm = KeepWarm(nse, dns_cache=DnsCache())  # also caches the DNS answers of the process
+            warm.start()
+            ...
+            warm.stop()
+
+        Attributes:
+            client: `CustomSession` whose connections are kept warm
+            urls: urls pinged, one per host
+            connections: connections kept open per host
+            interval: seconds between two rounds, below the idle timeout of the servers
+            windows: list of (start, end) IST times of the day the connections are kept warm in
+            weekdays_only: the connections are not kept warm on Saturdays and Sundays
+            dns_cache: (optional) `DnsCache` installed while running and refreshed on every round; installing it
+            patches the resolver of the whole process, so it is only done when one is passed
+
+        Methods:
+            is_active(now: datetime = None) -> bool: Tells whether the time is inside a window.
+            warm() -> int: Runs one round right away.
+            start() -> None: Starts keeping the connections warm on a background thread.
+            stop() -> None: Stops the background thread.
+    """
+
+    default_windows = ((dt_time(9, 0), dt_time(15, 35)),)
+
+    def __init__(self, client, urls: list = None, connections: int = 2, interval: float = 20, windows: list = None,
+                 weekdays_only: bool = True, dns_cache: DnsCache = None) -> None:
+        """
+            Builds the keep-warm of a client, nothing is sent till `start` or `warm` is called.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` whose connections are kept warm
+            :param urls: (optional) urls pinged, default is the primer pages of the client (e.g. www.nseindia.com and
+            charting.nseindia.com for the NSE clients)
+            :param connections: (optional) connections kept open per host
+            :param interval: (optional) seconds between two rounds
+            :param windows: (optional) list of (start, end) IST `datetime.time` the connections are kept warm in,
+            `default_windows` when not passed
+            :param weekdays_only: (optional) skip Saturdays and Sundays
+            :param dns_cache: (optional) `DnsCache` to install (patching `socket.getaddrinfo` for the process) and
+            refresh while running, DNS is left alone when not passed
+
+            :return: None
+        """
+
+        if connections < 1 or interval <= 0:
+            raise ValueError(f'invalid keep-warm settings; got connections={connections}, interval={interval}')
+        if urls is None:
+            hosts = dict.fromkeys([*client.primers, *client._own_primers])
+            urls = [step for host in hosts for step in client._primer_steps(host) if isinstance(step, str)]
+        self.client = client
+        self.urls = list(urls)
+        self.connections = connections
+        self.interval = interval
+        self.windows = list(self.default_windows if windows is None else windows)
+        self.weekdays_only = weekdays_only
+        self.dns_cache = dns_cache
+        self._stop = threading.Event()
+        self._thread = None
+
+    def is_active(self, now: datetime = None) -> bool:
+        """
+            Tells whether the connections are to be kept warm at the given time.
+
+            :param self: Represent the instance of the class
+            :param now: (optional) time to check, default is current time
+
+            :return: True if the time is inside one of the windows
+        """
+
+        now = (now or datetime.now(IST)).astimezone(IST)
+        if self.weekdays_only and now.weekday() >= 5:
+            return False
+        return any(start <= now.time() < end for start, end in self.windows)
+
+    def _ping(self, url: str) -> bool:
+        """
+            Sends one HEAD request to the url on the transport of the client, leaving its connection in the pool. It
+            goes through `_request_once` like any request, so its outcome resolves a half-open circuit and its latency
+            and bytes are recorded.
+
+            :param self: Represent the instance of the class
+            :param url: Url to ping
+
+            :return: True if the server answered
+        """
+
+        client = self.client
+        try:
+            with Priority(Priority.BULK):
+                client._request_once('HEAD', url, headers=client.headers, allow_redirects=False)
+        except CircuitOpenError:
+            return False
+        except Exception:
+            if client.metrics is not None:
+                client.metrics.inc(url, 'keep_warm.errors')
+            return False
+        if client.metrics is not None:
+            client.metrics.inc(url, 'keep_warm.pings')
+        return True
+
+    def warm(self) -> int:
+        """
+            Runs one round: refreshes the DNS answers of the hosts and pings every url `connections` times at once, so
+            that many connections are opened (or kept open) per host.
+
+            :param self: Represent the instance of the class
+
+            :return: Number of pings answered
+        """
+
+        if self.dns_cache is not None:
+            for url in self.urls:
+                parts = urlsplit(url)
+                try:
+                    self.dns_cache.resolve(parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+                except OSError:
+                    pass
+        pings = [url for url in self.urls for _ in range(self.connections)]
+        if not pings:
+            return 0
+        with ThreadPoolExecutor(max_workers=len(pings), thread_name_prefix='bharat_sm_data_keep_warm') as pool:
+            return sum(pool.map(self._ping, pings))
+
+    def _run(self) -> None:
+        """
+            Body of the background thread, runs a round every `interval` seconds inside the windows.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        while not self._stop.is_set():
+            if self.is_active():
+                self.warm()
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """
+            Installs the DNS cache, if any, and starts keeping the connections warm on a daemon thread, a no-op when
+            running.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self.dns_cache is not None:
+            self.dns_cache.install()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='bharat_sm_data_keep_warm', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+            Stops the background thread (after its round in progress) and uninstalls the DNS cache.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.dns_cache is not None:
+            self.dns_cache.uninstall()
+
+    def __enter__(self) -> 'KeepWarm':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
@@ -0,0 +1,259 @@
+import json
+import re
+import threading
+from urllib.parse import urlsplit
+
+_id_segment = re.compile(r'^(?:\d+|[0-9a-fA-F-]{16,})$')
+
+
+def endpoint_template(url: str) -> tuple:
+    """
+        Splits a url into its host and endpoint template; query string is dropped and the path segments which are
+        ids (numbers, uuids, hashes) are replaced by `{id}`, so every company / token of an api is counted together.
+
+        :param url: Url of the request
+
+        :return: A tuple of (host, endpoint template)
+    """
+
+    parts = urlsplit(url)
+    segments = ['{id}' if _id_segment.match(segment) else segment for segment in parts.path.split('/')]
+    return (parts.hostname or '').lower(), '/'.join(segments) or '/'
+
+
+class Histogram:
+    """
+        A fixed bucket histogram; keeps the count of observations falling into every bucket along with the count, sum,
+        min and max, which is enough to estimate percentiles without keeping the observations.
+
+        Attributes:
+            buckets: sorted upper bounds of the buckets, observations above the last one fall into the overflow bucket
+
+        Methods:
+            observe(value: float) -> None: Records an observation.
+            percentile(q: float) -> float: Estimates the q-th percentile (0 - 100) from the buckets.
+            to_dict() -> dict: Summary of the histogram.
+    """
+
+    default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets: tuple = None) -> None:
+        """
+            Builds an empty histogram.
+
+            :param self: Represent the instance of the class
+            :param buckets: (optional) upper bounds of the buckets, default is suited for latencies in seconds
+
+            :return: None
+        """
+
+        self.buckets = tuple(sorted(buckets or self.default_buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float) -> None:
+        """
+            Records an observation.
+
+            :param self: Represent the instance of the class
+            :param value: Observed value
+
+            :return: None
+        """
+
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """
+            Estimates a percentile as the upper bound of the bucket it falls into (the max for the overflow bucket).
+
+            :param self: Represent the instance of the class
+            :param q: Percentile between 0 and 100
+
+            :return: Estimated value or None when nothing was observed
+        """
+
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        """
+            Summary of the histogram.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict of count, sum, mean, min, max, p50, p90, p99 and the bucket counts
+        """
+
+        bounds = [str(bound) for bound in self.buckets] + ['+Inf']
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': dict(zip(bounds, self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+        Thread-safe registry of counters and histograms kept per host and endpoint template. `CustomSession` records
+        into it the latency and time to first byte of every request, compressed and decompressed bytes, retries,
+        status codes and cache hits / misses.
+
+        Attributes:
+            histogram_buckets: dict of histogram name and its bucket bounds, names not listed use `Histogram` defaults
+
+        Methods:
+            inc(url: str, name: str, value: float = 1) -> None: Increments a counter of the url's endpoint.
+            observe(url: str, name: str, value: float) -> None: Records an observation into a histogram.
+            snapshot() -> dict: Returns all the metrics as a plain dict `{host: {endpoint: {counters, histograms}}}`.
+            to_json(**kwargs) -> str: Returns the snapshot as JSON.
+            dump(file_path: str) -> None: Writes the snapshot as JSON into a file.
+            reset() -> None: Drops every metric.
+    """
+
+    def __init__(self, histogram_buckets: dict = None) -> None:
+        """
+            Builds an empty registry.
+
+            :param self: Represent the instance of the class
+            :param histogram_buckets: (optional) dict of histogram name and its bucket bounds
+
+            :return: None
+        """
+
+        self.histogram_buckets = histogram_buckets or {}
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _entry(self, url: str) -> dict:
+        """
+            Returns the metrics of the url's endpoint, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: Dict with `counters` and `histograms` of the endpoint
+        """
+
+        host, endpoint = endpoint_template(url)
+        endpoints = self._metrics.setdefault(host, {})
+        entry = endpoints.get(endpoint)
+        if entry is None:
+            entry = endpoints[endpoint] = {'counters': {}, 'histograms': {}}
+        return entry
+
+    def inc(self, url: str, name: str, value: float = 1) -> None:
+        """
+            Increments a counter of the url's endpoint.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param name: Name of the counter, e.g. `requests`, `status.200`, `cache.hit`
+            :param value: (optional) Increment
+
+            :return: None
+        """
+
+        with self._lock:
+            counters = self._entry(url)['counters']
+            counters[name] = counters.get(name, 0) + value
+
+    def observe(self, url: str, name: str, value: float) -> None:
+        """
+            Records an observation into a histogram of the url's endpoint.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param name: Name of the histogram, e.g. `latency`, `ttfb`
+            :param value: Observed value
+
+            :return: None
+        """
+
+        with self._lock:
+            histograms = self._entry(url)['histograms']
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = Histogram(self.histogram_buckets.get(name))
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        """
+            Returns all the metrics as a plain dict.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict of `{host: {endpoint: {'counters': {...}, 'histograms': {name: summary}}}}`
+        """
+
+        with self._lock:
+            return {
+                host: {
+                    endpoint: {
+                        'counters': dict(entry['counters']),
+                        'histograms': {name: histogram.to_dict() for name, histogram in entry['histograms'].items()},
+                    } for endpoint, entry in endpoints.items()
+                } for host, endpoints in self._metrics.items()
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """
+            Returns the snapshot as JSON.
+
+            :param self: Represent the instance of the class
+            :param kwargs: (optional) keyword arguments of `json.dumps`, e.g. `indent`
+
+            :return: JSON string of the snapshot
+        """
+
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def dump(self, file_path: str) -> None:
+        """
+            Writes the snapshot as JSON into a file.
+
+            :param self: Represent the instance of the class
+            :param file_path: Path of the file
+
+            :return: None
+        """
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json(indent=2))
+
+    def reset(self) -> None:
+        """
+            Drops every metric.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            self._metrics = {}
@@ -1,9 +1,15 @@
+import asyncio
+import time
 from datetime import datetime
-from io import StringIO
+from functools import partial
+from io import BytesIO
+from tempfile import TemporaryFile
 
 import pandas as pd
 import pydash as _
+from .CookieStore import CookieStore
 from .CustomRequest import CustomSession
+from .Operation import Operation, RequestSpec
 
 
 class NSEBase(CustomSession):
@@ -12,9 +18,14 @@ class NSEBase(CustomSession):
 
         Attributes:
             _base_url: base URL for the NSE API
+            cookie_store: `CookieStore` which keeps the warmed up NSE cookies across process restarts, shared by all
+            the NSE clients by default; set it to None to warm up on every construction
+            session_family: every NSE client (`NSEBase`, `Technical.NSE`, `Derivatives.NSE`) shares one warmed up
+            session, connection pool and cookie jar through `CustomSession.session_registry`
 
         Methods:
-            __init__(): Initializes the class and sets up the session and headers for all subsequent requests.
+            __init__(headers: dict = None): Initializes the class and sets up the session and headers for all subsequent requests, the NSE cookies are fetched lazily on the first api call.
+            save_cookies() -> None: Saves the current NSE cookies of the session into the cookie store.
             get_market_status_and_current_val(index: str = 'NIFTY 50') -> tuple: Returns the market status and current value of a given index.
             get_last_traded_date() -> datetime.date: Returns the last traded date of NIFTY 50 index.
             get_second_wise_data(ticker_or_index: str = "NIFTY 50", is_index: bool = True, underlying_symbol: str = None) -> pd.DataFrame: Returns a dataframe with second wise data for a given index or stock.
@@ -27,14 +38,34 @@ class NSEBase(CustomSession):
             search_charting_symbol(symbol: str, segment: str = "") -> dict: Searches for a symbol in the new NSE charting API with optional segment filter ("FO", "IDX", "EQ") and returns metadata including scripcode/token.
             get_charting_historical_data(symbol: str, token: str, symbol_type: str = "Index", chart_type: str = "D", time_interval: int = 1, from_date: int = 0, to_date: int = None) -> pd.DataFrame: Fetches historical OHLC data from the new NSE charting API using token. Supports symbol_type: "Index", "Equity", "Futures", "Options".
             get_ohlc_from_charting_v2(symbol: str, timeframe: str = "1Day", start_date: datetime = None, end_date: datetime = None, symbol_type: str = "Index", segment: str = "") -> pd.DataFrame: Simplified wrapper to fetch historical data from new NSE charting API with optional segment filter. Supports symbol_type: "Index", "Equity", "Futures", "Options".
+            async_* : Coroutine variants of the JSON API methods above (market status, search, equity meta info, second wise data and the charting v2 methods) running on the asyncio transport.
+            *_operation : Sans-IO form of the single request methods above (e.g. `get_market_status_and_current_val_operation`), an `Operation` with the `RequestSpec` of the request and the pure parser of its response, driven by `run` / `async_run` / `run_many`.
     """
 
-    def __init__(self):
+    _charting_time_mappings = {
+        '1Min': ('I', 1),
+        '5Min': ('I', 5),
+        '15Min': ('I', 15),
+        '30Min': ('I', 30),
+        '60Min': ('I', 60),
+        '1Day': ('D', 1),
+        '1Week': ('W', 1),
+        '1Month': ('M', 1),
+    }
+    _valid_symbol_types = ["Index", "Equity", "Futures", "Options"]
+    _valid_segments = ["", "FO", "IDX", "EQ"]
+    _cookie_domain = 'nseindia.com'
+    session_family = 'nseindia.com'
+    _cookie_min_ttl = 60
+    cookie_store = CookieStore()
+
+    def __init__(self, headers: dict = None):
         """
             The __init__ function is called when the class is instantiated.
             It sets up the session and headers for all subsequent requests.
     
             :param self: Represent the instance of the class
+            :param headers: (optional) headers overriding the default NSE headers, e.g. the referer of a sub class
 
             :return: Nothing
         """
@@ -52,7 +83,9 @@ class NSEBase(CustomSession):
             'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
                           'Chrome/108.0.0.0 Safari/537.36 Edg/108.0.1462.54',
         })
-        
+        if headers:
+            self.headers = self.merge_headers(headers)
+
         self._base_url = 'https://www.nseindia.com'
         self._charting_base_url = 'https://charting.nseindia.com'
         self._charting_headers = {
@@ -66,9 +99,139 @@ class NSEBase(CustomSession):
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-origin',
         }
-        self.hit_and_get_data(self._base_url)
-        self.hit_and_get_data(f'{self._charting_base_url}')
-        # This will call the main website and sets cookies into a session object if available
+        # the main websites set the cookies required by the apis, they are hit lazily before the first api call
+        self.add_primer(self._cookie_domain, self._base_url, self._charting_base_url)
+        # a session shared with an earlier NSE client already holds (or is about to fetch) the cookies
+        if self._cookie_domain not in self._primed and self.cookie_store is not None and \
+                self.cookie_store.load(self.session.cookies, self._cookie_domain):
+            self.mark_primed(self._cookie_domain)
+
+    def _on_primed(self, host: str) -> None:
+        """
+            Saves the fresh NSE cookies into the cookie store once the session is primed.
+
+            :param self: Represent the instance of the class
+            :param host: Host suffix which was primed
+
+            :return: None
+        """
+
+        if host == self._cookie_domain:
+            self.save_cookies()
+
+    def _nse_cookies_fresh(self) -> bool:
+        """
+            Tells whether the session holds NSE cookies and none of them expires within `_cookie_min_ttl` seconds.
+
+            :param self: Represent the instance of the class
+
+            :return: True if the NSE cookies are fresh
+        """
+
+        fresh_till = time.time() + self._cookie_min_ttl
+        has_cookies = False
+        for cookie in self.cookie_snapshot():
+            if not CookieStore._matches(cookie.domain, self._cookie_domain):
+                continue
+            if cookie.expires is not None and cookie.expires <= fresh_till:
+                return False
+            has_cookies = True
+        return has_cookies
+
+    def _warm_up(self, page_url: str, params: dict = None) -> None:
+        """
+            Hits the NSE web page which sets the cookies of its apis, it is skipped while the session holds fresh NSE
+            cookies; an api call rejected with 401 / 403 re-primes the session anyway.
+
+            :param self: Represent the instance of the class
+            :param page_url: Url of the web page
+            :param params: (optional) url params of the web page
+
+            :return: None
+        """
+
+        self._ensure_primed(page_url)
+        if self._nse_cookies_fresh():
+            return
+        # concurrent callers with stale cookies share one hit of the page
+        self._priming_flight.do(f'{self._cookie_domain} warm-up', lambda: self._refresh_cookies(page_url, params))
+
+    def _refresh_cookies(self, page_url: str, params: dict = None) -> None:
+        """
+            Hits the NSE web page which sets the cookies unless a caller which ran just before already refreshed them.
+
+            :param self: Represent the instance of the class
+            :param page_url: Url of the web page
+            :param params: (optional) url params of the web page
+
+            :return: None
+        """
+
+        if self._nse_cookies_fresh():
+            return
+        self.hit_and_get_data(page_url, params=params)
+        self.save_cookies()
+
+    async def _async_warm_up(self, page_url: str, params: dict = None) -> None:
+        """
+            Coroutine equivalent of `_warm_up`.
+
+            :param self: Represent the instance of the class
+            :param page_url: Url of the web page
+            :param params: (optional) url params of the web page
+
+            :return: None
+        """
+
+        await self._async_ensure_primed(page_url)
+        if self._nse_cookies_fresh():
+            return
+        await self._priming_flight.async_do(f'{self._cookie_domain} warm-up',
+                                            lambda: self._async_refresh_cookies(page_url, params))
+
+    async def _async_refresh_cookies(self, page_url: str, params: dict = None) -> None:
+        """
+            Coroutine equivalent of `_refresh_cookies`.
+
+            :param self: Represent the instance of the class
+            :param page_url: Url of the web page
+            :param params: (optional) url params of the web page
+
+            :return: None
+        """
+
+        if self._nse_cookies_fresh():
+            return
+        await self.async_hit_and_get_data(page_url, params=params)
+        self.save_cookies()
+
+    def save_cookies(self) -> None:
+        """
+            Saves the current NSE cookies of the session into the cookie store, if any.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        if self.cookie_store is None:
+            return
+        try:
+            self.cookie_store.save(self.cookie_snapshot(), self._cookie_domain)
+        except OSError as err:
+            print(f'Error in saving the cookies : {err}')
+
+    @staticmethod
+    def _data_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the `data` list of an NSE api response into a DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: A DataFrame of the records of the response
+        """
+
+        return pd.DataFrame(response.get('data', []))
 
     # ----------------------------------------------------------------------------------------------------------------
     # Utility Functions
@@ -83,7 +246,33 @@ class NSEBase(CustomSession):
             :return: A tuple of the market status and the current value
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/marketStatus').get('marketState')
+        return self.run(self.get_market_status_and_current_val_operation(index))
+
+    def get_market_status_and_current_val_operation(self, index: str = 'NIFTY 50') -> Operation:
+        """
+            Sans-IO form of `get_market_status_and_current_val`.
+
+            :param self: Represent the instance of the class
+            :param index: Get the market status and last price of a particular index
+
+            :return: Operation of the `marketStatus` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/marketStatus'),
+                         partial(self._parse_market_status, index=index))
+
+    @staticmethod
+    def _parse_market_status(response: dict, index: str) -> tuple:
+        """
+            Picks the market status and the last price of the given index from the `marketStatus` api response.
+
+            :param response: Parsed response of the `marketStatus` api
+            :param index: Index for which the last price is required
+
+            :return: A tuple of the market status and the current value
+        """
+
+        response = response.get('marketState')
         status = _.get(_.find(response, {'index': 'NIFTY 50'}), 'marketStatus', 'Close')
         last_price = _.get(_.find(response, {'index': index}), 'last')
         return status, last_price
@@ -95,8 +284,30 @@ class NSEBase(CustomSession):
             :param self: Represent the instance of the class
             :return: The date of the last traded day
         """
-        response = self.hit_and_get_data(f'{self._base_url}/api/marketStatus').get('marketState')
-        last_traded = _.get(_.find(response, {'index': 'NIFTY 50'}), 'tradeDate')
+        return self.run(self.get_last_traded_date_operation())
+
+    def get_last_traded_date_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_last_traded_date`.
+
+            :param self: Represent the instance of the class
+
+            :return: Operation of the `marketStatus` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/marketStatus'), self._parse_last_traded_date)
+
+    @staticmethod
+    def _parse_last_traded_date(response: dict):
+        """
+            Picks the last traded date of NIFTY 50 from the `marketStatus` api response.
+
+            :param response: Parsed response of the `marketStatus` api
+
+            :return: The date of the last traded day
+        """
+
+        last_traded = _.get(_.find(response.get('marketState'), {'index': 'NIFTY 50'}), 'tradeDate')
         return datetime.strptime(last_traded, '%d-%b-%Y %H:%M').date()
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -116,8 +327,25 @@ class NSEBase(CustomSession):
 
             :return: A dataframe with second wise data
         """
-         # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/get-quotes/equity', params={'symbol': ticker_or_index})
+        self._warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': ticker_or_index})
+
+        params = self._second_wise_data_params(ticker_or_index, is_index, underlying_symbol)
+        response = self.hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params=params)
+        params['preopen'] = True
+        pre_response = self.hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params=params)
+        return self._second_wise_data_to_df(response, pre_response)
+
+    @staticmethod
+    def _second_wise_data_params(ticker_or_index: str, is_index: bool, underlying_symbol: str = None) -> dict:
+        """
+            Builds the url params of the `chart-databyindex` api.
+
+            :param ticker_or_index: Specify the index for which we want to get data
+            :param is_index: Determine whether the index is an index or not
+            :param underlying_symbol: (optional) Underlying assets ticker for the derivatives
+
+            :return: Dict of url params
+        """
 
         if not ticker_or_index.endswith('EQN') and not is_index:
             ticker_or_index += 'EQN'
@@ -128,9 +356,19 @@ class NSEBase(CustomSession):
 
         if underlying_symbol is not None:
             params['underlyingsymbol'] = underlying_symbol
-        response = self.hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params=params)
-        params['preopen'] = True
-        pre_response = self.hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params=params)
+        return params
+
+    @staticmethod
+    def _second_wise_data_to_df(response: dict, pre_response: dict) -> pd.DataFrame:
+        """
+            Merges the pre-open and the normal session response of the `chart-databyindex` api into a DataFrame.
+
+            :param response: Parsed response of the normal market session
+            :param pre_response: Parsed response of the pre-open market session
+
+            :return: A dataframe with second wise data
+        """
+
         datapoint_size = 2
         try:
             datapoint_size = len(response.get('grapthData', [])[0])
@@ -178,12 +416,22 @@ class NSEBase(CustomSession):
             :return: The ohlc data for a given ticker or index
         """
 
+        return self.run(self.search_operation(search_text))
+
+    def search_operation(self, search_text: str) -> Operation:
+        """
+            Sans-IO form of `search`.
+
+            :param self: Represent the instance of the class
+            :param search_text: Specify the ticker or index for which we want to get data
+
+            :return: Operation of the `search/autocomplete` api
+        """
+
         params = {
             'q': search_text,
         }
-
-        response = self.hit_and_get_data(f'{self._base_url}/api/search/autocomplete', params=params)
-        return response
+        return Operation(RequestSpec(f'{self._base_url}/api/search/autocomplete', params=params), None)
 
     def get_nse_turnover(self) -> pd.DataFrame:
         """
@@ -195,7 +443,31 @@ class NSEBase(CustomSession):
            :return: The exchange turnover data in the DataFrame format
        """
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/NextApi/apiClient', params={'functionName':'getMarketTurnoverSummary'})
+        return self.run(self.get_nse_turnover_operation())
+
+    def get_nse_turnover_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_nse_turnover`.
+
+            :param self: Represent the instance of the class
+
+            :return: Operation of the `getMarketTurnoverSummary` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/NextApi/apiClient',
+                                     params={'functionName': 'getMarketTurnoverSummary'}),
+                         self._turnover_to_df)
+
+    @staticmethod
+    def _turnover_to_df(response: dict) -> pd.DataFrame:
+        """
+            Flattens the segments of the `getMarketTurnoverSummary` api response into a DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: The exchange turnover data in the DataFrame format
+        """
+
         data = []
         for key in response.get('data', {}):
             try:
@@ -206,14 +478,25 @@ class NSEBase(CustomSession):
         return df
 
     def get_nse_equity_meta_info(self, ticker: str) -> dict:
+        operation = self.get_nse_equity_meta_info_operation(ticker)
+        self._warm_up(f'{self._base_url}/get-quotes/equity', params=operation.spec.params)
+
+        return self.run(operation)
+
+    def get_nse_equity_meta_info_operation(self, ticker: str) -> Operation:
+        """
+            Sans-IO form of `get_nse_equity_meta_info`, the NSE quote page is not warmed up by the operation.
+
+            :param self: Represent the instance of the class
+            :param ticker: Equity ticker / symbol
+
+            :return: Operation of the `equity-meta-info` api
+        """
+
         params = {
             'symbol': ticker,
         }
-        # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/get-quotes/equity', params=params)
-
-        response = self.hit_and_get_data(f'{self._base_url}/api/equity-meta-info', params=params)
-        return response
+        return Operation(RequestSpec(f'{self._base_url}/api/equity-meta-info', params=params), None)
 
     def get_ohlc_from_charting(self, ticker: str, timeframe: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
@@ -228,16 +511,26 @@ class NSEBase(CustomSession):
             :return: A DataFrame containing OHLC data for a given ticker and timeframe
         """
 
-        time_mappings = {
-            '1Min': ('I', 1),
-            '5Min': ('I', 5),
-            '15Min': ('I', 15),
-            '30Min': ('I', 30),
-            '60Min': ('I', 60),
-            '1Day': ('D', 1),
-            '1Week': ('W', 1),
-            '1Month': ('M', 1),
-        }
+        operation = self.get_ohlc_from_charting_operation(ticker, timeframe, start_date, end_date)
+        self._warm_up(f'{self._charting_base_url}', params={'symbol': ticker})
+
+        return self.run(operation)
+
+    def get_ohlc_from_charting_operation(self, ticker: str, timeframe: str, start_date: datetime,
+                                         end_date: datetime) -> Operation:
+        """
+            Sans-IO form of `get_ohlc_from_charting`, the charting website is not warmed up by the operation.
+
+            :param self: Represent the instance of the class
+            :param ticker: Charting ticker, see `get_charting_mappings()`
+            :param timeframe: Specify the time interval for which we want to get the data
+            :param start_date: Specify the start date of the data
+            :param end_date: Specify the end date of the data
+
+            :return: Operation of the `ChartData` charting api
+        """
+
+        time_mappings = self._charting_time_mappings
         if timeframe not in time_mappings:
             raise ValueError(f"Unsupported timeframe: {timeframe}; supported timeframes are {list(time_mappings.keys())}")
         params = {
@@ -249,14 +542,19 @@ class NSEBase(CustomSession):
             'fromDate':int(start_date.timestamp()),
             'toDate': int(end_date.timestamp())
         }
+        return Operation(RequestSpec(f'{self._charting_base_url}//Charts/ChartData', params=params),
+                         self._charting_ohlc_to_df)
 
-        
-        # Set the cookies
-        self.hit_and_get_data(f'{self._charting_base_url}', params={'symbol': ticker})
+    @staticmethod
+    def _charting_ohlc_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the response of the `ChartData` charting api into an OHLC DataFrame.
 
+            :param response: Parsed response of the api
 
+            :return: A DataFrame containing OHLC data
+        """
 
-        response = self.hit_and_get_data(f'{self._charting_base_url}//Charts/ChartData', params=params)
         df = pd.DataFrame({
             'timestamp': response.get('t', []),
             'open': response.get('o', []),
@@ -275,14 +573,47 @@ class NSEBase(CustomSession):
             :param self: Represent the instance of the class
 
             :return: A DataFrame containing the mappings for charting for all Equity and F&O instruments
+
+            Raises:
+                requests.HTTPError: when a master can't be downloaded (the error page used to be parsed as a master)
         """
         
         url_endpoints = ['/Charts/GetEQMasters', '/Charts/GetFOMasters']
         df = pd.DataFrame()
         for endpoint in url_endpoints:
-            df = pd.concat([df, pd.read_csv(StringIO(self.session.get(f'{self._charting_base_url}{endpoint}', headers=self.headers).text), sep='|')], ignore_index=True)
+            # the masters are large, they are streamed to disk (or copied from the caches) and parsed from there
+            # instead of held in memory
+            with TemporaryFile() as master:
+                self.download(self._charting_masters_operation(endpoint).spec.url, master)
+                master.seek(0)
+                df = pd.concat([df, self._charting_masters_to_df(master)], ignore_index=True)
         return df
 
+    def _charting_masters_operation(self, endpoint: str) -> Operation:
+        """
+            Sans-IO form of the download of one charting master (CSV separated by `|`).
+
+            :param self: Represent the instance of the class
+            :param endpoint: Endpoint of the master, e.g. `/Charts/GetEQMasters`
+
+            :return: Operation of the master
+        """
+
+        return Operation(RequestSpec(f'{self._charting_base_url}{endpoint}', kind='content'),
+                         self._charting_masters_to_df)
+
+    @staticmethod
+    def _charting_masters_to_df(content) -> pd.DataFrame:
+        """
+            Reads a charting master into a DataFrame.
+
+            :param content: Body of the master, as bytes or as a binary file positioned at its start
+
+            :return: A DataFrame of the instruments of the master
+        """
+
+        return pd.read_csv(content if hasattr(content, 'read') else BytesIO(content), sep='|')
+
     def search_charting_symbol(self, symbol: str, segment: str = "") -> dict:
         """
             The search_charting_symbol function searches for a symbol in the new NSE charting API
@@ -308,23 +639,42 @@ class NSEBase(CustomSession):
                 nse.search_charting_symbol("NIFTY", segment="FO")
         """
         
-        # Validate segment parameter
-        valid_segments = ["", "FO", "IDX", "EQ"]
-        if segment not in valid_segments:
-            raise ValueError(f"Invalid segment '{segment}'. Valid values are: {valid_segments}")
-        
-        payload = {
+        return self.run(self.search_charting_symbol_operation(symbol, segment))
+
+    def search_charting_symbol_operation(self, symbol: str, segment: str = "") -> Operation:
+        """
+            Sans-IO form of `search_charting_symbol`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name to search (e.g., "NIFTY 50", "RELIANCE")
+            :param segment: (optional) Market segment filter - "" (all), "FO" (Futures & Options), "IDX" (Index), "EQ" (Equity)
+
+            :return: Operation of the `symbolsDynamic` charting api
+        """
+
+        return Operation(RequestSpec(f'{self._charting_base_url}/v1/exchanges/symbolsDynamic', method='POST',
+                                     json_data=self._charting_symbol_payload(symbol, segment),
+                                     headers=self._charting_headers),
+                         None)
+
+    def _charting_symbol_payload(self, symbol: str, segment: str) -> dict:
+        """
+            Validates the segment and builds the payload of the `symbolsDynamic` charting api.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name to search
+            :param segment: Market segment filter - "" (all), "FO" (Futures & Options), "IDX" (Index), "EQ" (Equity)
+
+            :return: Dict payload of the request
+        """
+
+        if segment not in self._valid_segments:
+            raise ValueError(f"Invalid segment '{segment}'. Valid values are: {self._valid_segments}")
+
+        return {
             "symbol": symbol,
             "segment": segment
         }
-        
-        response = self.post_and_get_data(
-            f'{self._charting_base_url}/v1/exchanges/symbolsDynamic',
-            json_data=payload,
-            headers=self._charting_headers
-        )
-        
-        return response
 
     def get_charting_historical_data(self, symbol: str, token: str, symbol_type: str = "Index", 
                                      chart_type: str = "D", time_interval: int = 1,
@@ -344,15 +694,57 @@ class NSEBase(CustomSession):
             :return: DataFrame containing OHLC data with columns: time, open, high, low, close, volume
         """
         
-        # Validate symbol_type
-        valid_symbol_types = ["Index", "Equity", "Futures", "Options"]
-        if symbol_type not in valid_symbol_types:
-            raise ValueError(f"Invalid symbol_type '{symbol_type}'. Valid values are: {valid_symbol_types}")
-        
+        return self.run(self.get_charting_historical_data_operation(symbol, token, symbol_type, chart_type,
+                                                                    time_interval, from_date, to_date))
+
+    def get_charting_historical_data_operation(self, symbol: str, token: str, symbol_type: str = "Index",
+                                               chart_type: str = "D", time_interval: int = 1,
+                                               from_date: int = 0, to_date: int = None) -> Operation:
+        """
+            Sans-IO form of `get_charting_historical_data`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name (e.g., "NIFTY 50", "RELIANCE")
+            :param token: Scripcode/token obtained from search_charting_symbol (e.g., "26000" for NIFTY 50)
+            :param symbol_type: (optional) Type of symbol - "Index", "Equity", "Futures", or "Options" (default: "Index")
+            :param chart_type: (optional) Chart type - "D" (Daily), "I" (Intraday), "W" (Weekly), "M" (Monthly) (default: "D")
+            :param time_interval: (optional) Time interval in minutes for intraday or 1 for daily/weekly/monthly (default: 1)
+            :param from_date: (optional) Start date as Unix timestamp (default: 0 for all available data)
+            :param to_date: (optional) End date as Unix timestamp (default: current time)
+
+            :return: Operation of the `symbolHistoricalData` charting api
+        """
+
+        payload = self._charting_historical_payload(symbol, token, symbol_type, chart_type, time_interval,
+                                                    from_date, to_date)
+        return Operation(RequestSpec(f'{self._charting_base_url}/v1/charts/symbolHistoricalData', method='POST',
+                                     json_data=payload, headers=self._charting_headers),
+                         self._charting_history_to_df)
+
+    def _charting_historical_payload(self, symbol: str, token: str, symbol_type: str, chart_type: str,
+                                     time_interval: int, from_date: int, to_date: int = None) -> dict:
+        """
+            Validates the symbol type and builds the payload of the `symbolHistoricalData` charting api.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name (e.g., "NIFTY 50", "RELIANCE")
+            :param token: Scripcode/token obtained from search_charting_symbol
+            :param symbol_type: Type of symbol - "Index", "Equity", "Futures", or "Options"
+            :param chart_type: Chart type - "D" (Daily), "I" (Intraday), "W" (Weekly), "M" (Monthly)
+            :param time_interval: Time interval in minutes for intraday or 1 for daily/weekly/monthly
+            :param from_date: Start date as Unix timestamp
+            :param to_date: (optional) End date as Unix timestamp (default: current time)
+
+            :return: Dict payload of the request
+        """
+
+        if symbol_type not in self._valid_symbol_types:
+            raise ValueError(f"Invalid symbol_type '{symbol_type}'. Valid values are: {self._valid_symbol_types}")
+
         if to_date is None:
             to_date = int(datetime.now().timestamp())
-        
-        payload = {
+
+        return {
             "token": str(token),
             "fromDate": from_date,
             "toDate": to_date,
@@ -361,13 +753,17 @@ class NSEBase(CustomSession):
             "chartType": chart_type,
             "timeInterval": time_interval
         }
-        
-        response = self.post_and_get_data(
-            f'{self._charting_base_url}/v1/charts/symbolHistoricalData',
-            json_data=payload,
-            headers=self._charting_headers
-        )
-        
+
+    @staticmethod
+    def _charting_history_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the response of the `symbolHistoricalData` charting api into an OHLC DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: DataFrame containing OHLC data with columns: time, open, high, low, close, volume
+        """
+
         if response.get('status') and response.get('data'):
             df = pd.DataFrame(response['data'])
             if not df.empty:
@@ -408,41 +804,12 @@ class NSEBase(CustomSession):
                 nse.get_ohlc_from_charting_v2("NIFTY 25JAN2024 23500 CE", "1Day", symbol_type="Options", segment="FO")
         """
         
-        # Validate symbol_type
-        valid_symbol_types = ["Index", "Equity", "Futures", "Options"]
-        if symbol_type not in valid_symbol_types:
-            raise ValueError(f"Invalid symbol_type '{symbol_type}'. Valid values are: {valid_symbol_types}")
-        
-        time_mappings = {
-            '1Min': ('I', 1),
-            '5Min': ('I', 5),
-            '15Min': ('I', 15),
-            '30Min': ('I', 30),
-            '60Min': ('I', 60),
-            '1Day': ('D', 1),
-            '1Week': ('W', 1),
-            '1Month': ('M', 1),
-        }
-        
-        if timeframe not in time_mappings:
-            raise ValueError(f"Unsupported timeframe: {timeframe}; supported timeframes are {list(time_mappings.keys())}")
-        
-        chart_type, time_interval = time_mappings[timeframe]
-        
+        chart_type, time_interval = self._charting_v2_chart_type(timeframe, symbol_type)
+
         # Search for symbol to get token (with segment filter)
         search_result = self.search_charting_symbol(symbol, segment=segment)
-        
-        if not search_result.get('status') or not search_result.get('data'):
-            raise ValueError(f"Symbol '{symbol}' not found in charting API" + (f" for segment '{segment}'" if segment else ""))
-        
-        # Get the first matching symbol's token
-        symbol_data = search_result['data'][0]
-        token = symbol_data['scripcode']
-        
-        # Convert dates to timestamps
-        from_timestamp = 0 if start_date is None else int(start_date.timestamp())
-        to_timestamp = int(datetime.now().timestamp()) if end_date is None else int(end_date.timestamp())
-        
+        token = self._token_from_charting_search(search_result, symbol, segment)
+
         # Fetch historical data
         df = self.get_charting_historical_data(
             symbol=symbol,
@@ -450,8 +817,173 @@ class NSEBase(CustomSession):
             symbol_type=symbol_type,
             chart_type=chart_type,
             time_interval=time_interval,
-            from_date=from_timestamp,
-            to_date=to_timestamp
+            from_date=0 if start_date is None else int(start_date.timestamp()),
+            to_date=int(datetime.now().timestamp()) if end_date is None else int(end_date.timestamp())
         )
         
-        return df
\ No newline at end of file
+        return df
+
+    def _charting_v2_chart_type(self, timeframe: str, symbol_type: str) -> tuple:
+        """
+            Validates the timeframe and symbol type and maps the timeframe to charting api chart type and interval.
+
+            :param self: Represent the instance of the class
+            :param timeframe: Timeframe - "1Min", "5Min", "15Min", "30Min", "60Min", "1Day", "1Week", "1Month"
+            :param symbol_type: Type of symbol - "Index", "Equity", "Futures", or "Options"
+
+            :return: A tuple of chart type and time interval
+        """
+
+        if symbol_type not in self._valid_symbol_types:
+            raise ValueError(f"Invalid symbol_type '{symbol_type}'. Valid values are: {self._valid_symbol_types}")
+
+        if timeframe not in self._charting_time_mappings:
+            raise ValueError(f"Unsupported timeframe: {timeframe}; supported timeframes are "
+                             f"{list(self._charting_time_mappings.keys())}")
+
+        return self._charting_time_mappings[timeframe]
+
+    @staticmethod
+    def _token_from_charting_search(search_result: dict, symbol: str, segment: str) -> str:
+        """
+            Picks the token (scripcode) of the first matching symbol from the `symbolsDynamic` charting api response.
+
+            :param search_result: Parsed response of the `search_charting_symbol`
+            :param symbol: Symbol name which was searched
+            :param segment: Market segment filter which was used for the search
+
+            :return: Scripcode / token of the symbol
+        """
+
+        if not search_result.get('status') or not search_result.get('data'):
+            raise ValueError(f"Symbol '{symbol}' not found in charting API" + (f" for segment '{segment}'" if segment else ""))
+
+        return search_result['data'][0]['scripcode']
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Async variants - same as the above functions but run on the asyncio transport
+
+    async def async_get_market_status_and_current_val(self, index: str = 'NIFTY 50') -> tuple:
+        """
+            Coroutine variant of `get_market_status_and_current_val`.
+
+            :param self: Represent the instance of the class
+            :param index: Get the market status and last price of a particular index
+
+            :return: A tuple of the market status and the current value
+        """
+
+        return await self.async_run(self.get_market_status_and_current_val_operation(index))
+
+    async def async_get_second_wise_data(self, ticker_or_index: str = "NIFTY 50", is_index: bool = True,
+                                         underlying_symbol: str = None) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_second_wise_data`, the normal and pre-open session data are fetched together.
+
+            :param self: Represent the instance of the class
+            :param ticker_or_index: Specify the index for which we want to get data
+            :param is_index: (optional) Determine whether the index is an index or not
+            :param underlying_symbol: (optional) Underlying assets ticker for the derivatives
+
+            :return: A dataframe with second wise data
+        """
+
+        await self._async_warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': ticker_or_index})
+
+        params = self._second_wise_data_params(ticker_or_index, is_index, underlying_symbol)
+        response, pre_response = await asyncio.gather(
+            self.async_hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params=params),
+            self.async_hit_and_get_data(f'{self._base_url}/api/chart-databyindex', params={**params, 'preopen': True}),
+        )
+        return self._second_wise_data_to_df(response, pre_response)
+
+    async def async_search(self, search_text: str) -> dict:
+        """
+            Coroutine variant of `search`.
+
+            :param self: Represent the instance of the class
+            :param search_text: Specify the ticker or index for which we want to get data
+
+            :return: Search result of the NSE autocomplete api
+        """
+
+        return await self.async_run(self.search_operation(search_text))
+
+    async def async_get_nse_equity_meta_info(self, ticker: str) -> dict:
+        """
+            Coroutine variant of `get_nse_equity_meta_info`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Equity ticker / symbol
+
+            :return: Equity meta information
+        """
+
+        operation = self.get_nse_equity_meta_info_operation(ticker)
+        await self._async_warm_up(f'{self._base_url}/get-quotes/equity', params=operation.spec.params)
+
+        return await self.async_run(operation)
+
+    async def async_search_charting_symbol(self, symbol: str, segment: str = "") -> dict:
+        """
+            Coroutine variant of `search_charting_symbol`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name to search (e.g., "NIFTY 50", "RELIANCE")
+            :param segment: (optional) Market segment filter - "" (all), "FO" (Futures & Options), "IDX" (Index), "EQ" (Equity)
+
+            :return: Dict containing symbol information with scripcode, instrumentType, exchange, etc.
+        """
+
+        return await self.async_run(self.search_charting_symbol_operation(symbol, segment))
+
+    async def async_get_charting_historical_data(self, symbol: str, token: str, symbol_type: str = "Index",
+                                                 chart_type: str = "D", time_interval: int = 1,
+                                                 from_date: int = 0, to_date: int = None) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_charting_historical_data`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name (e.g., "NIFTY 50", "RELIANCE")
+            :param token: Scripcode/token obtained from search_charting_symbol (e.g., "26000" for NIFTY 50)
+            :param symbol_type: (optional) Type of symbol - "Index", "Equity", "Futures", or "Options" (default: "Index")
+            :param chart_type: (optional) Chart type - "D" (Daily), "I" (Intraday), "W" (Weekly), "M" (Monthly) (default: "D")
+            :param time_interval: (optional) Time interval in minutes for intraday or 1 for daily/weekly/monthly (default: 1)
+            :param from_date: (optional) Start date as Unix timestamp (default: 0 for all available data)
+            :param to_date: (optional) End date as Unix timestamp (default: current time)
+
+            :return: DataFrame containing OHLC data with columns: time, open, high, low, close, volume
+        """
+
+        return await self.async_run(self.get_charting_historical_data_operation(symbol, token, symbol_type, chart_type,
+                                                                                time_interval, from_date, to_date))
+
+    async def async_get_ohlc_from_charting_v2(self, symbol: str, timeframe: str = "1Day",
+                                              start_date: datetime = None, end_date: datetime = None,
+                                              symbol_type: str = "Index", segment: str = "") -> pd.DataFrame:
+        """
+            Coroutine variant of `get_ohlc_from_charting_v2`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Symbol name (e.g., "NIFTY 50", "RELIANCE")
+            :param timeframe: (optional) Timeframe - "1Min", "5Min", "15Min", "30Min", "60Min", "1Day", "1Week", "1Month" (default: "1Day")
+            :param start_date: (optional) Start date as datetime object (default: beginning of available data)
+            :param end_date: (optional) End date as datetime object (default: current time)
+            :param symbol_type: (optional) Type of symbol - "Index", "Equity", "Futures", or "Options" (default: "Index")
+            :param segment: (optional) Market segment filter - "" (all), "FO" (Futures & Options), "IDX" (Index), "EQ" (Equity) (default: "")
+
+            :return: DataFrame containing OHLC data with columns: time, open, high, low, close, volume
+        """
+
+        chart_type, time_interval = self._charting_v2_chart_type(timeframe, symbol_type)
+        search_result = await self.async_search_charting_symbol(symbol, segment=segment)
+        token = self._token_from_charting_search(search_result, symbol, segment)
+        return await self.async_get_charting_historical_data(
+            symbol=symbol,
+            token=token,
+            symbol_type=symbol_type,
+            chart_type=chart_type,
+            time_interval=time_interval,
+            from_date=0 if start_date is None else int(start_date.timestamp()),
+            to_date=int(datetime.now().timestamp()) if end_date is None else int(end_date.timestamp())
+        )
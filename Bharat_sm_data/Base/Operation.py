@@ -0,0 +1,79 @@
+from collections import namedtuple
+
+
+class RequestSpec(namedtuple('RequestSpec', ['url', 'method', 'params', 'json_data', 'data', 'headers', 'kind'],
+                             defaults=('GET', None, None, None, None, 'json'))):
+    """
+        One HTTP request described as plain data, built without any I/O so that any transport can send it: the sync and
+        async APIs of `CustomSession`, `fetch_many` / `async_fetch_many` (a spec is accepted wherever a spec dict is) or
+        a cassette.
+
+        Attributes:
+            url: url of the request
+            method: HTTP method, `GET` by default
+            params: (optional) url params
+            json_data: (optional) JSON payload
+            data: (optional) form payload
+            headers: (optional) headers of the request, None for the default headers of the client
+            kind: `json` when the payload is the parsed JSON body, `content` when it is the decompressed body bytes
+
+        Methods:
+            to_dict() -> dict: Returns the spec as a `fetch_many` spec dict.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """
+            Returns the spec as a `fetch_many` spec dict, without the fields which are not set.
+
+            :param self: Represent the instance of the class
+
+            :return: Dict with `url`, `method` and the other set fields except `kind`
+        """
+
+        spec = {'url': self.url, 'method': self.method}
+        for name in ('params', 'json_data', 'data', 'headers'):
+            value = getattr(self, name)
+            if value is not None:
+                spec[name] = value
+        return spec
+
+
+class Operation(namedtuple('Operation', ['spec', 'parse'])):
+    """
+        Sans-IO form of a public client method: the `RequestSpec` of its request and the pure function which turns the
+        payload of the request into the result of the method. The `*_operation` methods of the clients build them,
+        `CustomSession.run`, `async_run`, `run_many` and `async_run_many` drive them over the sync, async and bulk
+        transports, and a stored or replayed payload can be handed to `result` directly.
+
+        The parsers are static functions (or `functools.partial` of them) which only read their payload, so they can
+        run on worker processes through the `parse_executor` of `run_many`.
+
+        Usage:
+            operation = nse.get_option_chain_operation('NIFTY', expiry)
+            df = nse.run(operation)  # same as nse.get_option_chain('NIFTY', expiry)
+            dfs = nse.run_many([nse.get_option_chain_operation(ticker, expiry) for ticker in tickers],
+                               parse_executor=ProcessPoolExecutor())
+
+        Attributes:
+            spec: `RequestSpec` of the request
+            parse: function of the payload returning the result, None returns the payload as it is
+
+        Methods:
+            result(payload) -> object: Turns the payload of the request into the result.
+    """
+
+    __slots__ = ()
+
+    def result(self, payload):
+        """
+            Turns the payload of the request into the result of the operation.
+
+            :param self: Represent the instance of the class
+            :param payload: Parsed JSON (`json` spec) or decompressed body (`content` spec) of the response
+
+            :return: Result of the operation
+        """
+
+        return payload if self.parse is None else self.parse(payload)
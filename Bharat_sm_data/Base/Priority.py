@@ -0,0 +1,64 @@
+from contextvars import ContextVar
+
+# priority of the requests made by the running code, None means `Priority.NORMAL`
+_priority = ContextVar('bharat_sm_data_priority', default=None)
+
+
+class Priority:
+    """
+        Priority of the requests made inside the `with` block: while requests wait for the rate limit of a host, the
+        more urgent ones (lower value) are let through first, so interactive calls skip ahead of bulk backfills sharing
+        the same host. Requests of the same priority keep their arrival order.
+
+        The priority is kept in a context variable, so it follows the code into the coroutines, tasks and `fetch_many`
+        threads started within the block. The public request methods of `CustomSession` also take a `priority`.
+
+        Usage:
+            with Priority(Priority.BULK):
+                history = nse.get_charting_historical_data(...)
+
+        Attributes:
+            INTERACTIVE: priority of latency critical calls, e.g. option chain and market status
+            NORMAL: priority of the requests made outside of any block
+            BULK: priority of backfills which may wait
+            value: priority of the block, None keeps the outer priority
+
+        Methods:
+            current() -> int: Priority of the current context.
+    """
+
+    INTERACTIVE = 0
+    NORMAL = 10
+    BULK = 20
+
+    def __init__(self, value: int = None) -> None:
+        """
+            Builds the priority, it applies once the `with` block is entered.
+
+            :param self: Represent the instance of the class
+            :param value: (optional) priority, lower is more urgent; None keeps the outer priority as it is
+
+            :return: None
+        """
+
+        self.value = value
+        self._token = None
+
+    def __enter__(self) -> 'Priority':
+        self._token = _priority.set(_priority.get() if self.value is None else self.value)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _priority.reset(self._token)
+        self._token = None
+
+    @staticmethod
+    def current() -> int:
+        """
+            Priority of the current context.
+
+            :return: Priority, `Priority.NORMAL` outside of any block
+        """
+
+        priority = _priority.get()
+        return Priority.NORMAL if priority is None else priority
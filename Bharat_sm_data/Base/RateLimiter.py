@@ -0,0 +1,358 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .Priority import Priority
+
+
+class TokenBucket:
+    """
+        A thread-safe token bucket which refills at `rate` tokens per second and holds at most `capacity` tokens, so
+        up to `capacity` requests can go out in a burst and after that they are spaced to `rate` per second.
+
+        Callers which find the bucket empty (or other callers already waiting) join a queue ordered by priority, then
+        arrival: only the head of the queue takes the next token, so an interactive request which arrives behind a
+        backlog of bulk requests goes out as soon as a token is free. The same bucket can be shared by threads and
+        asyncio tasks (of any event loop) at once.
+
+        Attributes:
+            rate: tokens added per second
+            capacity: maximum number of tokens the bucket can hold (burst size)
+
+        Methods:
+            reserve(tokens: float = 1) -> float: Reserves tokens and returns the seconds to wait before using them.
+            acquire(tokens: float = 1, priority: int = None) -> float: Blocks the thread till the tokens are available.
+            async_acquire(tokens: float = 1, priority: int = None) -> float: Suspends the task till the tokens are
+            available.
+            queued() -> int: Returns the number of callers waiting for tokens.
+            available(tokens: float = 1) -> bool: Tells whether the tokens could be taken right away.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        """
+            Builds a full bucket.
+
+            :param self: Represent the instance of the class
+            :param rate: tokens added per second
+            :param capacity: (optional) maximum number of tokens the bucket can hold (burst size)
+
+            :return: None
+        """
+
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f'rate and capacity must be positive; got rate={rate}, capacity={capacity}')
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiting = []
+        self._arrivals = itertools.count()
+
+    def _refill(self) -> None:
+        """
+            Adds the tokens earned since the last refill, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+            Takes the tokens from the bucket, the balance may go negative in which case the caller has to wait for the
+            bucket to refill the debt. The reservation does not queue, the queued callers wait for the debt as well.
+
+            :param self: Represent the instance of the class
+            :param tokens: (optional) number of tokens required
+
+            :return: Seconds to wait before the tokens can be used
+        """
+
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def queued(self) -> int:
+        """
+            Returns the number of callers waiting for tokens.
+
+            :param self: Represent the instance of the class
+
+            :return: Length of the queue
+        """
+
+        with self._lock:
+            return len(self._waiting)
+
+    def available(self, tokens: float = 1) -> bool:
+        """
+            Tells whether the tokens could be taken right away (nobody is waiting and the bucket holds them), without
+            taking them.
+
+            :param self: Represent the instance of the class
+            :param tokens: (optional) number of tokens required
+
+            :return: True if an `acquire` of the tokens would not wait
+        """
+
+        with self._lock:
+            self._refill()
+            return not self._waiting and self._tokens >= tokens
+
+    def _enqueue(self, tokens: float, priority: int) -> tuple:
+        """
+            Takes the tokens right away when nobody is waiting and the bucket holds them, else queues the caller; must
+            be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param tokens: number of tokens required
+            :param priority: priority of the caller, lower is served first; None for the priority of the context
+
+            :return: Queue entry of the caller, None when the tokens were taken
+        """
+
+        self._refill()
+        if not self._waiting and self._tokens >= tokens:
+            self._tokens -= tokens
+            return None
+        entry = (Priority.current() if priority is None else priority, next(self._arrivals))
+        heapq.heappush(self._waiting, entry)
+        return entry
+
+    def _take(self, tokens: float, entry: tuple) -> float:
+        """
+            Takes the tokens of a queued caller once it is the head of the queue and the bucket holds them; must be
+            called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param tokens: number of tokens required
+            :param entry: Queue entry of the caller
+
+            :return: 0 when the tokens were taken, else the seconds to wait before trying again
+        """
+
+        self._refill()
+        if self._waiting[0] == entry and self._tokens >= tokens:
+            heapq.heappop(self._waiting)
+            self._tokens -= tokens
+            self._condition.notify_all()
+            return 0.0
+        # nothing can change before the head gets its tokens, a thread is woken up earlier if the head leaves
+        return max((tokens - self._tokens) / self.rate, 0.001)
+
+    def _leave(self, entry: tuple) -> None:
+        """
+            Removes an interrupted caller from the queue, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param entry: Queue entry of the caller
+
+            :return: None
+        """
+
+        if entry in self._waiting:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            self._condition.notify_all()
+
+    def acquire(self, tokens: float = 1, priority: int = None) -> float:
+        """
+            Blocks the calling thread till the tokens are available and every more urgent caller was served.
+
+            :param self: Represent the instance of the class
+            :param tokens: (optional) number of tokens required
+            :param priority: (optional) priority of the caller, lower is served first; default is `Priority.current()`
+
+            :return: Seconds waited
+        """
+
+        started = time.monotonic()
+        with self._condition:
+            entry = self._enqueue(tokens, priority)
+            if entry is None:
+                return 0.0
+            try:
+                wait = self._take(tokens, entry)
+                while wait:
+                    self._condition.wait(wait)
+                    wait = self._take(tokens, entry)
+            except BaseException:
+                self._leave(entry)
+                raise
+        return time.monotonic() - started
+
+    async def async_acquire(self, tokens: float = 1, priority: int = None) -> float:
+        """
+            Suspends the calling task till the tokens are available and every more urgent caller was served.
+
+            :param self: Represent the instance of the class
+            :param tokens: (optional) number of tokens required
+            :param priority: (optional) priority of the caller, lower is served first; default is `Priority.current()`
+
+            :return: Seconds waited
+        """
+
+        started = time.monotonic()
+        with self._lock:
+            entry = self._enqueue(tokens, priority)
+        if entry is None:
+            return 0.0
+        try:
+            while True:
+                with self._lock:
+                    wait = self._take(tokens, entry)
+                if not wait:
+                    break
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._lock:
+                self._leave(entry)
+            raise
+        return time.monotonic() - started
+
+
+class HostRateLimiter:
+    """
+        Keeps one `TokenBucket` per upstream host. A url is matched to the longest configured host suffix, so
+        `charting.nseindia.com` can have its own limit while every other `*.nseindia.com` host shares the `nseindia.com`
+        bucket. Hosts without a configured limit are not throttled.
+
+        Attributes:
+            default_limits: dict of host suffix and its (requests per second, burst) limit used when none is passed
+
+        Methods:
+            set_limit(host: str, rate: float, burst: float = 1) -> None: Sets / replaces the limit of a host.
+            remove_limit(host: str) -> None: Stops throttling a host.
+            bucket_for(url: str) -> TokenBucket: Returns the bucket of the url's host or None.
+            available(url: str) -> bool: Tells whether a request to the url would go out without waiting.
+            acquire(url: str, priority: int = None) -> float: Blocks the thread till the request to the url is allowed.
+            async_acquire(url: str, priority: int = None) -> float: Suspends the task till the request to the url is
+            allowed.
+    """
+
+    default_limits = {
+        'nseindia.com': (3, 6),
+        'charting.nseindia.com': (5, 10),
+        'screener.in': (0.5, 3),
+        'tickertape.in': (5, 10),
+        'moneycontrol.com': (3, 6),
+        'sensibull.com': (3, 6),
+        'bseindia.com': (2, 4),
+    }
+
+    def __init__(self, limits: dict = None) -> None:
+        """
+            Builds the buckets of every host.
+
+            :param self: Represent the instance of the class
+            :param limits: (optional) dict of host suffix and its (requests per second, burst) limit, the default
+            limits are used when it is not passed
+
+            :return: None
+        """
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+        limits = self.default_limits if limits is None else limits
+        for host, (rate, burst) in limits.items():
+            self.set_limit(host, rate, burst)
+
+    def set_limit(self, host: str, rate: float, burst: float = 1) -> None:
+        """
+            Sets or replaces the limit of a host.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix, e.g. `nseindia.com`
+            :param rate: Sustained requests per second
+            :param burst: (optional) Number of requests allowed in a burst
+
+            :return: None
+        """
+
+        with self._lock:
+            self._buckets[host.lower().lstrip('.')] = TokenBucket(rate, burst)
+
+    def remove_limit(self, host: str) -> None:
+        """
+            Stops throttling a host.
+
+            :param self: Represent the instance of the class
+            :param host: Host name or suffix which was configured
+
+            :return: None
+        """
+
+        with self._lock:
+            self._buckets.pop(host.lower().lstrip('.'), None)
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """
+            Returns the bucket of the longest host suffix matching the url's host.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: TokenBucket object or None if the host is not throttled
+        """
+
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            while host:
+                bucket = self._buckets.get(host)
+                if bucket is not None:
+                    return bucket
+                host = host.partition('.')[2]
+        return None
+
+    def available(self, url: str) -> bool:
+        """
+            Tells whether a request to the url would go out right away, a host which is not throttled always allows it.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: True if an `acquire` for the url would not wait
+        """
+
+        bucket = self.bucket_for(url)
+        return bucket is None or bucket.available()
+
+    def acquire(self, url: str, priority: int = None) -> float:
+        """
+            Blocks the calling thread till a request to the url is allowed.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param priority: (optional) priority of the request, lower is served first; default is `Priority.current()`
+
+            :return: Seconds waited
+        """
+
+        bucket = self.bucket_for(url)
+        return bucket.acquire(priority=priority) if bucket is not None else 0.0
+
+    async def async_acquire(self, url: str, priority: int = None) -> float:
+        """
+            Suspends the calling task till a request to the url is allowed.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param priority: (optional) priority of the request, lower is served first; default is `Priority.current()`
+
+            :return: Seconds waited
+        """
+
+        bucket = self.bucket_for(url)
+        return await bucket.async_acquire(priority=priority) if bucket is not None else 0.0
@@ -0,0 +1,319 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from os import makedirs, path
+from urllib.parse import urlsplit
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+class MarketHoursTTL:
+    """
+        TTL policy of the `ResponseCache` which knows about the NSE trading session.
+
+        Every endpoint is mapped to an endpoint class by a url path fragment; while the market is open (09:15 - 15:30 IST
+        on weekdays by default) an entry lives for the TTL of its class, once the market is closed the data can not
+        change anymore, so the entry is frozen until the next session opens. Endpoints which don't belong to any class
+        are never cached.
+
+        Attributes:
+            endpoint_classes: list of (url path fragment, endpoint class) tuples, first match wins
+            class_ttls: dict of endpoint class and its TTL in seconds during market hours
+            market_open: session start time in IST
+            market_close: session end time in IST
+
+        Methods:
+            endpoint_class(url: str) -> str: Returns the endpoint class of the url or None.
+            is_market_open(now: datetime = None) -> bool: Tells whether the NSE session is running.
+            seconds_to_next_open(now: datetime = None) -> float: Seconds left for the next session to open.
+            ttl_for(url: str, now: datetime = None) -> float: Returns the TTL for the url or None if it is not cacheable.
+    """
+
+    default_endpoint_classes = [
+        # reference data, changes at most once a day
+        ('/api/master-quote', 'reference'),
+        ('/api/option-chain-contract-info', 'reference'),
+        ('/Charts/GetEQMasters', 'reference'),
+        ('/Charts/GetFOMasters', 'reference'),
+        ('/cache/underlying_instruments', 'reference'),
+        ('/screener/filters', 'reference'),
+        ('/indices/constituents/', 'reference'),
+        ('/indices/etfs/', 'reference'),
+        # fundamentals, only change when results are published
+        ('/stocks/financials/', 'fundamentals'),
+        ('/stocks/peers/', 'fundamentals'),
+        ('/stocks/scorecard/', 'fundamentals'),
+        ('/mcfinancials/', 'fundamentals'),
+        ('/schedules/', 'fundamentals'),
+        ('/investors/', 'fundamentals'),
+        # live market data
+        ('/api/marketStatus', 'live'),
+        ('/api/option-chain-v3', 'live'),
+        ('/api/quote-equity', 'live'),
+        ('/api/quote-derivative', 'live'),
+        ('/api/chart-databyindex', 'live'),
+        ('/api/equity-stockIndices', 'live'),
+        ('/api/allIndices', 'live'),
+        ('/cache/live_derivative_prices/', 'live'),
+    ]
+    default_class_ttls = {
+        'live': 5,
+        'fundamentals': 60 * 60,
+        'reference': 6 * 60 * 60,
+    }
+
+    def __init__(self, endpoint_classes: list = None, class_ttls: dict = None,
+                 market_open: dt_time = dt_time(9, 15), market_close: dt_time = dt_time(15, 30)) -> None:
+        """
+            Builds the TTL policy, defaults are used for everything not passed.
+
+            :param self: Represent the instance of the class
+            :param endpoint_classes: (optional) list of (url path fragment, endpoint class) tuples
+            :param class_ttls: (optional) dict of endpoint class and its TTL in seconds during market hours, it is
+            merged over the default TTLs
+            :param market_open: (optional) session start time in IST
+            :param market_close: (optional) session end time in IST
+
+            :return: None
+        """
+
+        self.endpoint_classes = list(endpoint_classes) if endpoint_classes is not None \
+            else list(self.default_endpoint_classes)
+        self.class_ttls = dict(self.default_class_ttls)
+        if class_ttls:
+            self.class_ttls.update(class_ttls)
+        self.market_open = market_open
+        self.market_close = market_close
+
+    def endpoint_class(self, url: str) -> str:
+        """
+            Returns the endpoint class of the given url.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: Endpoint class name or None when the url doesn't belong to any class
+        """
+
+        url_path = urlsplit(url).path
+        for fragment, endpoint_class in self.endpoint_classes:
+            if fragment in url_path:
+                return endpoint_class
+        return None
+
+    def is_market_open(self, now: datetime = None) -> bool:
+        """
+            Tells whether the NSE trading session is running.
+
+            :param self: Represent the instance of the class
+            :param now: (optional) time to check, default is current time
+
+            :return: True if the market is open
+        """
+
+        now = (now or datetime.now(IST)).astimezone(IST)
+        return now.weekday() < 5 and self.market_open <= now.time() < self.market_close
+
+    def seconds_to_next_open(self, now: datetime = None) -> float:
+        """
+            Seconds left for the next trading session to open (exchange holidays are not known, so only weekends
+            are skipped).
+
+            :param self: Represent the instance of the class
+            :param now: (optional) time to calculate from, default is current time
+
+            :return: Seconds till the next session open
+        """
+
+        now = (now or datetime.now(IST)).astimezone(IST)
+        next_open = datetime.combine(now.date(), self.market_open, tzinfo=IST)
+        if now >= next_open:
+            next_open += timedelta(days=1)
+        while next_open.weekday() >= 5:
+            next_open += timedelta(days=1)
+        return (next_open - now).total_seconds()
+
+    def ttl_for(self, url: str, now: datetime = None) -> float:
+        """
+            Returns how long the response of the given url can be cached.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+            :param now: (optional) time of the request, default is current time
+
+            :return: TTL in seconds or None if the url must not be cached
+        """
+
+        endpoint_class = self.endpoint_class(url)
+        if endpoint_class is None or endpoint_class not in self.class_ttls:
+            return None
+        if self.is_market_open(now):
+            return self.class_ttls[endpoint_class]
+        return max(self.seconds_to_next_open(now), self.class_ttls[endpoint_class])
+
+
+class ResponseCache:
+    """
+        A persistent on-disk (sqlite) cache of response bodies which is bounded by the total size of the bodies; least
+        recently used entries are evicted first once the limit is crossed. It can be shared by several clients and
+        threads.
+
+        Any object having the same `ttl_for`, `make_key`, `get`, `set` methods can be used in place of this class as the
+        `cache` of a `CustomSession`.
+
+        Attributes:
+            db_path: path of the sqlite database file
+            max_bytes: upper bound of the total size of the cached bodies
+            ttl_policy: object which decides the TTL of every url (`MarketHoursTTL` by default)
+
+        Methods:
+            ttl_for(url: str) -> float: TTL of the url as per the TTL policy, None if it must not be cached.
+            make_key(method: str, url: str, params: dict = None, body=None) -> str: Builds the cache key of a request.
+            get(key: str) -> bytes: Returns the cached body or None.
+            set(key: str, content: bytes, ttl: float) -> None: Stores a body for `ttl` seconds.
+            clear() -> None: Removes every entry.
+            size() -> int: Total size of the cached bodies in bytes.
+    """
+
+    default_path = path.join(path.expanduser('~'), '.cache', 'bharat_sm_data', 'responses.sqlite3')
+
+    def __init__(self, db_path: str = None, max_bytes: int = 256 * 1024 * 1024, ttl_policy=None) -> None:
+        """
+            Opens (creates if required) the cache database.
+
+            :param self: Represent the instance of the class
+            :param db_path: (optional) path of the sqlite database file, default is
+            `~/.cache/bharat_sm_data/responses.sqlite3`
+            :param max_bytes: (optional) upper bound of the total size of the cached bodies, default is 256 MB
+            :param ttl_policy: (optional) object with a `ttl_for(url)` method, default is `MarketHoursTTL()`
+
+            :return: None
+        """
+
+        self.db_path = db_path or self.default_path
+        self.max_bytes = max_bytes
+        self.ttl_policy = ttl_policy if ttl_policy is not None else MarketHoursTTL()
+        if self.db_path != ':memory:':
+            makedirs(path.dirname(path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content BLOB, size INTEGER, '
+                         'expires_at REAL, last_access REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)')
+
+    def ttl_for(self, url: str) -> float:
+        """
+            Returns the TTL of the url as per the TTL policy.
+
+            :param self: Represent the instance of the class
+            :param url: Url of the request
+
+            :return: TTL in seconds or None if the url must not be cached
+        """
+
+        return self.ttl_policy.ttl_for(url)
+
+    @staticmethod
+    def make_key(method: str, url: str, params: dict = None, body=None) -> str:
+        """
+            Builds the cache key of a request from its method, url, url params and body.
+
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param params: (optional) url params of the request
+            :param body: (optional) JSON payload of the request
+
+            :return: Hex digest which identifies the request
+        """
+
+        raw_key = json.dumps([method.upper(), url, params or {}, body], sort_keys=True, default=str)
+        return hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> bytes:
+        """
+            Returns the cached body of the key, expired entries are dropped on the way.
+
+            :param self: Represent the instance of the class
+            :param key: Cache key built by `make_key`
+
+            :return: Cached body or None on a miss
+        """
+
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT content, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+            self._db.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            return bytes(row[0])
+
+    def set(self, key: str, content: bytes, ttl: float) -> None:
+        """
+            Stores the body for `ttl` seconds and evicts the least recently used entries if the size limit is crossed.
+
+            :param self: Represent the instance of the class
+            :param key: Cache key built by `make_key`
+            :param content: Body of the response
+            :param ttl: Time to live in seconds
+
+            :return: None
+        """
+
+        if len(content) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses (key, content, size, expires_at, last_access) '
+                             'VALUES (?, ?, ?, ?, ?)', (key, sqlite3.Binary(content), len(content), now + ttl, now))
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """
+            Drops the expired entries and then the least recently used ones until the total size fits into `max_bytes`.
+
+            :param self: Represent the instance of the class
+            :param now: Current timestamp
+
+            :return: None
+        """
+
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._db.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY last_access').fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+
+    def clear(self) -> None:
+        """
+            Removes every entry of the cache.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def size(self) -> int:
+        """
+            Total size of the cached bodies.
+
+            :param self: Represent the instance of the class
+
+            :return: Size in bytes
+        """
+
+        with self._lock:
+            return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
@@ -0,0 +1,114 @@
+import threading
+
+from requests import Session
+
+from .SingleFlight import SingleFlight
+
+
+class SessionState:
+    """
+        Everything the clients of one host family share: the `requests` session (so its connection pool and cookie
+        jar), the registered primers and which of their steps already ran.
+
+        Attributes:
+            session: `requests.Session` used by every client of the family
+            primers: dict of host suffix and the steps which prime it, see `CustomSession.add_primer`
+            primed: dict of host suffix and the set of its primer steps which already ran
+            prime_generations: dict of host suffix and the number of full runs of its primer
+            priming_flight: `SingleFlight` sharing one priming run between the concurrent callers
+            cookie_lock: lock held while the cookie jar is written
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+            Builds the state of a new, not yet primed, session.
+
+            :param self: Represent the instance of the class
+            :param session: `requests.Session` to share
+
+            :return: None
+        """
+
+        self.session = session
+        self.primers = {}
+        self.primed = {}
+        self.prime_generations = {}
+        self.priming_flight = SingleFlight(ttl=0)
+        self.cookie_lock = threading.RLock()
+
+
+class SessionRegistry:
+    """
+        Process-wide registry of the warmed up sessions, keyed by host family (e.g. `nseindia.com`): every client of
+        a family shares one `SessionState`, so a `Technical.NSE`, a `Derivatives.NSE` and a bare `NSEBase` in the same
+        process open one connection pool, keep one cookie jar and warm it up once.
+
+        One instance is shared by all the clients through `CustomSession.session_registry`, set it to None before
+        constructing a client to give it a session of its own.
+
+        Attributes:
+            None
+
+        Methods:
+            get(family: str, factory) -> SessionState: Returns the state of a family, built by `factory()` the first time.
+            families() -> list: Returns the families which have a session.
+            discard(family: str = None) -> None: Forgets the session of a family (or of all of them).
+    """
+
+    def __init__(self) -> None:
+        """
+            Builds an empty registry.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        self._lock = threading.Lock()
+        self._states = {}
+
+    def get(self, family: str, factory) -> SessionState:
+        """
+            Returns the shared state of a host family, it is built by `factory` when the family has none yet.
+
+            :param self: Represent the instance of the class
+            :param family: Host family, e.g. `nseindia.com`
+            :param factory: Callable without arguments which returns a new `SessionState`
+
+            :return: SessionState of the family
+        """
+
+        with self._lock:
+            state = self._states.get(family)
+            if state is None:
+                state = self._states[family] = factory()
+            return state
+
+    def families(self) -> list:
+        """
+            Returns the host families which have a session.
+
+            :param self: Represent the instance of the class
+
+            :return: List of host families
+        """
+
+        with self._lock:
+            return sorted(self._states)
+
+    def discard(self, family: str = None) -> None:
+        """
+            Forgets the session of a host family, or of every family; the clients built from it keep using it, the
+            clients built afterwards get a new one.
+
+            :param self: Represent the instance of the class
+            :param family: (optional) Host family, default is every family
+
+            :return: None
+        """
+
+        with self._lock:
+            if family is None:
+                self._states.clear()
+            else:
+                self._states.pop(family, None)
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Call:
+    """
+        A single in-flight call which the concurrent callers of the same key wait on.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+        Coalesces concurrent identical requests: while a call for a key is in flight every other caller of the same key
+        waits for it and gets its result instead of firing its own request. Finished results are kept in a small LRU
+        for `ttl` seconds, so a burst of callers arriving right after the call finished is served from it as well.
+
+        The same parsed object is handed to every caller, so it must be treated as read-only. Failed calls are never
+        kept in the LRU; the error is raised to every caller that waited on it.
+
+        One instance can be shared by several clients, threads and event loops.
+
+        Attributes:
+            max_entries: maximum number of finished results kept in the LRU
+            ttl: seconds a finished result is served from the LRU
+
+        Methods:
+            do(key: str, fn) -> object: Runs `fn` once for all concurrent callers of the key (threads).
+            async_do(key: str, coro_fn) -> object: Awaits `coro_fn()` once for all concurrent callers of the key (tasks).
+            forget(key: str) -> None: Drops the finished result of a key from the LRU.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 3.0) -> None:
+        """
+            Builds an empty single-flight group.
+
+            :param self: Represent the instance of the class
+            :param max_entries: (optional) maximum number of finished results kept in the LRU
+            :param ttl: (optional) seconds a finished result is served from the LRU, 0 disables the LRU
+
+            :return: None
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+        self._results = OrderedDict()
+
+    def _cached(self, key: str) -> tuple:
+        """
+            Looks up the LRU, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param key: Key of the call
+
+            :return: A tuple of (found, result)
+        """
+
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._results[key]
+            return False, None
+        self._results.move_to_end(key)
+        return True, result
+
+    def _remember(self, key: str, result) -> None:
+        """
+            Stores a finished result into the LRU, must be called with the lock held.
+
+            :param self: Represent the instance of the class
+            :param key: Key of the call
+            :param result: Result of the call
+
+            :return: None
+        """
+
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        self._results[key] = (time.monotonic() + self.ttl, result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def do(self, key: str, fn):
+        """
+            Runs `fn` for the key unless an identical call is already in flight or recently finished.
+
+            :param self: Represent the instance of the class
+            :param key: Key which identifies identical calls
+            :param fn: Callable without arguments which does the actual work
+
+            :return: Result of `fn` (possibly the one of another caller)
+        """
+
+        with self._lock:
+            found, result = self._cached(key)
+            if found:
+                return result
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None:
+                    self._remember(key, call.result)
+            call.done.set()
+        return call.result
+
+    async def async_do(self, key: str, coro_fn):
+        """
+            Coroutine equivalent of `do`, the in-flight call is shared between the tasks of the same event loop.
+
+            :param self: Represent the instance of the class
+            :param key: Key which identifies identical calls
+            :param coro_fn: Callable without arguments which returns the coroutine doing the actual work
+
+            :return: Result of the coroutine (possibly the one of another task)
+        """
+
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            found, result = self._cached(key)
+            if found:
+                return result
+            future = self._async_calls.get(loop_key)
+            leader = future is None
+            if leader:
+                future = self._async_calls[loop_key] = asyncio.get_running_loop().create_future()
+
+        if not leader:
+            return await asyncio.shield(future)
+
+        try:
+            result = await coro_fn()
+        except BaseException as err:
+            with self._lock:
+                del self._async_calls[loop_key]
+            if isinstance(err, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(err)
+                future.exception()  # mark it retrieved, when nobody else is waiting
+            raise
+        with self._lock:
+            del self._async_calls[loop_key]
+            self._remember(key, result)
+        future.set_result(result)
+        return result
+
+    def forget(self, key: str) -> None:
+        """
+            Drops the finished result of the key from the LRU.
+
+            :param self: Represent the instance of the class
+            :param key: Key of the call
+
+            :return: None
+        """
+
+        with self._lock:
+            self._results.pop(key, None)
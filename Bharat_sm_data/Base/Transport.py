@@ -0,0 +1,332 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from http.cookies import CookieError, SimpleCookie
+from urllib.parse import urlencode, urljoin
+
+import urllib3
+from requests import Response
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout, RetryError, SSLError, TooManyRedirects
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import (ConnectTimeoutError, HTTPError as Urllib3HTTPError, MaxRetryError, ReadTimeoutError,
+                                ResponseError, SSLError as Urllib3SSLError)
+
+
+class Transport(ABC):
+    """
+        Interface of the sync transports of `CustomSession`: a transport sends one request on behalf of a client and
+        hands back a `requests.Response`, so everything above it (priming, rate limiting, metrics, caches, cassettes)
+        works the same whichever transport is used. The client's `requests` session stays the single owner of the
+        cookie jar and the retry policy.
+
+        Methods:
+            request(client, method: str, url: str, headers: dict = None, timeout: tuple = None, **kwargs) -> Response:
+            Sends a request.
+            close() -> None: Closes the connections of the transport.
+    """
+
+    @abstractmethod
+    def request(self, client, method: str, url: str, headers: dict = None, timeout: tuple = None,
+                **kwargs) -> Response:
+        """
+            Sends a request.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` the request is made for
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+            :param timeout: (optional) (connect, read) timeout in seconds
+            :param kwargs: (optional) any other keyword argument of `requests.Session.request`
+
+            :return: requests.Response object
+        """
+
+    def close(self) -> None:
+        """
+            Closes the connections of the transport.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+
+class RequestsTransport(Transport):
+    """
+        The default transport: sends the requests with the `requests` session of the client, so its adapters, hooks,
+        redirects and cookie handling apply as they are.
+
+        Methods:
+            request(client, method: str, url: str, headers: dict = None, timeout: tuple = None, **kwargs) -> Response:
+            Sends a request with `client.session`.
+    """
+
+    def request(self, client, method: str, url: str, headers: dict = None, timeout: tuple = None,
+                **kwargs) -> Response:
+        """
+            Sends a request with the `requests` session of the client.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` the request is made for
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+            :param timeout: (optional) (connect, read) timeout in seconds
+            :param kwargs: (optional) any other keyword argument of `requests.Session.request`
+
+            :return: requests.Response object
+        """
+
+        return client.session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+
+class PoolTransport(Transport):
+    """
+        A lean transport for hot polling loops (option chain, market status, intraday charts), built straight on a
+        `urllib3.PoolManager`: it skips the `requests` machinery run on every call (request preparation, hooks, adapter
+        lookup, cookie jar policy, case-insensitive header merging) and only does what the apis need. The default
+        headers of the session are added, the cookies of the session's jar valid for the host are sent, the cookies
+        set by every response (redirects included) are stored back into the jar, and the retry policy and redirect
+        limit of the session are reused. Redirects are followed here rather than by `urllib3`, so each hop sends the
+        cookies set by the previous ones.
+
+        Requests using `requests` features it doesn't implement (`files`, `auth`, `cookies`, `proxies`, `verify`,
+        `cert`, `hooks`) are handed to the `requests` session as they are. A transport keeps its own connections, it
+        can be shared by several clients and threads.
+
+        Usage:
+            poller = NSE()
+            poller.transport = PoolTransport()
+            while True:
+                option_chain = poller.get_option_chain(...)
+
+        Attributes:
+            num_pools: number of hosts whose connections are kept
+            maxsize: connections kept per host
+
+        Methods:
+            request(client, method: str, url: str, headers: dict = None, timeout: tuple = None, **kwargs) -> Response:
+            Sends a request on the connection pool.
+            close() -> None: Closes every connection.
+    """
+
+    _supported = frozenset(('params', 'json', 'data', 'stream', 'allow_redirects'))
+
+    def __init__(self, num_pools: int = 10, maxsize: int = 32) -> None:
+        """
+            Builds the transport, the connections are opened on the first request to each host.
+
+            :param self: Represent the instance of the class
+            :param num_pools: (optional) number of hosts whose connections are kept
+            :param maxsize: (optional) connections kept per host, like `CustomSession._pool_maxsize`
+
+            :return: None
+        """
+
+        self.num_pools = num_pools
+        self.maxsize = maxsize
+        self._fallback = RequestsTransport()
+        self._pool = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize)
+
+    def _build_headers(self, client, url: str, headers: dict = None) -> dict:
+        """
+            Adds the default headers of the session which the request doesn't override and the cookies of the host.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` the request is made for
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+
+            :return: Dict of the headers to send
+        """
+
+        merged = dict(headers or {})
+        given = {name.lower() for name in merged}
+        for name, value in client.session.headers.items():
+            if name.lower() not in given and value is not None:
+                merged[name] = value
+        cookies = client._cookies_for(url)
+        if cookies:
+            merged['Cookie'] = '; '.join(f'{name}={value}' for name, value in cookies.items())
+        return merged
+
+    @staticmethod
+    def _build_body(headers: dict, json_data=None, data=None):
+        """
+            Encodes the payload of the request the way `requests` does and sets its content type when missing.
+
+            :param headers: headers of the request, updated in place
+            :param json_data: (optional) JSON payload
+            :param data: (optional) form payload (dict) or raw body (str / bytes)
+
+            :return: Bytes of the body or None
+        """
+
+        if json_data is not None:
+            content_type, body = 'application/json', json.dumps(json_data, allow_nan=False).encode('utf-8')
+        elif isinstance(data, dict):
+            content_type, body = 'application/x-www-form-urlencoded', urlencode(data, doseq=True).encode('utf-8')
+        elif data:
+            return data.encode('utf-8') if isinstance(data, str) else data
+        else:
+            return None
+        if not any(name.lower() == 'content-type' for name in headers):
+            headers['Content-Type'] = content_type
+        return body
+
+    def request(self, client, method: str, url: str, headers: dict = None, timeout: tuple = None,
+                **kwargs) -> Response:
+        """
+            Sends a request on the connection pool, or with the `requests` session when it uses a feature this
+            transport doesn't implement.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` the request is made for
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param headers: (optional) headers of the request
+            :param timeout: (optional) (connect, read) timeout in seconds
+            :param kwargs: (optional) `params`, `json`, `data`, `stream`, `allow_redirects`; any other keyword argument
+            of `requests.Session.request` sends the request with `requests`
+
+            :return: requests.Response object
+        """
+
+        if not self._supported.issuperset(kwargs):
+            return self._fallback.request(client, method, url, headers=headers, timeout=timeout, **kwargs)
+
+        params = kwargs.get('params')
+        if params:
+            query = urlencode({key: value for key, value in params.items() if value is not None}, doseq=True)
+            if query:
+                url = f'{url}{"&" if "?" in url else "?"}{query}'
+        json_data, data = kwargs.get('json'), kwargs.get('data')
+        stream = bool(kwargs.get('stream'))
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        timeout = urllib3.Timeout(connect=connect, read=read)
+
+        started = time.perf_counter()
+        history = []
+        while True:
+            request_headers = self._build_headers(client, url, headers)
+            body = self._build_body(request_headers, json_data, data)
+            raw = self._urlopen(client, method, url, body, request_headers, timeout, stream)
+            self._store_set_cookies(client, url, raw)
+            location = kwargs.get('allow_redirects', True) and raw.get_redirect_location()
+            if not location:
+                break
+            if len(history) >= client.session.max_redirects:
+                raw.release_conn()
+                raise TooManyRedirects(f'Exceeded {client.session.max_redirects} redirects.')
+            # the body of a redirect is not read by anyone, its connection goes back to the pool
+            raw.drain_conn()
+            raw.release_conn()
+            history.append(self._build_response(url, raw, started, stream=False))
+            url = urljoin(url, location)
+            if (raw.status == 303 and method != 'HEAD') or (raw.status in (301, 302) and method == 'POST'):
+                # the method and payload are dropped the way `requests` (and browsers) do
+                method, json_data, data = 'GET', None, None
+                headers = {name: value for name, value in (headers or {}).items()
+                           if name.lower() not in ('content-type', 'content-length')}
+
+        response = self._build_response(url, raw, started, stream)
+        response.history = history
+        return response
+
+    def _urlopen(self, client, method: str, url: str, body, headers: dict, timeout: urllib3.Timeout,
+                 stream: bool) -> urllib3.HTTPResponse:
+        """
+            Sends one request on the pool, without following its redirect, and reports the errors as `requests` does
+            so the callers catch the same exceptions whichever the transport.
+
+            :param self: Represent the instance of the class
+            :param client: `CustomSession` the request is made for
+            :param method: HTTP method of the request
+            :param url: Url of the request
+            :param body: Bytes of the body or None
+            :param headers: headers to send
+            :param timeout: connect and read timeout
+            :param stream: leave the body unread
+
+            :return: urllib3 response
+        """
+
+        try:
+            return self._pool.urlopen(method, url, body=body, headers=headers,
+                                      retries=client.session.get_adapter(url).max_retries, redirect=False,
+                                      timeout=timeout, preload_content=not stream, decode_content=True)
+        except MaxRetryError as err:
+            if isinstance(err.reason, ConnectTimeoutError):
+                raise ConnectTimeout(err) from err
+            if isinstance(err.reason, ResponseError):
+                raise RetryError(err) from err
+            if isinstance(err.reason, Urllib3SSLError):
+                raise SSLError(err) from err
+            raise ConnectionError(err) from err
+        except ReadTimeoutError as err:
+            raise ReadTimeout(err) from err
+        except Urllib3HTTPError as err:
+            raise ConnectionError(err) from err
+
+    @staticmethod
+    def _store_set_cookies(client, url: str, raw: urllib3.HTTPResponse) -> None:
+        """
+            Stores the cookies set by a response into the jar of the session.
+
+            :param client: `CustomSession` the request is made for
+            :param url: Url which answered
+            :param raw: urllib3 response
+
+            :return: None
+        """
+
+        set_cookies = raw.headers.getlist('Set-Cookie')
+        if not set_cookies:
+            return
+        cookies = SimpleCookie()
+        for set_cookie in set_cookies:
+            try:
+                cookies.load(set_cookie)
+            except CookieError:
+                pass
+        client._store_cookies(url, cookies)
+
+    @staticmethod
+    def _build_response(url: str, raw: urllib3.HTTPResponse, started: float, stream: bool) -> Response:
+        """
+            Wraps a urllib3 response into a `requests.Response`.
+
+            :param url: Url which answered
+            :param raw: urllib3 response
+            :param started: `time.perf_counter()` when the request was sent
+            :param stream: the body is left to be read from `raw`
+
+            :return: requests.Response object
+        """
+
+        response = Response()
+        response.status_code = raw.status
+        response.reason = raw.reason
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = raw
+        response.url = url
+        response.elapsed = timedelta(seconds=time.perf_counter() - started)
+        if not stream:
+            response._content = raw.data
+            response._content_consumed = True
+        return response
+
+    def close(self) -> None:
+        """
+            Closes every connection of the transport.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        self._pool.clear()
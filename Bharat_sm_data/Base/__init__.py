@@ -1,2 +1,19 @@
-from Base.CustomRequest import CustomSession
-from Base.NSEBase import NSEBase
\ No newline at end of file
+from Base.Cassette import Cassette
+from Base.CircuitBreaker import CircuitBreaker, HostCircuitBreaker
+from Base.ConcurrencyLimiter import AIMDLimit, HostConcurrencyLimiter
+from Base.ConditionalCache import ConditionalCache, Validated
+from Base.CookieStore import CookieStore
+from Base.CustomRequest import CustomSession, DownloadProgress, FetchResult
+from Base.Deadline import Deadline
+from Base.Exceptions import CassetteMiss, CircuitOpenError, DeadlineExceeded
+from Base.Hedger import Hedger
+from Base.KeepWarm import DnsCache, KeepWarm
+from Base.Metrics import MetricsRegistry, Histogram
+from Base.NSEBase import NSEBase
+from Base.Operation import Operation, RequestSpec
+from Base.Priority import Priority
+from Base.RateLimiter import TokenBucket, HostRateLimiter
+from Base.ResponseCache import ResponseCache, MarketHoursTTL
+from Base.SessionRegistry import SessionRegistry, SessionState
+from Base.SingleFlight import SingleFlight
+from Base.Transport import Transport, RequestsTransport, PoolTransport
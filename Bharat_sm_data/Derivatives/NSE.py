@@ -1,10 +1,11 @@
 from datetime import datetime
+from functools import partial
 
 import pandas as pd
 import pydash as _
 from bs4 import BeautifulSoup
 
-from Base import NSEBase
+from Base import NSEBase, Operation, RequestSpec
 
 
 class NSE(NSEBase):
@@ -27,6 +28,9 @@ class NSE(NSEBase):
             get_currency_futures : Get the data for currency futures
             get_commodity_futures : Get the data for commodity futures
             get_pcr : Get the put-call ratio for a given ticker and expiry date
+            async_* : Coroutine variants of the option chain, expiry and trade info functions
+            *_operation : Sans-IO form of the single request functions (e.g. `get_option_chain_operation`), see
+            `Operation`
     """
 
     def __init__(self) -> None:
@@ -39,9 +43,9 @@ class NSE(NSEBase):
             :return: Nothing
         """
 
-        super().__init__()
-        self.headers['Referer'] = 'https://www.nseindia.com/option-chain'
-        self.hit_and_get_data(f'{self._base_url}/option-chain')
+        super().__init__(headers={'referer': 'https://www.nseindia.com/option-chain'})
+        # only the option chain apis need the cookies of its page, the other clients of the family don't load it
+        self.add_primer(self._cookie_domain, f'{self._base_url}/option-chain', shared=False)
         self.valid_pcr_fields = ['oi', 'volume']
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -63,17 +67,48 @@ class NSE(NSEBase):
             :return: A dataframe with option chain
         """
 
-        params = {'symbol': ticker, 'expiry': expiry.strftime('%d-%b-%Y')}
-        url = f'{self._base_url}/api/option-chain-v3'
+        return self.run(self.get_option_chain_operation(ticker, expiry, is_index))
 
-        if is_index:
-            params['type'] = 'Indices'
-        else:
-            params['type'] = 'Equity'
+    def get_option_chain_operation(self, ticker: str, expiry: datetime, is_index: bool = True) -> Operation:
+        """
+            Sans-IO form of `get_option_chain`.
 
-        response = self.hit_and_get_data(url, params=params)
-        df = pd.DataFrame(pd.json_normalize(_.get(response, 'records.data', {}), sep='_')).set_index('strikePrice')
-        return df
+            :param self: Represent the instance of the class
+            :param ticker: Specify the stock ticker for which we want to get the option chain
+            :param expiry: It takes the `expiry date` in the datetime format of the options contracts
+            :param is_index: (optional) Boolean value Specifies the given ticker is an index or not
+
+            :return: Operation of the `option-chain-v3` api
+        """
+
+        params = self._option_chain_params(ticker, expiry, 'Indices' if is_index else 'Equity')
+        return Operation(RequestSpec(f'{self._base_url}/api/option-chain-v3', params=params), self._option_chain_to_df)
+
+    @staticmethod
+    def _option_chain_params(ticker: str, expiry: datetime, instrument_type: str) -> dict:
+        """
+            Builds the url params of the `option-chain-v3` api.
+
+            :param ticker: Stock / index ticker also called symbol in NSE
+            :param expiry: Expiry date of the options contracts
+            :param instrument_type: `type` url param of the api
+
+            :return: Dict of url params
+        """
+
+        return {'symbol': ticker, 'expiry': expiry.strftime('%d-%b-%Y'), 'type': instrument_type}
+
+    @staticmethod
+    def _option_chain_to_df(response: dict) -> pd.DataFrame:
+        """
+            Flattens the `option-chain-v3` api response into a DataFrame indexed on strike price.
+
+            :param response: Parsed response of the api
+
+            :return: A dataframe with option chain
+        """
+
+        return pd.DataFrame(pd.json_normalize(_.get(response, 'records.data', {}), sep='_')).set_index('strikePrice')
 
     def get_raw_option_chain(self, ticker: str, expiry: datetime, is_index: bool = True) -> dict:
         """
@@ -88,16 +123,22 @@ class NSE(NSEBase):
             :return: A dataframe with option chain data
         """
 
-        params = {'symbol': ticker, 'expiry': expiry.strftime('%d-%b-%Y')}
-        url = f'{self._base_url}/api/option-chain-v3'
+        return self.run(self.get_raw_option_chain_operation(ticker, expiry, is_index))
 
-        if is_index:
-            params['type'] = 'indices'
-        else:
-            params['type'] = 'Equity'
+    def get_raw_option_chain_operation(self, ticker: str, expiry: datetime, is_index: bool = True) -> Operation:
+        """
+            Sans-IO form of `get_raw_option_chain`.
 
-        response = self.hit_and_get_data(url, params=params)
-        return response
+            :param self: Represent the instance of the class
+            :param ticker: Specify the stock ticker for which we want to get the option chain
+            :param expiry: It takes the `expiry date` in the datetime format of the options contracts
+            :param is_index: Boolean value Specifies the given ticker is an index or not
+
+            :return: Operation of the `option-chain-v3` api
+        """
+
+        params = self._option_chain_params(ticker, expiry, 'indices' if is_index else 'Equity')
+        return Operation(RequestSpec(f'{self._base_url}/api/option-chain-v3', params=params), None)
 
     def get_options_expiry(self, ticker: str, is_index: bool = False) -> datetime:
         """
@@ -112,15 +153,34 @@ class NSE(NSEBase):
             :return: The very next expiry date
         """
 
+        return self.run(self.get_options_expiry_operation(ticker, is_index))
+
+    def get_options_expiry_operation(self, ticker: str, is_index: bool = False) -> Operation:
+        """
+            Sans-IO form of `get_options_expiry`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol for which we want to get the expiry date
+            :param is_index: Boolean value Specifies the given ticker is an index or not
+
+            :return: Operation of the `option-chain-contract-info` api
+        """
+
         params = {'symbol': ticker}
-        if is_index:
-            url = f'{self._base_url}/api/option-chain-contract-info'
-        else:
-            url = f'{self._base_url}/api/option-chain-contract-info'
-        response = self.hit_and_get_data(url, params=params)
-        dates = sorted([datetime.strptime(date_str, "%d-%b-%Y") for date_str in
-                        response.get('expiryDates', [])])
-        return dates
+        return Operation(RequestSpec(f'{self._base_url}/api/option-chain-contract-info', params=params),
+                         self._parse_expiry_dates)
+
+    @staticmethod
+    def _parse_expiry_dates(response: dict) -> list:
+        """
+            Sorts the expiry dates of the `option-chain-contract-info` api response.
+
+            :param response: Parsed response of the api
+
+            :return: Sorted list of expiry dates
+        """
+
+        return sorted([datetime.strptime(date_str, "%d-%b-%Y") for date_str in response.get('expiryDates', [])])
 
     # ----------------------------------------------------------------------------------------------------------------_
     # Equity Futures
@@ -133,8 +193,18 @@ class NSE(NSEBase):
             :return: List of all Equities tickers / symbols for which derivative trading is allowed
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/master-quote')
-        return response
+        return self.run(self.get_all_derivatives_enabled_stocks_operation())
+
+    def get_all_derivatives_enabled_stocks_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_all_derivatives_enabled_stocks`.
+
+            :param self: Represent the instance of the class
+
+            :return: Operation of the `master-quote` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/master-quote'), None)
 
     def get_equity_future_trade_info(self, ticker: str) -> pd.DataFrame:
         """
@@ -147,18 +217,59 @@ class NSE(NSEBase):
             :return: A DataFrame of trade info data of Equity Future contracts
         """
 
+        return self.run(self.get_equity_future_trade_info_operation(ticker))
+
+    def get_equity_future_trade_info_operation(self, ticker: str) -> Operation:
+        """
+            Sans-IO form of `get_equity_future_trade_info`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol
+
+            :return: Operation of the `quote-derivative` api
+        """
+
+        return self._derivative_quote_operation(ticker, 'Stock Futures', 'fut_timestamp')
+
+    def _derivative_quote_operation(self, ticker: str, instrument_type: str, timestamp_key: str) -> Operation:
+        """
+            Builds the operation of the `quote-derivative` api parsed for the given instrument type.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol
+            :param instrument_type: `Stock Futures` or `Stock Options`
+            :param timestamp_key: Key of the response which has the timestamp of the given instrument type
+
+            :return: Operation of the `quote-derivative` api
+        """
+
         params = {'symbol': ticker}
-        response = self.hit_and_get_data(f'{self._base_url}/api/quote-derivative', params=params)
-        future_data = []
+        return Operation(RequestSpec(f'{self._base_url}/api/quote-derivative', params=params),
+                         partial(self._derivative_quote_to_df, instrument_type=instrument_type,
+                                 timestamp_key=timestamp_key))
+
+    @staticmethod
+    def _derivative_quote_to_df(response: dict, instrument_type: str, timestamp_key: str) -> pd.DataFrame:
+        """
+            Filters the contracts of the given instrument type from the `quote-derivative` api response.
+
+            :param response: Parsed response of the api
+            :param instrument_type: `Stock Futures` or `Stock Options`
+            :param timestamp_key: Key of the response which has the timestamp of the given instrument type
+
+            :return: A DataFrame of trade info data of the contracts
+        """
+
+        contracts_data = []
         for fno_data in response.get('stocks', []):
-            if fno_data.get('metadata', {}).get('instrumentType') == 'Stock Futures':
-                future_data.append(fno_data)
+            if fno_data.get('metadata', {}).get('instrumentType') == instrument_type:
+                contracts_data.append(fno_data)
 
-        df = pd.DataFrame(pd.json_normalize(future_data, sep='_'))
+        df = pd.DataFrame(pd.json_normalize(contracts_data, sep='_'))
         df['ticker'] = response.get('info', {}).get('symbol', '')
         df['companyName'] = response.get('info', {}).get('companyName', '')
         df['industry'] = response.get('info', {}).get('industry', '')
-        df['fut_timestamp'] = response.get('fut_timestamp', '')
+        df[timestamp_key] = response.get(timestamp_key, '')
         return df
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -173,19 +284,19 @@ class NSE(NSEBase):
             :return: DataFrame containing the trade information.
         """
 
-        params = {'symbol': ticker}
-        response = self.hit_and_get_data(f'{self._base_url}/api/quote-derivative', params=params)
-        future_data = []
-        for fno_data in response.get('stocks', []):
-            if fno_data.get('metadata', {}).get('instrumentType') == 'Stock Options':
-                future_data.append(fno_data)
+        return self.run(self.get_equity_options_trade_info_operation(ticker))
 
-        df = pd.DataFrame(pd.json_normalize(future_data, sep='_'))
-        df['ticker'] = response.get('info', {}).get('symbol', '')
-        df['companyName'] = response.get('info', {}).get('companyName', '')
-        df['industry'] = response.get('info', {}).get('industry', '')
-        df['opt_timestamp'] = response.get('opt_timestamp', '')
-        return df
+    def get_equity_options_trade_info_operation(self, ticker: str) -> Operation:
+        """
+            Sans-IO form of `get_equity_options_trade_info`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Ticker symbol of the equity options trade.
+
+            :return: Operation of the `quote-derivative` api
+        """
+
+        return self._derivative_quote_operation(ticker, 'Stock Options', 'opt_timestamp')
 
     # ----------------------------------------------------------------------------------------------------------------
     # Index Futures
@@ -198,9 +309,20 @@ class NSE(NSEBase):
             :return: A dict obj with all FUTURES mappings
         """
 
-        response = self.session.get(f'{self._base_url}//market-data/equity-derivatives-watch',
-                                    headers=self.headers)
-        soup = BeautifulSoup(response.text, features="html5lib")
+        page_url = f'{self._base_url}//market-data/equity-derivatives-watch'
+        return self.run(Operation(RequestSpec(page_url, kind='content'), self._parse_mapped_index_tickers))
+
+    @staticmethod
+    def _parse_mapped_index_tickers(content: bytes) -> dict:
+        """
+            Picks the index names and their tickers from the `equity-derivatives-watch` page.
+
+            :param content: Body of the page
+
+            :return: A dict obj with all FUTURES mappings
+        """
+
+        soup = BeautifulSoup(content, features="html5lib")
         all_derivative_options = soup.find_all('option', attrs={"rel": "derivative"})
         mapped_index_ticker = {}
         for i in all_derivative_options:
@@ -232,10 +354,21 @@ class NSE(NSEBase):
             ticker_to_used = mapped_tickers[index_or_ticker]
         else:
             ticker_to_used = index_or_ticker
-        params = {'index': ticker_to_used}
-        response = self.hit_and_get_data(f'{self._base_url}/api/liveEquity-derivatives', params=params)
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return self.run(self.get_index_futures_data_operation(ticker_to_used))
+
+    def get_index_futures_data_operation(self, ticker: str) -> Operation:
+        """
+            Sans-IO form of `get_index_futures_data`, it takes the NSE ticker of the index as it is (the index names
+            are mapped to tickers by `get_index_futures_data` with one more request).
+
+            :param self: Represent the instance of the class
+            :param ticker: NSE ticker of the index, e.g. `nse50_fut`
+
+            :return: Operation of the `liveEquity-derivatives` api
+        """
+
+        params = {'index': ticker}
+        return Operation(RequestSpec(f'{self._base_url}/api/liveEquity-derivatives', params=params), self._data_to_df)
 
     # ----------------------------------------------------------------------------------------------------------------
     # Currency
@@ -249,11 +382,20 @@ class NSE(NSEBase):
             :return: DataFrame containing the currency futures data
         """
 
+        return self.run(self.get_currency_futures_operation())
+
+    def get_currency_futures_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_currency_futures`.
+
+            :param self: Represent the instance of the class
+
+            :return: Operation of the `liveCurrency-derivatives` api
+        """
+
         params = {'index': 'live_market_currency', 'key': 'INR'}
-        response = self.hit_and_get_data(
-            f'{self._base_url}/api/liveCurrency-derivatives', params=params)
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return Operation(RequestSpec(f'{self._base_url}/api/liveCurrency-derivatives', params=params),
+                         self._data_to_df)
 
     # ----------------------------------------------------------------------------------------------------------------
     # Commodity
@@ -265,9 +407,18 @@ class NSE(NSEBase):
 
             :return: Pd.DataFrame: DataFrame containing the currency futures data
         """
-        response = self.hit_and_get_data(f'{self._base_url}/api/liveCommodity-derivatives')
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return self.run(self.get_commodity_futures_operation())
+
+    def get_commodity_futures_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_commodity_futures`.
+
+            :param self: Represent the instance of the class
+
+            :return: Operation of the `liveCommodity-derivatives` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/liveCommodity-derivatives'), self._data_to_df)
 
     def get_pcr(self, ticker: str, is_index: bool = True, on_field: str = 'OI', expiry: datetime = None) -> float:
         """
@@ -302,4 +453,84 @@ class NSE(NSEBase):
         else:
             put_vol = df['PE_totalTradedVolume'].sum()
             call_vol = df['CE_totalTradedVolume'].sum()
-            return put_vol / call_vol
\ No newline at end of file
+            return put_vol / call_vol
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Async variants - same as the above functions but run on the asyncio transport
+
+    async def async_get_option_chain(self, ticker: str, expiry: datetime, is_index: bool = True) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_option_chain`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the stock ticker for which we want to get the option chain its also called symbol in
+            NSE
+            :param expiry: It takes the `expiry date` in the datetime format of the options contracts
+            :param is_index: (optional) Boolean value Specifies the given ticker is an index or not
+
+            :return: A dataframe with option chain
+        """
+
+        return await self.async_run(self.get_option_chain_operation(ticker, expiry, is_index))
+
+    async def async_get_raw_option_chain(self, ticker: str, expiry: datetime, is_index: bool = True) -> dict:
+        """
+            Coroutine variant of `get_raw_option_chain`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the stock ticker for which we want to get the option chain
+            :param expiry: It takes the `expiry date` in the datetime format of the options contracts
+            :param is_index: Boolean value Specifies the given ticker is an index or not
+
+            :return: Raw option chain data
+        """
+
+        return await self.async_run(self.get_raw_option_chain_operation(ticker, expiry, is_index))
+
+    async def async_get_options_expiry(self, ticker: str, is_index: bool = False) -> list:
+        """
+            Coroutine variant of `get_options_expiry`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol for which we want to get the expiry date
+            :param is_index: Boolean value Specifies the given ticker is an index or not
+
+            :return: Sorted list of expiry dates
+        """
+
+        return await self.async_run(self.get_options_expiry_operation(ticker, is_index))
+
+    async def async_get_all_derivatives_enabled_stocks(self) -> list:
+        """
+            Coroutine variant of `get_all_derivatives_enabled_stocks`.
+
+            :param self: Represent the instance of the class
+
+            :return: List of all Equities tickers / symbols for which derivative trading is allowed
+        """
+
+        return await self.async_run(self.get_all_derivatives_enabled_stocks_operation())
+
+    async def async_get_equity_future_trade_info(self, ticker: str) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_equity_future_trade_info`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol
+
+            :return: A DataFrame of trade info data of Equity Future contracts
+        """
+
+        return await self.async_run(self.get_equity_future_trade_info_operation(ticker))
+
+    async def async_get_equity_options_trade_info(self, ticker: str) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_equity_options_trade_info`.
+
+            :param self: Represent the instance of the class
+            :param ticker: Specify the ticker / symbol
+
+            :return: DataFrame containing the trade information.
+        """
+
+        return await self.async_run(self.get_equity_options_trade_info_operation(ticker))
@@ -1,10 +1,11 @@
 from datetime import datetime
+from functools import partial
 
 import pandas as pd
 import pydash as _
 import json
 
-from Base import CustomSession
+from Base import CustomSession, Operation, RequestSpec
 
 
 class Sensibull(CustomSession):
@@ -21,8 +22,12 @@ class Sensibull(CustomSession):
            search_token : Returns the token of a given symbol
            get_token_details : Returns the details of a given token
            get_options_data_with_greeks : Returns a dataframe with options data and greeks
+           async_search_token / async_get_token_details : Coroutine variants of the token lookups
+           search_token_operation / get_token_details_operation : Sans-IO form of the token lookups, see `Operation`
     """
 
+    session_family = 'sensibull.com'
+
     def __init__(self):
         """
            The __init__ function is called when the class is instantiated.
@@ -48,11 +53,8 @@ class Sensibull(CustomSession):
                           'Chrome/110.0.0.0 Safari/537.36'
         })
         self._base_url = 'https://oxide.sensibull.com/v1/compute'
-        try:
-            self.session.get('https://sensibull.com/', headers=self.headers, timeout=10)
-            self.session.get('https://web.sensibull.com/optionchain', headers=self.headers, timeout=10)
-        except Exception as err:
-            print(f"Error Occurred while setting cookies for SENSIBULL, Error MSG: {err}")
+        # sets the cookies of SENSIBULL lazily before the first api call
+        self.add_primer('sensibull.com', 'https://sensibull.com/', 'https://web.sensibull.com/optionchain')
 
     # ----------------------------------------------------------------------------------------------------------------
     # Utility Functions
@@ -97,10 +99,34 @@ class Sensibull(CustomSession):
             :return: The token of the symbol entered
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/cache/underlying_instruments')
-        response = response['data']
-        result = _.find(response, {'tradingsymbol': symbol})
-        return result
+        return self.run(self.search_token_operation(symbol))
+
+    def search_token_operation(self, symbol: str) -> Operation:
+        """
+            Sans-IO form of `search_token`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Search for the underlying instrument in the response
+
+            :return: Operation of the `underlying_instruments` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/cache/underlying_instruments'),
+                         partial(self._find_instrument, field='tradingsymbol', value=symbol))
+
+    @staticmethod
+    def _find_instrument(response: dict, field: str, value) -> dict:
+        """
+            Finds the underlying instrument whose field has the given value in the `underlying_instruments` response.
+
+            :param response: Parsed response of the api
+            :param field: Field of the instrument to match, e.g. `tradingsymbol`
+            :param value: Value of the field
+
+            :return: The details of the instrument or None
+        """
+
+        return _.find(response['data'], {field: value})
 
     def get_token_details(self, token: int) -> dict:
         """
@@ -114,10 +140,44 @@ class Sensibull(CustomSession):
             :return: The details of the token
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/cache/underlying_instruments')
-        response = response['data']
-        result = _.find(response, {'instrument_token': token})
-        return result
+        return self.run(self.get_token_details_operation(token))
+
+    def get_token_details_operation(self, token: int) -> Operation:
+        """
+            Sans-IO form of `get_token_details`.
+
+            :param self: Bind the method to an object
+            :param token: Get the details of a particular token
+
+            :return: Operation of the `underlying_instruments` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/cache/underlying_instruments'),
+                         partial(self._find_instrument, field='instrument_token', value=token))
+
+    async def async_search_token(self, symbol: str) -> dict:
+        """
+            Coroutine variant of `search_token`.
+
+            :param self: Represent the instance of the class
+            :param symbol: Search for the underlying instrument in the response
+
+            :return: The token of the symbol entered
+        """
+
+        return await self.async_run(self.search_token_operation(symbol))
+
+    async def async_get_token_details(self, token: int) -> dict:
+        """
+            Coroutine variant of `get_token_details`.
+
+            :param self: Bind the method to an object
+            :param token: Get the details of a particular token
+
+            :return: The details of the token
+        """
+
+        return await self.async_run(self.get_token_details_operation(token))
 
     # ----------------------------------------------------------------------------------------------------------------
     # Options (Greeks) Functions
@@ -139,14 +199,32 @@ class Sensibull(CustomSession):
 
         response = self.hit_and_get_data(
             f'{self._base_url}/cache/live_derivative_prices/{ticker_data["instrument_token"]}')
-        next_expiry = expiry_date.strftime('%Y-%m-%d')
-        required_expiry_data = _.get(response, f"data.per_expiry_data.{next_expiry}", {})
 
         json_data = {'underlyer_list': [ticker_data["tradingsymbol"]]}
-        resp = self.session.post('https://api.sensibull.com/v1/instrument_metadata/', headers=self.headers,
-                                 json=json_data).json()
-        mappings_data = json.loads(_.get(resp,
-                                         f'derivatives.{ticker_data["tradingsymbol"]}'))
+        resp = self.post_and_get_response('https://api.sensibull.com/v1/instrument_metadata/',
+                                          json_data=json_data).json()
+        return self._options_greeks_to_df(response, resp, ticker_data["tradingsymbol"], num_look_ups_from_atm,
+                                          expiry_date)
+
+    @staticmethod
+    def _options_greeks_to_df(response: dict, resp: dict, tradingsymbol: str, num_look_ups_from_atm: int,
+                              expiry_date: datetime) -> tuple:
+        """
+            Merges the live derivative prices (with greeks) and the instrument metadata of the underlying into the
+            options data of the strikes around the atm strike.
+
+            :param response: Parsed response of the `live_derivative_prices` api
+            :param resp: Parsed response of the `instrument_metadata` api
+            :param tradingsymbol: Trading symbol of the underlying
+            :param num_look_ups_from_atm: Get the number of strikes from atm strike
+            :param expiry_date: Gets the data for that particular expiry date
+
+            :return: A tuple of the options dataframe and the atm strike
+        """
+
+        next_expiry = expiry_date.strftime('%Y-%m-%d')
+        required_expiry_data = _.get(response, f"data.per_expiry_data.{next_expiry}", {})
+        mappings_data = json.loads(_.get(resp, f'derivatives.{tradingsymbol}'))
         mappings_data = _.get(mappings_data, f'derivatives.{next_expiry}.options')
 
         atm_strike = _.get(required_expiry_data, 'atm_strike')
@@ -154,7 +232,7 @@ class Sensibull(CustomSession):
         atm_index = sorted_mappings_data_keys.index(str(atm_strike))
         strike_gap = int(float(sorted_mappings_data_keys[atm_index])) - int(
             float(sorted_mappings_data_keys[atm_index - 1]))
-        strikes = self._get_n_strikes_from_atm(atm_strike, num_look_ups_from_atm, strike_gap)
+        strikes = Sensibull._get_n_strikes_from_atm(atm_strike, num_look_ups_from_atm, strike_gap)
         merged_data = []
         future_price = _.get(required_expiry_data, 'future_price', 0)
         required_expiry_data = required_expiry_data['options']
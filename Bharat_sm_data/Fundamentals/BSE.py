@@ -5,6 +5,8 @@ from Base import CustomSession
 
 class BSE(CustomSession):
 
+    session_family = 'bseindia.com'
+
     def __init__(self):
         """
             The __init__ function is called when the class is instantiated.
@@ -61,15 +63,13 @@ class BSE(CustomSession):
         if from_year is None:
             from_year = '0000'
 
-        response = self.session.get('https://api.bseindia.com/BseIndiaAPI/api/AnnualReport_New/w',
-                                    params=params,
-                                    headers=self.headers).json()
+        response = self.hit_and_get_response('https://api.bseindia.com/BseIndiaAPI/api/AnnualReport_New/w',
+                                             params=params).json()
 
-        for yr in response.get('Table', []):
-            link = yr.get('PDFDownload', '')
-            year = yr.get('Year')
-            if year < from_year or year > to_year:
-                continue
-            pdf_data = self.session.get(link, headers=self.headers)
-            with open(f'{folder_path}/{year}.pdf', 'wb') as pdf_file:
-                pdf_file.write(pdf_data.content)
+        reports = [yr for yr in response.get('Table', []) if from_year <= yr.get('Year') <= to_year]
+        # the PDFs are streamed to disk concurrently, a failed download does not stop the others
+        results = self.fetch_many([{'url': yr.get('PDFDownload', ''),
+                                    'destination': f'{folder_path}/{yr.get("Year")}.pdf'} for yr in reports], kind='file')
+        for yr, result in zip(reports, results):
+            if not result.ok:
+                print(f'Error in downloading the annual report of {yr.get("Year")} Error : {result.error}')
@@ -3,12 +3,13 @@ import warnings
 import json
 import math
 from datetime import datetime, timedelta
+from functools import partial
 
 import pandas as pd
 from bs4 import BeautifulSoup
 from pydash.collections import find
 
-from Base import CustomSession
+from Base import CustomSession, Operation, RequestSpec
 
 warnings.filterwarnings('ignore')
 
@@ -26,15 +27,20 @@ class MoneyControl(CustomSession):
        _common_complete_sheet_data_extractor(company_mc_url, statement_type, report_data, pages): Extracts
        data from the given URL and returns a DataFrame.
        get_india_vix(interval: str) -> pd.DataFrame: Retrieves India Vix data for a given interval.
+       async_get_india_vix(interval: str) -> pd.DataFrame: Coroutine variant of `get_india_vix`.
        get_overview_mini_statement(ticker: str, statement_type: str = 'consolidated',
        statement_frequency: int = 12): Retrieve the overview mini statement for a given ticker.
        get_income_mini_statement(ticker: str, statement_type: str = 'consolidated', statement_frequency: int = 12):
        Retrieves the income mini statement for a given ticker.
        get_balance_sheet_mini_statement(ticker: str,
        statement_type: str = 'consolidated'): Retrieves the balance sheet mini statement for a given ticker.
+       *_operation(...) -> Operation: Sans-IO form of `get_ticker`, `get_india_vix` and the mini statements, the
+       request spec and the pure parser of the response driven by `run` / `async_run` / `run_many`.
 
     """
 
+    session_family = 'moneycontrol.com'
+
     def __init__(self) -> None:
         """
             The __init__ function gets called automatically to set up the attributes with their initial values.
@@ -49,7 +55,7 @@ class MoneyControl(CustomSession):
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:133.0) Gecko/20100101 Firefox/133.0'
         })
         self._base_url = 'https://www.moneycontrol.com'
-        self.hit_and_get_data(f'{self._base_url}/')
+        self.add_primer('moneycontrol.com', f'{self._base_url}/')
         self.valid_intervals_for_vix = ['1',  # 1 min
                                         '1d',  # 1 day
                                         ]
@@ -67,6 +73,18 @@ class MoneyControl(CustomSession):
            :return: A tuple containing the stock ID and the corresponding object (raw data).
        """
 
+        return self.run(self.get_ticker_operation(search_text))
+
+    def get_ticker_operation(self, search_text: str) -> Operation:
+        """
+            Sans-IO form of `get_ticker`.
+
+           :param self: Represent the instance of the class.
+           :param search_text: The text to search for.
+
+           :return: Operation of the autosuggestion api
+       """
+
         params = {
             'classic': 'true',
             'query': search_text,
@@ -75,9 +93,22 @@ class MoneyControl(CustomSession):
             'callback': 'suggest1',
         }
 
-        response = self.session.get(f'{self._base_url}/mccode/common/autosuggestion_solr.php/',
-                                    params=params)
-        resp = json.loads(response.text[9:-1])
+        return Operation(RequestSpec(f'{self._base_url}/mccode/common/autosuggestion_solr.php/', params=params,
+                                     headers={}, kind='content'),
+                         partial(self._parse_ticker_search, search_text=search_text))
+
+    @staticmethod
+    def _parse_ticker_search(content: bytes, search_text: str) -> tuple:
+        """
+            Picks the stock matching the search text from the JSONP response of the autosuggestion api.
+
+           :param content: Body of the response
+           :param search_text: The text which was searched
+
+           :return: A tuple containing the stock ID and the corresponding object (raw data).
+       """
+
+        resp = json.loads(content.decode('utf-8', errors='replace')[9:-1])
         obj = find(resp, {'stock_name': search_text})
 
         if obj is not None:
@@ -95,7 +126,7 @@ class MoneyControl(CustomSession):
            :return: A list of strikes
        """
 
-        response = self.session.get(main_url, headers=self.headers)
+        response = self.hit_and_get_response(main_url)
         soup = BeautifulSoup(response.text, features="html5lib")
         ul = soup.find('div', class_='quick_links clearfix').find('ul')
         urls = {}
@@ -124,15 +155,15 @@ class MoneyControl(CustomSession):
         if statement_type == 'consolidated':
             data_url = data_url.replace(report_data.get('report_code'),
                                         f"consolidated-{report_data.get('report_code')}")
-        for page in range(pages):
-            try:
-                response = self.session.get(f'{data_url}/{page + 1}', headers=self.headers)
-            except:
+        # all the pages are fetched concurrently and merged in order
+        results = self.fetch_many([f'{data_url}/{page + 1}' for page in range(pages)], kind='response')
+        for page, result in enumerate(results):
+            if not result.ok:
                 print(f'Only till {page + 1} is available; so, returning data collected so far')
                 return main_df
-            df = pd.read_html(io.StringIO(response.text))[0]
+            df = pd.read_html(io.StringIO(result.data.text))[0]
             df.columns = df.iloc[0]
-            merge_col = df.iloc[0][0]
+            merge_col = df.iloc[0, 0]
             df = df[1:]
             df.drop(columns=[df.columns.to_list()[-1]], inplace=True)
             if page == 0:
@@ -153,9 +184,47 @@ class MoneyControl(CustomSession):
            :return: DataFrame containing the India VIX data for last 2months or ~1780 OHLCV datapoints
        """
 
+        return self.run(self.get_india_vix_operation(interval))
+
+    def get_india_vix_operation(self, interval: str) -> Operation:
+        """
+           Sans-IO form of `get_india_vix`.
+
+           :param self: Represent the instance of the class.
+           :param interval: Time interval for the data ('1d' for daily qnd '1' for 1min)
+
+           :return: Operation of the techCharts history api
+       """
+
+        return Operation(RequestSpec('https://priceapi.moneycontrol.com/techCharts/history',
+                                     params=self._india_vix_params(interval)),
+                         self._india_vix_to_df)
+
+    async def async_get_india_vix(self, interval: str) -> pd.DataFrame:
+        """
+           Coroutine variant of `get_india_vix`.
+
+           :param self: Represent the instance of the class.
+           :param interval: Time interval for the data ('1d' for daily qnd '1' for 1min)
+
+           :return: DataFrame containing the India VIX data for last 2months or ~1780 OHLCV datapoints
+       """
+
+        return await self.async_run(self.get_india_vix_operation(interval))
+
+    @staticmethod
+    def _india_vix_params(interval: str) -> dict:
+        """
+           Builds the url params of the techCharts history api for the last 60 days of INDIA VIX.
+
+           :param interval: Time interval for the data ('1d' for daily qnd '1' for 1min)
+
+           :return: Dict of url params
+       """
+
         end = datetime.now()  # set to now for getting latest vix
         start = end - timedelta(days=60)
-        params = {
+        return {
             'symbol': 'in;IDXN',
             'resolution': interval,
             'from': int(start.timestamp()),
@@ -163,13 +232,22 @@ class MoneyControl(CustomSession):
             'countback': '1782',
             'currencyCode': 'INR',
         }
-        response = self.hit_and_get_data('https://priceapi.moneycontrol.com/techCharts/history', params=params)
-        try:
-            del response['s']
-        except Exception as err:
-            print(f'Deleting Exception!! Error : {err}')
 
-        df = pd.DataFrame.from_dict(response)
+    @staticmethod
+    def _india_vix_to_df(response: dict) -> pd.DataFrame:
+        """
+           Converts the techCharts history api response into an OHLCV DataFrame.
+
+           :param response: Parsed response of the api
+
+           :return: DataFrame containing the India VIX data
+       """
+
+        if 's' not in response:
+            print("Deleting Exception!! Error : 's'")
+
+        # the response may be shared with other callers, so it is copied instead of being modified in place
+        df = pd.DataFrame.from_dict({key: value for key, value in response.items() if key != 's'})
         return df
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -190,29 +268,105 @@ class MoneyControl(CustomSession):
            :return: The processed data in a DataFrame format.
        """
 
-        valid_frequencies = [3, 12]
-        statement_type = statement_type.lower()
         try:
-            statement_type = self.valid_reports_type[statement_type]
-        except:
-            print(
-                f'Invalid statement type passed; these are the only allowed statements : {self.valid_reports_type.keys()}')
+            operation = self.get_overview_mini_statement_operation(ticker, statement_type, statement_frequency)
+        except ValueError as err:
+            print(err)
             return pd.DataFrame()
+        return self.run(operation)
+
+    def get_overview_mini_statement_operation(self, ticker: str, statement_type: str = 'consolidated',
+                                              statement_frequency: int = 12) -> Operation:
+        """
+           Sans-IO form of `get_overview_mini_statement`, an invalid statement type or frequency raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param statement_type: (Optional) The type of statement to retrieve (consolidated / standalone).
+           Defaults to 'consolidated'.
+           :param statement_frequency: (Optional) The frequency of the statement. Defaults to 12.
+
+           :return: Operation of the financial data widget
+       """
+
+        request_type = self._mini_statement_request_type(statement_type)
+        self._check_mini_statement_frequency(statement_frequency, [3, 12])
+        return self._mini_statement_operation('overview', ticker, request_type, statement_frequency,
+                                              partial(self._overview_to_df,
+                                                      graph_id=f'{request_type}-{statement_frequency}-graph'))
+
+    def _mini_statement_request_type(self, statement_type: str) -> str:
+        """
+           Maps the statement type to the request type of the financial data widget, an invalid one raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param statement_type: The type of statement (consolidated / standalone).
+
+           :return: `C` or `S`
+       """
+
+        try:
+            return self.valid_reports_type[statement_type.lower()]
+        except KeyError:
+            raise ValueError(f'Invalid statement type passed; these are the only allowed statements : '
+                             f'{self.valid_reports_type.keys()}')
+
+    @staticmethod
+    def _check_mini_statement_frequency(statement_frequency: int, valid_frequencies: list) -> None:
+        """
+           Checks the frequency of a mini statement, an invalid one raises ValueError.
+
+           :param statement_frequency: The frequency of the statement.
+           :param valid_frequencies: The frequencies the statement is available in.
+
+           :return: None
+       """
+
         if statement_frequency not in valid_frequencies:
-            print(f'Invalid statement frequency passed; these are the only allowed statements : {valid_frequencies}')
-            return pd.DataFrame()
+            raise ValueError(f'Invalid statement frequency passed; these are the only allowed statements : '
+                             f'{valid_frequencies}')
+
+    def _mini_statement_operation(self, reference_id: str, ticker: str, request_type: str,
+                                  statement_frequency: int = None, parse=None) -> Operation:
+        """
+           Builds the operation of a mini statement of the financial data widget.
+
+           :param self: Represent the instance of the class.
+           :param reference_id: The statement of the widget (overview / income / balance-sheet / cash-flow / ratios).
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param request_type: `C` (consolidated) or `S` (standalone).
+           :param statement_frequency: (Optional) The frequency of the statement, not sent when None.
+           :param parse: Parser of the body of the widget.
+
+           :return: Operation of the financial data widget
+       """
+
         params = {
             'classic': 'true',
-            'referenceId': 'overview',
-            'requestType': statement_type,
+            'referenceId': reference_id,
+            'requestType': request_type,
             'scId': ticker,
-            'frequency': str(statement_frequency)
         }
-        response = self.session.get(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData',
-                                    params=params)
-        soup = BeautifulSoup(response.text, features="html5lib")
+        if statement_frequency is not None:
+            params['frequency'] = str(statement_frequency)
+        return Operation(RequestSpec(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData', params=params,
+                                     headers={}, kind='content'),
+                         parse)
+
+    @staticmethod
+    def _overview_to_df(content: bytes, graph_id: str) -> pd.DataFrame:
+        """
+           Reads the overview mini statement from the graph data embedded in the widget.
+
+           :param content: Body of the widget
+           :param graph_id: Id of the div holding the graph data, e.g. `C-12-graph`
+
+           :return: The processed data in a DataFrame format.
+       """
+
+        soup = BeautifulSoup(content, features="html5lib")
         try:
-            data = json.loads(soup.find('div', attrs={'id': f'{statement_type}-{statement_frequency}-graph'}).contents[0].text)
+            data = json.loads(soup.find('div', attrs={'id': graph_id}).contents[0].text)
         except Exception as err:
             print(f'Exception happened while parsing webpage pls check all params once again; Error Message : {err}')
 
@@ -245,27 +399,63 @@ class MoneyControl(CustomSession):
            :return: The company income data in a DataFrame format.
        """
 
-        valid_frequencies = [3, 6, 9, 12]
-        statement_type = statement_type.lower()
         try:
-            statement_type = self.valid_reports_type[statement_type]
-        except:
-            print(
-                f'Invalid statement type passed; these are the only allowed statements : {self.valid_reports_type.keys()}')
-            return pd.DataFrame()
-        if statement_frequency not in valid_frequencies:
-            print(f'Invalid statement frequency passed; these are the only allowed statements : {valid_frequencies}')
+            operation = self.get_income_mini_statement_operation(ticker, statement_type, statement_frequency)
+        except ValueError as err:
+            print(err)
             return pd.DataFrame()
-        params = {
-            'classic': 'true',
-            'referenceId': 'income',
-            'requestType': statement_type,
-            'scId': ticker,
-            'frequency': str(statement_frequency)
-        }
-        response = self.session.get(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData',
-                                    params=params)
-        df = pd.read_html(io.StringIO(response.text))[0]
+        return self.run(operation)
+
+    def get_income_mini_statement_operation(self, ticker: str, statement_type: str = 'consolidated',
+                                            statement_frequency: int = 12) -> Operation:
+        """
+           Sans-IO form of `get_income_mini_statement`, an invalid statement type or frequency raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param statement_type: (Optional) The type of statement to retrieve (consolidated / standalone).
+           Defaults to 'consolidated'.
+           :param statement_frequency: (Optional) The frequency of the statement. Defaults to 12.
+
+           :return: Operation of the financial data widget
+       """
+
+        request_type = self._mini_statement_request_type(statement_type)
+        self._check_mini_statement_frequency(statement_frequency, [3, 6, 9, 12])
+        return self._mini_statement_operation('income', ticker, request_type, statement_frequency,
+                                              self._statement_table_to_df)
+
+    @staticmethod
+    def _statement_table_to_df(content: bytes) -> pd.DataFrame:
+        """
+           Reads the table of a mini statement without its trend column.
+
+           :param content: Body of the widget
+
+           :return: The statement data in a DataFrame format.
+       """
+
+        df = pd.read_html(io.StringIO(content.decode('utf-8', errors='replace')))[0]
+        df.drop(columns=[df.columns.to_list()[-1]], inplace=True)  # drop the trend column
+        return df
+
+    @staticmethod
+    def _statement_tables_to_df(content: bytes, first_header: str) -> pd.DataFrame:
+        """
+           Stacks the tables of a mini statement (one per section) without their trend column.
+
+           :param content: Body of the widget
+           :param first_header: Name of the first column, which holds the row names
+
+           :return: The statement data in a DataFrame format.
+       """
+
+        dfs = pd.read_html(io.StringIO(content.decode('utf-8', errors='replace')))
+        annual_headers = dfs[0].columns.to_list()
+        annual_headers[0] = first_header
+        for df in dfs:
+            df.columns = annual_headers
+        df = pd.concat(dfs, ignore_index=True)
         df.drop(columns=[df.columns.to_list()[-1]], inplace=True)  # drop the trend column
         return df
 
@@ -283,29 +473,29 @@ class MoneyControl(CustomSession):
            :return: The company balance sheet data in a DataFrame format.
         """
 
-        statement_type = statement_type.lower()
         try:
-            statement_type = self.valid_reports_type[statement_type]
-        except:
-            print(
-                f'Invalid statement type passed; these are the only allowed statements : {self.valid_reports_type.keys()}')
+            operation = self.get_balance_sheet_mini_statement_operation(ticker, statement_type)
+        except ValueError as err:
+            print(err)
             return pd.DataFrame()
-        params = {
-            'classic': 'true',
-            'referenceId': 'balance-sheet',
-            'requestType': statement_type,
-            'scId': ticker
-        }
-        response = self.session.get(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData',
-                                    params=params)
-        dfs = pd.read_html(io.StringIO(response.text))
-        annual_headers = dfs[0].columns.to_list()
-        annual_headers[0] = 'headers'
-        for df in dfs:
-            df.columns = annual_headers
-        df = pd.concat(dfs, ignore_index=True)
-        df.drop(columns=[df.columns.to_list()[-1]], inplace=True)  # drop the trend column
-        return df
+        return self.run(operation)
+
+    def get_balance_sheet_mini_statement_operation(self, ticker: str,
+                                                   statement_type: str = 'consolidated') -> Operation:
+        """
+           Sans-IO form of `get_balance_sheet_mini_statement`, an invalid statement type raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param statement_type: (Optional) The type of statement to retrieve (consolidated / standalone).
+           Defaults to 'consolidated'.
+
+           :return: Operation of the financial data widget
+        """
+
+        return self._mini_statement_operation('balance-sheet', ticker,
+                                              self._mini_statement_request_type(statement_type),
+                                              parse=partial(self._statement_tables_to_df, first_header='headers'))
 
     def get_cash_flow_mini_statement(self, ticker: str, statement_type: str = 'consolidated') -> pd.DataFrame:
         """
@@ -321,24 +511,27 @@ class MoneyControl(CustomSession):
            :return: The company's cash flow statements data in a DataFrame format.
        """
 
-        statement_type = statement_type.lower()
         try:
-            statement_type = self.valid_reports_type[statement_type]
-        except:
-            print(
-                f'Invalid statement type passed; these are the only allowed statements : {self.valid_reports_type.keys()}')
+            operation = self.get_cash_flow_mini_statement_operation(ticker, statement_type)
+        except ValueError as err:
+            print(err)
             return pd.DataFrame()
-        params = {
-            'classic': 'true',
-            'referenceId': 'cash-flow',
-            'requestType': statement_type,
-            'scId': ticker,
-        }
-        response = self.session.get(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData',
-                                    params=params)
-        df = pd.read_html(io.StringIO(response.text))[0]
-        df.drop(columns=[df.columns.to_list()[-1]], inplace=True)  # drop the trend column
-        return df
+        return self.run(operation)
+
+    def get_cash_flow_mini_statement_operation(self, ticker: str, statement_type: str = 'consolidated') -> Operation:
+        """
+           Sans-IO form of `get_cash_flow_mini_statement`, an invalid statement type raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param statement_type: (Optional) The type of statement to retrieve (consolidated / standalone).
+           Defaults to 'consolidated'.
+
+           :return: Operation of the financial data widget
+       """
+
+        return self._mini_statement_operation('cash-flow', ticker, self._mini_statement_request_type(statement_type),
+                                              parse=self._statement_table_to_df)
 
     def get_ratios_mini_statement(self, ticker: str, statement_type: str = 'consolidated') -> pd.DataFrame:
         """
@@ -354,29 +547,27 @@ class MoneyControl(CustomSession):
            :return: The company's key performance ratios in DataFrame format.
         """
 
-        statement_type = statement_type.lower()
         try:
-            statement_type = self.valid_reports_type[statement_type]
-        except:
-            print(
-                f'Invalid statement type passed; these are the only allowed statements : {self.valid_reports_type.keys()}')
+            operation = self.get_ratios_mini_statement_operation(ticker, statement_type)
+        except ValueError as err:
+            print(err)
             return pd.DataFrame()
-        params = {
-            'classic': 'true',
-            'referenceId': 'ratios',
-            'requestType': statement_type,
-            'scId': ticker
-        }
-        response = self.session.get(f'{self._base_url}/mc/widget/mcfinancials/getFinancialData',
-                                    params=params)
-        dfs = pd.read_html(io.StringIO(response.text))
-        annual_headers = dfs[0].columns.to_list()
-        annual_headers[0] = 'ratios'
-        for df in dfs:
-            df.columns = annual_headers
-        df = pd.concat(dfs, ignore_index=True)
-        df.drop(columns=[df.columns.to_list()[-1]], inplace=True)  # drop the trend column
-        return df
+        return self.run(operation)
+
+    def get_ratios_mini_statement_operation(self, ticker: str, statement_type: str = 'consolidated') -> Operation:
+        """
+           Sans-IO form of `get_ratios_mini_statement`, an invalid statement type raises ValueError.
+
+           :param self: Represent the instance of the class.
+           :param ticker: The moneycontrol ticker symbol of the company.
+           :param statement_type: (Optional) The type of statement to retrieve (consolidated / standalone).
+           Defaults to 'consolidated'.
+
+           :return: Operation of the financial data widget
+        """
+
+        return self._mini_statement_operation('ratios', ticker, self._mini_statement_request_type(statement_type),
+                                              parse=partial(self._statement_tables_to_df, first_header='ratios'))
 
     # ----------------------------------------------------------------------------------------------------------------
     # Complete Statements regd financials of Equity
@@ -583,7 +774,7 @@ class MoneyControl(CustomSession):
         """
 
         data_url = self._get_all_extracted_urls(company_mc_url).get('Capital Structure')
-        response = self.session.get(f'{data_url}', headers=self.headers)
+        response = self.hit_and_get_response(f'{data_url}')
         df = pd.read_html(io.StringIO(response.text))[0]
         return df
     
\ No newline at end of file
@@ -1,10 +1,9 @@
 
 import pandas as pd
-from time import sleep
 from io import StringIO
 from bs4 import BeautifulSoup
 
-from Base import CustomSession 
+from Base import CustomSession, Deadline, Operation, RequestSpec
 
 
 
@@ -28,7 +27,7 @@ class Screener(CustomSession):
             Fetches the textual data of a company from Screener.
         get_base_tables(ticker_url: str, table: str) -> pd.DataFrame:
             Fetches the key points table for a given ticker URL.
-        get_quarterly_results(ticker_url: str) -> pd.DataFrame:
+        get_quarterly_results(ticker_url: str, deadline: float = None) -> pd.DataFrame:
             Fetches the quarterly results table for a given ticker URL.
         get_profit_and_loss(ticker_url: str) -> pd.DataFrame:
             Fetches the Profit & Loss table for a given ticker URL.
@@ -54,6 +53,10 @@ class Screener(CustomSession):
             Fetches the industry-wise Stocks for a given industry URL.
         get_concall_list(ticker_url: str) -> pd.DataFrame:
             Fetches the concall list for a given ticker URL.
+        *_operation(...) -> Operation:
+            Sans-IO form of the single page / api functions (`get_ticker`, `get_chart_data`, `get_screens`,
+            `get_query_from_pre_screens_feed`, `get_all_industries`, `get_cocalls_link`): the request spec and the
+            pure parser of the response, driven by `run` / `async_run` / `run_many`.
     """
     def __init__(self, username: str, password: str) -> None:
         """
@@ -78,32 +81,39 @@ class Screener(CustomSession):
         all_supported_columns = ['Sales', 'OPM', 'Profit after tax', 'Market Capitalization', 'Sales latest quarter', 'Profit after tax latest quarter', 'YOY Quarterly sales growth', 'YOY Quarterly profit growth', 'Price to Earning', 'Dividend yield', 'Price to book value', 'Return on capital employed', 'Return on assets', 'Debt to equity', 'Return on equity', 'EPS', 'Debt', 'Promoter holding', 'Change in promoter holding', 'Earnings yield', 'Pledged percentage', 'Industry PE', 'Sales growth', 'Profit growth', 'Current price', 'Price to Sales', 'Price to Free Cash Flow', 'EVEBITDA', 'Enterprise Value', 'Current ratio', 'Interest Coverage Ratio', 'PEG Ratio', 'Return over 3months', 'Return over 6months', 'Is SME', 'Is not SME', 'Number of equity shares', 'Equity capital', 'Preference capital', 'Reserves', 'Secured loan', 'Unsecured loan', 'Balance sheet total', 'Gross block', 'Revaluation reserve', 'Accumulated depreciation', 'Net block', 'Capital work in progress', 'Investments', 'Current assets', 'Current liabilities', 'Book value of unquoted investments', 'Market value of quoted investments', 'Contingent liabilities', 'Cash from operations last year', 'Free cash flow last year', 'Cash from investing last year', 'Cash from financing last year', 'Net cash flow last year', 'Cash beginning of last year', 'Cash end of last year', 'Sales last year', 'Operating profit last year', 'Other income last year', 'EBIDT last year', 'Depreciation last year', 'EBIT last year', 'Interest last year', 'Profit before tax last year', 'Tax last year', 'Profit after tax last year', 'Extraordinary items last year', 'Net Profit last year', 'Dividend last year', 'Material cost last year', 'Employee cost last year', 'OPM last year', 'NPM last year', 'Operating profit latest quarter', 'Other income latest quarter', 'EBIDT latest quarter', 'Depreciation latest quarter', 'EBIT latest quarter', 'Interest latest quarter', 'Profit before tax latest quarter', 'Tax latest quarter', 'Extraordinary items latest quarter', 'Net Profit latest quarter', 'GPM latest quarter', 'OPM latest quarter', 'NPM latest quarter', 'Equity Capital latest quarter', 'EPS latest quarter', 'Price to Quarterly Earning', 'Book value', 'Inventory turnover ratio', 'Quick ratio', 'Exports percentage', 'Total Assets', 'Piotroski score', 'G Factor', 'Operating profit', 'Interest', 'Depreciation', 'EPS last year', 'EBIT', 'Net profit', 'Asset Turnover Ratio', 'Financial leverage', 'Current Tax', 'Tax', 'Operating profit 2quarters back', 'Operating profit 3quarters back', 'Sales 2quarters back', 'Sales 3quarters back', 'Net profit 2quarters back', 'Net profit 3quarters back', 'Working capital', 'Number of Shareholders', 'Unpledged promoter holding', 'Return on invested capital', 'Lease liabilities', 'Inventory', 'Trade receivables', 'Debtor days', 'Industry PBV', 'Operating profit growth', 'Other income', 'Volume 1month average', 'Volume 1week average', 'Volume', 'High price', 'Low price', 'High price all time', 'Low price all time', 'Face value', 'Credit rating', 'Working Capital to Sales ratio', 'QoQ Profits', 'QoQ Sales', 'Net worth', 'Market Cap to Sales', 'Interest Coverage', 'Enterprise Value to EBIT', 'Debt Capacity', 'Debt To Profit', 'Total Capital Employed', 'CROIC', 'debtplus', 'Leverage', 'Dividend Payout', 'Intrinsic Value', 'cash debt contingent liabilities by mcap', 'Cash by market cap', '52w Index', 'Down from 52w high', 'Up from 52w low', 'From 52w high', 'Mkt Cap To Debt Cap', 'Dividend Payout Ratio', 'Graham', 'Price to Cash Flow', 'ROCE3yr avg', 'Working Capital Days', 'Cash Equivalents', 'Earning Power', 'PB X PE', 'Graham Number', 'NCAVPS', 'Market Capt to Cash Flow', 'Altman Z Score', 'Cash Conversion Cycle', 'Advance from Customers', 'Trade Payables', 'Days Payable Outstanding', 'Days Receivable Outstanding', 'Days Inventory Outstanding', 'Market cap to quarterly profit', 'Return over 1day', 'Return over 1week', 'Return over 1month', 'Last result date', 'Last annual result date', 'Expected quarterly sales growth', 'Expected quarterly sales', 'Expected quarterly operating profit', 'Expected quarterly net profit', 'Expected quarterly EPS', 'DMA 50', 'DMA 200', 'DMA 50 previous day', 'DMA 200 previous day', 'RSI', 'MACD', 'MACD Previous Day', 'MACD Signal', 'MACD Signal Previous Day', 'Public holding', 'FII holding', 'Change in FII holding', 'DII holding', 'Change in DII holding', 'Number of equity shares preceding year', 'Free cash flow preceding year', 'Cash from operations preceding year', 'Cash from investing preceding year', 'Cash from financing preceding year', 'Net cash flow preceding year', 'Cash beginning of preceding year', 'Cash end of preceding year', 'Sales preceding year', 'Operating profit preceding year', 'Other income preceding year', 'EBIDT preceding year', 'Depreciation preceding year', 'EBIT preceding year', 'Interest preceding year', 'Profit before tax preceding year', 'Tax preceding year', 'Profit after tax preceding year', 'Extraordinary items preceding year', 'Net Profit preceding year', 'Dividend preceding year', 'OPM preceding year', 'NPM preceding year', 'Sales preceding quarter', 'Operating profit preceding quarter', 'Other income preceding quarter', 'EBIDT preceding quarter', 'Depreciation preceding quarter', 'EBIT preceding quarter', 'Interest preceding quarter', 'Profit before tax preceding quarter', 'Tax preceding quarter', 'Profit after tax preceding quarter', 'Extraordinary items preceding quarter', 'Net Profit preceding quarter', 'OPM preceding quarter', 'NPM preceding quarter', 'Equity Capital preceding quarter', 'EPS preceding quarter', 'Book value preceding year', 'Return on capital employed preceding year', 'Return on assets preceding year', 'EPS preceding year', 'Return on equity preceding year', 'Debt preceding year', 'Sales preceding 12months', 'Net profit preceding 12months', 'Working capital preceding year', 'Number of Shareholders preceding quarter', 'Net block preceding year', 'Gross block preceding year', 'Capital work in progress preceding year', 'Sales growth 3Years', 'Sales growth 5Years', 'Profit growth 3Years', 'Profit growth 5Years', 'Average return on equity 5Years', 'Average return on equity 3Years', 'Return over 1year', 'Return over 3years', 'Return over 5years', 'Number of equity shares 10years back', 'Free cash flow 3years', 'Free cash flow 5years', 'Free cash flow 7years', 'Free cash flow 10years', 'Sales preceding year quarter', 'Operating profit preceding year quarter', 'Other income preceding year quarter', 'EBIDT preceding year quarter', 'Depreciation preceding year quarter', 'EBIT preceding year quarter', 'Interest preceding year quarter', 'Profit before tax preceding year quarter', 'Tax preceding year quarter', 'Profit after tax preceding year quarter', 'Extraordinary items preceding year quarter', 'Net Profit preceding year quarter', 'OPM preceding year quarter', 'NPM preceding year quarter', 'Equity Capital preceding year quarter', 'EPS preceding year quarter', 'Book value 3years back', 'Book value 5years back', 'Book value 10years back', 'Inventory turnover ratio 3Years back', 'Inventory turnover ratio 5Years back', 'Inventory turnover ratio 7Years back', 'Inventory turnover ratio 10Years back', 'Sales growth 10years median', 'Sales growth 5years median', 'Sales growth 7Years', 'Sales growth 10Years', 'EBIDT growth 3Years', 'EBIDT growth 5Years', 'EBIDT growth 7Years', 'EBIDT growth 10Years', 'EPS growth 3Years', 'EPS growth 5Years', 'EPS growth 7Years', 'EPS growth 10Years', 'Profit growth 7Years', 'Profit growth 10Years', 'Exports percentage 3Years back', 'Exports percentage 5Years back', 'Average 5years dividend', 'Average return on capital employed 3Years', 'Average return on capital employed 5Years', 'Average return on capital employed 7Years', 'Average return on capital employed 10Years', 'Average return on equity 10Years', 'Average return on equity 7Years', 'Return on equity 5years growth', 'Operating cash flow 3years', 'Operating cash flow 5years', 'Operating cash flow 7years', 'Operating cash flow 10years', 'Investing cash flow 10years', 'Investing cash flow 7years', 'Investing cash flow 5years', 'Investing cash flow 3years', 'OPM 5Year', 'OPM 10Year', 'Working capital 3Years back', 'Working capital 5Years back', 'Working capital 7Years back', 'Working capital 10Years back', 'Debt 3Years back', 'Debt 5Years back', 'Debt 7Years back', 'Debt 10Years back', 'Number of Shareholders 1year back', 'Change in promoter holding 3Years', 'Average dividend payout 3years', 'Net block 3Years back', 'Net block 5Years back', 'Net block 7Years back', 'Cash 3Years back', 'Cash 5Years back', 'Cash 7Years back', 'Average debtor days 3years', 'Debtor days 3years back', 'Debtor days 5years back', 'Return on assets 5years', 'Return on assets 3years', 'Historical PE 3Years', 'Historical PE 10Years', 'Historical PE 7Years', 'Historical PE 5Years', 'Volume 1year average', 'Average Earnings 5Year', 'Average Earnings 10Year', 'Average EBIT 5Year', 'Average EBIT 10Year', 'Market Capitalization 3years back', 'Market Capitalization 5years back', 'Market Capitalization 7years back', 'Market Capitalization 10years back', 'Average Working Capital Days 3years', 'Return over 7years', 'Return over 10years', 'Change in FII holding 3Years', 'Change in DII holding 3Years']
         super().__init__(headers=headers)
         if username and password:
-            login_session = self.session.get(url=f'{self.base_url}/login/', headers=self.headers)
-            soup = BeautifulSoup(login_session.text, 'html.parser')
-            self._csrf_token = soup.find('input', {'name': 'csrfmiddlewaretoken'})['value']
-            print("CSRF Token fetched successfully", self._csrf_token)
-
-            payload = {
-                'username': self._username,
-                'password': self._password,
-                'csrfmiddlewaretoken': self._csrf_token
-            }
-            login = self.session.post(f'{self.base_url}/login/', data=payload, headers=self.headers)
-            if login.status_code == 200:
-                login_soup = BeautifulSoup(login.text, 'html.parser')
-                self._login_csrf_token = login_soup.find('input', {'name': 'csrfmiddlewaretoken'})['value']
-                error_message = login_soup.find('ul', class_='errorlist nonfield')
-                if error_message:
-                    print("Error during login:", error_message.text.strip())
-                elif not self._login_csrf_token:
-                    print("Login failed: CSRF token is missing after login.")
-                else:
-                    print("Login successful! ", self._login_csrf_token)
-                    
+            # logs in lazily before the first request to screener
+            self.add_primer('screener.in', self._login)
+
+    def _login(self) -> None:
+        """
+        Logs in to Screener with the credentials passed to the constructor and keeps the CSRF tokens of the session.
 
+        :return: None
+        """
+        login_session = self.hit_and_get_response(f'{self.base_url}/login/')
+        soup = BeautifulSoup(login_session.text, 'html.parser')
+        self._csrf_token = soup.find('input', {'name': 'csrfmiddlewaretoken'})['value']
+        print("CSRF Token fetched successfully", self._csrf_token)
+
+        payload = {
+            'username': self._username,
+            'password': self._password,
+            'csrfmiddlewaretoken': self._csrf_token
+        }
+        login = self.post_and_get_response(f'{self.base_url}/login/', data=payload)
+        if login.status_code == 200:
+            login_soup = BeautifulSoup(login.text, 'html.parser')
+            self._login_csrf_token = login_soup.find('input', {'name': 'csrfmiddlewaretoken'})['value']
+            error_message = login_soup.find('ul', class_='errorlist nonfield')
+            if error_message:
+                print("Error during login:", error_message.text.strip())
+            elif not self._login_csrf_token:
+                print("Login failed: CSRF token is missing after login.")
             else:
-                print("Login failed with status code:", login.status_code)
-    
+                print("Login successful! ", self._login_csrf_token)
+        else:
+            print("Login failed with status code:", login.status_code)
+
     def get_ticker(self, symbol_name: str) -> list:
         """
         Fetches the ticker symbol for a given company name from Screener.
@@ -112,16 +122,22 @@ class Screener(CustomSession):
 
         :return: The ticker symbol of the company.
         """
+        return self.run(self.get_ticker_operation(symbol_name))
+
+    def get_ticker_operation(self, symbol_name: str) -> Operation:
+        """
+        Sans-IO form of `get_ticker`.
+
+        :param symbol_name: The name of the company to fetch the ticker for (some prefix string to search).
+
+        :return: Operation of the company search api.
+        """
         params = {
             'q': symbol_name,
             'v' : 3,
             'fts': 1
         }
-        search_res = self.hit_and_get_data(
-            url=f'{self.base_url}/api/company/search/',
-            params=params
-        )
-        return search_res
+        return Operation(RequestSpec(f'{self.base_url}/api/company/search/', params=params), None)
     
     def get_company_textual_data(self, ticker: str) -> str:
         """
@@ -131,11 +147,12 @@ class Screener(CustomSession):
 
         :return: The textual data of the company.
         """
+        self._ensure_primed(self.base_url)
         if not self._login_csrf_token:
             raise Exception("Login failed. CSRF token is missing.")
         
         url = f'{self.base_url}/wiki/company/{ticker}/commentary/edit'
-        response = self.session.get(url, headers=self.headers)
+        response = self.hit_and_get_response(url)
         
         if response.status_code == 200 and self._login_csrf_token is not None:
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -160,17 +177,55 @@ class Screener(CustomSession):
         if table not in order:
             raise ValueError(f"Table '{table}' is not a valid table type. Valid options are: {order}")
         
-        response = self.session.get(self.base_url+ticker_url, headers=self.headers)
+        response = self.hit_and_get_response(self.base_url+ticker_url)
         soup = BeautifulSoup(response.text, 'html.parser')
         company_id = soup.find('div', {'id': 'company-info'})['data-company-id']
         if response.status_code == 200 and self._login_csrf_token is not None:
             dfs = pd.read_html(StringIO(response.text))
             return dfs[order.index(table)] if table != 'ALL' else dfs, company_id
         
-    def get_quarterly_results(self, ticker_url: str) -> pd.DataFrame:
+    def _get_schedules(self, company_id: str, extra_urls: list, consolidated: bool) -> dict:
+        """
+        Fetches the breakups of the expandable rows of a table concurrently and merges them in the order of the rows.
+
+        :param company_id: Screener id of the company.
+        :param extra_urls: List of url params (`parent` row and `section`) of every expandable row.
+        :param consolidated: Whether the breakups of the consolidated statements are required.
+
+        :return: A dict of breakup row name and its values.
+        """
+        url = f'{self.base_url}/api/company/{company_id}/schedules/'
+        if consolidated:
+            for param in extra_urls:
+                param['consolidated'] = True
+        results = self.fetch_many([{'url': url, 'params': param} for param in extra_urls])
+
+        expired = Deadline.expired()
+        if expired:
+            print('Deadline exceeded; returning the breakups fetched so far')
+        datapoints = dict()
+        for result in results:
+            if result.ok or not expired:
+                datapoints.update(self._result_data(result))
+        return datapoints
+
+    def get_quarterly_results(self, ticker_url: str, deadline: float = None) -> pd.DataFrame:
         """
         Fetches the quarterly results table for a given ticker URL.
 
+        :param ticker_url: The URL of the company's ticker page.
+        :param deadline: (optional) latency budget in seconds; once it is over the row breakups fetched so far are
+            returned along with the base table.
+
+        :return: A DataFrame containing the quarterly results table.
+        """
+        with Deadline(deadline):
+            return self._get_quarterly_results(ticker_url)
+
+    def _get_quarterly_results(self, ticker_url: str) -> pd.DataFrame:
+        """
+        Fetches the quarterly results table along with the breakups of its expandable rows.
+
         :param ticker_url: The URL of the company's ticker page.
 
         :return: A DataFrame containing the quarterly results table.
@@ -186,25 +241,7 @@ class Screener(CustomSession):
             if row_idx.endswith('+'):
                 extra_urls.append({'parent': row_idx.rstrip('+'), 'section': 'quarters'})
 
-        datapoints = dict()  
-        if consolidated:
-            for param in extra_urls:
-                param['consolidated'] = True
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        else:
-            for param in extra_urls:
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        
+        datapoints = self._get_schedules(company_id, extra_urls, consolidated)
         extra_df = pd.DataFrame.from_dict(datapoints, orient='index')
         extra_df.index.name = 'Unnamed: 0'
         df = pd.concat([base_df, extra_df], axis=0)
@@ -231,24 +268,7 @@ class Screener(CustomSession):
             if row_idx.endswith('+'):
                 extra_urls.append({'parent': row_idx.rstrip('+'), 'section': 'profit-loss'})
 
-        datapoints = dict()
-        if consolidated:
-            for param in extra_urls:
-                param['consolidated'] = True
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        else:
-            for param in extra_urls:
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
+        datapoints = self._get_schedules(company_id, extra_urls, consolidated)
         extra_df = pd.DataFrame.from_dict(datapoints, orient='index')
         extra_df.index.name = 'Unnamed: 0'
         df = pd.concat([base_df, extra_df], axis=0)
@@ -276,24 +296,7 @@ class Screener(CustomSession):
             if row_idx.endswith('+'):
                 extra_urls.append({'parent': row_idx.rstrip('+'), 'section': 'balance-sheet'})
         
-        datapoints = dict()
-        if consolidated:
-            for param in extra_urls:
-                param['consolidated'] = True
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        else:
-            for param in extra_urls:
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
+        datapoints = self._get_schedules(company_id, extra_urls, consolidated)
         extra_df = pd.DataFrame.from_dict(datapoints, orient='index')
         extra_df.index.name = 'Unnamed: 0'
         df = pd.concat([base_df, extra_df], axis=0)
@@ -321,25 +324,7 @@ class Screener(CustomSession):
             if row_idx.endswith('+'):
                 extra_urls.append({'parent': row_idx.rstrip('+'), 'section': 'cash-flow'})
         
-        datapoints = dict()
-        if consolidated:
-            for param in extra_urls:
-                param['consolidated'] = True
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        else:
-            for param in extra_urls:
-                url = f'{self.base_url}/api/company/{company_id}/schedules/'
-                extra_data = self.hit_and_get_data(
-                    url=url,
-                    params=param
-                )
-                datapoints.update(extra_data)
-        
+        datapoints = self._get_schedules(company_id, extra_urls, consolidated)
         extra_df = pd.DataFrame.from_dict(datapoints, orient='index')
         extra_df.index.name = 'Unnamed: 0'
         df = pd.concat([base_df, extra_df], axis=0)
@@ -377,11 +362,11 @@ class Screener(CustomSession):
         
         entities = ['promoters', 'public', 'foreign_institutions', 'domestic_institutions', 'government']
 
+        results = self.fetch_many([f'{self.base_url}/api/3/{company_id}/investors/{entity}/quarterly/'
+                                   for entity in entities])
         datapoints = dict()
-        for entity in entities:
-            url = f'{self.base_url}/api/3/{company_id}/investors/{entity}/quarterly/'
-            extra_data = self.hit_and_get_data(url=url)
-            datapoints.update(extra_data)
+        for result in results:
+            datapoints.update(self._result_data(result))
         extra_df = pd.DataFrame.from_dict(datapoints, orient='index')
         extra_df.index.name = 'Unnamed: 0'
         df = pd.concat([base_df, extra_df], axis=0)
@@ -396,14 +381,11 @@ class Screener(CustomSession):
 
         :return: A DataFrame containing the peers comparison table.
         """
-        response = self.session.get(self.base_url+ticker_url, headers=self.headers)
+        response = self.hit_and_get_response(self.base_url+ticker_url)
         soup = BeautifulSoup(response.text, 'html.parser')
         company_id = soup.find('div', {'id': 'company-info'})['data-warehouse-id']
 
-        peers_html = self.session.get(
-            url=f'{self.base_url}/api/company/{company_id}/peers/',
-            headers=self.headers
-        )
+        peers_html = self.hit_and_get_response(f'{self.base_url}/api/company/{company_id}/peers/')
         if peers_html.status_code == 200:
             dfs = pd.read_html(StringIO(peers_html.text))
             if dfs:
@@ -422,21 +404,55 @@ class Screener(CustomSession):
 
         :return: A DataFrame containing the chart data.
         """
-        valid_on_options = ['Price-DMA50-DMA200-Volume', 'Price to Earning-Median PE-EPS', 'GPM-OPM-NPM-Quarter Sales', 'EV Multiple-Median EV Multiple-EBITDA', 'Price to book value-Median PBV-Book value', 'Market Cap to Sales-Median Market Cap to Sales-Sales']
-        if on not in valid_on_options:
-            raise ValueError(f"Invalid 'on' option. Valid options are: {valid_on_options}")
+        self._validate_chart_on(on)
 
         _, company_id = self.get_base_tables(ticker_url, 'Stock Price CAGR')
 
+        return self.run(self.get_chart_data_operation(company_id, days, on, 'consolidated' in ticker_url))
+
+    def get_chart_data_operation(self, company_id: str, days=365, on='Price-DMA50-DMA200-Volume',
+                                 consolidated: bool = False) -> Operation:
+        """
+        Sans-IO form of `get_chart_data`, it takes the Screener id of the company (the second item returned by
+        `get_base_tables`) instead of the ticker URL.
+
+        :param company_id: Screener id of the company.
+        :param days: The number of days for which to fetch the chart data (default is 365).
+        :param on: The type of chart data to fetch (default is 'Price-DMA50-DMA200-Volume').
+        :param consolidated: Whether the chart of the consolidated figures is required.
+
+        :return: Operation of the company chart api.
+        """
+        self._validate_chart_on(on)
+
         params = {'q': on, 'days': days}
-        if 'consolidated' in ticker_url:
+        if consolidated:
             params['consolidated'] = True
+        return Operation(RequestSpec(f'{self.base_url}/api/company/{company_id}/chart/', params=params),
+                         self._chart_data_to_df)
+
+    @staticmethod
+    def _validate_chart_on(on: str) -> None:
+        """
+        Checks the type of chart data, an invalid one raises ValueError.
+
+        :param on: The type of chart data to fetch.
+
+        :return: None
+        """
+        valid_on_options = ['Price-DMA50-DMA200-Volume', 'Price to Earning-Median PE-EPS', 'GPM-OPM-NPM-Quarter Sales', 'EV Multiple-Median EV Multiple-EBITDA', 'Price to book value-Median PBV-Book value', 'Market Cap to Sales-Median Market Cap to Sales-Sales']
+        if on not in valid_on_options:
+            raise ValueError(f"Invalid 'on' option. Valid options are: {valid_on_options}")
+
+    @staticmethod
+    def _chart_data_to_df(chart_data: dict) -> pd.DataFrame:
+        """
+        Converts the datasets of the company chart api response into a DataFrame with a column per metric.
 
-        chart_data = self.hit_and_get_data(
-            url=f'{self.base_url}/api/company/{company_id}/chart/',
-            params=params
-        )
+        :param chart_data: Parsed response of the api.
 
+        :return: A DataFrame containing the chart data, the datasets as they are when they can't be merged.
+        """
         chart_data = chart_data.get('datasets', [])
         processed_data = {}
         for item in chart_data:
@@ -457,8 +473,26 @@ class Screener(CustomSession):
 
         :return: A list of screens.
         """
-        response = self.session.get(f'{self.base_url}/explore', headers=self.headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self.run(self.get_screens_operation())
+
+    def get_screens_operation(self) -> Operation:
+        """
+        Sans-IO form of `get_screens`.
+
+        :return: Operation of the explore page.
+        """
+        return Operation(RequestSpec(f'{self.base_url}/explore', kind='content'), self._parse_screens)
+
+    @staticmethod
+    def _parse_screens(content: bytes) -> dict:
+        """
+        Picks the screens and their URLs from the explore page.
+
+        :param content: Body of the page.
+
+        :return: A dict of screen name and its URL.
+        """
+        soup = BeautifulSoup(content, 'html.parser')
         screens_tags = soup.find_all('a', class_='screen-item')
         screens = {}
         for tag in screens_tags:
@@ -475,8 +509,28 @@ class Screener(CustomSession):
 
         :return: The query string used in the screen.
         """
-        response = self.session.get(f'{self.base_url}{screen_url}', headers=self.headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self.run(self.get_query_from_pre_screens_feed_operation(screen_url))
+
+    def get_query_from_pre_screens_feed_operation(self, screen_url: str) -> Operation:
+        """
+        Sans-IO form of `get_query_from_pre_screens_feed`.
+
+        :param screen_url: The URL of the pre-defined screen.
+
+        :return: Operation of the screen page.
+        """
+        return Operation(RequestSpec(f'{self.base_url}{screen_url}', kind='content'), self._parse_screen_query)
+
+    @staticmethod
+    def _parse_screen_query(content: bytes) -> str:
+        """
+        Picks the query of a screen from its page.
+
+        :param content: Body of the page.
+
+        :return: The query string used in the screen.
+        """
+        soup = BeautifulSoup(content, 'html.parser')
         query_tag = soup.find('textarea', {'name': 'query'})
         if query_tag:
             return query_tag.text.strip()
@@ -492,14 +546,17 @@ class Screener(CustomSession):
         :return: A DataFrame containing the data from the screen query.
         """
         if len(columns) > 0:
-            response = self.session.post(
+            self._ensure_primed(self.base_url)
+            response = self.post_and_get_response(
                 f'{self.base_url}/user/columns/',
-                json={'csrfmiddlewaretoken': self._login_csrf_token,'data': columns},
+                json_data={'csrfmiddlewaretoken': self._login_csrf_token,'data': columns},
+                headers={}
             )
             soup = BeautifulSoup(response.text, 'html.parser')
             error = soup.find('li', class_='manage-columns error')
             if error:
-                raise ValueError(f"Error: setting columns requires Premium Account: {error.text.strip().replace('\n', ' ')}")
+                error_text = error.text.strip().replace('\n', ' ')
+                raise ValueError(f"Error: setting columns requires Premium Account: {error_text}")
             else:
                 print("Columns set successfully.")
 
@@ -508,7 +565,7 @@ class Screener(CustomSession):
         while pg:
             params = {'sort': '', 'order': '', 'query': query, 'page': pg, 'limit': 50}
             try:
-                response = self.session.get(f'{self.base_url}/screen/raw', params=params, headers=self.headers)
+                response = self.hit_and_get_response(f'{self.base_url}/screen/raw', params=params)
                 temp_df = pd.read_html(StringIO(response.text))
             except Exception as e:
                 print(f"Error fetching data for page {pg}: {e}")
@@ -522,7 +579,6 @@ class Screener(CustomSession):
             else:
                 print("No data found for the given query.")
                 break
-            sleep(5)  # To avoid hitting the server too hard
             pg += 1
         try:
             df = df[df['S.No.'] != 'S.No.']
@@ -537,8 +593,26 @@ class Screener(CustomSession):
 
         :return: A list of industries.
         """
-        response = self.session.get(f'{self.base_url}/market/', headers=self.headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self.run(self.get_all_industries_operation())
+
+    def get_all_industries_operation(self) -> Operation:
+        """
+        Sans-IO form of `get_all_industries`.
+
+        :return: Operation of the market page.
+        """
+        return Operation(RequestSpec(f'{self.base_url}/market/', kind='content'), self._industries_to_df)
+
+    @staticmethod
+    def _industries_to_df(content: bytes) -> pd.DataFrame:
+        """
+        Reads the industries table of the market page along with the URL of every industry.
+
+        :param content: Body of the page.
+
+        :return: A DataFrame of the industries indexed on the industry name.
+        """
+        soup = BeautifulSoup(content, 'html.parser')
 
         links_map = {}
         for tag in soup.find_all('a', {'class': 'font-weight-500'}):
@@ -546,7 +620,7 @@ class Screener(CustomSession):
                 links_map[tag.text.strip()] = tag.get('href')
         industries_df = pd.DataFrame.from_dict(links_map, orient='index', columns=['URL'])
         
-        df = pd.read_html(StringIO(response.text))
+        df = pd.read_html(StringIO(content.decode('utf-8', errors='replace')))
         if df:
             df = df[0]
             df = df.set_index('Industry')
@@ -565,7 +639,7 @@ class Screener(CustomSession):
 
         :return: A DataFrame containing the industry data.
         """
-        response = self.session.get(f'{self.base_url}{industry_url}', headers=self.headers)
+        response = self.hit_and_get_response(f'{self.base_url}{industry_url}')
         tables = pd.read_html(StringIO(response.text))
         if tables:
             df = tables[0]
@@ -581,7 +655,7 @@ class Screener(CustomSession):
         print('Fetching Pages ... 1.', end="\t")
         while page <= last_page:
             try:
-                response = self.session.get(f'{self.base_url}{industry_url}', headers=self.headers, params={'page': page})
+                response = self.hit_and_get_response(f'{self.base_url}{industry_url}', params={'page': page})
                 tables = pd.read_html(StringIO(response.text))
             except Exception as e:
                 print(f"Error fetching data for page {page}: {e}")
@@ -596,7 +670,6 @@ class Screener(CustomSession):
                     break
             else:
                 break
-            sleep(5)
             print(f"{page}.", end="\t")
             page += 1
         print("Done")
@@ -616,8 +689,28 @@ class Screener(CustomSession):
 
         :return: The CoCalls link for the company.
         """
-        response = self.session.get(self.base_url+ticker_url, headers=self.headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return self.run(self.get_cocalls_link_operation(ticker_url))
+
+    def get_cocalls_link_operation(self, ticker_url: str) -> Operation:
+        """
+        Sans-IO form of `get_cocalls_link`.
+
+        :param ticker_url: The URL of the company's ticker page.
+
+        :return: Operation of the company page.
+        """
+        return Operation(RequestSpec(self.base_url+ticker_url, kind='content'), self._cocalls_to_df)
+
+    @staticmethod
+    def _cocalls_to_df(content: bytes) -> pd.DataFrame:
+        """
+        Picks the links of the concalls (transcript, notes, presentation and recording) from the company page.
+
+        :param content: Body of the page.
+
+        :return: A DataFrame of the links indexed on the concall name.
+        """
+        soup = BeautifulSoup(content, 'html.parser')
         concalls = {}
         for tag in soup.findAll('li', {'class': 'flex flex-gap-8 flex-wrap'}):
             name = tag.find('div', {'class': 'ink-600 font-size-15 font-weight-500 nowrap'})
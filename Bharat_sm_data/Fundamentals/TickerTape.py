@@ -4,7 +4,7 @@ import pandas as pd
 import pydash as _
 from bs4 import BeautifulSoup
 
-from Base import CustomSession
+from Base import CustomSession, Operation, RequestSpec
 
 
 class Tickertape(CustomSession):
@@ -28,8 +28,13 @@ class Tickertape(CustomSession):
             get_score_card : Get the scorecard for a given ticker
             get_share_holding_pattern : Get the share holding pattern for a given ticker
             get_mutual_fund_holdings : Get the mutual fund holdings for a given ticker
+            async_* : Coroutine variants of the index constituents, financials, peers and score card functions
+            *_operation : Sans-IO form of the single request functions (e.g. `get_income_data_operation`), an
+            `Operation` with the request spec and the pure parser of the response
     """
 
+    session_family = 'tickertape.in'
+
     def __init__(self, custom_headers: dict=None, custom_cookies: dict=None) -> None:
         """
             The __init__ function is called when the class is instantiated.
@@ -43,7 +48,7 @@ class Tickertape(CustomSession):
 
             :return: The session and headers
         """
-        self.headers = {
+        headers = {
             'Accept': 'application/json, text/plain, */*',
             'Referer': '',
             'accept-version': '7.9.0',
@@ -51,11 +56,14 @@ class Tickertape(CustomSession):
                           'Chrome/108.0.0.0 Safari/537.36'
         }
         if custom_headers:
-            self.headers.update(custom_headers)
+            headers.update(custom_headers)
 
-        super().__init__(headers=self.headers)
         if custom_cookies:
-            self.session.cookies.update(self.cookies)
+            # the cookies of the caller are not shared with the other Tickertape clients
+            self.session_family = None
+        super().__init__(headers=headers)
+        if custom_cookies:
+            self.session.cookies.update(custom_cookies)
         self._base_url = 'https://api.tickertape.in'
         self.valid_horizons = ['interim', 'annual']
         self.valid_search_places = ['stock', 'index', 'etf', 'mutualfund', 'space', 'profile', 'smallcase']
@@ -75,6 +83,17 @@ class Tickertape(CustomSession):
             :param search_place: Specify the type of search you want to perform
             :return: A tuple with the first hit and all hits
         """
+        return self.run(self.get_ticker_operation(hint, search_place))
+
+    def get_ticker_operation(self, hint, search_place='all') -> Operation:
+        """
+            Sans-IO form of `get_ticker`.
+
+            :param self: Represent the instance of the class
+            :param hint: Search for the ticker
+            :param search_place: Specify the type of search you want to perform
+            :return: Operation of the `search` api
+        """
         if search_place == 'all':
             search_place = ','.join(self.valid_search_places)
         elif search_place not in self.valid_search_places:
@@ -88,7 +107,18 @@ class Tickertape(CustomSession):
 
         }
 
-        response = self.hit_and_get_data(f"{self._base_url}/search", params=params)
+        return Operation(RequestSpec(f"{self._base_url}/search", params=params), self._parse_search)
+
+    @staticmethod
+    def _parse_search(response: dict) -> tuple:
+        """
+            Picks the first hit and all the hits of the `search` api response.
+
+            :param response: Parsed response of the api
+
+            :return: A tuple with the first hit and all hits
+        """
+
         raw = _.get(response, 'data.items', {})
         first_hit = raw[0].get('sid', '')
         return first_hit, raw
@@ -121,8 +151,30 @@ class Tickertape(CustomSession):
             :return: A list of tickers
         """
 
+        return self.run(self.get_all_nifty_50_ticker_operation())
+
+    def get_all_nifty_50_ticker_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_all_nifty_50_ticker`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `indices/constituents` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/indices/constituents/.NSEI'), self._constituent_tickers)
+
+    @staticmethod
+    def _constituent_tickers(response: dict) -> list:
+        """
+            Picks the tickers of the constituents from the `indices/constituents` api response.
+
+            :param response: Parsed response of the api
+
+            :return: A list of tickers
+        """
+
         tickertape_tickers = []
-        response = self.hit_and_get_data(f'{self._base_url}/indices/constituents/.NSEI')
         for tick in response['data']['constituents']:
             tickertape_tickers.append(tick['sid'])
         return tickertape_tickers
@@ -137,9 +189,31 @@ class Tickertape(CustomSession):
             :return: A list of tickers
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/indices/constituents/{index}')
-        df = pd.DataFrame(response.get('data', {}).get('constituents', []))
-        return df
+        return self.run(self.get_all_constituents_of_index_operation(index))
+
+    def get_all_constituents_of_index_operation(self, index: str) -> Operation:
+        """
+            Sans-IO form of `get_all_constituents_of_index`.
+
+            :param self: Represents the instance of the class
+            :param index: The index name; for example .NSEI (nifty 50), .NIFTY500 (nifty 500)
+
+            :return: Operation of the `indices/constituents` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/indices/constituents/{index}'), self._constituents_to_df)
+
+    @staticmethod
+    def _constituents_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the constituents of the `indices/constituents` api response into a DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: A DataFrame of the constituents
+        """
+
+        return pd.DataFrame(response.get('data', {}).get('constituents', []))
 
     # ----------------------------------------------------------------------------------------------------------------
     # Annual Report/ Quarterly Results extracted data
@@ -158,19 +232,62 @@ class Tickertape(CustomSession):
             :return: The DataFrame containing income data
         """
 
-        if time_horizon not in self.valid_horizons:
-            print(f'Error You have passed wrong time horizon, valid horizons are : {self.valid_horizons}')
+        try:
+            operation = self.get_income_data_operation(ticker, time_horizon, num_time_periods, view_type)
+        except ValueError as err:
+            print(f'Error {err}')
             return pd.DataFrame()
+        return self.run(operation)
+
+    def get_income_data_operation(self, ticker: str, time_horizon: str = 'interim', num_time_periods: int = 10,
+                                  view_type: str = 'normal') -> Operation:
+        """
+            Sans-IO form of `get_income_data`, a wrong time horizon or view type raises ValueError.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param time_horizon: The time horizon of the income data (interim / annual). Defaults to 'interim'
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param view_type: The view type of the income data (normal / growth). Defaults to 'normal'.
+
+            :return: Operation of the `stocks/financials/income` api
+        """
+
+        if time_horizon not in self.valid_horizons:
+            raise ValueError(f'You have passed wrong time horizon, valid horizons are : {self.valid_horizons}')
 
         if view_type not in ['normal', 'growth', 'margin']:
-            print(f"Error You have passed wrong view type, valid view types are : {['normal', 'growth', 'margin']}")
-            return pd.DataFrame()
+            raise ValueError(f"You have passed wrong view type, valid view types are : "
+                             f"{['normal', 'growth', 'margin']}")
 
         params = {'count' : num_time_periods}
-        response = self.hit_and_get_data(
-            f'{self._base_url}/stocks/financials/income/{ticker}/{time_horizon}/{view_type}', params=params)
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return Operation(RequestSpec(f'{self._base_url}/stocks/financials/income/{ticker}/{time_horizon}/{view_type}',
+                                     params=params),
+                         self._data_to_df)
+
+    @staticmethod
+    def _data_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the `data` list of an api response into a DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: A DataFrame of the records of the response
+        """
+
+        return pd.DataFrame(response.get('data', []))
+
+    @staticmethod
+    def _normalized_data_to_df(response: dict) -> pd.DataFrame:
+        """
+            Flattens the `data` list of an api response into a DataFrame.
+
+            :param response: Parsed response of the api
+
+            :return: A DataFrame of the flattened records of the response
+        """
+
+        return pd.DataFrame(pd.json_normalize(response.get('data', []), sep='_'))
 
     def get_balance_sheet_data(self, ticker: str, num_time_periods: int = 10, growth: bool = False) -> pd.DataFrame:
         """
@@ -184,16 +301,46 @@ class Tickertape(CustomSession):
             :return: The DataFrame containing balance sheet data
         """
 
+        return self.run(self.get_balance_sheet_data_operation(ticker, num_time_periods, growth))
+
+    def get_balance_sheet_data_operation(self, ticker: str, num_time_periods: int = 10,
+                                         growth: bool = False) -> Operation:
+        """
+            Sans-IO form of `get_balance_sheet_data`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param growth: Boolean flag tell the report is normal type or growth type.
+
+            :return: Operation of the `stocks/financials/balancesheet` api
+        """
+
+        return self._annual_financials_operation('balancesheet', ticker, num_time_periods, growth)
+
+    def _annual_financials_operation(self, statement: str, ticker: str, num_time_periods: int,
+                                     growth: bool) -> Operation:
+        """
+            Builds the operation of the annual financial statement of a ticker.
+
+            :param self: Represents the instance of the class
+            :param statement: `balancesheet` or `cashflow`
+            :param ticker: The ticker symbol of the stock
+            :param num_time_periods: The number of time periods to retrieve
+            :param growth: Boolean flag tell the report is normal type or growth type.
+
+            :return: Operation of the `stocks/financials` api
+        """
+
         if growth:
             growth_type = 'growth'
         else:
             growth_type = 'normal'
 
         params = {'count': num_time_periods}
-        response = self.hit_and_get_data(
-            f'{self._base_url}/stocks/financials/balancesheet/{ticker}/annual/{growth_type}', params=params)
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return Operation(RequestSpec(f'{self._base_url}/stocks/financials/{statement}/{ticker}/annual/{growth_type}',
+                                     params=params),
+                         self._data_to_df)
 
     def get_cash_flow_data(self, ticker: str, num_time_periods: int = 10, growth: bool = False) -> pd.DataFrame:
         """
@@ -207,16 +354,21 @@ class Tickertape(CustomSession):
             :return: The DataFrame containing cash flow data
         """
 
-        if growth:
-            growth_type = 'growth'
-        else:
-            growth_type = 'normal'
+        return self.run(self.get_cash_flow_data_operation(ticker, num_time_periods, growth))
 
-        params = {'count': num_time_periods}
-        response = self.hit_and_get_data(
-            f'{self._base_url}/stocks/financials/cashflow/{ticker}/annual/{growth_type}', params=params)
-        df = pd.DataFrame(response.get('data', []))
-        return df
+    def get_cash_flow_data_operation(self, ticker: str, num_time_periods: int = 10, growth: bool = False) -> Operation:
+        """
+            Sans-IO form of `get_cash_flow_data`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param growth: Boolean flag tell the report is normal type or growth type.
+
+            :return: Operation of the `stocks/financials/cashflow` api
+        """
+
+        return self._annual_financials_operation('cashflow', ticker, num_time_periods, growth)
 
     # ----------------------------------------------------------------------------------------------------------------
     # Peer Comparisons
@@ -232,13 +384,25 @@ class Tickertape(CustomSession):
             :return: The DataFrame containing the peers comparison result
         """
 
+        return self.run(self.peers_comparison_operation(ticker, comparison_type))
+
+    def peers_comparison_operation(self, ticker: str, comparison_type: str = 'valuation') -> Operation:
+        """
+            Sans-IO form of `peers_comparison`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param comparison_type: Type of comparison (valuation/technical). Defaults to 'valuation'.
+
+            :return: Operation of the `stocks/peers` api
+        """
+
         comparison_type = comparison_type.lower()
         params = {
             'tab': comparison_type
         }
-        response = self.hit_and_get_data(f'{self._base_url}/stocks/peers/{ticker}', params=params)
-        df = pd.DataFrame(pd.json_normalize(response.get('data', []), sep='_'))
-        return df
+        return Operation(RequestSpec(f'{self._base_url}/stocks/peers/{ticker}', params=params),
+                         self._normalized_data_to_df)
 
     # ----------------------------------------------------------------------------------------------------------------
     # TickerTape Score cards
@@ -253,13 +417,52 @@ class Tickertape(CustomSession):
             :return: The DataFrame contains all key flags like valuation, technical, growth red flags, etc.
         """
 
-        response = self.hit_and_get_data(f'https://analyze.api.tickertape.in/stocks/scorecard/{ticker}')
-        df = pd.DataFrame(pd.json_normalize(response.get('data', []), sep='_'))
-        return df
+        return self.run(self.get_score_card_operation(ticker))
+
+    def get_score_card_operation(self, ticker) -> Operation:
+        """
+            Sans-IO form of `get_score_card`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+
+            :return: Operation of the `stocks/scorecard` api
+        """
+
+        return Operation(RequestSpec(f'https://analyze.api.tickertape.in/stocks/scorecard/{ticker}'),
+                         self._normalized_data_to_df)
 
     # ----------------------------------------------------------------------------------------------------------------
     # Share Holding Patterns
 
+    def _stock_page_operation(self, stock_slug_endpoint: str, parse) -> Operation:
+        """
+            Builds the operation of a stock page of the website, its data is read from the page.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: Slug of the stock page, e.g. `stocks/hdfc-bank-HDBK`
+            :param parse: Parser of the body of the page
+
+            :return: Operation of the stock page
+        """
+
+        return Operation(RequestSpec(f'https://www.tickertape.in/{stock_slug_endpoint}', headers={}, kind='content'),
+                         parse)
+
+    @staticmethod
+    def _next_data(content: bytes) -> dict:
+        """
+            Reads the `__NEXT_DATA__` JSON which a page of the website is rendered from.
+
+            :param content: Body of the page
+
+            :return: Dict of the page data
+        """
+
+        soup = BeautifulSoup(content, features="html5lib")
+        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
+        return json.loads(sp_div.contents[0].text)
+
     def get_share_holding_pattern(self, stock_slug_endpoint: str) -> pd.DataFrame:
         """
             Get the share holding pattern for a given ticker.
@@ -273,10 +476,34 @@ class Tickertape(CustomSession):
             :return: The DataFrame contains the share holding pattern.
         """
 
-        response = self.session.get(f'https://www.tickertape.in/{stock_slug_endpoint}')
-        soup = BeautifulSoup(response.text, features="html5lib")
-        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
-        data = json.loads(sp_div.contents[0].text)
+        return self.run(self.get_share_holding_pattern_operation(stock_slug_endpoint))
+
+    def get_share_holding_pattern_operation(self, stock_slug_endpoint: str) -> Operation:
+        """
+            Sans-IO form of `get_share_holding_pattern`.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: It's the part of url expect base url which navigates to the
+                                        stock profile in the website. You can get this from search url raw data.
+                                        For example, if stock url is `https://www.tickertape.in/stocks/hdfc-bank-HDBK`
+                                        then `stocks/hdfc-bank-HDBK` is the slug url.
+
+            :return: Operation of the stock page
+        """
+
+        return self._stock_page_operation(stock_slug_endpoint, self._share_holding_to_df)
+
+    @staticmethod
+    def _share_holding_to_df(content: bytes) -> pd.DataFrame:
+        """
+            Extracts the share holding pattern from the stock page.
+
+            :param content: Body of the stock page
+
+            :return: The DataFrame contains the share holding pattern.
+        """
+
+        data = Tickertape._next_data(content)
         data = data.get('props').get('pageProps').get('securitySummary').get('holdings').get('holdings')
         df = pd.DataFrame(pd.json_normalize(data, sep='_'))
         return df
@@ -294,10 +521,34 @@ class Tickertape(CustomSession):
             :return: The DataFrame contains the mutual fund holdings.
         """
 
-        response = self.session.get(f'https://www.tickertape.in/{stock_slug_endpoint}')
-        soup = BeautifulSoup(response.text, features="html5lib")
-        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
-        data = json.loads(sp_div.contents[0].text)
+        return self.run(self.get_mutual_fund_holdings_operation(stock_slug_endpoint))
+
+    def get_mutual_fund_holdings_operation(self, stock_slug_endpoint: str) -> Operation:
+        """
+            Sans-IO form of `get_mutual_fund_holdings`.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: It's the part of url expect base url which navigates to the
+                                        stock profile in the website. You can get this from search url raw data.
+                                        For example, if stock url is `https://www.tickertape.in/stocks/hdfc-bank-HDBK`
+                                        then `stocks/hdfc-bank-HDBK` is the slug url.
+
+            :return: Operation of the stock page
+        """
+
+        return self._stock_page_operation(stock_slug_endpoint, self._mutual_fund_holdings_to_df)
+
+    @staticmethod
+    def _mutual_fund_holdings_to_df(content: bytes) -> pd.DataFrame:
+        """
+            Extracts the mutual fund holdings from the stock page.
+
+            :param content: Body of the stock page
+
+            :return: The DataFrame contains the mutual fund holdings.
+        """
+
+        data = Tickertape._next_data(content)
         data = data.get('props').get('pageProps').get('securitySummary').get('mfHoldings')
         df = pd.DataFrame(pd.json_normalize(data, sep='_'))
         return df
@@ -315,10 +566,34 @@ class Tickertape(CustomSession):
             :return: The DataFrame containing smallcase holdings for the given ticker
         """
 
-        response = self.session.get(f'https://www.tickertape.in/{stock_slug_endpoint}')
-        soup = BeautifulSoup(response.text, features="html5lib")
-        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
-        data = json.loads(sp_div.contents[0].text)
+        return self.run(self.get_smallcase_holdings_operation(stock_slug_endpoint))
+
+    def get_smallcase_holdings_operation(self, stock_slug_endpoint: str) -> Operation:
+        """
+            Sans-IO form of `get_smallcase_holdings`.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: It's the part of url expect base url which navigates to the
+                                        stock profile in the website. You can get this from search url raw data.
+                                        For example, if stock url is `https://www.tickertape.in/stocks/hdfc-bank-HDBK`
+                                        then `stocks/hdfc-bank-HDBK` is the slug url.
+
+            :return: Operation of the stock page
+        """
+
+        return self._stock_page_operation(stock_slug_endpoint, self._smallcase_holdings_to_df)
+
+    @staticmethod
+    def _smallcase_holdings_to_df(content: bytes) -> pd.DataFrame:
+        """
+            Extracts the smallcase holdings from the stock page.
+
+            :param content: Body of the stock page
+
+            :return: The DataFrame containing smallcase holdings
+        """
+
+        data = Tickertape._next_data(content)
         data = data.get('props').get('pageProps').get('securitySummary').get('smallcases')
         df = pd.DataFrame(data)
         return df
@@ -338,10 +613,34 @@ class Tickertape(CustomSession):
             :return: The DataFrame contains the dividend history
         """
 
-        response = self.session.get(f'https://www.tickertape.in/{stock_slug_endpoint}')
-        soup = BeautifulSoup(response.text, features="html5lib")
-        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
-        data = json.loads(sp_div.contents[0].text)
+        return self.run(self.get_dividends_history_operation(stock_slug_endpoint))
+
+    def get_dividends_history_operation(self, stock_slug_endpoint: str) -> Operation:
+        """
+            Sans-IO form of `get_dividends_history`.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: It's the part of url expect base url which navigates to the
+                                        stock profile in the website. You can get this from search url raw data.
+                                        For example, if stock url is `https://www.tickertape.in/stocks/hdfc-bank-HDBK`
+                                        then `stocks/hdfc-bank-HDBK` is the slug url.
+
+            :return: Operation of the stock page
+        """
+
+        return self._stock_page_operation(stock_slug_endpoint, self._dividends_history_to_df)
+
+    @staticmethod
+    def _dividends_history_to_df(content: bytes) -> pd.DataFrame:
+        """
+            Extracts the past and upcoming dividends from the stock page.
+
+            :param content: Body of the stock page
+
+            :return: The DataFrame contains the dividend history
+        """
+
+        data = Tickertape._next_data(content)
         data = data.get('props').get('pageProps').get('securitySummary').get('dividends')
         df = pd.DataFrame(data.get('past', []) + data.get('upcoming', []))
         return df
@@ -359,10 +658,34 @@ class Tickertape(CustomSession):
             :return: A transposed DataFrame containing the key ratios for the stock.
         """
 
-        response = self.session.get(f'https://www.tickertape.in/{stock_slug_endpoint}')
-        soup = BeautifulSoup(response.text, features="html5lib")
-        sp_div = soup.find('script', attrs={'id': '__NEXT_DATA__'})
-        data = json.loads(sp_div.contents[0].text)
+        return self.run(self.get_key_ratios_operation(stock_slug_endpoint))
+
+    def get_key_ratios_operation(self, stock_slug_endpoint: str) -> Operation:
+        """
+            Sans-IO form of `get_key_ratios`.
+
+            :param self: Represents the instance of the class
+            :param stock_slug_endpoint: It's the part of url expect base url which navigates to the
+                                        stock profile in the website. You can get this from search url raw data.
+                                        For example, if stock url is `https://www.tickertape.in/stocks/hdfc-bank-HDBK`
+                                        then `stocks/hdfc-bank-HDBK` is the slug url.
+
+            :return: Operation of the stock page
+        """
+
+        return self._stock_page_operation(stock_slug_endpoint, self._key_ratios_to_df)
+
+    @staticmethod
+    def _key_ratios_to_df(content: bytes) -> pd.DataFrame:
+        """
+            Extracts the key ratios from the stock page.
+
+            :param content: Body of the stock page
+
+            :return: A transposed DataFrame containing the key ratios for the stock.
+        """
+
+        data = Tickertape._next_data(content)
         data = data.get('props').get('pageProps').get('securityInfo').get('ratios')
         df = pd.DataFrame([data])
         return df.T
@@ -380,9 +703,110 @@ class Tickertape(CustomSession):
             :return: A DataFrame containing the ETF data.
         """
 
-        response = self.hit_and_get_data(f'{self._base_url}/indices/etfs/{index}')
-        df = pd.DataFrame(pd.json_normalize(response.get('data', []), sep='_'))
-        return df
+        return self.run(self.get_all_etfs_under_index_operation(index))
+
+    def get_all_etfs_under_index_operation(self, index: str) -> Operation:
+        """
+            Sans-IO form of `get_all_etfs_under_index`.
+
+            :param self: Represents the instance of the class
+            :param index: A valid index traded on Indian Exchange.
+
+            :return: Operation of the `indices/etfs` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/indices/etfs/{index}'), self._normalized_data_to_df)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Async variants - same as the above functions but run on the asyncio transport
+
+    async def async_get_all_constituents_of_index(self, index: str) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_all_constituents_of_index`.
+
+            :param self: Represents the instance of the class
+            :param index: The index name; for example .NSEI (nifty 50), .NIFTY500 (nifty 500)
+
+            :return: A DataFrame of the constituents
+        """
+
+        return await self.async_run(self.get_all_constituents_of_index_operation(index))
+
+    async def async_get_income_data(self, ticker: str, time_horizon: str = 'interim', num_time_periods: int = 10,
+                                    view_type: str = 'normal') -> pd.DataFrame:
+        """
+            Coroutine variant of `get_income_data`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param time_horizon: The time horizon of the income data (interim / annual). Defaults to 'interim'
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param view_type: The view type of the income data (normal / growth). Defaults to 'normal'.
+
+            :return: The DataFrame containing income data
+        """
+
+        try:
+            operation = self.get_income_data_operation(ticker, time_horizon, num_time_periods, view_type)
+        except ValueError as err:
+            print(f'Error {err}')
+            return pd.DataFrame()
+        return await self.async_run(operation)
+
+    async def async_get_balance_sheet_data(self, ticker: str, num_time_periods: int = 10,
+                                           growth: bool = False) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_balance_sheet_data`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param growth: Boolean flag tell the report is normal type or growth type.
+
+            :return: The DataFrame containing balance sheet data
+        """
+
+        return await self.async_run(self.get_balance_sheet_data_operation(ticker, num_time_periods, growth))
+
+    async def async_get_cash_flow_data(self, ticker: str, num_time_periods: int = 10,
+                                       growth: bool = False) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_cash_flow_data`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param num_time_periods: The number of time periods to retrieve. Default to 10.
+            :param growth: Boolean flag tell the report is normal type or growth type.
+
+            :return: The DataFrame containing cash flow data
+        """
+
+        return await self.async_run(self.get_cash_flow_data_operation(ticker, num_time_periods, growth))
+
+    async def async_peers_comparison(self, ticker: str, comparison_type: str = 'valuation') -> pd.DataFrame:
+        """
+            Coroutine variant of `peers_comparison`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+            :param comparison_type: Type of comparison (valuation/technical). Defaults to 'valuation'.
+
+            :return: The DataFrame containing the peers comparison result
+        """
+
+        return await self.async_run(self.peers_comparison_operation(ticker, comparison_type))
+
+    async def async_get_score_card(self, ticker) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_score_card`.
+
+            :param self: Represents the instance of the class
+            :param ticker: The ticker symbol of the stock
+
+            :return: The DataFrame contains all key flags like valuation, technical, growth red flags, etc.
+        """
+
+        return await self.async_run(self.get_score_card_operation(ticker))
 
     # ----------------------------------------------------------------------------------------------------------------_
     # Equity Research Filters
@@ -395,7 +819,27 @@ class Tickertape(CustomSession):
             :param self: Represent the instance of the class.
             :return: A dictionary of all the filters that can be used in the equity screener.
         """
-        response = self.hit_and_get_data(f'{self._base_url}/screener/filters')
+        return self.run(self.get_equity_screener_all_filters_operation())
+
+    def get_equity_screener_all_filters_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_equity_screener_all_filters`.
+
+            :param self: Represent the instance of the class.
+            :return: Operation of the `screener/filters` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/screener/filters'), self._parse_screener_filters)
+
+    @staticmethod
+    def _parse_screener_filters(response: dict) -> dict:
+        """
+            Maps the display name of the non premium filters of the `screener/filters` api response to their label.
+
+            :param response: Parsed response of the api
+            :return: A dictionary of all the filters that can be used in the equity screener.
+        """
+
         all_filters = {}
         for filters_type in response.get('data'):
             for fltr in response.get('data').get(filters_type):
@@ -444,8 +888,7 @@ class Tickertape(CustomSession):
                 'sids': [],
             }
 
-            response = self.session.post(f'{self._base_url}/screener/query', headers=self.headers,
-                                         json=json_data).json()
+            response = self.post_and_get_response(f'{self._base_url}/screener/query', json_data=json_data).json()
             df = pd.DataFrame(response.get('data').get('results'))
             if df.shape[1] == 0 or page * 20 > number_of_records:
                 break
@@ -1,6 +1,8 @@
+import asyncio
+
 import pandas as pd
 
-from Base import NSEBase
+from Base import Deadline, NSEBase, Operation, RequestSpec
 
 # constants
 
@@ -36,17 +38,24 @@ class NSE(NSEBase):
                 Returns:
                     A dataframe with information about all indices.
 
-            Get_trade_info(ticker)
+            Get_trade_info(ticker, deadline=None)
                 Retrieves trade information for a given ticker or list of tickers.
 
                 Args:
                     ticker: The ticker or list of tickers for which to retrieve trade information.
+                    deadline: Latency budget in seconds, the tickers fetched within it are returned.
 
                 Returns:
                     A dataframe with trade information.
 
             Get_corporate_disclosures(ticker)
                 Retrieves corporate disclosures
+
+            async_* : Coroutine variants of the index, trade info and corporate disclosures functions, the list of
+            tickers is fetched concurrently by them.
+
+            *_operation : Sans-IO form of the single request functions (e.g. `get_all_indices_operation`), an
+            `Operation` with the request spec and the parser of the response; the NSE pages are not warmed up by them.
     """
 
     def __init__(self) -> None:
@@ -61,7 +70,6 @@ class NSE(NSEBase):
         """
         super().__init__()
         self._base_url = 'https://www.nseindia.com'
-        self.hit_and_get_data(self._base_url)
 
 
     def get_important_reports(self) -> dict:
@@ -75,9 +83,19 @@ class NSE(NSEBase):
             :return: A dict of objects which will give links to various reports
         """
 
+        return self.run(self.get_important_reports_operation())
+
+    def get_important_reports_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_important_reports`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `merged-daily-reports` api
+        """
+
         params = {'key': 'favCapital'}
-        response = self.hit_and_get_data(f'{self._base_url}/api/merged-daily-reports', params=params)
-        return response
+        return Operation(RequestSpec(f'{self._base_url}/api/merged-daily-reports', params=params), None)
 
     def get_equities_data_from_index(self, index='SECURITIES IN F&O'):
         """
@@ -94,13 +112,36 @@ class NSE(NSEBase):
 
             :return: A dataframe with the following columns:
         """
-        # Set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/live-market-indices', params={'symbol': index})
+        self._warm_up(f'{self._base_url}/market-data/live-market-indices', params={'symbol': index})
+
+        return self.run(self.get_equities_data_from_index_operation(index))
+
+    def get_equities_data_from_index_operation(self, index='SECURITIES IN F&O') -> Operation:
+        """
+            Sans-IO form of `get_equities_data_from_index`.
+
+            :param self: Represent the instance of the class
+            :param index: Specify the index for which we want to get the data
+
+            :return: Operation of the `equity-stockIndices` api
+        """
 
         params = {
             'index': index.upper(),
         }
-        response = self.hit_and_get_data(f'{self._base_url}/api/equity-stockIndices', params=params)
+        return Operation(RequestSpec(f'{self._base_url}/api/equity-stockIndices', params=params),
+                         self._index_equities_to_df)
+
+    @staticmethod
+    def _index_equities_to_df(response: dict) -> pd.DataFrame:
+        """
+            Flattens the `equity-stockIndices` api response and drops the chart / meta flag columns.
+
+            :param response: Parsed response of the api
+
+            :return: A dataframe with the equities of the index
+        """
+
         df = pd.DataFrame(pd.json_normalize(response['data'], sep='_'))
         rm_cols = [x for x in df.columns.to_list() if x.startswith('chart') or x.startswith('meta_is')
                    or x.startswith('meta_tempSuspended') or x.startswith('meta_debtSeries')
@@ -116,21 +157,31 @@ class NSE(NSEBase):
 
             :return: A DataFrame of all indices traded on NSE
         """
-        # Set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/live-market-indices')
+        self._warm_up(f'{self._base_url}/market-data/live-market-indices')
 
-        response = self.hit_and_get_data("https://www.nseindia.com/api/allIndices")
-        df = pd.DataFrame(response.get('data', {}))
-        return df
+        return self.run(self.get_all_indices_operation())
+
+    def get_all_indices_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_all_indices`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `allIndices` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/allIndices'), self._data_to_df)
 
     # ----------------------------------------------------------------------------------------------------------------
     # Equity/ETF/SGB Related Data
-    def get_trade_info(self, ticker: list or str) -> pd.DataFrame:
+    def get_trade_info(self, ticker: list or str, deadline: float = None) -> pd.DataFrame:
         """
-            Get trade information for one or more ticker(s).
+            Get trade information for one or more ticker(s), the tickers are fetched concurrently.
 
             :param self: Represents the instance of the class
             :param ticker: this can a string represents single ticker ot list tickers.
+            :param deadline: (optional) latency budget in seconds for all the tickers; the tickers which could not be
+            fetched within it are left out
 
             :return: DataFrame containing the trade information for the given ticker(s).
         """
@@ -139,28 +190,44 @@ class NSE(NSEBase):
             tickers = [ticker]
         else:
             tickers = ticker
-        data = []
-        for ticker in tickers:
-            params = {
-                'symbol': ticker,
-            }
-            # set the cookies
-            self.hit_and_get_data(f'{self._base_url}/get-quotes/equity', params=params)
+        specs = []
+        for tick in tickers:
+            specs.extend(self._trade_info_specs(tick))
+        with Deadline(deadline):
+            if tickers:
+                self._warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': tickers[0]})
+            results = self.fetch_many(specs)
+            expired = Deadline.expired()
 
+        data = []
+        for i in range(len(tickers)):
             complete_equity_info = {}
-            for section in ['', 'trade_info']:
-                params['section'] = section
-                if section == '':
-                    del params['section']
-                response = self.hit_and_get_data(f'{self._base_url}/api/quote-equity', params=params)
-                complete_equity_info.update(response)
-            data.append(complete_equity_info)
+            for result in results[2 * i: 2 * i + 2]:
+                if result.ok or not expired:
+                    complete_equity_info.update(self._result_data(result))
+            if complete_equity_info or not expired:
+                data.append(complete_equity_info)
+        if expired:
+            print(f'Deadline exceeded; returning trade info of {len(data)} out of {len(tickers)} tickers')
         df = pd.DataFrame(pd.json_normalize(data, sep='_'))
         return df
 
+    def _trade_info_specs(self, ticker: str) -> tuple:
+        """
+            Builds the requests of the quote and the trade info sections of a single ticker.
+
+            :param self: Represents the instance of the class
+            :param ticker: Ticker / symbol of the equity
+
+            :return: A tuple of the `RequestSpec` of the quote and of the trade info
+        """
+
+        return (RequestSpec(f'{self._base_url}/api/quote-equity', params={'symbol': ticker}),
+                RequestSpec(f'{self._base_url}/api/quote-equity', params={'symbol': ticker, 'section': 'trade_info'}))
+
     def get_corporate_disclosures(self, ticker: list or str) -> dict:
         """
-            Get corporate disclosure data
+            Get corporate disclosure data, the tickers are fetched concurrently
 
             :param self: Represents the instance of the class
             :param ticker: this can a string represents single ticker ot list tickers.
@@ -172,18 +239,25 @@ class NSE(NSEBase):
             tickers = [ticker]
         else:
             tickers = ticker
-        data = {}
-        for ticker in tickers:
-            # set the cookies
-            self.hit_and_get_data(f'{self._base_url}/get-quotes/equity', params={'symbol': ticker})
-
-            params = {
-                'symbol': ticker,
-                'market': 'equities'
-            }
-            response = self.hit_and_get_data(f'{self._base_url}/api/top-corp-info', params=params)
-            data[ticker] = response
-        return data
+        if tickers:
+            self._warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': tickers[0]})
+
+        specs = [self._corporate_disclosures_operation(tick).spec for tick in tickers]
+        results = self.fetch_many(specs)
+        return {tick: self._result_data(result) for tick, result in zip(tickers, results)}
+
+    def _corporate_disclosures_operation(self, ticker: str) -> Operation:
+        """
+            Sans-IO form of the corporate disclosures of a single ticker.
+
+            :param self: Represents the instance of the class
+            :param ticker: Ticker / symbol of the equity
+
+            :return: Operation of the `top-corp-info` api
+        """
+
+        params = {'symbol': ticker, 'market': 'equities'}
+        return Operation(RequestSpec(f'{self._base_url}/api/top-corp-info', params=params), None)
 
     def get_sme_stocks(self):
         """
@@ -193,12 +267,20 @@ class NSE(NSEBase):
 
             :return: DataFrame containing SME Stocks data.
         """
-        # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/sme-market')
+        self._warm_up(f'{self._base_url}/market-data/sme-market')
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/live-analysis-emerge')
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return self.run(self.get_sme_stocks_operation())
+
+    def get_sme_stocks_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_sme_stocks`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `live-analysis-emerge` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/live-analysis-emerge'), self._data_to_df)
 
     def get_sgb_data(self):
         """
@@ -208,10 +290,31 @@ class NSE(NSEBase):
 
             :return: DataFrame containing the trade information for SGB.
         """
-        # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/sovereign-gold-bond')
+        self._warm_up(f'{self._base_url}/market-data/sovereign-gold-bond')
+
+        return self.run(self.get_sgb_data_operation())
+
+    def get_sgb_data_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_sgb_data`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `sovereign-gold-bonds` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/sovereign-gold-bonds'), self._data_without_meta_to_df)
+
+    @staticmethod
+    def _data_without_meta_to_df(response: dict) -> pd.DataFrame:
+        """
+            Converts the `data` list of an api response into a DataFrame without its `meta` column.
+
+            :param response: Parsed response of the api
+
+            :return: A DataFrame of the records of the response
+        """
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/sovereign-gold-bonds')
         df = pd.DataFrame(response.get('data', []))
         df.drop(columns=['meta'], inplace=True)
         return df
@@ -224,13 +327,20 @@ class NSE(NSEBase):
 
             :return: DataFrame containing data of all ETFs
         """
-        # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/exchange-traded-funds-etf')
+        self._warm_up(f'{self._base_url}/market-data/exchange-traded-funds-etf')
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/etf')
-        df = pd.DataFrame(response.get('data', []))
-        df.drop(columns=['meta'], inplace=True)
-        return df
+        return self.run(self.get_all_etf_operation())
+
+    def get_all_etf_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_all_etf`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `etf` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/etf'), self._data_without_meta_to_df)
 
     def get_all_today_block_deals(self):
         """
@@ -240,12 +350,20 @@ class NSE(NSEBase):
 
             :return: DataFrame containing block deals data.
         """
-        # set the cookies
-        self.hit_and_get_data(f'{self._base_url}/market-data/block-deal-watch')
+        self._warm_up(f'{self._base_url}/market-data/block-deal-watch')
 
-        response = self.hit_and_get_data(f'{self._base_url}/api/block-deal')
-        df = pd.DataFrame(response.get('data', []))
-        return df
+        return self.run(self.get_all_today_block_deals_operation())
+
+    def get_all_today_block_deals_operation(self) -> Operation:
+        """
+            Sans-IO form of `get_all_today_block_deals`.
+
+            :param self: Represents the instance of the class
+
+            :return: Operation of the `block-deal` api
+        """
+
+        return Operation(RequestSpec(f'{self._base_url}/api/block-deal'), self._data_to_df)
 
     def get_india_vix(self, interval: str) -> pd.DataFrame:
         """
@@ -263,4 +381,89 @@ class NSE(NSEBase):
         moneycontrol.get_india_vix(interval='1') # Only `1d` (for day interval) or `1`  (for minute interval) is supported
         """)    
         # return self.get_ohlc_data('INDIA VIX', timeframe=interval)
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # Async variants - same as the above functions but run on the asyncio transport
+
+    async def async_get_equities_data_from_index(self, index='SECURITIES IN F&O') -> pd.DataFrame:
+        """
+            Coroutine variant of `get_equities_data_from_index`.
+
+            :param self: Represent the instance of the class
+            :param index: Specify the index for which we want to get the data
+
+            :return: A dataframe with the equities of the index
+        """
+        await self._async_warm_up(f'{self._base_url}/market-data/live-market-indices', params={'symbol': index})
+
+        return await self.async_run(self.get_equities_data_from_index_operation(index))
+
+    async def async_get_all_indices(self) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_all_indices`.
+
+            :param self: Represents the instance of the class
+
+            :return: A DataFrame of all indices traded on NSE
+        """
+        await self._async_warm_up(f'{self._base_url}/market-data/live-market-indices')
+
+        return await self.async_run(self.get_all_indices_operation())
+
+    async def _async_get_single_trade_info(self, ticker: str) -> dict:
+        """
+            Fetches the quote and the trade info sections of a single ticker.
+
+            :param self: Represents the instance of the class
+            :param ticker: Ticker / symbol of the equity
+
+            :return: Merged quote and trade info of the ticker
+        """
+        await self._async_warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': ticker})
+
+        quote, trade_info = await asyncio.gather(*[self.async_run(Operation(spec, None))
+                                                   for spec in self._trade_info_specs(ticker)])
+        complete_equity_info = {}
+        complete_equity_info.update(quote)
+        complete_equity_info.update(trade_info)
+        return complete_equity_info
+
+    async def async_get_trade_info(self, ticker: list or str, deadline: float = None) -> pd.DataFrame:
+        """
+            Coroutine variant of `get_trade_info`, all the tickers are fetched concurrently.
+
+            :param self: Represents the instance of the class
+            :param ticker: this can a string represents single ticker ot list tickers.
+            :param deadline: (optional) latency budget in seconds for all the tickers; the tickers which could not be
+            fetched within it are left out
+
+            :return: DataFrame containing the trade information for the given ticker(s).
+        """
+
+        tickers = [ticker] if type(ticker) == str else ticker
+        with Deadline(deadline):
+            data = await asyncio.gather(*[self._async_get_single_trade_info(tick) for tick in tickers])
+            if Deadline.expired():
+                data = [info for info in data if info]
+                print(f'Deadline exceeded; returning trade info of {len(data)} out of {len(tickers)} tickers')
+        return pd.DataFrame(pd.json_normalize(list(data), sep='_'))
+
+    async def async_get_corporate_disclosures(self, ticker: list or str) -> dict:
+        """
+            Coroutine variant of `get_corporate_disclosures`, all the tickers are fetched concurrently.
+
+            :param self: Represents the instance of the class
+            :param ticker: this can a string represents single ticker ot list tickers.
+
+            :return: Dict of ticker and its corporate disclosures data
+        """
+
+        tickers = [ticker] if type(ticker) == str else ticker
+
+        async def _fetch(tick: str) -> dict:
+            await self._async_warm_up(f'{self._base_url}/get-quotes/equity', params={'symbol': tick})
+            return await self.async_run(self._corporate_disclosures_operation(tick))
+
+        responses = await asyncio.gather(*[_fetch(tick) for tick in tickers])
+        return dict(zip(tickers, responses))
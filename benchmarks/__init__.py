@@ -0,0 +1,12 @@
+"""
+    End-to-end benchmarks of the public client methods against a local stand-in of the upstream websites.
+
+    Usage:
+        python -m benchmarks.suite [--iterations N] [--only PATTERN] [--json results.json] [--compare old.json]
+        python -m benchmarks.suite --record benchmarks/fixtures   # records live responses as fixtures
+        python benchmarks/json_decode.py [recorded_body.json ...]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Bharat_sm_data'))
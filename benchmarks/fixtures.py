@@ -0,0 +1,481 @@
+"""
+    Response fixtures of the stand-in server.
+
+    Recorded fixtures are `Cassette` files (`*.jsonl`, see `python -m benchmarks.suite --record`) and are served as they
+    came over the wire. Every endpoint without a recording is answered by a synthetic generator below, which builds a
+    deterministic body of the same shape (and roughly the same size) as the live api, enough for the parsers of the
+    clients to do their full work.
+"""
+import base64
+import glob
+import json
+import random
+import re
+from datetime import datetime, timedelta
+from os import path
+from urllib.parse import parse_qsl, urlsplit
+
+from .json_decode import synthetic_option_chain
+
+_html = 'text/html; charset=utf-8'
+_json = 'application/json'
+
+
+def _rng(*seed) -> random.Random:
+    """
+        Returns a random generator seeded on the request, so the same request always gets the same body.
+
+        :param seed: Any hashable parts of the request
+
+        :return: random.Random object
+    """
+
+    return random.Random('|'.join(str(part) for part in seed))
+
+
+def _dumps(data) -> bytes:
+    """
+        Encodes a body as JSON.
+
+        :param data: Body
+
+        :return: Encoded body
+    """
+
+    return json.dumps(data).encode('utf-8')
+
+
+def _trading_days(count: int, end: datetime = datetime(2026, 10, 16)) -> list:
+    """
+        Returns the timestamps (ms) of the last `count` week days.
+
+        :param count: Number of days
+        :param end: (optional) Last day
+
+        :return: List of timestamps in ms, oldest first
+    """
+
+    days = []
+    day = end
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(int(day.timestamp() * 1000))
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Synthetic generators; every one takes the url params and the payload of a request and returns a tuple of
+# (status, content type, body)
+
+# NSE
+def nse_page(query: dict, body: bytes) -> tuple:
+    return 200, _html, b'<html><head><title>NSE</title></head><body>' + b'<div></div>' * 2000 + b'</body></html>'
+
+
+def nse_market_status(query: dict, body: bytes) -> tuple:
+    states = [{'market': market, 'marketStatus': 'Open', 'tradeDate': '16-Oct-2026 15:30', 'index': index,
+               'last': 22000.55, 'variation': 12.3, 'percentChange': 0.06}
+              for market, index in [('Capital Market', 'NIFTY 50'), ('Currency', ''), ('Commodity', ''),
+                                    ('currencyfuture', ''), ('Debt', '')]]
+    return 200, _json, _dumps({'marketState': states, 'marketcap': {'timeStamp': '16-Oct-2026'},
+                               'indicativenifty50': {'indexName': 'NIFTY 50', 'closingValue': 22000.55}})
+
+
+def nse_quote_equity(query: dict, body: bytes) -> tuple:
+    symbol = query.get('symbol', 'RELIANCE')
+    rng = _rng('quote', symbol)
+    price = round(rng.uniform(100, 4000), 2)
+    if query.get('section') == 'trade_info':
+        data = {
+            'noBlockDeals': True,
+            'bulkBlockDeals': [{'name': 'Session I'}, {'name': 'Session II'}],
+            'marketDeptOrderBook': {
+                'totalBuyQuantity': rng.randint(0, 10 ** 6), 'totalSellQuantity': rng.randint(0, 10 ** 6),
+                'bid': [{'price': price - i * 0.05, 'quantity': rng.randint(1, 5000)} for i in range(5)],
+                'ask': [{'price': price + i * 0.05, 'quantity': rng.randint(1, 5000)} for i in range(5)],
+                'tradeInfo': {'totalTradedVolume': rng.randint(0, 10 ** 7), 'totalMarketCap': rng.random() * 10 ** 7,
+                              'ffmc': rng.random() * 10 ** 7, 'impactCost': rng.random()},
+                'valueAtRisk': {'securityVar': 12.5, 'indexVar': 0, 'varMargin': 12.5, 'extremeLossMargin': 3.5},
+            },
+            'securityWiseDP': {'quantityTraded': rng.randint(0, 10 ** 7), 'deliveryQuantity': rng.randint(0, 10 ** 6),
+                               'deliveryToTradedQuantity': round(rng.random() * 100, 2), 'secWiseDelPosDate': '16-OCT-2026'},
+        }
+    else:
+        data = {
+            'info': {'symbol': symbol, 'companyName': f'{symbol} Limited', 'industry': 'Refineries',
+                     'isFNOSec': True, 'isin': 'INE002A01018', 'identifier': f'{symbol}EQN'},
+            'metadata': {'series': 'EQ', 'symbol': symbol, 'status': 'Listed', 'listingDate': '29-Nov-1995',
+                         'pdSectorPe': 25.1, 'pdSymbolPe': 24.3, 'pdSectorInd': 'NIFTY 50'},
+            'securityInfo': {'boardStatus': 'Main', 'tradingStatus': 'Active', 'faceValue': 10,
+                             'issuedSize': rng.randint(10 ** 8, 10 ** 10)},
+            'priceInfo': {'lastPrice': price, 'change': rng.uniform(-20, 20), 'pChange': rng.uniform(-2, 2),
+                          'previousClose': price - 1, 'open': price - 2, 'close': 0, 'vwap': price - 0.5,
+                          'lowerCP': str(round(price * 0.9, 2)), 'upperCP': str(round(price * 1.1, 2)),
+                          'intraDayHighLow': {'min': price - 10, 'max': price + 10, 'value': price},
+                          'weekHighLow': {'min': price * 0.7, 'minDate': '04-Jun-2026', 'max': price * 1.2,
+                                          'maxDate': '08-Jul-2026', 'value': price}},
+            'preOpenMarket': {'preopen': [{'price': price + i * 0.05, 'buyQty': 0, 'sellQty': rng.randint(0, 100)}
+                                          for i in range(10)], 'totalBuyQuantity': 100, 'totalSellQuantity': 100},
+        }
+    return 200, _json, _dumps(data)
+
+
+def nse_option_chain(query: dict, body: bytes) -> tuple:
+    return 200, _json, synthetic_option_chain(strikes=120, expiries=1)
+
+
+def nse_option_chain_contract_info(query: dict, body: bytes) -> tuple:
+    expiries = [datetime(2026, 10, 20) + timedelta(days=7 * i) for i in range(18)]
+    return 200, _json, _dumps({'expiryDates': [expiry.strftime('%d-%b-%Y') for expiry in expiries],
+                               'strikePrice': [str(15000 + 50 * i) for i in range(400)]})
+
+
+def nse_equity_stock_indices(query: dict, body: bytes) -> tuple:
+    rng = _rng('index', query.get('index'))
+    data = [{
+        'priority': 0, 'symbol': f'SYMBOL{i}', 'identifier': f'SYMBOL{i}EQN', 'series': 'EQ',
+        'open': rng.uniform(100, 4000), 'dayHigh': rng.uniform(100, 4000), 'dayLow': rng.uniform(100, 4000),
+        'lastPrice': rng.uniform(100, 4000), 'previousClose': rng.uniform(100, 4000), 'change': rng.uniform(-20, 20),
+        'pChange': rng.uniform(-2, 2), 'totalTradedVolume': rng.randint(0, 10 ** 7),
+        'totalTradedValue': rng.random() * 10 ** 9, 'yearHigh': rng.uniform(100, 4000),
+        'yearLow': rng.uniform(100, 4000), 'perChange365d': rng.uniform(-50, 50), 'perChange30d': rng.uniform(-10, 10),
+        'chart30dPath': 'https://nsearchives.nseindia.com/30d/SYMBOL.svg',
+        'chartTodayPath': 'https://nsearchives.nseindia.com/today/SYMBOL.svg',
+        'meta': {'symbol': f'SYMBOL{i}', 'companyName': f'Company {i} Limited', 'industry': 'Banks',
+                 'isFNOSec': True, 'isCASec': False, 'isSLBSec': True, 'isDebtSec': False, 'isSuspended': False,
+                 'tempSuspendedSeries': [], 'isETFSec': False, 'isDelisted': False, 'isin': 'INE000A01010',
+                 'activeSeries': ['EQ'], 'debtSeries': []},
+    } for i in range(180)]
+    return 200, _json, _dumps({'name': query.get('index'), 'data': data, 'timestamp': '16-Oct-2026 15:30:00'})
+
+
+def nse_all_indices(query: dict, body: bytes) -> tuple:
+    rng = _rng('allIndices')
+    data = [{'key': 'BROAD MARKET INDICES', 'index': f'NIFTY INDEX {i}', 'indexSymbol': f'NIFTY INDEX {i}',
+             'last': rng.uniform(1000, 50000), 'variation': rng.uniform(-100, 100), 'percentChange': rng.uniform(-2, 2),
+             'open': rng.uniform(1000, 50000), 'high': rng.uniform(1000, 50000), 'low': rng.uniform(1000, 50000),
+             'previousClose': rng.uniform(1000, 50000), 'yearHigh': rng.uniform(1000, 50000),
+             'yearLow': rng.uniform(1000, 50000), 'pe': '22.1', 'pb': '3.5', 'dy': '1.2', 'declines': '20',
+             'advances': '30', 'unchanged': '0'} for i in range(130)]
+    return 200, _json, _dumps({'data': data, 'timestamp': '16-Oct-2026 15:30:00', 'advances': 30, 'declines': 20})
+
+
+def nse_top_corp_info(query: dict, body: bytes) -> tuple:
+    rng = _rng('corp', query.get('symbol'))
+    announcements = [{'symbol': query.get('symbol'), 'desc': 'Updates', 'attchmntText': 'x' * rng.randint(50, 400),
+                      'an_dt': '16-Oct-2026 10:00:00', 'attchmntFile': 'https://nsearchives.nseindia.com/a.pdf'}
+                     for _ in range(20)]
+    return 200, _json, _dumps({'latest_announcements': {'data': announcements},
+                               'corporate_actions': {'data': [{'purpose': 'Dividend', 'exdate': '20-Aug-2026'}] * 5},
+                               'shareholdings_patterns': {'data': {'31-Mar-2026': [{'Promoter': '50.0'}] * 4}},
+                               'financial_results': {'data': [{'income': '1000', 'proLossAftTax': '100'}] * 8},
+                               'borad_meeting': {'data': [{'purpose': 'Results', 'meetingdate': '20-Oct-2026'}] * 5}})
+
+
+def nse_chart_data_by_index(query: dict, body: bytes) -> tuple:
+    rng = _rng('grapth', query.get('index'), query.get('preopen'))
+    start = int(datetime(2026, 10, 16, 9, 15).timestamp() * 1000) + 19800 * 1000
+    points = 30 if query.get('preopen') else 22500
+    price = 22000.0
+    data = []
+    for i in range(points):
+        price += rng.uniform(-2, 2)
+        data.append([start + i * 1000, round(price, 2), 'NM'])
+    return 200, _json, _dumps({'identifier': query.get('index'), 'name': query.get('index'), 'grapthData': data,
+                               'closePrice': 0})
+
+
+def nse_search(query: dict, body: bytes) -> tuple:
+    text = query.get('q', '')
+    return 200, _json, _dumps({'symbols': [{'symbol': f'{text.upper()}{i}', 'symbol_info': f'{text} {i} Limited',
+                                            'result_type': 'symbol', 'result_sub_type': 'equity',
+                                            'url': f'/get-quotes/equity?symbol={text.upper()}{i}'}
+                                           for i in range(10)], 'mfsymbols': [], 'search_content': []})
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# NSE charting
+
+def charting_masters(query: dict, body: bytes) -> tuple:
+    rows = ['ScripCode|Symbol|Description|InstrumentType|Series']
+    rows.extend(f'{1000 + i}|SYMBOL{i}|Company {i} Limited|0|EQ' for i in range(2500))
+    return 200, 'text/plain', '\n'.join(rows).encode('utf-8')
+
+
+def charting_symbols(query: dict, body: bytes) -> tuple:
+    payload = json.loads(body or b'{}')
+    symbol = payload.get('symbol', 'NIFTY 50')
+    return 200, _json, _dumps({'status': True, 'data': [{'symbol': symbol, 'scripcode': '26000', 'exchange': 'NSE',
+                                                          'instrumentType': 'Index', 'description': symbol}]})
+
+
+def charting_history(query: dict, body: bytes) -> tuple:
+    payload = json.loads(body or b'{}')
+    rng = _rng('charting', payload.get('token'), payload.get('chartType'))
+    price = 22000.0
+    data = []
+    for timestamp in _trading_days(1000):
+        open_ = price
+        price += rng.uniform(-150, 150)
+        data.append({'time': timestamp, 'open': round(open_, 2), 'high': round(max(open_, price) + 20, 2),
+                     'low': round(min(open_, price) - 20, 2), 'close': round(price, 2),
+                     'volume': rng.randint(10 ** 5, 10 ** 7)})
+    return 200, _json, _dumps({'status': True, 'data': data})
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Screener
+
+_csrf_page = (b'<html><body><form method="post"><input type="hidden" name="csrfmiddlewaretoken" '
+              b'value="standincsrftoken0123456789"></form></body></html>')
+
+_screener_tables = ['Quarterly Results', 'Profit & Loss', 'Compounded Sales Growth', 'Compounded Profit Growth',
+                    'Stock Price CAGR', 'Return on Equity', 'Balance Sheet', 'Cash Flow', 'Ratios',
+                    'Shareholding Pattern']
+
+
+def screener_login(query: dict, body: bytes) -> tuple:
+    return 200, _html, _csrf_page
+
+
+def screener_company(query: dict, body: bytes) -> tuple:
+    rng = _rng('screener-company')
+    quarters = [f'{month} {year}' for year in range(2023, 2027) for month in ('Mar', 'Jun', 'Sep', 'Dec')]
+    rows = ['Sales+', 'Expenses+', 'Operating Profit', 'OPM %', 'Other Income+', 'Interest', 'Depreciation',
+            'Profit before tax', 'Tax %', 'Net Profit+', 'EPS in Rs']
+    tables = []
+    for title in _screener_tables:
+        header = ''.join(f'<th>{quarter}</th>' for quarter in quarters)
+        body_rows = ''.join(
+            f'<tr><td>{row}</td>' + ''.join(f'<td>{rng.randint(100, 99999):,}</td>' for _ in quarters) + '</tr>'
+            for row in rows)
+        tables.append(f'<section><h2>{title}</h2><table><thead><tr><th></th>{header}</tr></thead>'
+                      f'<tbody>{body_rows}</tbody></table></section>')
+    page = ('<html><body><div id="company-info" data-company-id="2726"></div>' + _csrf_page.decode('utf-8')
+            + ''.join(tables) + '</body></html>')
+    return 200, _html, page.encode('utf-8')
+
+
+def screener_schedules(query: dict, body: bytes) -> tuple:
+    rng = _rng('schedules', query.get('parent'))
+    quarters = [f'{month} {year}' for year in range(2023, 2027) for month in ('Mar', 'Jun', 'Sep', 'Dec')]
+    parent = query.get('parent', 'Sales')
+    return 200, _json, _dumps({f'{parent} {name}': {quarter: f'{rng.randint(1, 9999):,}' for quarter in quarters}
+                               for name in ('Growth %', 'Domestic', 'Exports', 'Other')})
+
+
+def screener_search(query: dict, body: bytes) -> tuple:
+    text = query.get('q', '')
+    return 200, _json, _dumps([{'id': 2726 + i, 'name': f'{text} Company {i}', 'url': f'/company/{text.upper()}{i}/'}
+                               for i in range(10)])
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Tickertape
+
+def tickertape_financials(query: dict, body: bytes) -> tuple:
+    rng = _rng('tickertape', query.get('count'))
+    count = int(query.get('count', 10))
+    fields = ['qIncTrev', 'qIncOpex', 'qIncEbitda', 'qIncEbit', 'qIncInt', 'qIncPbt', 'qIncTax', 'qIncNinc',
+              'qIncEps', 'qIncDps', 'qIncCogs', 'qIncSga', 'qIncDep', 'qIncOthinc', 'qIncPayout']
+    data = [dict({'endDate': f'{2026 - i}-03-31T00:00:00.000Z', 'displayPeriod': f'Mar {2026 - i}'},
+                 **{field: rng.uniform(-10 ** 5, 10 ** 6) for field in fields}) for i in range(count)]
+    return 200, _json, _dumps({'success': True, 'data': data})
+
+
+def tickertape_peers(query: dict, body: bytes) -> tuple:
+    rng = _rng('peers')
+    data = [{'sid': f'PEER{i}', 'info': {'name': f'Peer {i}', 'ticker': f'PEER{i}', 'sector': 'Energy'},
+             'ratios': {field: rng.uniform(0, 100) for field in ('mrktCapf', 'apef', 'pbr', 'divDps', 'roe', 'roce')}}
+            for i in range(12)]
+    return 200, _json, _dumps({'success': True, 'data': data})
+
+
+def tickertape_scorecard(query: dict, body: bytes) -> tuple:
+    data = [{'name': name, 'tag': 'Avg', 'type': 'score', 'description': f'{name} of the stock', 'colour': 'yellow',
+             'score': {'percentage': False, 'max': 10, 'value': 5, 'key': name}}
+            for name in ('Performance', 'Valuation', 'Growth', 'Profitability', 'Entry point', 'Red flags')]
+    return 200, _json, _dumps({'success': True, 'data': data})
+
+
+def tickertape_constituents(query: dict, body: bytes) -> tuple:
+    rng = _rng('constituents')
+    constituents = [{'sid': f'SYM{i}', 'name': f'Company {i}', 'ticker': f'SYM{i}', 'weight': rng.random() * 10,
+                     'sector': 'Banks', 'marketCap': rng.uniform(10 ** 4, 10 ** 6)} for i in range(50)]
+    return 200, _json, _dumps({'success': True, 'data': {'constituents': constituents}})
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# MoneyControl
+
+def moneycontrol_home(query: dict, body: bytes) -> tuple:
+    return 200, _html, b'<html><body>' + b'<div class="x"></div>' * 5000 + b'</body></html>'
+
+
+def moneycontrol_vix(query: dict, body: bytes) -> tuple:
+    rng = _rng('vix', query.get('resolution'))
+    count = int(query.get('countback', 1782))
+    start = int(query.get('from', 1700000000))
+    step = 86400 if query.get('resolution') == '1d' else 60
+    closes = [round(12 + rng.random() * 4, 2) for _ in range(count)]
+    return 200, _json, _dumps({'s': 'ok', 't': [start + i * step for i in range(count)], 'o': closes,
+                               'h': [value + 0.5 for value in closes], 'l': [value - 0.5 for value in closes],
+                               'c': closes, 'v': [0] * count})
+
+
+def moneycontrol_financials(query: dict, body: bytes) -> tuple:
+    rng = _rng('mcfinancials', query.get('scId'), query.get('referenceId'))
+    divs = []
+    for statement_type in ('C', 'S'):
+        for frequency in (3, 12):
+            data = [{'heading': heading, 'data': [{'year': f'Mar {year}', 'value': rng.randint(1000, 99999)}
+                                                  for year in range(2021, 2027)]}
+                    for heading in ('Revenue', 'Net Profit', 'EBITDA', 'Total Assets', 'Net Worth')]
+            divs.append(f'<div id="{statement_type}-{frequency}-graph" style="display:none">{json.dumps(data)}</div>')
+    years = ''.join(f'<th>Mar {year}</th>' for year in range(2022, 2027))
+    tables = ''.join(
+        f'<table><thead><tr><th>Particulars</th>{years}<th>Trend</th></tr></thead><tbody>'
+        + ''.join(f'<tr><td>{section} item {row}</td>' + ''.join(f'<td>{rng.randint(10, 99999):,}</td>' for _ in range(5))
+                  + '<td></td></tr>' for row in range(12))
+        + '</tbody></table>' for section in ('Income', 'Expenses', 'Profit'))
+    return 200, _html, ('<html><body>' + ''.join(divs) + tables + '</body></html>').encode('utf-8')
+
+
+_moneycontrol_reports = [('Balance Sheet', 'balance-sheetVI'), ('Profit & Loss', 'profit-lossVI'),
+                         ('Quarterly Results', 'quarterly-resultsVI'), ('Half Yearly Results', 'half-yearly-resultsVI'),
+                         ('Nine Months Results', 'nine-months-resultsVI'), ('Yearly Results', 'yearly-resultsVI'),
+                         ('Cash Flows', 'cash-flowVI'), ('Ratios', 'ratiosVI'),
+                         ('Capital Structure', 'capital-structureVI')]
+
+
+def moneycontrol_company(query: dict, body: bytes) -> tuple:
+    links = ''.join(f'<li><a href="https://www.moneycontrol.com/financials/company/{code}/RI#RI">{name}</a></li>'
+                    for name, code in _moneycontrol_reports)
+    page = ('<html><body>' + '<div class="x"></div>' * 3000
+            + f'<div class="quick_links clearfix"><ul>{links}</ul></div></body></html>')
+    return 200, _html, page.encode('utf-8')
+
+
+def moneycontrol_statement(query: dict, body: bytes) -> tuple:
+    rng = _rng('mcstatement', query.get('page'))
+    years = ''.join(f'<td>Mar {year}</td>' for year in range(2022, 2027))
+    rows = ''.join(f'<tr><td>Item {row}</td>' + ''.join(f'<td>{rng.randint(10, 99999):,}</td>' for _ in range(5))
+                   + '<td></td></tr>' for row in range(60))
+    page = f'<html><body><table><tr><td>Particulars</td>{years}<td></td></tr>{rows}</table></body></html>'
+    return 200, _html, page.encode('utf-8')
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+
+# (host suffix, path pattern, generator); the first match wins, so specific hosts come before their parent domains
+routes = [
+    ('charting.nseindia.com', r'/Charts/Get(EQ|FO)Masters$', charting_masters),
+    ('charting.nseindia.com', r'/v1/exchanges/symbolsDynamic$', charting_symbols),
+    ('charting.nseindia.com', r'/v1/charts/symbolHistoricalData$', charting_history),
+    ('charting.nseindia.com', r'', nse_page),
+    ('nseindia.com', r'/api/marketStatus$', nse_market_status),
+    ('nseindia.com', r'/api/quote-equity$', nse_quote_equity),
+    ('nseindia.com', r'/api/option-chain-v3$', nse_option_chain),
+    ('nseindia.com', r'/api/option-chain-contract-info$', nse_option_chain_contract_info),
+    ('nseindia.com', r'/api/equity-stockIndices$', nse_equity_stock_indices),
+    ('nseindia.com', r'/api/allIndices$', nse_all_indices),
+    ('nseindia.com', r'/api/top-corp-info$', nse_top_corp_info),
+    ('nseindia.com', r'/api/chart-databyindex$', nse_chart_data_by_index),
+    ('nseindia.com', r'/api/search/autocomplete$', nse_search),
+    ('nseindia.com', r'^/(?!api/)', nse_page),
+    ('screener.in', r'/login/$', screener_login),
+    ('screener.in', r'/api/company/search/$', screener_search),
+    ('screener.in', r'/api/company/\d+/schedules/$', screener_schedules),
+    ('screener.in', r'/company/', screener_company),
+    ('tickertape.in', r'/stocks/financials/', tickertape_financials),
+    ('tickertape.in', r'/stocks/peers/', tickertape_peers),
+    ('tickertape.in', r'/stocks/scorecard/', tickertape_scorecard),
+    ('tickertape.in', r'/indices/constituents/', tickertape_constituents),
+    ('priceapi.moneycontrol.com', r'/techCharts/history$', moneycontrol_vix),
+    ('moneycontrol.com', r'/mc/widget/mcfinancials/getFinancialData$', moneycontrol_financials),
+    ('moneycontrol.com', r'^/india/stockpricequote/', moneycontrol_company),
+    ('moneycontrol.com', r'^/financials/', moneycontrol_statement),
+    ('moneycontrol.com', r'^/$', moneycontrol_home),
+]
+
+
+def synthetic(host: str, path_: str, query: dict, body: bytes) -> tuple:
+    """
+        Answers a request with the synthetic generator of its endpoint.
+
+        :param host: Host of the request, e.g. `www.nseindia.com`
+        :param path_: Path of the request
+        :param query: Dict of url params
+        :param body: Payload of the request
+
+        :return: A tuple of (status, content type, body); 404 when no generator matches
+    """
+
+    host = host.lower()
+    for suffix, pattern, generator in routes:
+        if (host == suffix or host.endswith(f'.{suffix}')) and re.search(pattern, path_):
+            return generator(query, body)
+    return 404, _json, _dumps({'error': f'no fixture for {host}{path_}'})
+
+
+class RecordedFixtures:
+    """
+        Recorded responses loaded from the `Cassette` files of a directory, looked up by host, path and url params; a
+        request whose exact params were not recorded gets any response recorded for its path.
+
+        Attributes:
+            directory: directory of the `*.jsonl` cassette files
+
+        Methods:
+            find(host: str, path: str, query: dict) -> dict: Returns the recorded response or None.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+            Loads every cassette of the directory.
+
+            :param self: Represent the instance of the class
+            :param directory: directory of the `*.jsonl` cassette files
+
+            :return: None
+        """
+
+        self.directory = directory
+        self._exact = {}
+        self._by_path = {}
+        for file_path in sorted(glob.glob(path.join(directory, '*.jsonl'))):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    interaction = json.loads(line)
+                    request = interaction['request']
+                    parts = urlsplit(request['url'])
+                    query = dict(parse_qsl(parts.query))
+                    query.update({key: str(value) for key, value in (request.get('params') or {}).items()})
+                    route = ((parts.hostname or '').lower(), parts.path)
+                    self._exact.setdefault(route + (tuple(sorted(query.items())),), interaction['response'])
+                    self._by_path.setdefault(route, interaction['response'])
+
+    def __len__(self) -> int:
+        return len(self._by_path)
+
+    def find(self, host: str, path_: str, query: dict) -> dict:
+        """
+            Returns the recorded response of a request.
+
+            :param self: Represent the instance of the class
+            :param host: Host of the request
+            :param path_: Path of the request
+            :param query: Dict of url params
+
+            :return: Dict with `status`, `headers` and the decoded `body` or None when nothing was recorded
+        """
+
+        route = (host.lower(), path_)
+        response = self._exact.get(route + (tuple(sorted(query.items())),)) or self._by_path.get(route)
+        if response is None:
+            return None
+        return {'status': response['status'], 'headers': response['headers'],
+                'body': base64.b64decode(response['body'])}
@@ -0,0 +1,85 @@
+"""
+    Compares the JSON decode paths of `CustomSession` on response bodies.
+
+    Usage:
+        python benchmarks/json_decode.py [recorded_body.json ...]
+
+    Pass recorded (decompressed) response bodies, e.g. saved from `option-chain-v3`, `master-quote` or the Sensibull
+    `underlying_instruments` api; without any file a synthetic option chain of the same shape is used.
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Bharat_sm_data'))
+
+from Base import FastJson  # noqa: E402
+
+
+def synthetic_option_chain(strikes: int = 400, expiries: int = 6) -> bytes:
+    """
+        Builds an `option-chain-v3` like body, big enough to show the difference between the decoders.
+
+        :param strikes: Number of strikes per expiry
+        :param expiries: Number of expiries
+
+        :return: Encoded JSON body
+    """
+
+    rng = random.Random(42)
+    data = []
+    for expiry in range(expiries):
+        for strike in range(strikes):
+            row = {'strikePrice': 15000 + strike * 50, 'expiryDate': f'{expiry + 1:02d}-Jan-2026'}
+            for side in ('CE', 'PE'):
+                row[side] = {
+                    'strikePrice': row['strikePrice'], 'expiryDate': row['expiryDate'], 'underlying': 'NIFTY',
+                    'identifier': f'OPTIDXNIFTY{side}{row["strikePrice"]}', 'openInterest': rng.randint(0, 10 ** 6),
+                    'changeinOpenInterest': rng.randint(-10 ** 5, 10 ** 5), 'pchangeinOpenInterest': rng.random(),
+                    'totalTradedVolume': rng.randint(0, 10 ** 7), 'impliedVolatility': rng.random() * 40,
+                    'lastPrice': rng.random() * 500, 'change': rng.random() - 0.5, 'pChange': rng.random(),
+                    'totalBuyQuantity': rng.randint(0, 10 ** 6), 'totalSellQuantity': rng.randint(0, 10 ** 6),
+                    'bidQty': rng.randint(0, 10 ** 4), 'bidprice': rng.random() * 500,
+                    'askQty': rng.randint(0, 10 ** 4), 'askPrice': rng.random() * 500,
+                    'underlyingValue': 22000.55,
+                }
+            data.append(row)
+    body = {'records': {'timestamp': '16-Oct-2026 15:30:00', 'underlyingValue': 22000.55, 'data': data},
+            'filtered': {'data': data[:strikes]}}
+    return json.dumps(body).encode('utf-8')
+
+
+def bench(name: str, content: bytes, repeat: int = 5) -> None:
+    """
+        Prints the best time of every decode path for one body.
+
+        :param name: Label of the body
+        :param content: Decompressed body
+        :param repeat: Number of timing rounds, the best one is reported
+
+        :return: None
+    """
+
+    number = max(1, int(2 * 1024 * 1024 / max(len(content), 1)))
+    paths = [('json (stdlib)', FastJson.loads_stdlib), ('json.loads(bytes)', json.loads)]
+    if FastJson.orjson is not None:
+        paths.append(('orjson.loads(bytes)', FastJson.loads))
+    print(f'{name}: {len(content) / 1024:.1f} KiB, {number} decodes per round')
+    baseline = None
+    for label, fn in paths:
+        best = min(timeit.repeat(lambda: fn(content), number=number, repeat=repeat)) / number
+        baseline = baseline or best
+        print(f'    {label:<22}{best * 1000:9.3f} ms  x{baseline / best:.2f}')
+
+
+if __name__ == '__main__':
+    if FastJson.orjson is None:
+        print('orjson is not installed, only the stdlib paths are compared (pip install orjson)')
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            with open(file_path, 'rb') as f:
+                bench(os.path.basename(file_path), f.read())
+    else:
+        bench('synthetic option-chain-v3', synthetic_option_chain())
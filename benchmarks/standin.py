@@ -0,0 +1,168 @@
+"""
+    A local HTTP stand-in of the upstream websites (NSE, NSE charting, Screener, Tickertape, MoneyControl) and the
+    `requests` adapter which routes a client's traffic to it.
+"""
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+
+from . import fixtures
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+        Answers every request from the recorded fixtures of the server, else from the synthetic ones, dispatching on
+        the `Host` header which the `StandInAdapter` keeps as the upstream host.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    # the NSE apis check these cookies, the warm-up pages set them
+    cookies = ('nsit=standin; Domain=.nseindia.com; Path=/; Max-Age=7200',
+               'nseappid=standin; Domain=.nseindia.com; Path=/; Max-Age=7200')
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _answer(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        host = (self.headers.get('Host') or '').split(':')[0]
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        recorded = self.server.recorded.find(host, parts.path, query) if self.server.recorded is not None else None
+        if recorded is not None:
+            status, content = recorded['status'], recorded['body']
+            headers = [(name, value) for name, value in recorded['headers'].items()
+                       if name.lower() not in ('content-length', 'transfer-encoding', 'connection')]
+        else:
+            status, content_type, content = fixtures.synthetic(host, parts.path, query, body)
+            headers = [('Content-Type', content_type)]
+            if 'gzip' in (self.headers.get('Accept-Encoding') or '') and len(content) > 1024:
+                content = gzip.compress(content, compresslevel=6)
+                headers.append(('Content-Encoding', 'gzip'))
+            if host.endswith('nseindia.com'):
+                headers.extend(('Set-Cookie', cookie) for cookie in self.cookies)
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _answer
+    do_POST = _answer
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+        Threaded HTTP server answering as every upstream website at once, on a free port of localhost.
+
+        Attributes:
+            recorded: `fixtures.RecordedFixtures` served before the synthetic fixtures or None
+            latency: seconds every response is delayed by, to emulate the round trip to the real servers
+            base_url: url of the server
+
+        Methods:
+            start() -> StandInServer: Serves on a daemon thread.
+            stop() -> None: Shuts the server down.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, recorded: fixtures.RecordedFixtures = None, latency: float = 0.0) -> None:
+        """
+            Binds the server to a free port of localhost.
+
+            :param self: Represent the instance of the class
+            :param recorded: (optional) recorded fixtures to serve before the synthetic ones
+            :param latency: (optional) seconds every response is delayed by
+
+            :return: None
+        """
+
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.recorded = recorded
+        self.latency = latency
+        self.base_url = f'http://127.0.0.1:{self.server_address[1]}'
+
+    def start(self) -> 'StandInServer':
+        """
+            Serves on a daemon thread.
+
+            :param self: Represent the instance of the class
+
+            :return: The server itself
+        """
+
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """
+            Shuts the server down.
+
+            :param self: Represent the instance of the class
+
+            :return: None
+        """
+
+        self.shutdown()
+        self.server_close()
+
+
+class StandInAdapter(HTTPAdapter):
+    """
+        `requests` transport adapter which sends every request to the stand-in server instead of its host, keeping the
+        upstream host in the `Host` header. The caller still sees the upstream url on the request and the response, so
+        cookies, priming and metrics behave as they do against the real websites.
+    """
+
+    def __init__(self, base_url: str, **kwargs) -> None:
+        """
+            Builds the adapter.
+
+            :param self: Represent the instance of the class
+            :param base_url: Url of the stand-in server
+            :param kwargs: (optional) keyword arguments of `HTTPAdapter`, e.g. `max_retries`
+
+            :return: None
+        """
+
+        super().__init__(**kwargs)
+        self._netloc = urlsplit(base_url).netloc
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        routed = request.copy()
+        routed.url = urlunsplit(('http', self._netloc, parts.path, parts.query, ''))
+        routed.headers['Host'] = parts.netloc
+        response = super().send(routed, **kwargs)
+        response.request = request
+        response.url = request.url
+        return response
+
+
+def route(client, base_url: str) -> None:
+    """
+        Routes the `requests` traffic of a client to the stand-in server, keeping the retry policy of the client.
+
+        :param client: `CustomSession` object, e.g. a `Technical.NSE` client
+        :param base_url: Url of the stand-in server
+
+        :return: None
+    """
+
+    session = client.get_session()
+    adapter = StandInAdapter(base_url, max_retries=session.get_adapter('https://').max_retries,
+                             pool_maxsize=client._pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
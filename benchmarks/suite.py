@@ -0,0 +1,296 @@
+"""
+    Runs the public methods of the clients end to end (request, decompression, JSON / HTML parsing, DataFrame
+    building) against the local stand-in server and reports the throughput, p50 / p99 latency and peak memory of each.
+
+    The process-wide rate limiter, metrics registry and cookie store are switched off for the run, so the numbers are
+    the cost of the library itself; pass `--latency` to add an emulated round trip to every response. Results can be
+    saved with `--json` and compared with the ones of an earlier release with `--compare`.
+
+    Usage:
+        python -m benchmarks.suite [--iterations 20] [--only option_chain] [--json results.json] [--compare old.json]
+        python -m benchmarks.suite --coverage
+        python -m benchmarks.suite --record benchmarks/fixtures
+"""
+import argparse
+import contextlib
+import fnmatch
+import inspect
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+
+from . import fixtures, standin
+
+from Base import Cassette, CustomSession, FastJson, NSEBase  # noqa: E402
+from Derivatives.NSE import NSE as DerivativesNSE  # noqa: E402
+from Fundamentals.MoneyControl import MoneyControl  # noqa: E402
+from Fundamentals.Screener import Screener  # noqa: E402
+from Fundamentals.TickerTape import Tickertape  # noqa: E402
+from Technical.NSE import NSE as TechnicalNSE  # noqa: E402
+
+Case = namedtuple('Case', ['name', 'client', 'method', 'args', 'kwargs'])
+
+# client kind and its (class, constructor arguments)
+clients = {
+    'technical_nse': (TechnicalNSE, ()),
+    'derivatives_nse': (DerivativesNSE, ()),
+    'screener': (Screener, ('benchmark', 'benchmark')),
+    'tickertape': (Tickertape, ()),
+    'moneycontrol': (MoneyControl, ()),
+}
+
+_expiry = datetime(2026, 10, 27)
+_company_mc_url = 'https://www.moneycontrol.com/india/stockpricequote/refineries/relianceindustries/RI'
+
+cases = [
+    Case('nse.market_status', 'technical_nse', 'get_market_status_and_current_val', (), {}),
+    Case('nse.last_traded_date', 'technical_nse', 'get_last_traded_date', (), {}),
+    Case('nse.trade_info', 'technical_nse', 'get_trade_info', (['RELIANCE', 'TCS', 'INFY', 'HDFCBANK'],), {}),
+    Case('nse.equities_from_index', 'technical_nse', 'get_equities_data_from_index', ('NIFTY 200',), {}),
+    Case('nse.all_indices', 'technical_nse', 'get_all_indices', (), {}),
+    Case('nse.corporate_disclosures', 'technical_nse', 'get_corporate_disclosures', (['RELIANCE', 'TCS'],), {}),
+    Case('nse.second_wise_data', 'technical_nse', 'get_second_wise_data', ('NIFTY 50',), {}),
+    Case('nse.ohlc_data', 'technical_nse', 'get_ohlc_data', ('NIFTY 50', '5Min'), {}),
+    Case('nse.search', 'technical_nse', 'search', ('RELIANCE',), {}),
+    Case('nse.charting_mappings', 'technical_nse', 'get_charting_mappings', (), {}),
+    Case('nse.search_charting_symbol', 'technical_nse', 'search_charting_symbol', ('NIFTY 50', 'IDX'), {}),
+    Case('nse.charting_historical_data', 'technical_nse', 'get_charting_historical_data', ('NIFTY 50', '26000'), {}),
+    Case('nse.ohlc_from_charting_v2', 'technical_nse', 'get_ohlc_from_charting_v2', ('NIFTY 50', '1Day'), {}),
+    Case('nse.option_chain', 'derivatives_nse', 'get_option_chain', ('NIFTY', _expiry), {}),
+    Case('nse.raw_option_chain', 'derivatives_nse', 'get_raw_option_chain', ('NIFTY', _expiry), {}),
+    Case('nse.options_expiry', 'derivatives_nse', 'get_options_expiry', ('NIFTY',), {'is_index': True}),
+    Case('nse.pcr', 'derivatives_nse', 'get_pcr', ('NIFTY',), {'expiry': _expiry}),
+    Case('screener.ticker', 'screener', 'get_ticker', ('reliance',), {}),
+    Case('screener.base_tables', 'screener', 'get_base_tables', ('/company/RELIANCE/consolidated/', 'ALL'), {}),
+    Case('screener.quarterly_results', 'screener', 'get_quarterly_results', ('/company/RELIANCE/consolidated/',), {}),
+    Case('tickertape.income_data', 'tickertape', 'get_income_data', ('RELI',), {}),
+    Case('tickertape.balance_sheet_data', 'tickertape', 'get_balance_sheet_data', ('RELI',), {}),
+    Case('tickertape.cash_flow_data', 'tickertape', 'get_cash_flow_data', ('RELI',), {}),
+    Case('tickertape.peers_comparison', 'tickertape', 'peers_comparison', ('RELI',), {}),
+    Case('tickertape.score_card', 'tickertape', 'get_score_card', ('RELI',), {}),
+    Case('tickertape.constituents_of_index', 'tickertape', 'get_all_constituents_of_index', ('.NSEI',), {}),
+    Case('moneycontrol.india_vix', 'moneycontrol', 'get_india_vix', ('1',), {}),
+    Case('moneycontrol.overview_mini_statement', 'moneycontrol', 'get_overview_mini_statement', ('RI',), {}),
+    Case('moneycontrol.income_mini_statement', 'moneycontrol', 'get_income_mini_statement', ('RI',), {}),
+    Case('moneycontrol.balance_sheet_mini_statement', 'moneycontrol', 'get_balance_sheet_mini_statement', ('RI',), {}),
+    Case('moneycontrol.ratios_mini_statement', 'moneycontrol', 'get_ratios_mini_statement', ('RI',), {}),
+    Case('moneycontrol.complete_balance_sheet', 'moneycontrol', 'get_complete_balance_sheet', (_company_mc_url,),
+         {'num_years': 10}),
+    Case('moneycontrol.complete_profit_loss', 'moneycontrol', 'get_complete_profit_loss', (_company_mc_url,),
+         {'statement_type': 'consolidated'}),
+]
+
+
+def percentile(samples: list, q: float) -> float:
+    """
+        Returns the q-th percentile of the samples by the nearest rank method.
+
+        :param samples: Sorted list of samples
+        :param q: Percentile between 0 and 100
+
+        :return: The percentile or None when there are no samples
+    """
+
+    if not samples:
+        return None
+    rank = max(1, int(round(q / 100 * len(samples) + 0.5)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def measure(call, iterations: int, warmup: int) -> dict:
+    """
+        Measures a call; the latencies are taken without tracing and the peak memory on one more traced call, since
+        `tracemalloc` slows down allocations heavily.
+
+        :param call: Callable without arguments
+        :param iterations: Number of timed calls
+        :param warmup: Number of untimed calls made first (priming, warm-up pages, imports)
+
+        :return: Dict of calls, errors, throughput (calls / sec), p50 / p99 / mean latency (sec) and peak memory (bytes)
+    """
+
+    errors = 0
+    last_error = None
+    for _ in range(warmup):
+        try:
+            call()
+        except Exception as err:
+            errors, last_error = errors + 1, err
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        try:
+            call()
+        except Exception as err:
+            errors, last_error = errors + 1, err
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        call()
+    except Exception as err:
+        errors, last_error = errors + 1, err
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'calls': iterations,
+        'errors': errors,
+        'last_error': repr(last_error) if last_error is not None else None,
+        'throughput': iterations / elapsed if elapsed else None,
+        'p50': percentile(latencies, 50),
+        'p99': percentile(latencies, 99),
+        'mean': sum(latencies) / len(latencies) if latencies else None,
+        'peak_memory': peak,
+    }
+
+
+def uncovered_methods() -> list:
+    """
+        Lists the public methods of the benchmarked clients which no case exercises; the coroutine variants are left
+        out since the stand-in routes only the `requests` transport.
+
+        :return: Sorted list of `client.method` names
+    """
+
+    covered = {(case.client, case.method) for case in cases}
+    transport = set(dir(CustomSession))
+    missing = []
+    for name, (cls, _) in clients.items():
+        for method, value in inspect.getmembers(cls, inspect.isfunction):
+            if method.startswith('_') or method.startswith('async_') or method in transport:
+                continue
+            if (name, method) not in covered:
+                missing.append(f'{name}.{method}')
+    return sorted(missing)
+
+
+def run(selected: list, iterations: int, warmup: int, base_url: str = None, record_dir: str = None,
+        verbose: bool = False) -> dict:
+    """
+        Runs the cases on one client per kind, either routed to the stand-in server or, while recording, to the real
+        websites with a recording cassette per case.
+
+        :param selected: Cases to run
+        :param iterations: Number of timed calls per case
+        :param warmup: Number of untimed calls per case
+        :param base_url: (optional) url of the stand-in server
+        :param record_dir: (optional) directory to record the cassettes of the cases into
+        :param verbose: (optional) keeps the prints of the library instead of discarding them
+
+        :return: Dict of case name and its measurements
+    """
+
+    instances = {}
+    results = {}
+    for case in selected:
+        client = instances.get(case.client)
+        if client is None:
+            cls, args = clients[case.client]
+            client = instances[case.client] = cls(*args)
+            if base_url is not None:
+                standin.route(client, base_url)
+        if record_dir is not None:
+            client.cassette = Cassette(os.path.join(record_dir, f'{case.name}.jsonl'), mode='record')
+
+        method = getattr(client, case.method)
+        output = sys.stdout if verbose else io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results[case.name] = measure(lambda: method(*case.args, **case.kwargs), iterations, warmup)
+        client.cassette = None
+        print(format_row(case.name, results[case.name]), flush=True)
+    return results
+
+
+def format_row(name: str, result: dict, baseline: dict = None) -> str:
+    """
+        Formats the measurements of a case as a table row.
+
+        :param name: Case name
+        :param result: Measurements of the case
+        :param baseline: (optional) Measurements of the same case from an earlier run
+
+        :return: Table row
+    """
+
+    row = (f'{name:<40}{result["throughput"] or 0:>10.1f}{(result["p50"] or 0) * 1000:>10.2f}'
+           f'{(result["p99"] or 0) * 1000:>10.2f}{result["peak_memory"] / 1024 ** 2:>10.2f}{result["errors"]:>8}')
+    if baseline:
+        row += f'{(result["p50"] or 0) / (baseline["p50"] or 1) * 100 - 100:>+9.1f}%'
+    return row
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--iterations', type=int, default=20, help='timed calls per case (default 20)')
+    parser.add_argument('--warmup', type=int, default=2, help='untimed calls per case (default 2)')
+    parser.add_argument('--only', action='append', default=[], help='glob of case names to run, may be repeated')
+    parser.add_argument('--latency', type=float, default=0.0, help='ms every stand-in response is delayed by')
+    parser.add_argument('--fixtures', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures'),
+                        help='directory of recorded cassettes served before the synthetic fixtures')
+    parser.add_argument('--json', help='file to save the results into')
+    parser.add_argument('--compare', help='results file of an earlier run to compare the p50 latency with')
+    parser.add_argument('--record', metavar='DIR', help='hit the real websites once per case and record cassettes')
+    parser.add_argument('--coverage', action='store_true', help='list the public methods without a case and exit')
+    parser.add_argument('--verbose', action='store_true', help='keep the prints of the library')
+    args = parser.parse_args(argv)
+
+    if args.coverage:
+        print('\n'.join(uncovered_methods()))
+        return 0
+
+    selected = [case for case in cases
+                if not args.only or any(fnmatch.fnmatch(case.name, f'*{pattern}*') for pattern in args.only)]
+    if not selected:
+        print(f'No case matches {args.only}')
+        return 1
+
+    CustomSession.rate_limiter = None
+    CustomSession.metrics = None
+    NSEBase.cookie_store = None
+
+    if args.record:
+        # one call per case is enough to record it and keeps the load on the websites low
+        os.makedirs(args.record, exist_ok=True)
+        run(selected, 1, 0, record_dir=args.record, verbose=args.verbose)
+        return 0
+
+    recorded = fixtures.RecordedFixtures(args.fixtures) if os.path.isdir(args.fixtures) else None
+    server = standin.StandInServer(recorded, args.latency / 1000).start()
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('cases', {})
+
+    print(f'python {platform.python_version()}, json backend {FastJson.backend}, '
+          f'{len(recorded) if recorded else 0} recorded endpoints, latency {args.latency} ms')
+    print(f'{"case":<40}{"calls/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"peak MiB":>10}{"errors":>8}'
+          + (f'{"p50 vs":>10}' if baseline else ''))
+    try:
+        results = run(selected, args.iterations, args.warmup, base_url=server.base_url, verbose=args.verbose)
+    finally:
+        server.stop()
+
+    if baseline:
+        print('\ncompared with', args.compare)
+        for name, result in results.items():
+            print(format_row(name, result, baseline.get(name)))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'json_backend': FastJson.backend,
+                       'latency_ms': args.latency, 'iterations': args.iterations, 'cases': results}, f, indent=2)
+    return 1 if any(result['errors'] for result in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -40,6 +40,8 @@ setup(
 
     extras_require={
         "dev": ["twine>=4.0.2"],
+        "async": ["aiohttp>=3.8.0"],
+        "fast": ["orjson>=3.6.0"],
     },
     python_requires=">=3.7",
     project_urls={
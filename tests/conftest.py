@@ -0,0 +1,195 @@
+"""
+    Offline unit tests of the transport building blocks. No request leaves the machine: the clients send through
+    `StubTransport`, which answers from a list of canned responses and keeps what it was asked, or, for the transports
+    which open connections of their own, to a `LocalServer` on the loopback interface.
+
+    Usage:
+        python -m pytest -q tests
+"""
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# the clients import their siblings as top level packages (`from Base import ...`), as in the installed layout
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Bharat_sm_data'))
+
+from Base import ConditionalCache, CustomSession, HostCircuitBreaker, MetricsRegistry, Priority, Transport  # noqa: E402
+
+
+def make_response(status: int = 200, body: bytes = b'{}', headers: dict = None, url: str = None) -> Response:
+    """
+        Builds a `requests.Response` as a transport hands it out.
+
+        :param status: (optional) HTTP status code
+        :param body: (optional) bytes of the body
+        :param headers: (optional) response headers
+        :param url: (optional) url which answered
+
+        :return: requests.Response object
+    """
+
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    response._content_consumed = True
+    response.url = url
+    response.elapsed = timedelta(milliseconds=1)
+    return response
+
+
+class StubTransport(Transport):
+    """
+        Transport answering every request with the next canned response (or raising it when it is an exception) and
+        recording the requests it was asked, with the priority they were sent at.
+
+        Attributes:
+            responses: list of `requests.Response` / exceptions still to hand out, the last one is repeated
+            requests: list of dict of the method, url, headers, timeout, keyword arguments and priority of every request
+    """
+
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses) or [make_response()]
+        self.requests = []
+
+    def request(self, client, method: str, url: str, headers: dict = None, timeout: tuple = None,
+                **kwargs) -> Response:
+        self.requests.append({'method': method, 'url': url, 'headers': dict(headers or {}), 'timeout': timeout,
+                              'kwargs': kwargs, 'priority': Priority.current()})
+        answer = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(answer, BaseException):
+            raise answer
+        answer.url = answer.url or url
+        return answer
+
+
+@pytest.fixture
+def stub_client():
+    """
+        Builds a `CustomSession` of its own sending through a `StubTransport`, with a fresh circuit breaker,
+        conditional cache and metrics and without rate or concurrency limits, so the tests don't share any state.
+
+        :return: Function taking the canned responses and returning the client
+    """
+
+    def build(*responses) -> CustomSession:
+        client = CustomSession()
+        client.transport = StubTransport(*responses)
+        client.rate_limiter = None
+        client.concurrency_limiter = None
+        client.circuit_breaker = HostCircuitBreaker()
+        client.conditional_cache = ConditionalCache()
+        client.metrics = MetricsRegistry()
+        return client
+
+    return build
+
+
+def counters(client: CustomSession, host: str, path: str) -> dict:
+    """
+        Reads the counters a client recorded for an endpoint.
+
+        :param client: `CustomSession` whose metrics are read
+        :param host: host of the endpoint
+        :param path: templated path of the endpoint
+
+        :return: Dict of counter name and value
+    """
+
+    return client.metrics.snapshot().get(host, {}).get(path, {}).get('counters', {})
+
+
+class LocalServer:
+    """
+        HTTP server on the loopback interface answering every path with its canned responses, for the transports which
+        open connections of their own (aiohttp, `PoolTransport`).
+
+        Attributes:
+            base: url of the server, e.g. `http://127.0.0.1:8080`
+            routes: dict of path and list of `requests.Response` (as built by `make_response`) still to hand out, the
+            last one is repeated; a path without route is answered 404
+            delay: seconds every answer is held back for
+            hits: list of dict of the method, path, query, headers and body of every request
+            max_in_flight: most requests the server was answering at once
+    """
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.delay = 0
+        self.hits = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.base = f'http://127.0.0.1:{self._server.server_address[1]}'
+        threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True).start()
+
+    def url(self, path: str) -> str:
+        return f'{self.base}{path}'
+
+    def answer(self, method: str, path: str, headers, body: bytes) -> Response:
+        split = urlsplit(path)
+        with self._lock:
+            self.hits.append({'method': method, 'path': split.path, 'query': parse_qs(split.query),
+                              'headers': dict(headers), 'body': body})
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            answers = self.routes.get(split.path)
+            answer = (answers.pop(0) if len(answers) > 1 else answers[0]) if answers else make_response(404)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        return answer
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _reply(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                answer = server.answer(self.command, self.path, self.headers, self.rfile.read(length))
+                self.send_response(answer.status_code)
+                for name, value in answer.headers.items():
+                    for line in value if isinstance(value, list) else [value]:
+                        self.send_header(name, line)
+                self.send_header('Content-Length', str(len(answer.content)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(answer.content)
+
+            do_GET = do_POST = do_HEAD = _reply
+
+        return Handler
+
+
+@pytest.fixture
+def local_server():
+    """
+        Starts a `LocalServer` for the test and stops it afterwards.
+
+        :return: LocalServer object
+    """
+
+    server = LocalServer()
+    yield server
+    server.close()
@@ -0,0 +1,165 @@
+import asyncio
+import json
+
+import pytest
+
+from conftest import counters, make_response
+
+from Base import CircuitOpenError, ResponseCache
+
+
+def json_response(data, status: int = 200, **headers):
+    headers = dict({'Content-Type': 'application/json'}, **headers)
+    return make_response(status, json.dumps(data).encode('utf-8'), headers)
+
+
+class FixedTTL:
+    def ttl_for(self, url: str) -> int:
+        return 60
+
+
+def run(client, coroutine):
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await client.aclose()
+
+    return asyncio.run(main())
+
+
+def test_hit_and_get_data_sends_the_params_and_parses_the_body(stub_client, local_server):
+    local_server.routes['/api/quote-equity'] = [json_response({'symbol': 'TCS'})]
+    client = stub_client()
+
+    data = run(client, client.async_hit_and_get_data(local_server.url('/api/quote-equity'), params={'symbol': 'TCS'},
+                                                     headers={'Accept-Language': 'en'}))
+
+    assert data == {'symbol': 'TCS'}
+    hit, = local_server.hits
+    assert hit['query'] == {'symbol': ['TCS']} and hit['headers']['Accept-Language'] == 'en'
+    recorded = counters(client, '127.0.0.1', '/api/quote-equity')
+    assert (recorded['requests'], recorded['status.200']) == (1, 1)
+
+
+def test_cookies_set_by_the_server_are_kept_in_the_shared_jar(stub_client, local_server):
+    local_server.routes['/'] = [json_response({}, **{'Set-Cookie': 'nsit=abc; Path=/; Max-Age=3600'})]
+    local_server.routes['/api/marketStatus'] = [json_response({'marketState': []})]
+    client = stub_client()
+
+    async def main():
+        await client.async_hit_and_get_data(local_server.url('/'))
+        return await client.async_hit_and_get_data(local_server.url('/api/marketStatus'))
+
+    assert run(client, main()) == {'marketState': []}
+    assert client.session.cookies.get('nsit') == 'abc'
+    assert local_server.hits[1]['headers']['Cookie'] == 'nsit=abc'
+
+
+def test_post_and_get_data_sends_the_json_payload(stub_client, local_server):
+    local_server.routes['/api/search'] = [json_response({'ok': True})]
+    client = stub_client()
+
+    assert run(client, client.async_post_and_get_data(local_server.url('/api/search'), json_data={'q': 'TCS'})) == \
+        {'ok': True}
+    assert local_server.hits[0]['method'] == 'POST' and json.loads(local_server.hits[0]['body']) == {'q': 'TCS'}
+
+
+def test_retryable_status_is_retried(stub_client, local_server):
+    local_server.routes['/api/quote-equity'] = [json_response({}, 503), json_response({'symbol': 'TCS'})]
+    client = stub_client()
+    client._backoff_factor = 0
+
+    assert run(client, client.async_hit_and_get_data(local_server.url('/api/quote-equity'))) == {'symbol': 'TCS'}
+    assert len(local_server.hits) == 2
+
+
+def test_invalid_json_and_unreachable_hosts_give_an_empty_dict(stub_client, local_server, capsys):
+    local_server.routes['/page'] = [make_response(200, b'<html></html>', {'Content-Type': 'text/html'})]
+    client = stub_client()
+    client._max_retries = 0
+
+    async def main():
+        return (await client.async_hit_and_get_data(local_server.url('/page')),
+                await client.async_hit_and_get_data('http://127.0.0.1:9/api'))
+
+    assert run(client, main()) == ({}, {})
+    printed = capsys.readouterr().out
+    assert '/page' not in printed and 'Error in connecting to url : http://127.0.0.1:9/api' in printed
+
+
+def test_cached_bodies_are_not_requested_again(stub_client, local_server):
+    local_server.routes['/api/master'] = [json_response({'symbols': ['TCS']})]
+    client = stub_client()
+    client.cache = ResponseCache(':memory:', ttl_policy=FixedTTL())
+
+    async def main():
+        first = await client.async_hit_and_get_data(local_server.url('/api/master'))
+        first['symbols'].append('altered')
+        return await client.async_hit_and_get_data(local_server.url('/api/master'))
+
+    assert run(client, main()) == {'symbols': ['TCS']}
+    assert len(local_server.hits) == 1
+
+
+def test_304_reuses_the_kept_body(stub_client, local_server):
+    local_server.routes['/api/master'] = [json_response({'symbols': ['TCS']}, ETag='"v1"'), make_response(304, b'')]
+    client = stub_client()
+
+    async def main():
+        await client.async_hit_and_get_data(local_server.url('/api/master'))
+        return await client.async_hit_and_get_data(local_server.url('/api/master'))
+
+    assert run(client, main()) == {'symbols': ['TCS']}
+    assert local_server.hits[1]['headers']['If-None-Match'] == '"v1"'
+    assert counters(client, '127.0.0.1', '/api/master')['cache.revalidated'] == 1
+
+
+def test_open_circuit_is_raised_without_a_request(stub_client, local_server):
+    client = stub_client()
+    client.circuit_breaker.configure('127.0.0.1', failure_threshold=1)
+    client.circuit_breaker.record(local_server.url('/'), 503)
+
+    with pytest.raises(CircuitOpenError):
+        run(client, client.async_hit_and_get_data(local_server.url('/api/quote-equity')))
+    assert local_server.hits == []
+
+
+def test_fetch_many_keeps_the_order_and_the_errors_per_request(stub_client, local_server):
+    for symbol in ('TCS', 'INFY', 'WIPRO'):
+        local_server.routes[f'/api/{symbol}'] = [json_response({'symbol': symbol})]
+    local_server.routes['/page'] = [make_response(200, b'<html></html>', {'Content-Type': 'text/html'})]
+    client = stub_client()
+    specs = [local_server.url('/api/TCS'), {'url': local_server.url('/api/INFY')}, local_server.url('/page'),
+             {'url': local_server.url('/api/WIPRO'), 'method': 'POST', 'json_data': {'a': 1}}]
+
+    results = run(client, client.async_fetch_many(specs))
+
+    assert [result.spec for result in results] == specs
+    assert [result.data for result in results] == [{'symbol': 'TCS'}, {'symbol': 'INFY'}, None, {'symbol': 'WIPRO'}]
+    assert isinstance(results[2].error, json.JSONDecodeError)
+    assert [result.ok for result in results] == [True, True, False, True]
+
+
+def test_fetch_many_bounds_the_requests_in_flight_per_host(stub_client, local_server):
+    local_server.routes['/api/quote-equity'] = [json_response({})]
+    local_server.delay = 0.05
+    client = stub_client()
+    urls = [local_server.url(f'/api/quote-equity?symbol={number}') for number in range(8)]
+
+    results = run(client, client.async_fetch_many(urls, per_host=2))
+
+    assert all(result.ok for result in results)
+    assert len(local_server.hits) == 8 and local_server.max_in_flight == 2
+
+
+def test_fetch_many_reports_an_open_circuit_per_request(stub_client, local_server):
+    client = stub_client()
+    client.circuit_breaker.configure('127.0.0.1', failure_threshold=1)
+    client.circuit_breaker.record(local_server.url('/'), 503)
+
+    result, = run(client, client.async_fetch_many([local_server.url('/api/quote-equity')]))
+
+    assert isinstance(result.error, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        client._result_data(result)
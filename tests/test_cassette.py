@@ -0,0 +1,141 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import brotli
+import pytest
+
+from conftest import make_response
+
+from Base import Cassette, CassetteMiss, RequestsTransport
+
+
+def json_response(data, **headers):
+    return make_response(200, json.dumps(data).encode('utf-8'), dict({'Content-Type': 'application/json'}, **headers))
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return str(tmp_path / 'cassettes' / 'nse.jsonl')
+
+
+def recording_client(stub_client, cassette_path, mode='record'):
+    client = stub_client()
+    client.transport = RequestsTransport()
+    client.cassette = Cassette(cassette_path, mode=mode)
+    return client
+
+
+def replaying_client(stub_client, cassette_path, mode='replay'):
+    client = stub_client(ConnectionError('the network must not be used'))
+    client.cassette = Cassette(cassette_path, mode=mode)
+    return client
+
+
+def test_invalid_mode_is_rejected(cassette_path):
+    with pytest.raises(ValueError):
+        Cassette(cassette_path, mode='rewind')
+
+
+def test_recorded_responses_are_replayed_offline(stub_client, local_server, cassette_path):
+    body = gzip.compress(json.dumps({'symbol': 'TCS'}).encode('utf-8'))
+    local_server.routes['/api/quote-equity'] = [make_response(200, body, {'Content-Type': 'application/json',
+                                                                           'Content-Encoding': 'gzip'})]
+    url = local_server.url('/api/quote-equity')
+
+    recorder = recording_client(stub_client, cassette_path)
+    assert recorder.hit_and_get_data(url, params={'symbol': 'TCS'}) == {'symbol': 'TCS'}
+
+    with open(cassette_path, encoding='utf-8') as f:
+        interaction, = [json.loads(line) for line in f]
+    assert interaction['request'] == {'method': 'GET', 'url': url, 'params': {'symbol': 'TCS'}, 'body': None}
+    assert interaction['response']['headers']['Content-Encoding'] == 'gzip'
+
+    player = replaying_client(stub_client, cassette_path)
+    assert player.hit_and_get_data(url, params={'symbol': 'TCS'}) == {'symbol': 'TCS'}
+    response = player.hit_and_get_response(url, params={'symbol': 'TCS'})
+    assert (response.status_code, response.url, response.raw.read()) == (200, f'{url}?symbol=TCS', body)
+    assert player.transport.requests == []
+
+
+def test_unknown_request_is_a_miss_in_replay_mode(stub_client, cassette_path):
+    player = replaying_client(stub_client, cassette_path)
+
+    with pytest.raises(CassetteMiss):
+        player.hit_and_get_response('https://www.nseindia.com/api/marketStatus')
+    assert player.transport.requests == []
+
+
+def test_repeated_requests_are_replayed_in_order_then_the_last_is_repeated(cassette_path):
+    cassette = Cassette(cassette_path, mode='record')
+    for count in (1, 2):
+        cassette.record('GET', 'https://www.nseindia.com/api/marketStatus', {'n': None}, None, 200, {},
+                        json.dumps({'count': count}).encode('utf-8'))
+
+    player = Cassette(cassette_path, mode='replay')
+    played = [json.loads(player.build_response(player.play('get', 'https://www.nseindia.com/api/marketStatus')).content)
+              for _ in range(3)]
+    assert played == [{'count': 1}, {'count': 2}, {'count': 2}]
+
+
+def test_auto_mode_replays_what_is_recorded_and_records_the_rest(stub_client, local_server, cassette_path):
+    local_server.routes['/api/a'] = [json_response({'a': 1}), json_response({'a': 'changed'})]
+    local_server.routes['/api/b'] = [json_response({'b': 1})]
+    recorder = recording_client(stub_client, cassette_path)
+    recorder.hit_and_get_data(local_server.url('/api/a'))
+
+    client = recording_client(stub_client, cassette_path, mode='auto')
+    assert client.hit_and_get_data(local_server.url('/api/a')) == {'a': 1}
+    assert client.hit_and_get_data(local_server.url('/api/b')) == {'b': 1}
+    assert [hit['path'] for hit in local_server.hits] == ['/api/a', '/api/b']
+
+    player = replaying_client(stub_client, cassette_path)
+    assert player.hit_and_get_data(local_server.url('/api/b')) == {'b': 1}
+
+
+def test_record_mode_starts_the_file_afresh(stub_client, local_server, cassette_path):
+    local_server.routes['/api/a'] = [json_response({'a': 1})]
+    for _ in range(2):
+        recording_client(stub_client, cassette_path).hit_and_get_data(local_server.url('/api/a'))
+
+    with open(cassette_path, encoding='utf-8') as f:
+        assert len(f.readlines()) == 1
+
+
+def test_post_requests_are_matched_by_their_payload(stub_client, local_server, cassette_path):
+    local_server.routes['/api/search'] = [json_response({'found': 'TCS'}), json_response({'found': 'INFY'})]
+    url = local_server.url('/api/search')
+    recorder = recording_client(stub_client, cassette_path)
+    recorder.post_and_get_data(url, json_data={'q': 'TCS'})
+    recorder.post_and_get_data(url, json_data={'q': 'INFY'})
+
+    player = replaying_client(stub_client, cassette_path)
+    assert player.post_and_get_data(url, json_data={'q': 'INFY'}) == {'found': 'INFY'}
+    assert player.post_and_get_data(url, json_data={'q': 'TCS'}) == {'found': 'TCS'}
+
+
+def test_async_requests_are_recorded_and_replayed(stub_client, local_server, cassette_path):
+    local_server.routes['/api/quote-equity'] = [json_response({'symbol': 'TCS'})]
+    url = local_server.url('/api/quote-equity')
+
+    async def fetch(client):
+        try:
+            return await client.async_hit_and_get_data(url, params={'symbol': 'TCS'})
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(fetch(recording_client(stub_client, cassette_path))) == {'symbol': 'TCS'}
+    local_server.close()
+    assert asyncio.run(fetch(replaying_client(stub_client, cassette_path))) == {'symbol': 'TCS'}
+
+
+def test_decode_body_undoes_every_content_encoding():
+    body = b'{"symbol": "TCS"}'
+    assert Cassette.decode_body(gzip.compress(body), 'gzip') == body
+    assert Cassette.decode_body(zlib.compress(body), 'deflate') == body
+    assert Cassette.decode_body(zlib.compress(body)[2:-4], 'deflate') == body
+    assert Cassette.decode_body(gzip.compress(brotli.compress(body)), 'br, gzip') == body
+    assert Cassette.decode_body(body, None) == Cassette.decode_body(body, 'identity') == body
+    with pytest.raises(ValueError):
+        Cassette.decode_body(body, 'zstd')
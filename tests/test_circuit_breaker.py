@@ -0,0 +1,145 @@
+import importlib
+
+import pytest
+
+from conftest import make_response
+
+from Base import CircuitBreaker, CircuitOpenError, HostCircuitBreaker
+
+
+class Clock:
+    """
+        Stand-in of the `time` module of `Base.CircuitBreaker` whose clock only moves when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(importlib.import_module('Base.CircuitBreaker'), 'time', clock)
+    return clock
+
+
+def open_breaker(**settings) -> CircuitBreaker:
+    breaker = CircuitBreaker('www.nseindia.com', **dict({'failure_threshold': 2, 'recovery_timeout': 30}, **settings))
+    for _ in range(breaker.failure_threshold):
+        breaker.allow()
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_the_threshold_of_consecutive_failures(clock):
+    breaker = CircuitBreaker('www.nseindia.com', failure_threshold=3, recovery_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.allow()
+    assert raised.value.host == 'www.nseindia.com'
+    assert raised.value.retry_after == pytest.approx(20)
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_half_open_probes_up_to_its_max_calls(clock):
+    breaker = open_breaker(half_open_max_calls=3)
+    clock.now += 30
+    for _ in range(3):
+        breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_successful_probe_closes_the_circuit(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    # the failures before the probe are forgotten
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_opens_the_circuit_for_another_recovery_timeout(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    clock.now += 1
+    breaker.allow()
+
+
+def test_probe_which_never_reports_back_is_replaced(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.allow()
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.allow()
+    assert raised.value.retry_after == pytest.approx(20)
+
+    clock.now += 20
+    breaker.allow()
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        CircuitBreaker('www.nseindia.com', failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker('www.nseindia.com', half_open_max_calls=0)
+
+
+def test_host_breaker_counts_failure_statuses_and_errors_per_host(clock):
+    breakers = HostCircuitBreaker({'nseindia.com': {'failure_threshold': 2}})
+    breakers.record('https://www.nseindia.com/api/quote', 503)
+    breakers.record('https://www.nseindia.com/api/quote', None)
+    breakers.record('https://charting.nseindia.com/Charts', 404)
+
+    assert breakers.states() == {'www.nseindia.com': 'open', 'charting.nseindia.com': 'closed'}
+    with pytest.raises(CircuitOpenError):
+        breakers.allow('https://www.nseindia.com/api/marketStatus')
+    breakers.allow('https://charting.nseindia.com/Charts')
+
+    breakers.reset('www.nseindia.com')
+    breakers.allow('https://www.nseindia.com/api/marketStatus')
+
+
+def test_client_stops_sending_once_the_circuit_opens(stub_client):
+    client = stub_client(make_response(503, b'{}'))
+    client._max_retries = 0
+    client.circuit_breaker.configure('nseindia.com', failure_threshold=2)
+    url = 'https://www.nseindia.com/api/quote-equity'
+
+    assert client.hit_and_get_data(url) == {} and client.hit_and_get_data(url) == {}
+    with pytest.raises(CircuitOpenError):
+        client.hit_and_get_data(url)
+    assert len(client.transport.requests) == 2
+    assert client.fetch_many([url])[0].error.host == 'www.nseindia.com'
@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from conftest import make_response
+
+from Base import AIMDLimit, HostConcurrencyLimiter
+
+
+def test_healthy_responses_grow_the_limit_additively():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=4, max_limit=32)
+    for _ in range(4):
+        limit.record(200, 0.05)
+    # about one slot per round of `limit` requests
+    assert 4.9 < limit.limit < 5
+
+    for _ in range(1000):
+        limit.record(200, 0.05)
+    assert limit.limit == 32
+
+
+@pytest.mark.parametrize('status', [403, 429, 500, 503, None])
+def test_congestion_halves_the_limit(status):
+    limit = AIMDLimit('www.nseindia.com', initial_limit=8)
+    limit.record(status, 0.05)
+    assert limit.limit == 4
+
+
+def test_limit_never_goes_below_its_minimum():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=4, min_limit=2)
+    for _ in range(5):
+        limit.record(503)
+    assert limit.limit == 2
+
+
+def test_failures_of_requests_sent_before_a_cut_count_once():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=16)
+    sent = time.monotonic()
+    for _ in range(8):
+        limit.record(503, 1.0, started=sent)
+    assert limit.limit == 8
+
+    limit.record(503, 1.0, started=time.monotonic())
+    assert limit.limit == 4
+
+
+def test_rising_latency_of_an_endpoint_is_congestion():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=8)
+    for _ in range(10):
+        limit.record(200, 0.05, endpoint='/api/quote-equity')
+    grown = limit.limit
+
+    for _ in range(3):
+        limit.record(200, 0.5, endpoint='/api/quote-equity')
+    assert limit.limit < grown
+
+
+def test_slow_endpoint_is_compared_with_its_own_baseline():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=8)
+    for _ in range(10):
+        limit.record(200, 0.05, endpoint='/api/quote-equity')
+    for _ in range(10):
+        limit.record(200, 0.5, endpoint='/api/option-chain-indices')
+    assert limit.limit > 8
+
+    shared = AIMDLimit('www.nseindia.com', initial_limit=8)
+    for _ in range(10):
+        shared.record(200, 0.05)
+    for _ in range(10):
+        shared.record(200, 0.5)
+    assert shared.limit < 8
+
+
+def test_least_recently_seen_endpoints_are_dropped():
+    limit = AIMDLimit('www.nseindia.com', max_endpoints=2)
+    for endpoint in ('/a', '/b', '/a', '/c'):
+        limit.record(200, 0.05, endpoint=endpoint)
+    assert list(limit._baselines) == ['/a', '/c']
+
+
+def test_slots_are_bounded_by_the_limit():
+    limit = AIMDLimit('www.nseindia.com', initial_limit=2)
+    limit.acquire()
+    limit.acquire()
+    waiter = threading.Thread(target=limit.acquire)
+    waiter.start()
+    waiter.join(0.05)
+    assert waiter.is_alive()
+
+    limit.release()
+    waiter.join(1)
+    assert not waiter.is_alive()
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        AIMDLimit('www.nseindia.com', initial_limit=64, max_limit=32)
+    with pytest.raises(ValueError):
+        AIMDLimit('www.nseindia.com', backoff=1)
+
+
+def test_host_limiter_keys_the_latency_by_endpoint_template():
+    limiter = HostConcurrencyLimiter({'screener.in': {'initial_limit': 2, 'max_limit': 4}})
+    for symbol in ('RELIANCE', 'TCS', 'INFY'):
+        limiter.record(f'https://www.nseindia.com/api/quote-equity?symbol={symbol}', 200, 0.05)
+    limiter.record('https://www.screener.in/company/TCS/', 429)
+
+    limit = limiter.limit_for('https://www.nseindia.com/api/quote-equity')
+    assert list(limit._baselines) == ['/api/quote-equity']
+    assert limiter.limits() == {'www.nseindia.com': round(limit.limit, 2), 'www.screener.in': 1}
+
+
+def test_client_records_every_outcome_into_the_limit_of_the_host(stub_client):
+    client = stub_client(make_response(200, b'{}'), make_response(503, b'{}'))
+    client.concurrency_limiter = HostConcurrencyLimiter({'nseindia.com': {'initial_limit': 8}})
+    client._max_retries = 0
+    url = 'https://www.nseindia.com/api/quote-equity'
+
+    client.hit_and_get_data(url)
+    grown = client.concurrency_limiter.limit_for(url).limit
+    assert grown > 8
+
+    client.hit_and_get_data(url)
+    assert client.concurrency_limiter.limit_for(url).limit == grown / 2
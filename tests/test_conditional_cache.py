@@ -0,0 +1,120 @@
+import json
+import os
+
+from conftest import counters, make_response
+
+from Base import ConditionalCache
+
+URL = 'https://www.nseindia.com/api/equity-master'
+
+
+def json_response(data, status: int = 200, **headers):
+    headers = dict({'Content-Type': 'application/json'}, **headers)
+    return make_response(status, json.dumps(data).encode('utf-8'), headers)
+
+
+def test_304_reuses_the_kept_body(stub_client):
+    client = stub_client(json_response({'symbols': ['TCS', 'INFY']}, ETag='"v1"'), make_response(304, b''))
+
+    first = client.hit_and_get_data(URL)
+    second = client.hit_and_get_data(URL)
+
+    sent = client.transport.requests
+    assert 'If-None-Match' not in sent[0]['headers']
+    assert sent[1]['headers']['If-None-Match'] == '"v1"'
+    assert first == second == {'symbols': ['TCS', 'INFY']}
+    assert counters(client, 'www.nseindia.com', '/api/equity-master')['cache.revalidated'] == 1
+
+
+def test_304_hands_every_caller_its_own_object(stub_client):
+    client = stub_client(json_response({'symbols': ['TCS']}, ETag='"v1"'), make_response(304, b''))
+
+    client.hit_and_get_data(URL)['symbols'].append('altered')
+    first = client.hit_and_get_data(URL)
+    first['symbols'].append('altered')
+
+    assert client.hit_and_get_data(URL) == {'symbols': ['TCS']}
+
+
+def test_last_modified_is_sent_as_if_modified_since(stub_client):
+    stamp = 'Fri, 16 Oct 2026 10:00:00 GMT'
+    client = stub_client(json_response({'a': 1}, **{'Last-Modified': stamp}), make_response(304, b''))
+
+    client.hit_and_get_data(URL)
+    assert client.hit_and_get_data(URL) == {'a': 1}
+    assert client.transport.requests[1]['headers']['If-Modified-Since'] == stamp
+
+
+def test_changed_resource_replaces_the_kept_one(stub_client):
+    client = stub_client(json_response({'a': 1}, ETag='"v1"'), json_response({'a': 2}, ETag='"v2"'),
+                         make_response(304, b''))
+
+    client.hit_and_get_data(URL)
+    assert client.hit_and_get_data(URL) == {'a': 2}
+    assert client.hit_and_get_data(URL) == {'a': 2}
+    assert client.transport.requests[2]['headers']['If-None-Match'] == '"v2"'
+
+
+def test_responses_without_validator_or_private_are_not_kept(stub_client):
+    for headers in ({}, {'ETag': '"v1"', 'Cache-Control': 'no-store'}, {'ETag': '"v1"', 'Vary': 'Accept, Cookie'}):
+        client = stub_client(json_response({'a': 1}, **headers))
+        client.hit_and_get_data(URL)
+        client.hit_and_get_data(URL)
+        assert 'If-None-Match' not in client.transport.requests[1]['headers']
+
+
+def test_requests_with_other_headers_are_kept_apart(stub_client):
+    client = stub_client(json_response({'a': 1}, ETag='"v1"'))
+
+    client.hit_and_get_data(URL, headers={'Accept-Language': 'en'})
+    client.hit_and_get_data(URL, headers={'Accept-Language': 'hi'})
+    client.hit_and_get_data(URL, headers={'accept-language': 'en'})
+
+    sent = client.transport.requests
+    assert 'If-None-Match' not in sent[1]['headers']
+    assert sent[2]['headers']['If-None-Match'] == '"v1"'
+
+
+def test_post_requests_are_never_conditional(stub_client):
+    client = stub_client(json_response({'a': 1}, ETag='"v1"'))
+
+    client.post_and_get_data(URL, json_data={'symbol': 'TCS'})
+    client.post_and_get_data(URL, json_data={'symbol': 'TCS'})
+    assert 'If-None-Match' not in client.transport.requests[1]['headers']
+
+
+def test_html_pages_are_not_kept_as_raw_responses(stub_client):
+    page = make_response(200, b'<html></html>', {'Content-Type': 'text/html', 'ETag': '"p1"'})
+    client = stub_client(page)
+
+    client.hit_and_get_response('https://www.nseindia.com/option-chain')
+    client.hit_and_get_response('https://www.nseindia.com/option-chain')
+    assert 'If-None-Match' not in client.transport.requests[1]['headers']
+
+
+def test_cache_is_bounded_by_size_and_drops_the_least_recently_used():
+    cache = ConditionalCache(max_bytes=10)
+    headers = {'ETag': '"v"'}
+    cache.store('a', headers, content=b'1234')
+    cache.store('b', headers, content=b'1234')
+    cache.get('a')
+    cache.store('c', headers, content=b'1234')
+
+    assert cache.get('b') is None
+    assert cache.get('a').content == b'1234' and cache.get('c') is not None
+    assert cache.size() == 8
+
+    cache.store('big', headers, content=b'x' * 11)
+    assert cache.get('big') is None
+
+
+def test_dropped_file_entries_remove_their_copy():
+    cache = ConditionalCache()
+    path = cache.new_file_path()
+    with open(path, 'wb') as file:
+        file.write(b'body')
+    cache.store('master', {'ETag': '"v"'}, size=4, path=path)
+    assert cache.get('master').path == path
+
+    cache.clear()
+    assert not os.path.exists(path)
@@ -0,0 +1,97 @@
+import json
+import time
+
+import pytest
+from requests.cookies import RequestsCookieJar, create_cookie
+
+from Base import CookieStore, NSEBase, SessionRegistry
+
+
+def jar_of(*cookies) -> RequestsCookieJar:
+    jar = RequestsCookieJar()
+    for name, domain, expires in cookies:
+        jar.set_cookie(create_cookie(name, f'{name}-value', domain=domain, path='/', expires=expires))
+    return jar
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CookieStore(str(tmp_path / 'cache' / 'cookies.json'))
+
+
+def test_saved_cookies_are_loaded_with_their_expiry(store):
+    expires = int(time.time()) + 3600
+    store.save(jar_of(('nsit', '.nseindia.com', expires), ('bm_sv', 'www.nseindia.com', None)))
+
+    jar = RequestsCookieJar()
+    assert store.load(jar, 'nseindia.com')
+    assert {cookie.name: cookie.expires for cookie in jar} == {'nsit': expires, 'bm_sv': None}
+    assert jar.get('nsit', domain='.nseindia.com') == 'nsit-value'
+
+
+def test_only_the_cookies_of_the_domain_are_saved_and_loaded(store):
+    expires = int(time.time()) + 3600
+    store.save(jar_of(('nsit', '.nseindia.com', expires), ('csrftoken', 'www.screener.in', expires)), 'nseindia.com')
+
+    with open(store.file_path, encoding='utf-8') as f:
+        assert [cookie['name'] for cookie in json.load(f)['cookies']] == ['nsit']
+    assert not store.load(RequestsCookieJar(), 'screener.in')
+    assert store.load(RequestsCookieJar(), 'NSEindia.com')
+
+
+@pytest.mark.parametrize('expires_in', [-10, 30])
+def test_nothing_is_loaded_when_any_cookie_is_expired_or_about_to(store, expires_in):
+    store.save(jar_of(('nsit', '.nseindia.com', int(time.time()) + 3600),
+                      ('nseappid', '.nseindia.com', int(time.time()) + expires_in)))
+
+    jar = RequestsCookieJar()
+    assert not store.load(jar)
+    assert len(jar) == 0
+
+
+def test_session_cookies_are_trusted_for_their_ttl(store):
+    store.save(jar_of(('bm_sv', 'www.nseindia.com', None)))
+    assert store.load(RequestsCookieJar())
+
+    short_lived = CookieStore(store.file_path, session_cookie_ttl=30)
+    assert not short_lived.load(RequestsCookieJar())
+
+
+@pytest.mark.parametrize('content', [None, '', '{not json', '{"saved_at": 0, "cookies": []}'])
+def test_missing_or_corrupt_file_means_a_warm_up(store, content):
+    if content is not None:
+        store.save(jar_of(('nsit', '.nseindia.com', None)))
+        with open(store.file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    assert not store.load(RequestsCookieJar())
+
+
+def test_save_replaces_the_file_and_clear_deletes_it(store, tmp_path):
+    store.save(jar_of(('nsit', '.nseindia.com', None)))
+    store.save(jar_of(('nseappid', '.nseindia.com', None)))
+    store.save(RequestsCookieJar())     # nothing to save keeps the earlier cookies
+
+    jar = RequestsCookieJar()
+    assert store.load(jar) and [cookie.name for cookie in jar] == ['nseappid']
+    assert [entry.name for entry in (tmp_path / 'cache').iterdir()] == ['cookies.json']
+
+    store.clear()
+    store.clear()
+    assert not store.load(RequestsCookieJar())
+
+
+def test_nse_client_skips_the_warm_up_with_fresh_saved_cookies(store, monkeypatch):
+    monkeypatch.setattr(NSEBase, 'session_registry', SessionRegistry())
+    monkeypatch.setattr(NSEBase, 'cookie_store', store)
+    assert 'nseindia.com' not in NSEBase()._primed
+
+    monkeypatch.setattr(NSEBase, 'session_registry', SessionRegistry())
+    store.save(jar_of(('nsit', '.nseindia.com', int(time.time()) + 3600)))
+    client = NSEBase()
+    assert 'nseindia.com' in client._primed
+    assert client._nse_cookies_fresh()
+
+    client.session.cookies.set('nseappid', 'refreshed', domain='.nseindia.com', path='/')
+    client.save_cookies()
+    jar = RequestsCookieJar()
+    assert store.load(jar) and jar.get('nseappid') == 'refreshed'
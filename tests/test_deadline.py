@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from conftest import make_response
+
+from Base import Deadline, DeadlineExceeded
+
+URL = 'https://www.nseindia.com/api/quote-equity'
+
+
+def test_no_deadline_outside_a_block():
+    assert Deadline.remaining() is None
+    assert not Deadline.expired()
+    assert Deadline.check() is None
+
+
+def test_remaining_counts_down_and_check_fails_once_over():
+    with Deadline(0.05):
+        assert 0 < Deadline.check() <= 0.05
+        time.sleep(0.06)
+        assert Deadline.remaining() == 0 and Deadline.expired()
+        with pytest.raises(DeadlineExceeded):
+            Deadline.check()
+    assert Deadline.remaining() is None
+
+
+def test_nested_deadlines_only_shorten_the_budget():
+    with Deadline(10) as outer:
+        with Deadline(60) as inner:
+            assert inner.expires_at == outer.expires_at
+        with Deadline(1):
+            assert Deadline.remaining() <= 1
+        with Deadline():
+            assert Deadline.remaining() > 1
+        assert Deadline.remaining() > 1
+
+
+def test_deadline_follows_the_code_into_tasks():
+    async def remaining():
+        return Deadline.remaining()
+
+    async def main():
+        with Deadline(5):
+            return await asyncio.gather(asyncio.ensure_future(remaining()), remaining())
+
+    assert all(0 < seconds <= 5 for seconds in asyncio.run(main()))
+
+
+def test_timeouts_are_cut_down_to_the_time_left(stub_client):
+    client = stub_client(make_response(200, b'{}'))
+
+    client.hit_and_get_data(URL)
+    assert client.transport.requests[0]['timeout'] == client._request_timeout()
+
+    with Deadline(0.5):
+        client.hit_and_get_data(URL)
+    connect, read = client.transport.requests[1]['timeout']
+    assert 0 < connect <= 0.5 and 0 < read <= 0.5
+
+
+def test_request_fails_fast_without_touching_the_network_once_over(stub_client):
+    client = stub_client(make_response(200, b'{}'))
+
+    with Deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            client.hit_and_get_response(URL)
+        assert client.hit_and_get_data(URL) == {}
+    assert client.transport.requests == []
+
+
+def test_timeout_past_the_deadline_is_not_a_failure_of_the_host(stub_client):
+    client = stub_client(ReadTimeout('read timed out'))
+    client.circuit_breaker.configure('nseindia.com', failure_threshold=1)
+
+    with Deadline(0.01):
+        time.sleep(0.02)
+        client._record_outcome(URL)
+    assert client.circuit_breaker.states() == {}
+
+    with pytest.raises(ReadTimeout):
+        client.hit_and_get_response(URL)
+    assert client.circuit_breaker.states() == {'www.nseindia.com': 'open'}
+
+
+def test_fetch_many_reports_the_requests_left_out_by_the_deadline(stub_client):
+    client = stub_client(make_response(200, b'{"a": 1}'))
+
+    with Deadline(0):
+        results = client.fetch_many([URL, URL + '?symbol=TCS'])
+    assert all(isinstance(result.error, DeadlineExceeded) for result in results)
+    assert client.transport.requests == []
@@ -0,0 +1,133 @@
+import io
+import os
+
+import pytest
+from requests import HTTPError
+
+from conftest import StubTransport, make_response
+
+from Base import ResponseCache
+from Base.CustomRequest import _BoundedCopy, _Tee
+
+URL = 'https://charting.nseindia.com/Charts/GetEQMasters'
+BODY = b'Symbol,Token\nTCS,11536\n' * 100
+
+
+class EvictingTransport(StubTransport):
+    """
+        Stub transport which empties the conditional cache of the client while the request is in flight, as another
+        download storing a newer copy (or the LRU) would.
+    """
+
+    def request(self, client, method, url, headers=None, timeout=None, **kwargs):
+        client.conditional_cache.clear()
+        return super().request(client, method, url, headers=headers, timeout=timeout, **kwargs)
+
+
+def test_body_is_written_in_chunks_with_progress(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY, {'Content-Length': str(len(BODY))}))
+    reports = []
+
+    written = client.download(URL, tmp_path / 'master.csv', chunk_size=1000, progress=reports.append)
+
+    assert written == len(BODY)
+    assert (tmp_path / 'master.csv').read_bytes() == BODY
+    assert [report.received for report in reports] == [1000, 2000, len(BODY)]
+    assert {report.total for report in reports} == {len(BODY)}
+    assert not (tmp_path / 'master.csv.part').exists()
+    assert client.transport.requests[0]['kwargs']['stream'] is True
+
+
+def test_body_can_be_written_to_any_writer(stub_client):
+    sink = io.BytesIO()
+    assert stub_client(make_response(200, BODY)).download(URL, sink) == len(BODY)
+    assert sink.getvalue() == BODY
+
+
+def test_error_status_raises_and_writes_nothing(stub_client, tmp_path):
+    client = stub_client(make_response(404, b'<html>not found</html>'))
+
+    with pytest.raises(HTTPError):
+        client.download(URL, tmp_path / 'master.csv')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_write_leaves_no_partial_file(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY))
+
+    def interrupt(report):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        client.download(URL, tmp_path / 'master.csv', chunk_size=100, progress=interrupt)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_304_copies_the_kept_file(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY, {'ETag': '"m1"'}), make_response(304, b''))
+
+    client.download(URL, tmp_path / 'first.csv')
+    assert client.download(URL, tmp_path / 'second.csv') == len(BODY)
+    assert (tmp_path / 'second.csv').read_bytes() == BODY
+    assert client.transport.requests[1]['headers']['If-None-Match'] == '"m1"'
+
+
+def test_304_copy_survives_its_eviction_during_the_request(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY, {'ETag': '"m1"'}))
+    client.download(URL, tmp_path / 'first.csv')
+    client.transport = EvictingTransport(make_response(304, b''))
+
+    assert client.download(URL, tmp_path / 'second.csv') == len(BODY)
+    assert (tmp_path / 'second.csv').read_bytes() == BODY
+
+
+def test_copy_gone_before_the_request_is_fetched_again(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY, {'ETag': '"m1"'}))
+    client.download(URL, tmp_path / 'first.csv')
+    for entry in list(client.conditional_cache._entries.values()):
+        os.remove(entry.path)
+
+    client.download(URL, tmp_path / 'second.csv')
+    assert 'If-None-Match' not in client.transport.requests[1]['headers']
+    assert (tmp_path / 'second.csv').read_bytes() == BODY
+
+
+def test_small_bodies_are_served_from_the_response_cache(stub_client, tmp_path):
+    client = stub_client(make_response(200, BODY))
+    client.conditional_cache = None
+    client.cache = ResponseCache(':memory:')
+
+    client.download(URL, tmp_path / 'first.csv')
+    client.download(URL, tmp_path / 'second.csv')
+    assert len(client.transport.requests) == 1
+    assert (tmp_path / 'second.csv').read_bytes() == BODY
+
+
+@pytest.mark.parametrize('headers', [{}, {'Content-Length': str(len(BODY))}])
+def test_bodies_over_the_limit_are_not_held_for_the_response_cache(stub_client, tmp_path, headers):
+    client = stub_client(make_response(200, BODY, headers))
+    client.conditional_cache = None
+    client.cache = ResponseCache(':memory:')
+    client.download_cache_max_bytes = len(BODY) - 1
+
+    client.download(URL, tmp_path / 'first.csv', chunk_size=100)
+    client.download(URL, tmp_path / 'second.csv', chunk_size=100)
+    assert len(client.transport.requests) == 2
+    assert client.cache.size() == 0
+
+
+def test_tee_writes_every_copy():
+    sink, copy = io.BytesIO(), io.BytesIO()
+    tee = _Tee(sink, copy)
+    tee.write(b'ab')
+    tee.write(b'cd')
+    assert sink.getvalue() == copy.getvalue() == b'abcd'
+
+
+def test_bounded_copy_gives_up_past_its_limit():
+    copy = _BoundedCopy(4)
+    copy.write(b'abc')
+    assert copy.getvalue() == b'abc'
+    copy.write(b'de')
+    copy.write(b'f')
+    assert copy.overflowed and copy.getvalue() is None
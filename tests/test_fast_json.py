@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from conftest import make_response
+
+from Base.FastJson import loads, loads_stdlib
+
+
+@pytest.mark.parametrize('decoder', [loads, loads_stdlib])
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-32', 'utf-32-be'])
+def test_bodies_in_every_json_encoding_are_parsed(decoder, encoding):
+    assert decoder('{"name": "Tata Consultancy Services – TCS"}'.encode(encoding)) == \
+        {'name': 'Tata Consultancy Services – TCS'}
+
+
+@pytest.mark.parametrize('decoder', [loads, loads_stdlib])
+def test_nan_literals_are_accepted(decoder):
+    assert decoder(b'{"pe": NaN}')['pe'] != decoder(b'{"pe": NaN}')['pe']
+
+
+@pytest.mark.parametrize('decoder', [loads, loads_stdlib])
+@pytest.mark.parametrize('content', [b'{"name": "\xe9"}', b'<html></html>', b''])
+def test_undecodable_or_invalid_bodies_are_decode_errors(decoder, content):
+    with pytest.raises(json.JSONDecodeError):
+        decoder(content)
+
+
+def test_non_utf8_body_is_reported_as_a_parse_error(stub_client, capsys):
+    client = stub_client(make_response(200, '{"name": "é"}'.encode('latin-1')))
+
+    assert client.hit_and_get_data('https://www.nseindia.com/api/quote-equity') == {}
+    assert 'Error in connecting' not in capsys.readouterr().out
+
+
+def test_non_utf8_body_in_fetch_many_gets_the_default_quietly(stub_client, capsys):
+    client = stub_client(make_response(200, '{"name": "é"}'.encode('cp1252')))
+
+    result, = client.fetch_many(['https://www.nseindia.com/api/quote-equity'])
+    assert isinstance(result.error, json.JSONDecodeError)
+    assert client._result_data(result) == {}
+    assert 'Error in connecting' not in capsys.readouterr().out
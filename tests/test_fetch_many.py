@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from conftest import StubTransport, make_response
+
+from Base import HostConcurrencyLimiter, Priority, RequestSpec
+
+NSE = 'https://www.nseindia.com'
+SCREENER = 'https://www.screener.in'
+
+
+class RoutedTransport(StubTransport):
+    """
+        Transport answering by the path of the url (`{'path': ...}` echoed back when the path has no route) after
+        `delay` seconds, and keeping the most requests it had in flight to every host.
+    """
+
+    def __init__(self, routes: dict = None, delay: float = 0) -> None:
+        super().__init__()
+        self.routes = routes or {}
+        self.delay = delay
+        self.max_in_flight = Counter()
+        self._in_flight = Counter()
+        self._lock = threading.Lock()
+
+    def request(self, client, method: str, url: str, headers: dict = None, timeout: tuple = None, **kwargs):
+        split = urlsplit(url)
+        with self._lock:
+            self.requests.append({'method': method, 'url': url, 'kwargs': kwargs, 'priority': Priority.current()})
+            self._in_flight[split.hostname] += 1
+            self.max_in_flight[split.hostname] = max(self.max_in_flight[split.hostname],
+                                                     self._in_flight[split.hostname])
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self._in_flight[split.hostname] -= 1
+        answer = self.routes.get(split.path)
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer or make_response(200, json.dumps({'path': split.path}).encode('utf-8'), url=url)
+
+
+@pytest.fixture
+def routed_client(stub_client):
+    def build(routes: dict = None, delay: float = 0):
+        client = stub_client()
+        client.transport = RoutedTransport(routes, delay)
+        return client
+
+    return build
+
+
+def test_no_specs_and_invalid_kind(routed_client):
+    client = routed_client()
+    assert client.fetch_many([]) == []
+    with pytest.raises(ValueError):
+        client.fetch_many([f'{NSE}/api/a'], kind='xml')
+
+
+def test_results_keep_the_order_of_every_kind_of_spec(routed_client):
+    client = routed_client(delay=0.01)
+    specs = [f'{NSE}/api/{number}' for number in range(10)] + [
+        {'url': f'{NSE}/api/dict', 'params': {'symbol': 'TCS'}},
+        RequestSpec(f'{NSE}/api/spec'),
+        {'url': f'{NSE}/api/search', 'json_data': {'q': 'TCS'}},
+    ]
+
+    results = client.fetch_many(specs)
+
+    assert [result.spec for result in results] == specs
+    assert [result.data['path'] for result in results] == \
+        [f'/api/{number}' for number in range(10)] + ['/api/dict', '/api/spec', '/api/search']
+    methods = {urlsplit(sent['url']).path: sent['method'] for sent in client.transport.requests}
+    assert (methods['/api/dict'], methods['/api/search']) == ('GET', 'POST')
+
+
+def test_a_failed_request_is_reported_in_its_own_result(routed_client):
+    client = routed_client({'/api/down': ConnectionError('reset by peer'),
+                            '/page': make_response(200, b'<html></html>')})
+    client._max_retries = 0
+
+    results = client.fetch_many([f'{NSE}/api/up', f'{NSE}/api/down', f'{NSE}/page', {'params': {'a': 1}}])
+
+    assert [result.ok for result in results] == [True, False, False, False]
+    assert results[0].data == {'path': '/api/up'}
+    assert isinstance(results[1].error, ConnectionError)
+    assert isinstance(results[2].error, json.JSONDecodeError)
+    assert isinstance(results[3].error, ValueError)
+
+
+def test_result_data_reports_failures_like_hit_and_get_data(routed_client, capsys):
+    client = routed_client({'/api/down': ConnectionError('reset by peer')})
+
+    up, down = client.fetch_many([f'{NSE}/api/up', {'url': f'{NSE}/api/down'}])
+
+    assert client._result_data(up) == {'path': '/api/up'}
+    assert client._result_data(down) == {} and client._result_data(down, default=[]) == []
+    assert f'Error in connecting to url : {NSE}/api/down' in capsys.readouterr().out
+
+
+def test_requests_in_flight_are_bounded_per_host(routed_client):
+    client = routed_client(delay=0.02)
+    specs = [f'{NSE}/api/{number}' for number in range(8)] + [f'{SCREENER}/company/{number}/' for number in range(8)]
+
+    assert all(result.ok for result in client.fetch_many(specs, per_host=2))
+    assert client.transport.max_in_flight == {'www.nseindia.com': 2, 'www.screener.in': 2}
+
+
+def test_requests_in_flight_follow_the_adaptive_limit_of_the_host(routed_client):
+    client = routed_client(delay=0.02)
+    client.concurrency_limiter = HostConcurrencyLimiter({'screener.in': {'initial_limit': 1, 'max_limit': 1}})
+
+    client.fetch_many([f'{SCREENER}/company/{number}/' for number in range(6)])
+
+    assert client.transport.max_in_flight['www.screener.in'] == 1
+
+
+def test_pool_size_is_bounded_by_max_workers(routed_client):
+    client = routed_client(delay=0.02)
+
+    client.fetch_many([f'{NSE}/api/{number}' for number in range(6)], per_host=6, max_workers=3)
+
+    assert client.transport.max_in_flight['www.nseindia.com'] == 3
+
+
+def test_priority_of_the_spec_or_the_batch(routed_client):
+    client = routed_client()
+
+    client.fetch_many([f'{NSE}/api/bulk', {'url': f'{NSE}/api/interactive', 'priority': Priority.INTERACTIVE}],
+                      priority=Priority.BULK)
+
+    priorities = {urlsplit(sent['url']).path: sent['priority'] for sent in client.transport.requests}
+    assert priorities == {'/api/bulk': Priority.BULK, '/api/interactive': Priority.INTERACTIVE}
+
+
+def test_other_kinds_of_data(routed_client, tmp_path):
+    client = routed_client({'/file.csv': make_response(200, b'a,b\n1,2\n')})
+    destination = str(tmp_path / 'file.csv')
+
+    content, = client.fetch_many([f'{NSE}/file.csv'], kind='content')
+    response, = client.fetch_many([{'url': f'{NSE}/file.csv', 'allow_redirects': False}], kind='response')
+    written, = client.fetch_many([{'url': f'{NSE}/file.csv', 'destination': destination}], kind='file')
+
+    assert content.data == b'a,b\n1,2\n'
+    assert response.data.status_code == 200 and client.transport.requests[1]['kwargs']['allow_redirects'] is False
+    assert written.data == 8
+    with open(destination, 'rb') as f:
+        assert f.read() == b'a,b\n1,2\n'
@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+
+import pytest
+
+from conftest import StubTransport, make_response
+
+from Base import Hedger, HostRateLimiter
+
+URL = 'https://www.nseindia.com/api/option-chain-v3?type=Indices&symbol=NIFTY'
+
+
+class SlowTransport(StubTransport):
+    """
+        Stub transport answering the n-th request after `delays[n]` seconds (the last delay is repeated) with a body
+        naming the request.
+    """
+
+    def __init__(self, *delays) -> None:
+        super().__init__()
+        self.delays = list(delays)
+        self._lock = threading.Lock()
+
+    def request(self, client, method, url, headers=None, timeout=None, **kwargs):
+        with self._lock:
+            sent = len(self.requests)
+            self.requests.append({'method': method, 'url': url})
+        time.sleep(self.delays[min(sent, len(self.delays) - 1)])
+        return make_response(200, json.dumps({'request': sent}).encode('utf-8'), url=url)
+
+
+def hedged_client(stub_client, *delays, delay=0.05):
+    client = stub_client()
+    client.transport = SlowTransport(*delays)
+    client.hedger = Hedger(min_samples=1, min_delay=delay, max_extra_load=1)
+    client.hedger.observe(URL, delay)
+    return client
+
+
+def test_delay_is_the_percentile_of_the_recent_latencies():
+    hedger = Hedger(min_samples=10, min_delay=0.01)
+    for latency in range(1, 10):
+        hedger.observe(URL, latency / 100)
+    assert hedger.delay_for(URL) is None
+
+    hedger.observe(URL, 0.5)
+    assert hedger.delay_for(URL) == 0.5
+    assert hedger.delay_for('https://www.nseindia.com/api/option-chain-v3?symbol=BANKNIFTY') == 0.5
+    assert not hedger.hedges('https://www.nseindia.com/api/marketStatus')
+
+
+def test_budget_caps_the_extra_load():
+    hedger = Hedger(max_extra_load=0.5, burst=1)
+    hedger.delay_for(URL)
+    assert not hedger.try_hedge(URL)
+    hedger.delay_for(URL)
+    assert hedger.try_hedge(URL)
+    assert not hedger.try_hedge(URL)
+    assert hedger.stats() == {'requests': 2, 'hedges': 1, 'hedge_wins': 0, 'over_budget': 2}
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        Hedger(percentile=100)
+
+
+def test_slow_request_is_hedged_and_the_duplicate_wins(stub_client):
+    client = hedged_client(stub_client, 0.5, 0)
+
+    assert client.hit_and_get_data(URL) == {'request': 1}
+    assert client.hedger.stats()['hedge_wins'] == 1
+    client.close()
+
+
+def test_fast_request_is_not_hedged(stub_client):
+    client = hedged_client(stub_client, 0, delay=0.2)
+
+    assert client.hit_and_get_data(URL) == {'request': 0}
+    assert client.hedger.stats()['hedges'] == 0
+    client.close()
+
+
+def test_waiting_for_a_thread_does_not_count_as_latency(stub_client):
+    client = hedged_client(stub_client, 0.06, delay=0.1)
+    client.bulk_max_workers = 1
+    threads = [threading.Thread(target=client.hit_and_get_data, args=(URL,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(client.transport.requests) == 4
+    assert client.hedger.stats()['hedges'] == 0
+    client.close()
+
+
+def test_no_hedge_without_a_rate_limit_token(stub_client):
+    client = hedged_client(stub_client, 0.3, 0)
+    client.rate_limiter = HostRateLimiter({'nseindia.com': (1, 1)})
+
+    assert client.hit_and_get_data(URL) == {'request': 0}
+    assert len(client.transport.requests) == 1
+    client.close()
+
+
+def test_close_leaves_requests_in_flight_to_finish(stub_client):
+    client = hedged_client(stub_client, 0.2, 0.2)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(client.hit_and_get_data(URL)))
+    thread.start()
+    time.sleep(0.1)
+    client.close()
+    thread.join()
+
+    assert results and 'request' in results[0]
+    # the pools are started again for the next request
+    assert client.hit_and_get_data(URL)
+    client.close()
@@ -0,0 +1,172 @@
+import importlib
+import socket
+from datetime import datetime, time as dt_time, timezone
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from conftest import counters, make_response
+
+from Base import DnsCache, KeepWarm, Priority
+from Base.ResponseCache import IST
+
+URL = 'https://www.nseindia.com/'
+ADDRESS = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', 443))]
+
+
+class Resolver:
+    """
+        Stand-in of the system resolver and of the clock of `Base.KeepWarm`, it counts the lookups and fails while
+        `down` is set.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.lookups = 0
+        self.down = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def getaddrinfo(self, *key) -> list:
+        self.lookups += 1
+        if self.down:
+            raise socket.gaierror('temporary failure in name resolution')
+        return list(ADDRESS)
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    resolver = Resolver()
+    module = importlib.import_module('Base.KeepWarm')
+    monkeypatch.setattr(module, 'time', resolver)
+    monkeypatch.setattr(module, '_system_getaddrinfo', resolver.getaddrinfo)
+    monkeypatch.setattr(module, '_installed', [])
+    monkeypatch.setattr(socket, 'getaddrinfo', socket.getaddrinfo)
+    return resolver
+
+
+def at(year, month, day, hour, minute):
+    return datetime(year, month, day, hour, minute, tzinfo=IST)
+
+
+@pytest.mark.parametrize('now, active', [
+    (at(2026, 10, 16, 9, 0), True),        # Friday, from a little before the open
+    (at(2026, 10, 16, 15, 34), True),
+    (at(2026, 10, 16, 8, 59), False),
+    (at(2026, 10, 16, 15, 35), False),     # the window ends a little after the close
+    (at(2026, 10, 17, 10, 0), False),      # Saturday
+])
+def test_is_active_inside_the_windows_on_weekdays(stub_client, now, active):
+    assert KeepWarm(stub_client(), urls=[URL]).is_active(now) is active
+
+
+def test_is_active_converts_to_ist(stub_client):
+    warm = KeepWarm(stub_client(), urls=[URL])
+    assert warm.is_active(datetime(2026, 10, 16, 3, 45, tzinfo=timezone.utc))
+    assert not warm.is_active(datetime(2026, 10, 16, 10, 30, tzinfo=timezone.utc))
+
+
+def test_is_active_with_own_windows_every_day(stub_client):
+    warm = KeepWarm(stub_client(), urls=[URL], windows=[(dt_time(18, 0), dt_time(23, 30))], weekdays_only=False)
+    assert warm.is_active(at(2026, 10, 17, 19, 0))
+    assert not warm.is_active(at(2026, 10, 16, 10, 0))
+
+
+def test_invalid_settings_are_rejected(stub_client):
+    with pytest.raises(ValueError):
+        KeepWarm(stub_client(), urls=[URL], connections=0)
+    with pytest.raises(ValueError):
+        KeepWarm(stub_client(), urls=[URL], interval=0)
+
+
+def test_urls_default_to_the_primer_pages(stub_client):
+    client = stub_client()
+    client.add_primer('nseindia.com', 'https://www.nseindia.com', lambda: None)
+    client.add_primer('nseindia.com', 'https://www.nseindia.com/option-chain', shared=False)
+
+    assert KeepWarm(client).urls == ['https://www.nseindia.com', 'https://www.nseindia.com/option-chain']
+
+
+def test_ping_is_a_bulk_head_request_and_records_its_outcome(stub_client):
+    client = stub_client(make_response(200, b''))
+
+    assert KeepWarm(client, urls=[URL])._ping(URL)
+
+    sent = client.transport.requests[0]
+    assert (sent['method'], sent['url'], sent['priority']) == ('HEAD', URL, Priority.BULK)
+    assert sent['kwargs'].get('allow_redirects') is False
+    recorded = counters(client, 'www.nseindia.com', '/')
+    assert (recorded['requests'], recorded['status.200'], recorded['keep_warm.pings']) == (1, 1, 1)
+    assert client.circuit_breaker.states() == {'www.nseindia.com': 'closed'}
+
+
+def test_failed_pings_open_the_circuit_and_stop(stub_client):
+    client = stub_client(ConnectionError('reset by peer'))
+    client.circuit_breaker.configure('nseindia.com', failure_threshold=2)
+    warm = KeepWarm(client, urls=[URL])
+
+    assert not warm._ping(URL)
+    assert not warm._ping(URL)
+    assert client.circuit_breaker.states() == {'www.nseindia.com': 'open'}
+    assert not warm._ping(URL)
+
+    assert len(client.transport.requests) == 2
+    assert counters(client, 'www.nseindia.com', '/')['keep_warm.errors'] == 2
+
+
+def test_ping_resolves_a_half_open_circuit(stub_client):
+    client = stub_client(make_response(200, b''))
+    client.circuit_breaker.configure('nseindia.com', failure_threshold=1, recovery_timeout=0)
+    client.circuit_breaker.record(URL, 503)
+
+    assert KeepWarm(client, urls=[URL])._ping(URL)
+    assert client.circuit_breaker.states() == {'www.nseindia.com': 'closed'}
+
+
+def test_warm_pings_every_url_once_per_connection(stub_client):
+    client = stub_client(make_response(200, b''))
+    urls = [URL, 'https://charting.nseindia.com/']
+
+    assert KeepWarm(client, urls=urls, connections=3).warm() == 6
+    assert sorted(sent['url'] for sent in client.transport.requests) == sorted(urls * 3)
+
+
+def test_dns_answers_are_reused_for_their_ttl(resolver):
+    cache = DnsCache(ttl=300)
+    assert cache.getaddrinfo('www.nseindia.com', 443) == ADDRESS
+    resolver.now += 299
+    cache.getaddrinfo('www.nseindia.com', 443)
+    assert resolver.lookups == 1
+
+    resolver.now += 1
+    cache.getaddrinfo('www.nseindia.com', 443)
+    assert resolver.lookups == 2
+    cache.resolve('www.nseindia.com')
+    assert resolver.lookups == 3
+
+
+def test_stale_dns_answer_is_served_while_the_resolver_fails(resolver):
+    cache = DnsCache(ttl=300, stale_ttl=600)
+    cache.getaddrinfo('www.nseindia.com', 443)
+    resolver.down = True
+
+    resolver.now += 899
+    assert cache.getaddrinfo('www.nseindia.com', 443) == ADDRESS
+    resolver.now += 1
+    with pytest.raises(socket.gaierror):
+        cache.getaddrinfo('www.nseindia.com', 443)
+    with pytest.raises(socket.gaierror):
+        cache.getaddrinfo('www.screener.in', 443)
+
+
+def test_dns_cache_installs_nest(resolver):
+    outer, inner = DnsCache(), DnsCache()
+    outer.install()
+    inner.install()
+    assert socket.getaddrinfo == inner.getaddrinfo
+
+    outer.uninstall()
+    assert socket.getaddrinfo == inner.getaddrinfo
+    inner.uninstall()
+    assert socket.getaddrinfo == resolver.getaddrinfo
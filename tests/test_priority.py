@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from conftest import make_response
+
+from Base import Priority, TokenBucket
+
+
+def wait_for(condition, timeout: float = 2) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.001)
+
+
+def test_current_priority_follows_the_blocks():
+    assert Priority.current() == Priority.NORMAL
+    with Priority(Priority.BULK):
+        assert Priority.current() == Priority.BULK
+        with Priority():
+            assert Priority.current() == Priority.BULK
+        with Priority(Priority.INTERACTIVE):
+            assert Priority.current() == Priority.INTERACTIVE
+        assert Priority.current() == Priority.BULK
+    assert Priority.current() == Priority.NORMAL
+
+
+def test_queued_callers_are_served_by_priority_then_arrival():
+    bucket = TokenBucket(rate=5, capacity=1)
+    bucket.acquire()
+    served = []
+
+    def caller(name, priority):
+        bucket.acquire(priority=priority)
+        served.append(name)
+
+    threads = []
+    for count, (name, priority) in enumerate([('bulk-1', Priority.BULK), ('bulk-2', Priority.BULK),
+                                              ('normal', Priority.NORMAL), ('interactive', Priority.INTERACTIVE)]):
+        threads.append(threading.Thread(target=caller, args=(name, priority)))
+        threads[-1].start()
+        wait_for(lambda: bucket.queued() == count + 1)
+    for thread in threads:
+        thread.join()
+
+    assert served == ['interactive', 'normal', 'bulk-1', 'bulk-2']
+
+
+def test_priority_defaults_to_the_context():
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.acquire()
+    served = []
+
+    def caller(name, priority):
+        with Priority(priority):
+            bucket.acquire()
+        served.append(name)
+
+    bulk = threading.Thread(target=caller, args=('bulk', Priority.BULK))
+    bulk.start()
+    wait_for(lambda: bucket.queued() == 1)
+    interactive = threading.Thread(target=caller, args=('interactive', Priority.INTERACTIVE))
+    interactive.start()
+    wait_for(lambda: bucket.queued() == 2)
+    bulk.join()
+    interactive.join()
+
+    assert served == ['interactive', 'bulk']
+
+
+def test_async_callers_are_served_by_priority():
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.acquire()
+    served = []
+
+    async def caller(name, priority):
+        await bucket.async_acquire(priority=priority)
+        served.append(name)
+
+    async def main():
+        tasks = []
+        for count, (name, priority) in enumerate([('bulk', Priority.BULK), ('interactive', Priority.INTERACTIVE)]):
+            tasks.append(asyncio.ensure_future(caller(name, priority)))
+            while bucket.queued() < count + 1:
+                await asyncio.sleep(0.001)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert served == ['interactive', 'bulk']
+
+
+def test_interrupted_caller_leaves_the_queue():
+    bucket = TokenBucket(rate=5, capacity=1)
+    bucket.acquire()
+
+    async def main():
+        task = asyncio.ensure_future(bucket.async_acquire())
+        while not bucket.queued():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert bucket.queued() == 0
+
+
+@pytest.mark.parametrize('method', ['hit_and_get_data', 'post_and_get_data', 'hit_and_get_response',
+                                    'post_and_get_response'])
+def test_public_methods_send_at_the_priority_asked_for(stub_client, method):
+    client = stub_client(make_response(200, b'{}'))
+    url = 'https://www.nseindia.com/api/marketStatus'
+
+    getattr(client, method)(url, priority=Priority.INTERACTIVE)
+    with Priority(Priority.BULK):
+        getattr(client, method)(url)
+
+    assert [sent['priority'] for sent in client.transport.requests] == [Priority.INTERACTIVE, Priority.BULK]
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+
+from conftest import make_response
+
+from Base import HostRateLimiter, TokenBucket
+
+
+def test_burst_then_spaced_to_the_rate():
+    bucket = TokenBucket(rate=20, capacity=2)
+    assert bucket.acquire() == 0 and bucket.acquire() == 0
+    assert not bucket.available()
+
+    waited = bucket.acquire()
+    assert 0.02 < waited < 0.2
+
+
+def test_reserve_goes_into_debt():
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_async_acquire_is_spaced_to_the_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.async_acquire()
+        return time.monotonic() - started
+
+    assert 0.08 < asyncio.run(main()) < 0.3
+
+
+def test_host_limiter_uses_the_longest_matching_suffix():
+    limiter = HostRateLimiter({'nseindia.com': (3, 6), 'charting.nseindia.com': (5, 10)})
+
+    assert limiter.bucket_for('https://www.nseindia.com/api/quote').rate == 3
+    assert limiter.bucket_for('https://charting.nseindia.com/Charts').rate == 5
+    assert limiter.bucket_for('https://www.screener.in/') is None
+    assert limiter.acquire('https://www.screener.in/') == 0
+    assert limiter.available('https://www.screener.in/')
+
+    limiter.remove_limit('charting.nseindia.com')
+    assert limiter.bucket_for('https://charting.nseindia.com/Charts').rate == 3
+
+    limiter.set_limit('.Screener.in', 1, 2)
+    assert limiter.bucket_for('https://www.screener.in/').capacity == 2
+
+
+def test_client_waits_for_the_host_and_records_the_queue_wait(stub_client):
+    client = stub_client(make_response(200, b'{}'))
+    client.rate_limiter = HostRateLimiter({'nseindia.com': (20, 1)})
+    url = 'https://www.nseindia.com/api/marketStatus'
+
+    started = time.monotonic()
+    for _ in range(3):
+        client.hit_and_get_data(url)
+    assert time.monotonic() - started > 0.08
+
+    queue_wait = client.metrics.snapshot()['www.nseindia.com']['/api/marketStatus']['histograms']['queue_wait']
+    assert queue_wait['count'] == 3 and queue_wait['sum'] > 0.08
@@ -0,0 +1,163 @@
+import importlib
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import make_response
+
+from Base import MarketHoursTTL, ResponseCache
+from Base.ResponseCache import IST
+
+QUOTE = 'https://www.nseindia.com/api/quote-equity?symbol=TCS'
+MASTERS = 'https://charting.nseindia.com/Charts/GetEQMasters'
+
+
+class Clock:
+    """
+        Stand-in of the `time` module of `Base.ResponseCache` whose clock only moves when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(importlib.import_module('Base.ResponseCache'), 'time', clock)
+    return clock
+
+
+def at(year, month, day, hour, minute):
+    return datetime(year, month, day, hour, minute, tzinfo=IST)
+
+
+@pytest.mark.parametrize('url, endpoint_class', [
+    (QUOTE, 'live'),
+    (MASTERS, 'reference'),
+    ('https://api.tickertape.in/stocks/financials/income/TCS', 'fundamentals'),
+    ('https://www.nseindia.com/api/unknown', None),
+    # fragments are matched against the path only
+    ('https://www.nseindia.com/?next=/api/quote-equity', None),
+])
+def test_endpoint_class_by_path_fragment(url, endpoint_class):
+    assert MarketHoursTTL().endpoint_class(url) == endpoint_class
+
+
+@pytest.mark.parametrize('now, is_open', [
+    (at(2026, 10, 16, 9, 15), True),
+    (at(2026, 10, 16, 15, 29), True),
+    (at(2026, 10, 16, 9, 14), False),
+    (at(2026, 10, 16, 15, 30), False),
+    (at(2026, 10, 17, 11, 0), False),      # Saturday
+    (datetime(2026, 10, 16, 4, 0, tzinfo=timezone.utc), True),
+])
+def test_is_market_open_in_ist_on_weekdays(now, is_open):
+    assert MarketHoursTTL().is_market_open(now) is is_open
+
+
+@pytest.mark.parametrize('now, seconds', [
+    (at(2026, 10, 15, 9, 0), 15 * 60),
+    (at(2026, 10, 15, 16, 0), (17 * 60 + 15) * 60),
+    (at(2026, 10, 16, 16, 0), (2 * 24 + 17) * 60 * 60 + 15 * 60),     # Friday evening waits for Monday
+])
+def test_seconds_to_next_open_skips_weekends(now, seconds):
+    assert MarketHoursTTL().seconds_to_next_open(now) == seconds
+
+
+def test_ttl_is_the_class_ttl_while_open_and_frozen_till_the_next_open_after_the_close():
+    ttl = MarketHoursTTL()
+    assert ttl.ttl_for(QUOTE, at(2026, 10, 16, 11, 0)) == 5
+    assert ttl.ttl_for(MASTERS, at(2026, 10, 16, 11, 0)) == 6 * 60 * 60
+    assert ttl.ttl_for(QUOTE, at(2026, 10, 16, 16, 0)) == ttl.seconds_to_next_open(at(2026, 10, 16, 16, 0))
+    # a class TTL longer than the wait for the open is kept
+    assert ttl.ttl_for(MASTERS, at(2026, 10, 15, 9, 0)) == 6 * 60 * 60
+    assert ttl.ttl_for('https://www.nseindia.com/api/unknown', at(2026, 10, 16, 11, 0)) is None
+
+
+def test_own_classes_and_ttls():
+    ttl = MarketHoursTTL(endpoint_classes=[('/api/quote-equity', 'quotes')], class_ttls={'quotes': 2})
+    assert ttl.ttl_for(QUOTE, at(2026, 10, 16, 11, 0)) == 2
+    assert ttl.ttl_for(MASTERS, at(2026, 10, 16, 11, 0)) is None
+    assert ttl.class_ttls['live'] == 5
+
+
+def test_make_key_is_stable_and_tells_requests_apart():
+    key = ResponseCache.make_key('get', QUOTE, {'b': 1, 'a': 2})
+    assert key == ResponseCache.make_key('GET', QUOTE, {'a': 2, 'b': 1})
+    assert key != ResponseCache.make_key('POST', QUOTE, {'a': 2, 'b': 1})
+    assert key != ResponseCache.make_key('GET', QUOTE, {'a': 2, 'b': 1}, {'symbol': 'TCS'})
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ResponseCache(':memory:')
+    cache.set('quote', b'{"a": 1}', 5)
+
+    clock.now += 4.9
+    assert cache.get('quote') == b'{"a": 1}'
+    clock.now += 0.1
+    assert cache.get('quote') is None
+    assert cache.size() == 0
+
+
+def test_least_recently_used_entries_are_evicted_past_max_bytes(clock):
+    cache = ResponseCache(':memory:', max_bytes=10)
+    cache.set('a', b'1234', 60)
+    clock.now += 1
+    cache.set('b', b'1234', 60)
+    clock.now += 1
+    cache.get('a')
+    clock.now += 1
+    cache.set('c', b'1234', 60)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1234' and cache.get('c') == b'1234'
+    assert cache.size() == 8
+
+    cache.set('big', b'x' * 11, 60)
+    assert cache.get('big') is None
+
+
+def test_expired_entries_are_evicted_before_live_ones(clock):
+    cache = ResponseCache(':memory:', max_bytes=10)
+    cache.set('old', b'1234', 60)
+    clock.now += 0.5
+    cache.set('short', b'1234', 1)
+    clock.now += 1.5
+    cache.set('new', b'1234', 60)
+
+    assert cache.get('old') == b'1234' and cache.get('new') == b'1234'
+
+
+def test_cache_is_kept_on_disk(tmp_path):
+    db_path = str(tmp_path / 'nested' / 'responses.sqlite3')
+    ResponseCache(db_path).set('quote', b'{}', 60)
+
+    assert ResponseCache(db_path).get('quote') == b'{}'
+    ResponseCache(db_path).clear()
+    assert ResponseCache(db_path).get('quote') is None
+
+
+def test_client_serves_cached_bodies_without_a_request(stub_client):
+    client = stub_client(make_response(200, json.dumps({'symbols': ['TCS']}).encode('utf-8')))
+    client.cache = ResponseCache(':memory:')
+
+    client.hit_and_get_data(MASTERS)['symbols'].append('altered')
+    assert client.hit_and_get_data(MASTERS) == {'symbols': ['TCS']}
+    assert len(client.transport.requests) == 1
+
+    client.hit_and_get_data('https://www.nseindia.com/api/unknown')
+    client.hit_and_get_data('https://www.nseindia.com/api/unknown')
+    assert len(client.transport.requests) == 3
+
+
+def test_failed_responses_are_not_cached(stub_client):
+    client = stub_client(make_response(404, b'{}'), make_response(200, b'{"a": 1}'))
+    client.cache = ResponseCache(':memory:')
+
+    client.hit_and_get_data(MASTERS)
+    assert client.hit_and_get_data(MASTERS) == {'a': 1}
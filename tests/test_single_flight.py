@@ -0,0 +1,173 @@
+import asyncio
+import importlib
+import threading
+import time
+
+import pytest
+
+from conftest import make_response
+
+from Base import SingleFlight
+
+
+class Clock:
+    """
+        Stand-in of the `time` module of `Base.SingleFlight` whose clock only moves when told to.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(importlib.import_module('Base.SingleFlight'), 'time', clock)
+    return clock
+
+
+def concurrent_calls(group, key, fn, callers: int = 5) -> list:
+    """
+        Calls `group.do(key, fn)` from several threads at once and returns what every caller got (result or error).
+    """
+
+    barrier = threading.Barrier(callers)
+    outcomes = [None] * callers
+
+    def caller(index):
+        barrier.wait()
+        try:
+            outcomes[index] = group.do(key, fn)
+        except Exception as err:
+            outcomes[index] = err
+
+    threads = [threading.Thread(target=caller, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_concurrent_callers_share_one_call():
+    group = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'symbol': 'TCS'}
+
+    outcomes = concurrent_calls(group, 'quote', fetch)
+
+    assert len(calls) == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+
+
+def test_error_is_raised_to_every_waiting_caller_and_not_kept():
+    group = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        raise ConnectionError('reset by peer')
+
+    outcomes = concurrent_calls(group, 'quote', fetch)
+
+    assert len(calls) == 1 and all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+    assert group.do('quote', lambda: 'retried') == 'retried'
+
+
+def test_finished_result_is_served_for_ttl_seconds(clock):
+    group = SingleFlight(ttl=3)
+    group.do('quote', lambda: 'first')
+
+    clock.now += 2.9
+    assert group.do('quote', lambda: 'second') == 'first'
+    clock.now += 0.1
+    assert group.do('quote', lambda: 'third') == 'third'
+
+
+def test_lru_is_bounded_and_can_be_disabled_or_forgotten(clock):
+    group = SingleFlight(max_entries=2)
+    for key in ('a', 'b', 'a', 'c'):
+        group.do(key, lambda: key)
+    assert group.do('a', lambda: 'again') == 'a'
+    assert group.do('b', lambda: 'again') == 'again'
+
+    group.forget('a')
+    assert group.do('a', lambda: 'forgotten') == 'forgotten'
+
+    uncached = SingleFlight(ttl=0)
+    uncached.do('a', lambda: 'first')
+    assert uncached.do('a', lambda: 'second') == 'second'
+
+
+def test_async_tasks_share_one_call():
+    group = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {'symbol': 'TCS'}
+
+    async def main():
+        return await asyncio.gather(*[group.async_do('quote', fetch) for _ in range(5)])
+
+    outcomes = asyncio.run(main())
+    assert len(calls) == 1 and all(outcome is outcomes[0] for outcome in outcomes)
+
+
+def test_async_error_reaches_every_task_and_the_next_call_runs_again():
+    group = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise ConnectionError('reset by peer')
+
+    async def main():
+        outcomes = await asyncio.gather(*[group.async_do('quote', fail) for _ in range(3)], return_exceptions=True)
+
+        async def fetch():
+            return 'retried'
+
+        return outcomes, await group.async_do('quote', fetch)
+
+    outcomes, retried = asyncio.run(main())
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes) and retried == 'retried'
+
+
+def test_client_coalesces_identical_requests(stub_client):
+    client = stub_client(make_response(200, b'{"symbol": "TCS"}'))
+    client.single_flight = SingleFlight()
+    send = client.transport.request
+
+    def slow_request(*args, **kwargs):
+        time.sleep(0.05)
+        return send(*args, **kwargs)
+
+    client.transport.request = slow_request
+    url = 'https://www.nseindia.com/api/quote-equity'
+    barrier = threading.Barrier(4)
+    results = []
+
+    def caller():
+        barrier.wait()
+        results.append(client.hit_and_get_data(url, params={'symbol': 'TCS'}))
+
+    threads = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{'symbol': 'TCS'}] * 4
+    assert len(client.transport.requests) == 1
+
+    client.hit_and_get_data(url, params={'symbol': 'INFY'})
+    assert len(client.transport.requests) == 2
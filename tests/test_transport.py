@@ -0,0 +1,159 @@
+import gzip
+import json
+
+import pytest
+from requests.exceptions import ConnectionError, TooManyRedirects
+
+from conftest import make_response
+
+from Base import PoolTransport, Transport
+
+TIMEOUT = (2, 2)
+
+
+def json_response(data, status: int = 200, **headers):
+    headers = dict({'Content-Type': 'application/json'}, **headers)
+    return make_response(status, json.dumps(data).encode('utf-8'), headers)
+
+
+def redirect(location: str, status: int = 302, **headers):
+    return make_response(status, b'', dict({'Location': location}, **headers))
+
+
+@pytest.fixture
+def pooled(stub_client):
+    client = stub_client()
+    client.transport = PoolTransport()
+    client.session.headers.update({'User-Agent': 'bharat-sm-data-tests', 'Accept': '*/*'})
+    yield client
+    client.transport.close()
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_params_and_the_default_headers_of_the_session_are_sent(pooled, local_server):
+    local_server.routes['/api/quote-equity'] = [json_response({'symbol': 'TCS'})]
+
+    response = pooled.transport.request(pooled, 'GET', local_server.url('/api/quote-equity?series=EQ'),
+                                        headers={'accept': 'application/json'}, timeout=TIMEOUT,
+                                        params={'symbol': 'TCS', 'section': None})
+
+    assert response.status_code == 200 and response.json() == {'symbol': 'TCS'}
+    assert response.url == local_server.url('/api/quote-equity?series=EQ&symbol=TCS')
+    hit, = local_server.hits
+    assert hit['query'] == {'series': ['EQ'], 'symbol': ['TCS']}
+    assert hit['headers']['User-Agent'] == 'bharat-sm-data-tests' and hit['headers']['accept'] == 'application/json'
+    assert 'Accept' not in hit['headers']
+
+
+def test_json_and_form_payloads_are_encoded_like_requests(pooled, local_server):
+    local_server.routes['/api/search'] = [json_response({})]
+    url = local_server.url('/api/search')
+
+    pooled.transport.request(pooled, 'POST', url, timeout=TIMEOUT, json={'q': 'TCS'})
+    pooled.transport.request(pooled, 'POST', url, timeout=TIMEOUT, data={'q': ['TCS', 'INFY']})
+
+    as_json, as_form = local_server.hits
+    assert json.loads(as_json['body']) == {'q': 'TCS'} and as_json['headers']['Content-Type'] == 'application/json'
+    assert as_form['body'] == b'q=TCS&q=INFY'
+    assert as_form['headers']['Content-Type'] == 'application/x-www-form-urlencoded'
+
+
+def test_compressed_body_is_decoded(pooled, local_server):
+    local_server.routes['/api/allIndices'] = [make_response(200, gzip.compress(b'{"data": []}'),
+                                                            {'Content-Encoding': 'gzip'})]
+
+    assert pooled.hit_and_get_data(local_server.url('/api/allIndices')) == {'data': []}
+
+
+def test_cookies_of_the_jar_are_sent_and_set_cookies_are_stored(pooled, local_server):
+    local_server.routes['/'] = [json_response({}, **{'Set-Cookie': ['nsit=abc; Path=/; Max-Age=3600',
+                                                                    'nseappid=xyz; Path=/']})]
+    pooled.session.cookies.set('bm_sv', 'old', domain='127.0.0.1', path='/')
+
+    pooled.transport.request(pooled, 'GET', local_server.url('/'), timeout=TIMEOUT)
+    pooled.transport.request(pooled, 'GET', local_server.url('/'), timeout=TIMEOUT)
+
+    assert local_server.hits[0]['headers']['Cookie'] == 'bm_sv=old'
+    assert sorted(local_server.hits[1]['headers']['Cookie'].split('; ')) == ['bm_sv=old', 'nseappid=xyz', 'nsit=abc']
+    nsit, = [cookie for cookie in pooled.session.cookies if cookie.name == 'nsit']
+    assert nsit.expires is not None
+
+
+def test_each_redirect_hop_sends_the_cookies_set_by_the_previous_one(pooled, local_server):
+    local_server.routes['/option-chain'] = [redirect('/login', **{'Set-Cookie': 'hop=1; Path=/'})]
+    local_server.routes['/login'] = [redirect(local_server.url('/api/option-chain'))]
+    local_server.routes['/api/option-chain'] = [json_response({'records': {}})]
+
+    response = pooled.transport.request(pooled, 'GET', local_server.url('/option-chain'), timeout=TIMEOUT)
+
+    assert response.json() == {'records': {}} and response.url == local_server.url('/api/option-chain')
+    assert [hop.status_code for hop in response.history] == [302, 302]
+    assert [hit['headers'].get('Cookie') for hit in local_server.hits] == [None, 'hop=1', 'hop=1']
+
+
+@pytest.mark.parametrize('status, method', [(301, 'GET'), (302, 'GET'), (303, 'GET'), (307, 'POST'), (308, 'POST')])
+def test_redirected_post_is_resent_the_way_requests_does(pooled, local_server, status, method):
+    local_server.routes['/api/search'] = [redirect('/api/results', status)]
+    local_server.routes['/api/results'] = [json_response({})]
+
+    pooled.transport.request(pooled, 'POST', local_server.url('/api/search'), headers={'Content-Type': 'text/plain'},
+                             timeout=TIMEOUT, data='q=TCS')
+
+    resent = local_server.hits[1]
+    assert resent['method'] == method
+    assert (resent['body'], 'Content-Type' in resent['headers']) == ((b'', False) if method == 'GET' else
+                                                                     (b'q=TCS', True))
+
+
+def test_redirects_are_limited_or_left_to_the_caller(pooled, local_server):
+    local_server.routes['/loop'] = [redirect('/loop')]
+    pooled.session.max_redirects = 3
+
+    with pytest.raises(TooManyRedirects):
+        pooled.transport.request(pooled, 'GET', local_server.url('/loop'), timeout=TIMEOUT)
+    assert len(local_server.hits) == 4
+
+    response = pooled.transport.request(pooled, 'GET', local_server.url('/loop'), timeout=TIMEOUT,
+                                        allow_redirects=False)
+    assert response.status_code == 302 and response.history == []
+
+
+def test_retry_policy_of_the_session_is_reused(pooled, local_server):
+    local_server.routes['/api/marketStatus'] = [json_response({}, 503), json_response({'marketState': []})]
+    # the policy is mounted for https, the local server speaks plain http
+    pooled.session.mount('http://', pooled.session.get_adapter('https://www.nseindia.com'))
+
+    response = pooled.transport.request(pooled, 'GET', local_server.url('/api/marketStatus'), timeout=TIMEOUT)
+
+    assert response.json() == {'marketState': []} and len(local_server.hits) == 2
+
+
+def test_streamed_body_is_left_to_be_read(pooled, local_server):
+    local_server.routes['/file.csv'] = [make_response(200, b'a,b\n1,2\n')]
+
+    response = pooled.transport.request(pooled, 'GET', local_server.url('/file.csv'), timeout=TIMEOUT, stream=True)
+
+    assert b''.join(response.iter_content(4)) == b'a,b\n1,2\n'
+
+
+def test_unsupported_arguments_are_sent_with_requests(pooled, local_server):
+    local_server.routes['/api/private'] = [json_response({})]
+
+    pooled.transport.request(pooled, 'GET', local_server.url('/api/private'), timeout=TIMEOUT, auth=('user', 'pass'))
+
+    assert local_server.hits[0]['headers']['Authorization'].startswith('Basic ')
+
+
+def test_connection_errors_are_raised_as_requests_does(pooled):
+    with pytest.raises(ConnectionError):
+        pooled.transport.request(pooled, 'GET', 'http://127.0.0.1:9/api', timeout=TIMEOUT)